@@ -0,0 +1,46 @@
+"""Add append-only play_events table
+
+Revision ID: 7c1e2a9b4d10
+Revises: 9595badce323
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e2a9b4d10'
+down_revision: Union[str, Sequence[str], None] = '9595badce323'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('play_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('sequence', sa.Integer(), nullable=False),
+    sa.Column('quarter', sa.Integer(), nullable=True),
+    sa.Column('possession', sa.String(), nullable=True),
+    sa.Column('data', sa.JSON(), nullable=False),
+    sa.ForeignKeyConstraint(['game_id'], ['game.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('play_events', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_play_events_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_play_events_game_id'), ['game_id'], unique=False)
+        batch_op.create_index('ix_play_events_game_sequence', ['game_id', 'sequence'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('play_events', schema=None) as batch_op:
+        batch_op.drop_index('ix_play_events_game_sequence')
+        batch_op.drop_index(batch_op.f('ix_play_events_game_id'))
+        batch_op.drop_index(batch_op.f('ix_play_events_id'))
+
+    op.drop_table('play_events')
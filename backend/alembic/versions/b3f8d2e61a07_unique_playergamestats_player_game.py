@@ -0,0 +1,54 @@
+"""Make (player_id, game_id) unique on playergamestats
+
+Revision ID: b3f8d2e61a07
+Revises: 7c1e2a9b4d10
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f8d2e61a07'
+down_revision: Union[str, Sequence[str], None] = '7c1e2a9b4d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Rows that would break the unique index are parked here so downgrade can put them back
+DUPLICATES_TABLE = 'playergamestats_duplicates'
+
+# Every stat line but the newest (highest id) for each (player_id, game_id) pair
+DUPLICATE_ROWS = """
+    SELECT * FROM playergamestats
+    WHERE player_id IS NOT NULL AND game_id IS NOT NULL
+      AND id NOT IN (
+        SELECT MAX(id) FROM playergamestats
+        WHERE player_id IS NOT NULL AND game_id IS NOT NULL
+        GROUP BY player_id, game_id
+      )
+"""
+
+
+def upgrade() -> None:
+    """Replace the plain composite index with a unique one (bulk upsert conflict target)."""
+    # Keep the latest stat line per player and game; older duplicates move aside
+    op.execute(f"CREATE TABLE {DUPLICATES_TABLE} AS {DUPLICATE_ROWS}")
+    op.execute(f"DELETE FROM playergamestats WHERE id IN (SELECT id FROM {DUPLICATES_TABLE})")
+
+    with op.batch_alter_table('playergamestats', schema=None) as batch_op:
+        batch_op.drop_index('ix_playergamestats_player_game')
+        batch_op.create_index('uq_playergamestats_player_game', ['player_id', 'game_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Restore the non-unique composite index and the duplicate rows upgrade removed."""
+    with op.batch_alter_table('playergamestats', schema=None) as batch_op:
+        batch_op.drop_index('uq_playergamestats_player_game')
+        batch_op.create_index('ix_playergamestats_player_game', ['player_id', 'game_id'], unique=False)
+
+    op.execute(f"INSERT INTO playergamestats SELECT * FROM {DUPLICATES_TABLE}")
+    op.drop_table(DUPLICATES_TABLE)
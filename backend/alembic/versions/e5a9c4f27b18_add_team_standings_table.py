@@ -0,0 +1,67 @@
+"""Add materialized team_standings table
+
+Revision ID: e5a9c4f27b18
+Revises: b3f8d2e61a07
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c4f27b18'
+down_revision: Union[str, Sequence[str], None] = 'b3f8d2e61a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('team_standings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('season_id', sa.Integer(), nullable=False),
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.Column('wins', sa.Integer(), nullable=True),
+    sa.Column('losses', sa.Integer(), nullable=True),
+    sa.Column('ties', sa.Integer(), nullable=True),
+    sa.Column('points_for', sa.Integer(), nullable=True),
+    sa.Column('points_against', sa.Integer(), nullable=True),
+    sa.Column('division_wins', sa.Integer(), nullable=True),
+    sa.Column('division_losses', sa.Integer(), nullable=True),
+    sa.Column('division_ties', sa.Integer(), nullable=True),
+    sa.Column('conference_wins', sa.Integer(), nullable=True),
+    sa.Column('conference_losses', sa.Integer(), nullable=True),
+    sa.Column('conference_ties', sa.Integer(), nullable=True),
+    sa.Column('head_to_head', sa.JSON(), nullable=True),
+    sa.Column('opponents', sa.JSON(), nullable=True),
+    sa.Column('win_percentage', sa.Float(), nullable=True),
+    sa.Column('point_differential', sa.Integer(), nullable=True),
+    sa.Column('strength_of_schedule', sa.Float(), nullable=True),
+    sa.Column('division_rank', sa.Integer(), nullable=True),
+    sa.Column('conference_rank', sa.Integer(), nullable=True),
+    sa.Column('seed', sa.Integer(), nullable=True),
+    sa.Column('clinched_playoff', sa.Boolean(), nullable=True),
+    sa.Column('clinched_division', sa.Boolean(), nullable=True),
+    sa.Column('clinched_seed', sa.Integer(), nullable=True),
+    sa.Column('tiebreaker_reason', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['season_id'], ['season.id'], ),
+    sa.ForeignKeyConstraint(['team_id'], ['team.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('team_standings', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_team_standings_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_team_standings_season_id'), ['season_id'], unique=False)
+        batch_op.create_index('ix_team_standings_season_team', ['season_id', 'team_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('team_standings', schema=None) as batch_op:
+        batch_op.drop_index('ix_team_standings_season_team')
+        batch_op.drop_index(batch_op.f('ix_team_standings_season_id'))
+        batch_op.drop_index(batch_op.f('ix_team_standings_id'))
+
+    op.drop_table('team_standings')
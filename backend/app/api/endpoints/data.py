@@ -8,6 +8,7 @@ from app.core.error_decorators import handle_errors
 from app.models.game import Game
 from app.models.team import Team
 from app.models.player import Player
+from app.services.play_log_service import PlayLogService
 
 router = APIRouter(prefix="/api/data", tags=["data"])
 logger = logging.getLogger(__name__)
@@ -120,9 +121,8 @@ def get_game_logs(game_id: int, db: Session = Depends(get_db)):
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
         
-    # Assuming logs are in game_data['plays'] or similar
-    # If not, return empty list for now
-    logs = (game.game_data or {}).get("plays", [])
+    # Plays are read from the append-only play log (legacy games fall back to game_data)
+    logs = PlayLogService(db).get_plays(game)
     
     return {
         "game_id": game.id,
@@ -18,7 +18,7 @@ from app.services.standings_calculator import StandingsCalculator, TeamStanding
 from app.services.week_simulator import WeekSimulator
 from app.services.playoff_service import PlayoffService
 from app.services.offseason_service import OffseasonService
-from app.schemas.playoff import PlayoffMatchup as PlayoffMatchupSchema
+from app.schemas.playoff import PlayoffMatchup as PlayoffMatchupSchema, WhatIfSeeding, WhatIfSeedingRequest
 from app.schemas.offseason import TeamNeed, Prospect, DraftPickSummary, PlayerProgressionResult, DraftPickDetail
 from app.schemas.stats import LeagueLeaders, PlayerLeader
 from app.schemas import draft as draft_schemas
@@ -234,7 +234,7 @@ async def get_season_summary(db: AsyncSession = Depends(get_async_db)):
         def get_standings_sync():
             with SessionLocal() as sync_db:
                 calculator = StandingsCalculator(sync_db)
-                return calculator.calculate_standings(season.id)
+                return calculator.get_standings(season.id)
 
         flat_standings = await run_in_threadpool(get_standings_sync)
 
@@ -385,6 +385,9 @@ async def initialize_season(
     logger.info(f"Generated {len(games)} games for season {season_data.year}")
 
     await db.commit()
+
+    # Materialize standings with the schedule, so standings reads never have to write
+    await db.run_sync(lambda session: StandingsCalculator(session).rebuild_standings(new_season_id))
     await db.refresh(new_season)
 
     logger.info(f"Season {new_season.id} initialized successfully")
@@ -472,7 +475,7 @@ async def get_standings(
 
     Can optionally filter by conference and/or division.
     """
-    logger.info(f"Calculating standings for season {season_id}")
+    logger.info(f"Fetching standings for season {season_id}")
     # Verify season exists
     stmt = select(Season).where(Season.id == season_id)
     result = await db.execute(stmt)
@@ -483,16 +486,12 @@ async def get_standings(
     def get_standings_sync(s_id, conf, div):
         with SessionLocal() as sync_db:
             calculator = StandingsCalculator(sync_db)
-            if div and conf:
-                return calculator.get_division_standings(s_id, conf, div)
-            elif conf:
-                return calculator.get_conference_standings(s_id, conf)
-            else:
-                return calculator.calculate_standings(s_id)
+            # A division name is only meaningful within a conference
+            return calculator.get_standings(s_id, conference=conf, division=div if conf else None)
 
     standings = await run_in_threadpool(get_standings_sync, season_id, conference, division)
 
-    logger.info(f"Standings calculated: {len(standings)} teams")
+    logger.info(f"Standings fetched: {len(standings)} teams")
     return standings
 
 
@@ -536,6 +535,8 @@ async def simulate_week(
     season_id: int,
     week: Optional[int] = None,
     play_count: int = 100,
+    workers: Optional[int] = None,
+    seed: Optional[str] = None,
     db: AsyncSession = Depends(get_async_db)
 ):
     """
@@ -545,6 +546,8 @@ async def simulate_week(
         season_id: ID of the season
         week: Week to simulate (default: current week)
         play_count: Number of plays per game (default: 100)
+        workers: If set, simulate games in parallel across this many processes
+        seed: Root seed for parallel simulation (default: derived from season/week)
 
     Returns:
         Results for all simulated games
@@ -564,12 +567,21 @@ async def simulate_week(
     # Create simulator and run
     # WeekSimulator is now async and accepts AsyncSession
     simulator = WeekSimulator(db)
-    results = await simulator.simulate_week(
-        season_id=season_id,
-        week=week,
-        play_count=play_count,
-        use_fast_sim=True
-    )
+    if workers:
+        results = await simulator.simulate_week_parallel(
+            season_id=season_id,
+            week=week,
+            play_count=play_count,
+            max_workers=workers,
+            seed=seed
+        )
+    else:
+        results = await simulator.simulate_week(
+            season_id=season_id,
+            week=week,
+            play_count=play_count,
+            use_fast_sim=True
+        )
 
     logger.info(f"Week {week} simulation complete: {len(results)} games")
 
@@ -680,6 +692,29 @@ async def get_playoff_bracket(season_id: int, db: AsyncSession = Depends(get_asy
     return await run_in_threadpool(get_bracket_sync)
 
 
+@router.post("/{season_id}/playoffs/what-if", response_model=List[WhatIfSeeding])
+@handle_errors
+async def what_if_playoff_seeding(
+    season_id: int,
+    request: WhatIfSeedingRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Project playoff seeds for hypothetical results of remaining games.
+
+    Dry run: each scenario is evaluated in memory and nothing is saved.
+    """
+    logger.info(f"Projecting playoff seeding for season {season_id}: {len(request.scenarios)} scenarios")
+    scenarios = [[outcome.model_dump() for outcome in scenario.outcomes] for scenario in request.scenarios]
+
+    def what_if_sync():
+        with SessionLocal() as sync_db:
+            service = PlayoffService(sync_db)
+            return service.what_if_seeding(season_id, scenarios)
+
+    return await run_in_threadpool(what_if_sync)
+
+
 @router.post("/{season_id}/playoffs/advance")
 @handle_errors
 async def advance_playoff_round(season_id: int, db: AsyncSession = Depends(get_async_db)):
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
+from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
@@ -7,11 +7,13 @@ import logging
 import asyncio
 
 from app.orchestrator.simulation_orchestrator import SimulationOrchestrator
+from app.orchestrator.session_manager import LiveGameSession, LiveSessionManager, SessionLimitError
 from app.schemas.play import PlayResult
 from app.schemas.simulation import SimulationRequest
 from app.core.database import get_db
 from app.core.error_decorators import handle_errors
 from app.models.game import Game
+from app.services.play_log_service import PlayLogService
 
 router = APIRouter(prefix="/api/simulation", tags=["simulation"])
 logger = logging.getLogger(__name__)
@@ -20,8 +22,24 @@ logger = logging.getLogger(__name__)
 
 
 
-# Instantiate the orchestrator at the module level
-orchestrator = SimulationOrchestrator()
+# Live games, one orchestrator and background task per session
+session_manager = LiveSessionManager()
+
+# Never started; backs /status before any live game exists
+_idle_orchestrator = SimulationOrchestrator()
+
+
+def _get_session(session_id: Optional[str]) -> LiveGameSession:
+    """Resolve a session id (or game id); without one, the most recently started session."""
+    if session_id is None:
+        session = session_manager.latest()
+        if session is None:
+            raise HTTPException(status_code=404, detail="No live simulation session")
+        return session
+    try:
+        return session_manager.get(session_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Simulation session not found")
 
 
 @router.post("/start", response_model=PlayResult)
@@ -32,81 +50,112 @@ def start_simulation(request: SimulationRequest):
     (Legacy endpoint - runs single play synchronously)
     """
     logger.info("Starting single play simulation")
-    result = orchestrator.run_simulation()
+    result = SimulationOrchestrator().run_simulation()
     return result
 
 
 @router.post("/start-live")
 @handle_errors
-async def start_live_simulation(request: SimulationRequest, background_tasks: BackgroundTasks):
+async def start_live_simulation(request: SimulationRequest):
     """
     Start a continuous live simulation that broadcasts via WebSocket.
     
     This endpoint:
-    1. Starts the simulation in the background
-    2. Returns immediately
+    1. Creates a new session with its own orchestrator
+    2. Starts the simulation in the background and returns immediately
     3. Simulation broadcasts plays via WebSocket as they happen
     """
     logger.info("Starting live simulation")
-    if orchestrator.is_running:
-        raise HTTPException(status_code=400, detail="Simulation already running")
     
     # Import WebSocket helpers
     from app.api.endpoints.websocket import broadcast_play_result, broadcast_game_update
     
-    # Set up WebSocket callbacks
-    async def on_play_complete(play_result: PlayResult):
-        """Broadcast play result to all connected clients."""
-        await broadcast_play_result(play_result.dict())
-    
-    async def on_game_update(game_state: dict):
-        """Broadcast game state update to all connected clients."""
-        await broadcast_game_update(game_state)
+    # Set up WebSocket callbacks, tagged with the session they came from
+    async def on_play_complete(session: LiveGameSession, play_result: PlayResult):
+        """Broadcast play result to clients following this game."""
+        await broadcast_play_result({**play_result.dict(), "session_id": session.session_id, "game_id": session.game_id}, game_id=session.game_id)
     
-    orchestrator.on_play_complete = on_play_complete
-    orchestrator.on_game_update = on_game_update
+    async def on_game_update(session: LiveGameSession, game_state: dict):
+        """Broadcast game state update to clients following this game."""
+        await broadcast_game_update({**game_state, "sessionId": session.session_id, "gameId": session.game_id}, game_id=session.game_id)
     
-    # Initialize game session synchronously to get ID
-    # Mocking Team IDs 1 and 2 for now
-    orchestrator.start_new_game_session(home_team_id=1, away_team_id=2, config=request.config)
-    game_id = orchestrator.current_game_id
-    
-    # Start continuous simulation in background
     num_plays = request.num_plays or 100
-    background_tasks.add_task(orchestrator.run_continuous_simulation, num_plays, request.config)
+    try:
+        session = await session_manager.start(
+            num_plays=num_plays,
+            config=request.config,
+            on_play_complete=on_play_complete,
+            on_game_update=on_game_update,
+        )
+    except SessionLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     
-    logger.info(f"Live simulation started (game_id={game_id}, num_plays={num_plays})")
+    logger.info(f"Live simulation started (session_id={session.session_id}, game_id={session.game_id}, num_plays={num_plays})")
     
     return {
         "status": "started",
         "message": f"Live simulation started for {num_plays} plays",
-        "game_id": game_id,
+        "session_id": session.session_id,
+        "game_id": session.game_id,
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 
+@router.get("/sessions")
+@handle_errors
+async def list_sessions():
+    """List live simulation sessions, dropping any that have gone idle."""
+    await session_manager.evict_idle()
+    return {
+        "sessions": session_manager.list(),
+        "running": session_manager.running_count,
+        "limit": session_manager.max_sessions,
+    }
+
+
+@router.get("/sessions/{session_id}")
+@handle_errors
+def get_session(session_id: str):
+    """Get one live simulation session."""
+    return _get_session(session_id).to_dict()
+
+
 @router.post("/stop")
 @handle_errors
-def stop_simulation():
-    """Stop the currently running simulation."""
+def stop_simulation(session_id: Optional[str] = None):
+    """Stop a running simulation (the most recently started one by default)."""
     logger.info("Stopping simulation")
-    if not orchestrator.is_running:
+    session = _get_session(session_id)
+    if not session.is_running:
         raise HTTPException(status_code=400, detail="No simulation is running")
     
-    orchestrator.stop_simulation()
-    logger.info("Simulation stopped")
+    session_manager.stop(session.session_id)
+    logger.info(f"Simulation stopped (session_id={session.session_id})")
     return {
         "status": "stopped",
         "message": "Simulation stopped",
+        "session_id": session.session_id,
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 
+@router.post("/sessions/{session_id}/stop")
+@handle_errors
+async def stop_session(session_id: str):
+    """Stop one live simulation session."""
+    return await stop_simulation(session_id=session_id)
+
+
 @router.get("/status")
 @handle_errors
 def get_simulation_status(simulation_id: Optional[str] = None):
     """Get the status of a running or completed simulation."""
     # logger.debug("Fetching simulation status") # Debug level to avoid spam
+    if simulation_id is None and session_manager.latest() is None:
+        # Nothing has run yet; report a fresh, idle scoreboard
+        orchestrator = _idle_orchestrator
+    else:
+        orchestrator = _get_session(simulation_id).orchestrator
     return {
         "isRunning": orchestrator.is_running,
         "currentQuarter": orchestrator.current_quarter,
@@ -123,9 +172,9 @@ def get_simulation_status(simulation_id: Optional[str] = None):
 @router.get("/{simulation_id}/plays", response_model=List[PlayResult])
 @handle_errors
 def get_simulation_plays(simulation_id: str):
-    """Retrieve play history for a simulation."""
+    """Retrieve play history for a simulation (by session id or game id)."""
     logger.info(f"Fetching play history for simulation {simulation_id}")
-    return orchestrator.get_history()
+    return _get_session(simulation_id).orchestrator.get_history()
 
 
 
@@ -144,7 +193,7 @@ def get_simulation_results(simulation_id: int, db: Session = Depends(get_db)):
         "status": "completed" if game.is_played else "in_progress",
         "home_score": game.home_score,
         "away_score": game.away_score,
-        "results": game.game_data or {},
+        "results": PlayLogService(db).get_game_data(game),
         "timestamp": game.date.isoformat() if game.date else None
     }
 
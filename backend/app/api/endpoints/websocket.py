@@ -1,49 +1,189 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import List, Dict, Any
+from typing import Any, Dict, List, Optional, Set
 import asyncio
 import json
 import logging
+from app.core.config import settings
 from app.orchestrator.simulation_orchestrator import SimulationOrchestrator
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+# Close codes sent to clients the server drops
+CLOSE_TRY_AGAIN_LATER = 1013  # Fell too far behind the broadcast
+CLOSE_INTERNAL_ERROR = 1011  # Sending to the client failed
+
+
+class ClientConnection:
+    """
+    One WebSocket client with its own bounded outbound queue.
+
+    A writer task drains the queue, so a slow client only ever backs up its own
+    queue. When the queue is full the manager's policy either drops the oldest
+    queued message or disconnects the client.
+    """
+
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.games: Set[str] = set()  # Empty = every game
+        self.dropped = 0
+        self.closed = False
+        self.writer: Optional[asyncio.Task] = None
+
+    def enqueue(self, text: str, policy: str) -> bool:
+        """Queue a serialized message without waiting; False if the client must be disconnected."""
+        if self.closed:
+            return False
+        if self.queue.full():
+            if policy == DISCONNECT:
+                return False
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(text)
+        return True
+
+    async def write_loop(self, manager: "ConnectionManager") -> None:
+        try:
+            while True:
+                text = await self.queue.get()
+                await self.websocket.send_text(text)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending to client: {e}")
+            manager.drop(self.websocket, CLOSE_INTERNAL_ERROR)
+
+
 class ConnectionManager:
-    """Manages active WebSocket connections for live simulation broadcasting."""
+    """
+    Manages active WebSocket connections for live simulation broadcasting.
+
+    Messages are serialized once per broadcast and handed to every matching
+    client's queue; clients subscribe to individual games or, by default, see
+    all of them.
+    """
     
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    def __init__(self, queue_size: Optional[int] = None, policy: Optional[str] = None):
+        self.queue_size = queue_size or settings.WS_CLIENT_QUEUE_SIZE
+        self.policy = policy or settings.WS_SLOW_CLIENT_POLICY
+        self.clients: Dict[WebSocket, ClientConnection] = {}
+        self.firehose: Set[ClientConnection] = set()  # Clients with no game subscription
+        self.channels: Dict[str, Set[ClientConnection]] = {}
+        self._closing: Set[asyncio.Task] = set()  # Close handshakes of dropped clients
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        return list(self.clients)
     
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket, game_id: Optional[Any] = None) -> ClientConnection:
         """Accept and register a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"Client connected. Total connections: {len(self.active_connections)}")
+        client = ClientConnection(websocket, self.queue_size)
+        self.clients[websocket] = client
+        self.firehose.add(client)
+        if game_id is not None:
+            self.subscribe(websocket, game_id)
+        client.writer = asyncio.create_task(client.write_loop(self))
+        logger.info(f"Client connected. Total connections: {len(self.clients)}")
+        return client
     
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection from active list."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            logger.info(f"Client disconnected. Total connections: {len(self.active_connections)}")
+        client = self.clients.pop(websocket, None)
+        if client is None:
+            return
+        client.closed = True
+        self.firehose.discard(client)
+        for game in client.games:
+            self._leave(game, client)
+        if client.writer and client.writer is not asyncio.current_task():
+            client.writer.cancel()
+        logger.info(f"Client disconnected. Total connections: {len(self.clients)}")
+
+    def drop(self, websocket: WebSocket, code: int = CLOSE_TRY_AGAIN_LATER) -> None:
+        """
+        Disconnect a client the server gives up on and close its socket.
+
+        The close runs in a tracked task, so callers never wait on the client;
+        a client that already left is not closed twice.
+        """
+        if websocket not in self.clients:
+            return
+        self.disconnect(websocket)
+        task = asyncio.create_task(self._close(websocket, code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket, code: int) -> None:
+        try:
+            await websocket.close(code=code)
+        except Exception as e:
+            # The client may have gone away on its own in the meantime
+            logger.debug(f"Error closing dropped client: {e}")
+
+    def subscribe(self, websocket: WebSocket, game_id: Any) -> None:
+        """Limit a client to the given game (plus any others it already follows)."""
+        client = self.clients.get(websocket)
+        if client is None:
+            return
+        game = str(game_id)
+        client.games.add(game)
+        self.firehose.discard(client)
+        self.channels.setdefault(game, set()).add(client)
+
+    def unsubscribe(self, websocket: WebSocket, game_id: Any) -> None:
+        client = self.clients.get(websocket)
+        if client is None:
+            return
+        game = str(game_id)
+        client.games.discard(game)
+        self._leave(game, client)
+        if not client.games:
+            self.firehose.add(client)
+
+    def _leave(self, game: str, client: ClientConnection) -> None:
+        members = self.channels.get(game)
+        if members is not None:
+            members.discard(client)
+            if not members:
+                del self.channels[game]
+
+    def send(self, websocket: WebSocket, message: Dict[str, Any]) -> None:
+        """Queue a message for one client (replies share the writer with broadcasts)."""
+        client = self.clients.get(websocket)
+        if client and not client.enqueue(json.dumps(message), self.policy):
+            self.drop(websocket)
     
-    async def broadcast(self, message: Dict[str, Any]):
+    async def broadcast(self, message: Dict[str, Any], game_id: Optional[Any] = None) -> int:
         """
-        Broadcast a message to all connected clients.
+        Broadcast a message to all connected clients following the game.
         
         Args:
             message: Dict with 'type' and 'payload' keys
+            game_id: Game the message belongs to; None goes to unsubscribed clients only
+
+        Returns:
+            Number of clients the message was queued for
         """
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                disconnected.append(connection)
+        targets = self.firehose
+        if game_id is not None and str(game_id) in self.channels:
+            targets = targets | self.channels[str(game_id)]
+        if not targets:
+            return 0
+
+        text = json.dumps(message)
+        overflowing = [client for client in targets if not client.enqueue(text, self.policy)]
         
-        # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        # Clean up clients that could not keep up
+        for client in overflowing:
+            logger.warning("Disconnecting slow WebSocket client", extra={"queued": client.queue.qsize()})
+            self.drop(client.websocket)
+        return len(targets) - len(overflowing)
 
 
 # Global connection manager instance
@@ -51,7 +191,7 @@ manager = ConnectionManager()
 
 
 @router.websocket("/ws/simulation/live")
-async def websocket_simulation_endpoint(websocket: WebSocket):
+async def websocket_simulation_endpoint(websocket: WebSocket, game_id: Optional[str] = None):
     """
     WebSocket endpoint for live simulation streaming.
     
@@ -59,8 +199,12 @@ async def websocket_simulation_endpoint(websocket: WebSocket):
     - GAME_UPDATE: Game state changes (score, quarter, time)
     - PLAY_RESULT: Individual play outcomes
     - ENGINE_UPDATE: Data from specific engines (genesis, empire, etc.)
+
+    By default a client sees every game. Pass ?game_id=... or send
+    {"type": "SUBSCRIBE", "game_id": ...} to follow specific games only
+    (UNSUBSCRIBE undoes it).
     """
-    await manager.connect(websocket)
+    await manager.connect(websocket, game_id=game_id)
     
     try:
         while True:
@@ -70,9 +214,14 @@ async def websocket_simulation_endpoint(websocket: WebSocket):
             # Handle client commands if needed
             try:
                 message = json.loads(data)
-                if message.get("type") == "PING":
-                    await websocket.send_text(json.dumps({"type": "PONG"}))
-            except json.JSONDecodeError:
+                message_type = message.get("type")
+                if message_type == "PING":
+                    manager.send(websocket, {"type": "PONG"})
+                elif message_type == "SUBSCRIBE" and message.get("game_id") is not None:
+                    manager.subscribe(websocket, message["game_id"])
+                elif message_type == "UNSUBSCRIBE" and message.get("game_id") is not None:
+                    manager.unsubscribe(websocket, message["game_id"])
+            except (json.JSONDecodeError, AttributeError):
                 logger.warning("Received invalid JSON from WebSocket client")
                 pass
                 
@@ -84,26 +233,26 @@ async def websocket_simulation_endpoint(websocket: WebSocket):
         manager.disconnect(websocket)
 
 
-async def broadcast_game_update(game_state: Dict[str, Any]):
-    """Broadcast game state update to all connected clients."""
+async def broadcast_game_update(game_state: Dict[str, Any], game_id: Optional[Any] = None):
+    """Broadcast game state update to clients following the game."""
     await manager.broadcast({
         "type": "GAME_UPDATE",
         "payload": game_state
-    })
+    }, game_id=game_id)
 
 
-async def broadcast_play_result(play_result: Dict[str, Any]):
-    """Broadcast individual play result to all connected clients."""
+async def broadcast_play_result(play_result: Dict[str, Any], game_id: Optional[Any] = None):
+    """Broadcast individual play result to clients following the game."""
     await manager.broadcast({
         "type": "PLAY_RESULT",
         "payload": play_result
-    })
+    }, game_id=game_id)
 
 
-async def broadcast_engine_update(engine_name: str, data: Dict[str, Any]):
-    """Broadcast engine-specific data to all connected clients."""
+async def broadcast_engine_update(engine_name: str, data: Dict[str, Any], game_id: Optional[Any] = None):
+    """Broadcast engine-specific data to clients following the game."""
     await manager.broadcast({
         "type": "ENGINE_UPDATE",
         "engine": engine_name,
         "payload": data
-    })
+    }, game_id=game_id)
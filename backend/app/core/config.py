@@ -39,6 +39,27 @@ class Settings(BaseSettings):
     LOG_MAX_BYTES: int = 10485760  # 10MB
     LOG_BACKUP_COUNT: int = 5
 
+    # Live simulation sessions
+    LIVE_SESSION_LIMIT: int = 64
+    LIVE_SESSION_IDLE_TIMEOUT: float = 900.0  # seconds without plays or API access
+    LIVE_SESSION_EVICT_INTERVAL: float = 60.0  # seconds between background idle sweeps
+
+    # WebSocket fan-out
+    WS_CLIENT_QUEUE_SIZE: int = 256  # messages buffered per client
+    WS_SLOW_CLIENT_POLICY: str = "drop_oldest"  # "drop_oldest" or "disconnect" when a client's queue is full
+
+    # Kernel timing (fraction of plays timed; 0 disables)
+    KERNEL_TIMING_SAMPLE_RATE: float = 1.0  # Live games
+    KERNEL_TIMING_BATCH_SAMPLE_RATE: float = 0.05  # Headless and fast-sim batch runs
+
+    # Play calling (precompiled situation -> play distribution tables; False always runs the live logic)
+    PLAY_POLICY_TABLES: bool = True
+
+    # Game state machine
+    STATE_MACHINE_SNAPSHOTS: bool = False  # Full context snapshot and log line per transition (debugging)
+    STATE_MACHINE_HISTORY_SIZE: int = 256  # Transitions kept in the ring buffer otherwise
+    STATE_MACHINE_CHECKPOINT_INTERVAL: int = 100  # Also checkpoint every N transitions (0: checkpoint states only)
+
     # Application
     DEBUG: bool = False
     ENVIRONMENT: str = "development"  # development, staging, production
@@ -0,0 +1,130 @@
+"""
+Per-phase timing for plays and games.
+
+A KernelTimer splits each play into phases (play calling, resolution, weather,
+attribute interactions, fatigue) and each game into the same phases plus
+persistence, and exports them as Prometheus histograms next to the HTTP
+metrics on /metrics. Phases may nest: resolution includes weather and
+interactions.
+
+Sampling keeps batch runs cheap: with sample_rate=0.05 only every 20th play
+reads the clock, and game totals are scaled up from the sampled plays.
+Persistence is rare and slow, so it is always timed.
+"""
+from collections import defaultdict
+from typing import Dict
+import logging
+import time
+
+from prometheus_client import Histogram
+
+logger = logging.getLogger(__name__)
+
+PLAY_CALLING = "play_calling"
+RESOLUTION = "resolution"
+WEATHER = "weather"
+INTERACTIONS = "interactions"
+FATIGUE = "fatigue"
+PERSISTENCE = "persistence"
+PLAY = "play"  # The whole play, end to end
+
+PLAY_PHASE_SECONDS = Histogram(
+    "sim_play_phase_seconds",
+    "Time spent in each phase of a sampled play",
+    ["phase"],
+    buckets=(0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.25),
+)
+GAME_PHASE_SECONDS = Histogram(
+    "sim_game_phase_seconds",
+    "Estimated time spent in each phase over a whole game",
+    ["phase"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+
+class KernelTimer:
+    """
+    Phase clock for one orchestrator.
+
+    Usage inside the play loop:
+
+        timer.start_play()
+        started = timer.clock()
+        ...
+        timer.record(PLAY_CALLING, started)
+        timer.end_play()
+
+    clock() returns 0.0 and record() does nothing for unsampled plays, so an
+    unsampled play costs a few attribute lookups.
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        self.sample_rate = max(0.0, min(1.0, float(sample_rate)))
+        # Sample every Nth play; a counter (not the sim RNG) so sampling never changes results
+        self.interval = round(1 / self.sample_rate) if self.sample_rate > 0 else 0
+        self.sampling = False
+        self.reset()
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def reset(self) -> None:
+        """Start a new game."""
+        self.plays = 0
+        self.sampled_plays = 0
+        self.sampling = False
+        self._play_started = 0.0
+        self._play: Dict[str, float] = {}
+        self.game_totals: Dict[str, float] = defaultdict(float)
+        self.unsampled_totals: Dict[str, float] = defaultdict(float)
+
+    def start_play(self) -> None:
+        self.plays += 1
+        self.sampling = self.enabled and self.plays % self.interval == 0
+        if self.sampling:
+            self._play = {}
+            self._play_started = time.perf_counter()
+
+    def clock(self) -> float:
+        return time.perf_counter() if self.sampling else 0.0
+
+    def record(self, phase: str, started: float) -> None:
+        if self.sampling:
+            self._play[phase] = self._play.get(phase, 0.0) + time.perf_counter() - started
+
+    def end_play(self) -> None:
+        if not self.sampling:
+            return
+        self._play[PLAY] = time.perf_counter() - self._play_started
+        self.sampled_plays += 1
+        for phase, seconds in self._play.items():
+            PLAY_PHASE_SECONDS.labels(phase).observe(seconds)
+            self.game_totals[phase] += seconds
+        self.sampling = False
+
+    def record_always(self, phase: str, started: float) -> None:
+        """Time a phase outside the play sampling (e.g. persistence); pass a perf_counter() start."""
+        if self.enabled:
+            self.unsampled_totals[phase] += time.perf_counter() - started
+
+    def game_summary(self) -> Dict[str, float]:
+        """Estimated seconds per phase for the game so far."""
+        scale = self.plays / self.sampled_plays if self.sampled_plays else 0.0
+        summary = {phase: seconds * scale for phase, seconds in self.game_totals.items()}
+        summary.update(self.unsampled_totals)
+        return summary
+
+    def end_game(self) -> Dict[str, float]:
+        """Observe the game's phase totals, then reset for the next game."""
+        summary = self.game_summary()
+        for phase, seconds in summary.items():
+            GAME_PHASE_SECONDS.labels(phase).observe(seconds)
+        if summary:
+            logger.debug(
+                "Game phase timings",
+                extra={"plays": self.plays, "sampled_plays": self.sampled_plays,
+                       "phases_ms": {p: round(s * 1000, 3) for p, s in summary.items()}},
+            )
+        self.reset()
+        return summary
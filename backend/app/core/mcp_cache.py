@@ -1,94 +1,239 @@
-from typing import Optional, Dict, Any, Tuple
-import time
-import logging
+"""
+Async cache for MCP responses.
+
+Two tiers: a size-bounded in-process LRU with per-type TTLs, and an optional
+shared backend (async Redis when REDIS_URL is set). get_or_fetch coalesces
+concurrent misses for the same key into a single MCP call. Hits, misses,
+evictions and coalesced requests are exported as Prometheus counters.
+"""
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Protocol, Tuple
+import asyncio
 import json
+import logging
 import os
+import time
+
+from prometheus_client import Counter
 try:
-    import redis
+    import redis.asyncio as redis
 except ImportError:
     redis = None
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TTL = 600  # 10 minutes
+DEFAULT_MAX_ENTRIES = 2048
+
+CACHE_HITS = Counter("mcp_cache_hits_total", "MCP cache hits", ["cache_type", "tier"])
+CACHE_MISSES = Counter("mcp_cache_misses_total", "MCP cache misses", ["cache_type"])
+CACHE_EVICTIONS = Counter("mcp_cache_evictions_total", "MCP cache LRU evictions")
+CACHE_COALESCED = Counter("mcp_cache_coalesced_total", "Requests that waited on an in-flight MCP call", ["cache_type"])
+
+
+class CacheBackend(Protocol):
+    """Shared cache tier; values are JSON strings."""
+
+    async def get(self, key: str) -> Optional[str]: ...
+
+    async def set(self, key: str, value: str, ttl: int) -> None: ...
+
+    async def clear(self) -> None: ...
+
+
+class RedisBackend:
+    """CacheBackend over redis.asyncio; connects lazily on first use."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.client = None
+
+    async def _client(self):
+        if self.client is None:
+            self.client = redis.from_url(self.url, decode_responses=True)
+        return self.client
+
+    async def get(self, key: str) -> Optional[str]:
+        return await (await self._client()).get(key)
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await (await self._client()).setex(key, ttl, value)
+
+    async def clear(self) -> None:
+        await (await self._client()).flushdb()
+
+
+class LRUTTLCache:
+    """In-process tier: at most max_entries items, each expiring after its own TTL."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            CACHE_EVICTIONS.inc()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class MCPCache:
     """
-    Hybrid cache for MCP responses using Redis with in-memory fallback.
+    Hybrid cache for MCP responses: in-memory LRU in front of an optional shared backend.
     """
 
-    def __init__(self):
-        self.memory_cache: Dict[str, Tuple[Any, float]] = {}
+    def __init__(self, backend: Optional[CacheBackend] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.memory_cache = LRUTTLCache(max_entries)
         self.ttl_config = {
             "league_averages": 3600,  # 1 hour
             "player_news": 900,       # 15 minutes
             "weather": 1800,          # 30 minutes
         }
+        self.backend = backend
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "backend_errors": 0}
 
-        self.redis_client = None
-        if redis:
-            try:
-                redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
-                self.redis_client = redis.from_url(redis_url, decode_responses=True)
-                # Test connection
-                self.redis_client.ping()
-                logger.info("Connected to Redis cache")
-            except Exception as e:
-                logger.warning(f"Redis connection failed, using in-memory cache: {e}")
-                self.redis_client = None
+    @classmethod
+    def from_env(cls) -> "MCPCache":
+        """Memory-only unless REDIS_URL is set and redis is installed."""
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url and redis:
+            logger.info("MCP cache using Redis backend")
+            return cls(backend=RedisBackend(redis_url))
+        return cls()
+
+    def ttl_for(self, cache_type: str) -> int:
+        return self.ttl_config.get(cache_type, DEFAULT_TTL)
 
-    def get(self, key: str, cache_type: str) -> Optional[Any]:
+    async def get(self, key: str, cache_type: str) -> Optional[Any]:
         """
         Retrieve item from cache if it exists and hasn't expired.
         """
-        # Try Redis first
-        if self.redis_client:
+        value = self.memory_cache.get(key)
+        if value is not None:
+            self._hit(cache_type, "memory")
+            logger.debug(f"MCP Memory Cache HIT: {key}")
+            return value
+
+        if self.backend is not None:
             try:
-                data = self.redis_client.get(key)
-                if data:
-                    logger.debug(f"MCP Redis Cache HIT: {key}")
-                    return json.loads(data)
+                data = await self.backend.get(key)
             except Exception as e:
-                logger.error(f"Redis get error: {e}")
-
-        # Fallback to memory
-        if key in self.memory_cache:
-            data, timestamp = self.memory_cache[key]
-            ttl = self.ttl_config.get(cache_type, 600) # Default 10 mins
-
-            if time.time() - timestamp < ttl:
-                logger.debug(f"MCP Memory Cache HIT: {key}")
-                return data
-            else:
-                logger.debug(f"MCP Memory Cache EXPIRED: {key}")
-                del self.memory_cache[key]
+                self.stats["backend_errors"] += 1
+                logger.error(f"MCP cache backend get error: {e}")
+                data = None
+            if data:
+                value = json.loads(data)
+                # Promote so the next read stays in process
+                self.memory_cache.set(key, value, self.ttl_for(cache_type))
+                self._hit(cache_type, "backend")
+                logger.debug(f"MCP Backend Cache HIT: {key}")
+                return value
 
+        self.stats["misses"] += 1
+        CACHE_MISSES.labels(cache_type=cache_type).inc()
         return None
 
-    def set(self, key: str, value: Any, cache_type: str):
+    async def set(self, key: str, value: Any, cache_type: str) -> None:
         """
         Set item in cache.
         """
-        ttl = self.ttl_config.get(cache_type, 600)
+        ttl = self.ttl_for(cache_type)
+        self.memory_cache.set(key, value, ttl)
+        logger.debug(f"MCP Memory Cache SET: {key}")
 
-        # Set in Redis
-        if self.redis_client:
+        if self.backend is not None:
             try:
-                self.redis_client.setex(key, ttl, json.dumps(value))
-                logger.debug(f"MCP Redis Cache SET: {key}")
+                await self.backend.set(key, json.dumps(value), ttl)
             except Exception as e:
-                logger.error(f"Redis set error: {e}")
+                self.stats["backend_errors"] += 1
+                logger.error(f"MCP cache backend set error: {e}")
 
-        # Set in Memory (as backup or primary)
-        self.memory_cache[key] = (value, time.time())
-        logger.debug(f"MCP Memory Cache SET: {key}")
+    async def get_or_fetch(self, key: str, cache_type: str, fetch: Callable[[], Awaitable[Any]]) -> Optional[Any]:
+        """
+        Cached value for key, calling fetch() on a miss.
+
+        Concurrent callers missing on the same key share one fetch() call.
+        None results are returned but not cached.
+        """
+        pending = self._inflight.get(key)
+        if pending is None:
+            value = await self.get(key, cache_type)
+            if value is not None:
+                return value
+            # Another caller may have started fetching while we checked the backend
+            pending = self._inflight.get(key)
+
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            CACHE_COALESCED.labels(cache_type=cache_type).inc()
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+            if value is not None:
+                await self.set(key, value, cache_type)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
 
-    def clear(self):
-        """Clear all cache entries."""
-        if self.redis_client:
+    def _hit(self, cache_type: str, tier: str) -> None:
+        self.stats["hits"] += 1
+        CACHE_HITS.labels(cache_type=cache_type, tier=tier).inc()
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            **self.stats,
+            "evictions": self.memory_cache.evictions,
+            "entries": len(self.memory_cache),
+            "inflight": len(self._inflight),
+        }
+
+    def clear(self) -> None:
+        """Clear the in-process tier."""
+        self.memory_cache.clear()
+
+    async def clear_all(self) -> None:
+        """Clear the in-process tier and the shared backend."""
+        self.clear()
+        if self.backend is not None:
             try:
-                self.redis_client.flushdb()
+                await self.backend.clear()
             except Exception as e:
-                logger.error(f"Redis clear error: {e}")
-        self.memory_cache.clear()
+                logger.error(f"MCP cache backend clear error: {e}")
 
 # Global cache instance
-mcp_cache = MCPCache()
+mcp_cache = MCPCache.from_env()
@@ -2,6 +2,8 @@ import random
 import hashlib
 from typing import Any, List, Sequence, TypeVar, Optional
 
+import numpy as np
+
 T = TypeVar('T')
 
 class DeterministicRNG:
@@ -16,6 +18,19 @@ class DeterministicRNG:
     The seed provided to the constructor is hashed using SHA-256 to generate a consistent
     integer seed for the underlying random.Random instance. This ensures that even string
     seeds (like "GAME_123") produce a robust numerical seed.
+
+    Streams:
+    stream() derives an independent child generator from this generator's seed and a
+    path of keys, never from its current state:
+
+        season = DeterministicRNG("league_1").stream("season", 2025)
+        game = season.stream("week", 3).stream("game", 41)
+        resolver = game.stream("play_resolver")
+
+    A child's draws depend only on the root seed and its path, so games (or kernels)
+    can run in any order, on any thread or process, and still produce the same
+    results. A child's seed is a plain string ("league_1/season:2025/week:3/..."),
+    which is what gets passed to worker processes.
     """
 
     def __init__(self, seed: Any):
@@ -26,7 +41,25 @@ class DeterministicRNG:
             seed: Any hashable value (string, int, etc.) used to seed the generator.
         """
         self._seed_val = seed
-        self._rng = random.Random(self._generate_int_seed(seed))
+        self._int_seed = self._generate_int_seed(seed)
+        self._rng = random.Random(self._int_seed)
+        self._batch_rng: Optional[np.random.Generator] = None
+
+    @property
+    def seed(self) -> Any:
+        """The seed this generator was created from."""
+        return self._seed_val
+
+    def stream(self, *keys: Any) -> "DeterministicRNG":
+        """
+        Return the child stream at ``keys`` below this generator.
+
+        Pure: the same keys always give a fresh generator with the same sequence,
+        however many numbers this generator has already drawn.
+        """
+        if not keys:
+            raise ValueError("stream() needs at least one key")
+        return DeterministicRNG(f"{self._seed_val}/{':'.join(str(key) for key in keys)}")
 
     def _generate_int_seed(self, seed: Any) -> int:
         """
@@ -68,3 +101,27 @@ class DeterministicRNG:
     def sample(self, population: Sequence[T], k: int) -> List[T]:
         """Chooses k unique random elements from a population sequence or set."""
         return self._rng.sample(population, k)
+
+    # Batch draws come from a separate NumPy generator seeded from the same seed, so
+    # drawing a batch never shifts the scalar sequence (and vice versa).
+
+    def _batch(self) -> np.random.Generator:
+        if self._batch_rng is None:
+            self._batch_rng = np.random.Generator(np.random.PCG64(self._int_seed))
+        return self._batch_rng
+
+    def randoms(self, n: int) -> np.ndarray:
+        """Return ``n`` floats in [0.0, 1.0) as an array."""
+        return self._batch().random(n)
+
+    def uniforms(self, a: float, b: float, n: int) -> np.ndarray:
+        """Return ``n`` floats in [a, b) as an array."""
+        return self._batch().uniform(a, b, n)
+
+    def gausses(self, mu: float, sigma: float, n: int) -> np.ndarray:
+        """Return ``n`` normally distributed floats as an array."""
+        return self._batch().normal(mu, sigma, n)
+
+    def randints(self, a: int, b: int, n: int) -> np.ndarray:
+        """Return ``n`` integers in [a, b], including both end points, as an array."""
+        return self._batch().integers(a, b, n, endpoint=True)
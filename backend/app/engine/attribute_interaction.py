@@ -23,6 +23,7 @@ The system uses a context-aware calculation that considers:
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -89,396 +90,568 @@ class InteractionDefinition:
     narrative_templates: Dict[str, str]      # Templates for outcome descriptions
 
 
-class AttributeInteractionEngine:
-    """
-    Engine for calculating complex cross-attribute effects.
+def build_interaction_catalog() -> Dict[str, InteractionDefinition]:
+    """Define every interaction. Called once per process by get_compiled_catalog()."""
+    catalog: Dict[str, InteractionDefinition] = {}
+
+    # ═══════════════════════════════════════════════════════════════════
+    # PRE-SNAP INTERACTIONS
+    # ═══════════════════════════════════════════════════════════════════
+
+    catalog["hard_count_vs_discipline"] = InteractionDefinition(
+        name="Hard Count vs Discipline",
+        interaction_type=InteractionType.PRE_SNAP,
+        attacker_attr="awareness",      # QB's ability to sell the hard count
+        defender_attr="discipline",     # DL's ability to stay patient
+        secondary_attrs=["experience", "play_recognition"],
+        positions_attacker=["QB"],
+        positions_defender=["DE", "DT", "LB"],
+        base_importance=1.5,            # High impact - free play potential
+        situational_modifiers={
+            "HOME": 0.10,               # QB gets crowd noise advantage
+            "AWAY": -0.05,              # Harder to sell on the road
+            "LOUD_STADIUM": 0.15,       # More effective in loud venues
+            "PLAYOFF": -0.10,           # Defenders more focused in playoffs
+            "4TH_QUARTER_CLOSE": -0.15, # High stakes = more discipline
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{qb} masterfully draws {defender} offsides with an Oscar-worthy hard count!",
+            "WIN": "{qb}'s hard count freezes {defender} just long enough.",
+            "SLIGHT_WIN": "{defender} nearly jumps but just holds on.",
+            "NEUTRAL": "Both sides are locked in - no pre-snap advantage.",
+            "SLIGHT_LOSS": "{defender} times the snap perfectly.",
+            "LOSS": "{defender} blows through unblocked, anticipating the snap.",
+            "DOMINANT_LOSS": "{defender} reads the hard count and jumps the snap for a devastating hit!"
+        }
+    )
+
+    catalog["coverage_disguise_vs_pre_snap_read"] = InteractionDefinition(
+        name="Coverage Disguise vs Pre-Snap Read",
+        interaction_type=InteractionType.PRE_SNAP,
+        attacker_attr="coverage_disguise",
+        defender_attr="awareness",
+        secondary_attrs=["experience", "play_recognition"],
+        positions_attacker=["LB", "S"],
+        positions_defender=["QB"],
+        base_importance=1.3,
+        situational_modifiers={
+            "3RD_DOWN": 0.20,           # More complex coverages on 3rd
+            "RED_ZONE": 0.15,           # Condensed field = more deception
+            "2_MINUTE": -0.10,          # Less time for complex disguises
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{defender} shows Tampa 2 but drops into a perfect trap coverage!",
+            "WIN": "{defender}'s disguise creates hesitation in the pocket.",
+            "SLIGHT_WIN": "The coverage look is slightly misleading.",
+            "NEUTRAL": "{qb} reads the defense correctly.",
+            "SLIGHT_LOSS": "{qb} sees through the disguise.",
+            "LOSS": "{qb} correctly identifies the coverage and audibles to the perfect play.",
+            "DOMINANT_LOSS": "{qb} reads it like a book, finding the coverage hole immediately!"
+        }
+    )
+
+    # ═══════════════════════════════════════════════════════════════════
+    # LINE OF SCRIMMAGE INTERACTIONS
+    # ═══════════════════════════════════════════════════════════════════
+
+    catalog["wr_release_vs_cb_press"] = InteractionDefinition(
+        name="WR Release vs CB Press",
+        interaction_type=InteractionType.LINE_OF_SCRIMMAGE,
+        attacker_attr="release",
+        defender_attr="press",
+        secondary_attrs=["agility", "strength", "speed"],
+        positions_attacker=["WR", "TE"],
+        positions_defender=["CB", "S"],
+        base_importance=1.4,
+        situational_modifiers={
+            "RAIN": -0.15,              # Slippery footing hurts release
+            "SNOW": -0.20,              # Even worse
+            "WIND": 0.05,               # Receiver might use wind for leverage
+            "MAN_COVERAGE": 0.20,       # Press more impactful in man
+            "ZONE": -0.10,              # Less direct matchup importance
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{wr} destroys {cb} with a filthy release - untouched into the route!",
+            "WIN": "{wr} wins off the line cleanly.",
+            "SLIGHT_WIN": "{wr} fights through contact and gets into the route.",
+            "NEUTRAL": "Physical battle at the line - neither gains advantage.",
+            "SLIGHT_LOSS": "{cb}'s jam disrupts the timing.",
+            "LOSS": "{cb} reroutes {wr} significantly.",
+            "DOMINANT_LOSS": "{cb} absolutely smothers {wr} at the line - route is dead on arrival!"
+        }
+    )
+
+    catalog["te_block_release_vs_lb_coverage"] = InteractionDefinition(
+        name="TE Block-Release vs LB Coverage",
+        interaction_type=InteractionType.LINE_OF_SCRIMMAGE,
+        attacker_attr="blocking_tenacity",  # Fake the block, then release
+        defender_attr="play_recognition",
+        secondary_attrs=["agility", "route_running", "awareness"],
+        positions_attacker=["TE"],
+        positions_defender=["LB"],
+        base_importance=1.2,
+        situational_modifiers={
+            "PLAY_ACTION": 0.25,        # PA sells the block
+            "GOAL_LINE": -0.10,         # Less room to work
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{te} sells the block perfectly and slips out wide open!",
+            "WIN": "{te} releases cleanly into the pattern.",
+            "SLIGHT_WIN": "{lb} hesitates just enough for {te} to get separation.",
+            "NEUTRAL": "{lb} stays with {te} through the release.",
+            "SLIGHT_LOSS": "{lb} reads the play and sticks with {te}.",
+            "LOSS": "{lb} is all over {te} from the snap.",
+            "DOMINANT_LOSS": "{lb} blows up the play, denying any release!"
+        }
+    )
+
+    # ═══════════════════════════════════════════════════════════════════
+    # PASS PROTECTION INTERACTIONS
+    # ═══════════════════════════════════════════════════════════════════
+
+    catalog["ol_anchor_vs_dl_first_step"] = InteractionDefinition(
+        name="OL Anchor vs DL First Step",
+        interaction_type=InteractionType.PASS_PROTECTION,
+        attacker_attr="first_step",
+        defender_attr="anchor",
+        secondary_attrs=["strength", "agility", "pass_block", "pass_rush_power"],
+        positions_attacker=["DE", "DT"],
+        positions_defender=["OT", "OG", "C"],
+        base_importance=1.8,            # Critical for pass protection
+        situational_modifiers={
+            "4TH_QUARTER": 0.10,        # DL gets boost from fatigue
+            "LONG_DRIVE": 0.15,         # OL tiring = worse anchor
+            "ROAD": 0.05,               # Crowd noise helps timing
+            "RAIN": -0.10,              # Slippery = worse first step
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{dl} explodes off the line and is in the backfield instantly!",
+            "WIN": "{dl} wins the edge with a quick get-off.",
+            "SLIGHT_WIN": "{dl} gains a half-step advantage.",
+            "NEUTRAL": "Stalemate at the point of attack.",
+            "SLIGHT_LOSS": "{ol} absorbs the rush and holds ground.",
+            "LOSS": "{ol} stonewalls {dl} with perfect technique.",
+            "DOMINANT_LOSS": "{ol} pancakes {dl} into the turf - no pass rush at all!"
+        }
+    )
+
+    catalog["ol_discipline_vs_dl_inside_move"] = InteractionDefinition(
+        name="OL Discipline vs DL Inside Counter",
+        interaction_type=InteractionType.PASS_PROTECTION,
+        attacker_attr="pass_rush_finesse",
+        defender_attr="discipline",
+        secondary_attrs=["agility", "awareness", "pass_block"],
+        positions_attacker=["DE", "DT"],
+        positions_defender=["OT", "OG", "C"],
+        base_importance=1.5,
+        situational_modifiers={
+            "3RD_AND_LONG": 0.15,       # Rushers more creative
+            "DROP_BACK_PASS": 0.10,     # More time for counters
+            "QUICK_PASS": -0.20,        # No time for counter moves
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{dl} uses a devastating swim-rip combo to blow by {ol}!",
+            "WIN": "{dl}'s counter move catches {ol} off balance.",
+            "SLIGHT_WIN": "{dl} creates a rushing lane with a flashy move.",
+            "NEUTRAL": "{ol} mirrors {dl}'s move effectively.",
+            "SLIGHT_LOSS": "{ol} recovers nicely from the initial move.",
+            "LOSS": "{ol} reads the counter and stays in front.",
+            "DOMINANT_LOSS": "{ol} bats away the move and drives {dl} into the ground!"
+        }
+    )
+
+    catalog["rb_chip_vs_blitz_timing"] = InteractionDefinition(
+        name="RB Chip Block vs LB Blitz Timing",
+        interaction_type=InteractionType.PASS_PROTECTION,
+        attacker_attr="blitz_timing",
+        defender_attr="pass_pro_rating",
+        secondary_attrs=["awareness", "speed", "strength"],
+        positions_attacker=["LB"],
+        positions_defender=["RB", "TE"],
+        base_importance=1.3,
+        situational_modifiers={
+            "MAX_PROTECT": 0.25,        # RB committed to blocking
+            "HOT_ROUTE": -0.15,         # RB releasing, less committed
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{lb} times the blitz perfectly and flies by {rb} untouched!",
+            "WIN": "{lb} gets a free run at the QB.",
+            "SLIGHT_WIN": "{rb}'s chip slows {lb} but doesn't stop them.",
+            "NEUTRAL": "{rb} and {lb} collide - both affected.",
+            "SLIGHT_LOSS": "{rb} gets a solid chip on {lb}.",
+            "LOSS": "{rb} stonewalls {lb} completely.",
+            "DOMINANT_LOSS": "{rb} delivers a devastating chip that sends {lb} to the turf!"
+        }
+    )
+
+    # ═══════════════════════════════════════════════════════════════════
+    # ROUTE VS COVERAGE INTERACTIONS
+    # ═══════════════════════════════════════════════════════════════════
+
+    catalog["route_running_vs_man_coverage"] = InteractionDefinition(
+        name="Route Running vs Man Coverage",
+        interaction_type=InteractionType.ROUTE_VS_COVERAGE,
+        attacker_attr="route_running",
+        defender_attr="man_coverage",
+        secondary_attrs=["speed", "agility", "awareness"],
+        positions_attacker=["WR", "TE", "RB"],
+        positions_defender=["CB", "S", "LB"],
+        base_importance=1.6,
+        situational_modifiers={
+            "CONCEPT_DEEP": 0.10,       # More time for route to develop
+            "CONCEPT_SHORT": -0.10,     # Less separation opportunity
+            "PRESS": -0.15,             # Already calculated in LOS
+            "OFF_COVERAGE": 0.10,       # More room to work
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{wr} runs a clinic on {cb} - wide open by 5 yards!",
+            "WIN": "{wr} creates clear separation at the break.",
+            "SLIGHT_WIN": "{wr} gains a step at the cut.",
+            "NEUTRAL": "{cb} is stride for stride with {wr}.",
+            "SLIGHT_LOSS": "{cb} anticipates the break and closes.",
+            "LOSS": "{cb} blankets {wr} throughout the route.",
+            "DOMINANT_LOSS": "{cb} jumps the route for an interception opportunity!"
+        }
+    )
+
+    catalog["ball_tracking_vs_throw_placement"] = InteractionDefinition(
+        name="DB Ball Tracking vs QB Throw Placement",
+        interaction_type=InteractionType.ROUTE_VS_COVERAGE,
+        attacker_attr="throw_accuracy_mid",  # Will be dynamic based on depth
+        defender_attr="ball_tracking",
+        secondary_attrs=["awareness", "speed", "catching"],
+        positions_attacker=["QB"],
+        positions_defender=["CB", "S"],
+        base_importance=1.4,
+        situational_modifiers={
+            "SUN_IN_EYES": 0.15,        # DB has trouble tracking
+            "NIGHT_GAME": -0.05,        # Lighting more consistent
+            "WIND": 0.20,               # Ball tracking harder in wind
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{qb} throws a perfect back-shoulder fade - DB has no chance!",
+            "WIN": "The ball placement puts {db} in a trailing position.",
+            "SLIGHT_WIN": "Good throw placement, but {db} nearly adjusts.",
+            "NEUTRAL": "Both the throw and coverage are contested.",
+            "SLIGHT_LOSS": "{db} tracks the ball well and is in position.",
+            "LOSS": "{db} reads the throw and makes a play on the ball.",
+            "DOMINANT_LOSS": "{db} high-points the ball for an incredible interception!"
+        }
+    )
+
+    # ═══════════════════════════════════════════════════════════════════
+    # RUN GAME INTERACTIONS
+    # ═══════════════════════════════════════════════════════════════════
+
+    catalog["rb_patience_vs_lb_run_fit"] = InteractionDefinition(
+        name="RB Patience vs LB Run Fit",
+        interaction_type=InteractionType.RUN_GAME,
+        attacker_attr="patience",
+        defender_attr="run_fit",
+        secondary_attrs=["awareness", "speed", "agility", "play_recognition"],
+        positions_attacker=["RB"],
+        positions_defender=["LB"],
+        base_importance=1.5,
+        situational_modifiers={
+            "INSIDE_RUN": 0.10,         # Patience more valuable inside
+            "OUTSIDE_RUN": -0.10,       # Speed more important outside
+            "GOAL_LINE": -0.20,         # No room for patience
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{rb} waits for the hole to develop, then explodes through!",
+            "WIN": "{rb}'s patience allows blockers to seal the lane.",
+            "SLIGHT_WIN": "{rb} makes a subtle cut to find daylight.",
+            "NEUTRAL": "Both {rb} and {lb} in position - contested yards.",
+            "SLIGHT_LOSS": "{lb} fills the gap before {rb} can react.",
+            "LOSS": "{lb} is in the hole immediately.",
+            "DOMINANT_LOSS": "{lb} reads it perfectly and blows up the play in the backfield!"
+        }
+    )
+
+    catalog["ol_pull_vs_dl_gap_integrity"] = InteractionDefinition(
+        name="OL Pull Speed vs DL Gap Integrity",
+        interaction_type=InteractionType.RUN_GAME,
+        attacker_attr="pull_speed",
+        defender_attr="gap_integrity",
+        secondary_attrs=["speed", "agility", "run_block", "block_shed"],
+        positions_attacker=["OG", "C"],
+        positions_defender=["DE", "DT", "LB"],
+        base_importance=1.4,
+        situational_modifiers={
+            "POWER_SCHEME": 0.15,       # Pull is central to the play
+            "ZONE_SCHEME": -0.10,       # Less pulling in zone
+            "TRAP": 0.20,               # Misdirection helps the pull
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{ol} gets out and creates a massive lane - convoy blocking!",
+            "WIN": "{ol} kicks out the edge defender perfectly.",
+            "SLIGHT_WIN": "{ol} gets enough to spring the runner.",
+            "NEUTRAL": "{dl} and {ol} meet at the point of attack.",
+            "SLIGHT_LOSS": "{dl} stays in lane and forces a cut.",
+            "LOSS": "{dl} sheds the block and makes the tackle.",
+            "DOMINANT_LOSS": "{dl} blows through the pull and stuffs the play!"
+        }
+    )
+
+    # ═══════════════════════════════════════════════════════════════════
+    # BALL CARRIER INTERACTIONS (YAC)
+    # ═══════════════════════════════════════════════════════════════════
+
+    catalog["juke_vs_tackle"] = InteractionDefinition(
+        name="Ball Carrier Jukes vs Open Field Tackle",
+        interaction_type=InteractionType.BALL_CARRIER,
+        attacker_attr="juke_efficiency",
+        defender_attr="tackle",
+        secondary_attrs=["agility", "speed", "awareness"],
+        positions_attacker=["RB", "WR"],
+        positions_defender=["CB", "S", "LB"],
+        base_importance=1.3,
+        situational_modifiers={
+            "OPEN_FIELD": 0.20,         # More room for moves
+            "SIDELINE": -0.15,          # Less room to operate
+            "FATIGUE_HIGH": 0.15,       # Tackler more likely to miss
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{bc} puts {defender} on skates with a filthy juke!",
+            "WIN": "{bc} makes {defender} miss in space.",
+            "SLIGHT_WIN": "{bc} spins out of the tackle attempt.",
+            "NEUTRAL": "{defender} slows {bc} but doesn't bring them down.",
+            "SLIGHT_LOSS": "{defender} wraps up but {bc} falls forward.",
+            "LOSS": "Solid open field tackle by {defender}.",
+            "DOMINANT_LOSS": "{defender} delivers a huge hit and forces a fumble!"
+        }
+    )
+
+    # ═══════════════════════════════════════════════════════════════════
+    # LEADERSHIP/TEAM INTERACTIONS
+    # ═══════════════════════════════════════════════════════════════════
+
+    catalog["field_general_influence"] = InteractionDefinition(
+        name="Field General Leadership Boost",
+        interaction_type=InteractionType.LEADERSHIP,
+        attacker_attr="awareness",      # QB's awareness creates the boost
+        defender_attr="awareness",      # Opposition awareness resists
+        secondary_attrs=["experience"],
+        positions_attacker=["QB"],
+        positions_defender=["LB"],      # Defensive captain counters
+        base_importance=1.0,
+        situational_modifiers={
+            "HOME": 0.10,
+            "LEAD": 0.15,
+            "TRAILING_LATE": -0.20,
+        },
+        narrative_templates={
+            "DOMINANT_WIN": "{qb} has the offense humming - everyone is on the same page!",
+            "WIN": "{qb}'s leadership keeps the offense composed.",
+            "SLIGHT_WIN": "The offense shows good execution.",
+            "NEUTRAL": "Both units are playing disciplined football.",
+            "SLIGHT_LOSS": "The defense's intensity is disrupting rhythm.",
+            "LOSS": "{lb} has the defense playing with fire.",
+            "DOMINANT_LOSS": "The defense is swarming - offense can't get anything going!"
+        }
+    )
 
-    This is the brain behind strategic matchups in the simulation.
-    It goes beyond simple A vs B comparisons to model the nuanced
-    rock-paper-scissors nature of football positioning.
-    """
+    return catalog
 
-    # Interaction Catalog - All defined matchup types
-    INTERACTION_CATALOG: Dict[str, InteractionDefinition] = {}
 
-    def __init__(self, rng: Any = None):
-        """
-        Initialize the Attribute Interaction Engine.
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMPILED CATALOG
+# ═══════════════════════════════════════════════════════════════════════════════
 
-        Args:
-            rng: DeterministicRNG instance for reproducible randomness
-        """
-        self.rng = rng
-        self._initialize_catalog()
-        logger.info("AttributeInteractionEngine initialized with %d interactions",
-                   len(self.INTERACTION_CATALOG))
+# Narrative placeholders filled with the attacker's name; any other role is the defender
+ATTACKER_PLACEHOLDERS = ("qb", "wr", "te", "rb", "ol", "bc", "attacker")
+DEFENDER_PLACEHOLDERS = ("dl", "lb", "cb", "db", "s", "defender")
+
+PLAY_TYPES = ("PASS", "RUN")
+
+PHASE_TYPES: Dict[str, Tuple[InteractionType, ...]] = {
+    "PRE_SNAP": (InteractionType.PRE_SNAP,),
+    "SNAP": (InteractionType.LINE_OF_SCRIMMAGE, InteractionType.PASS_PROTECTION),
+    "POST_SNAP": (
+        InteractionType.ROUTE_VS_COVERAGE,
+        InteractionType.RUN_GAME,
+        InteractionType.BALL_CARRIER
+    ),
+}
+
+# Interaction types that never apply to a play type
+EXCLUDED_TYPES: Dict[str, InteractionType] = {
+    "PASS": InteractionType.RUN_GAME,
+    "RUN": InteractionType.PASS_PROTECTION,
+}
+
+
+def _compile_template(template: str) -> str:
+    """Turn a narrative template into a format string taking (attacker_name, defender_name)."""
+    compiled = template.replace("{", "{{").replace("}", "}}")
+    for placeholder in ATTACKER_PLACEHOLDERS:
+        compiled = compiled.replace(f"{{{{{placeholder}}}}}", "{0}")
+    for placeholder in DEFENDER_PLACEHOLDERS:
+        compiled = compiled.replace(f"{{{{{placeholder}}}}}", "{1}")
+    return compiled
+
+
+@dataclass(frozen=True)
+class CompiledInteraction:
+    """An InteractionDefinition flattened into the values the hot path reads."""
+    name: str
+    definition: InteractionDefinition
+    secondary_attrs: Tuple[str, ...]                    # Max 2 count toward the differential
+    situational_modifiers: Tuple[Tuple[str, str, float], ...]  # (KEY, key, modifier)
+    narratives: Dict[str, str]                          # Outcome -> format string
+
+    @classmethod
+    def compile(cls, name: str, definition: InteractionDefinition) -> "CompiledInteraction":
+        narratives = {}
+        for outcome in InteractionOutcome:
+            template = definition.narrative_templates.get(outcome.value, "")
+            if template:
+                narratives[outcome.value] = _compile_template(template)
+            else:
+                narratives[outcome.value] = f"{outcome.value} in {definition.name}".replace("{", "{{").replace("}", "}}")
+
+        return cls(
+            name=name,
+            definition=definition,
+            secondary_attrs=tuple(definition.secondary_attrs[:2]),
+            situational_modifiers=tuple(
+                (situation, situation.lower(), modifier)
+                for situation, modifier in definition.situational_modifiers.items()
+            ),
+            narratives=narratives
+        )
 
-    def _initialize_catalog(self) -> None:
-        """Initialize all interaction definitions."""
 
-        # ═══════════════════════════════════════════════════════════════════
-        # PRE-SNAP INTERACTIONS
-        # ═══════════════════════════════════════════════════════════════════
+class CompiledInteractionCatalog:
+    """
+    The interaction catalog with lookup tables precomputed.
 
-        self.INTERACTION_CATALOG["hard_count_vs_discipline"] = InteractionDefinition(
-            name="Hard Count vs Discipline",
-            interaction_type=InteractionType.PRE_SNAP,
-            attacker_attr="awareness",      # QB's ability to sell the hard count
-            defender_attr="discipline",     # DL's ability to stay patient
-            secondary_attrs=["experience", "play_recognition"],
-            positions_attacker=["QB"],
-            positions_defender=["DE", "DT", "LB"],
-            base_importance=1.5,            # High impact - free play potential
-            situational_modifiers={
-                "HOME": 0.10,               # QB gets crowd noise advantage
-                "AWAY": -0.05,              # Harder to sell on the road
-                "LOUD_STADIUM": 0.15,       # More effective in loud venues
-                "PLAYOFF": -0.10,           # Defenders more focused in playoffs
-                "4TH_QUARTER_CLOSE": -0.15, # High stakes = more discipline
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{qb} masterfully draws {defender} offsides with an Oscar-worthy hard count!",
-                "WIN": "{qb}'s hard count freezes {defender} just long enough.",
-                "SLIGHT_WIN": "{defender} nearly jumps but just holds on.",
-                "NEUTRAL": "Both sides are locked in - no pre-snap advantage.",
-                "SLIGHT_LOSS": "{defender} times the snap perfectly.",
-                "LOSS": "{defender} blows through unblocked, anticipating the snap.",
-                "DOMINANT_LOSS": "{defender} reads the hard count and jumps the snap for a devastating hit!"
-            }
-        )
+    Indexes:
+    - by (attacker position, defender position)
+    - by (play type, attacker position, defender position)
+    - by (play type, phase)
+    """
 
-        self.INTERACTION_CATALOG["coverage_disguise_vs_pre_snap_read"] = InteractionDefinition(
-            name="Coverage Disguise vs Pre-Snap Read",
-            interaction_type=InteractionType.PRE_SNAP,
-            attacker_attr="coverage_disguise",
-            defender_attr="awareness",
-            secondary_attrs=["experience", "play_recognition"],
-            positions_attacker=["LB", "S"],
-            positions_defender=["QB"],
-            base_importance=1.3,
-            situational_modifiers={
-                "3RD_DOWN": 0.20,           # More complex coverages on 3rd
-                "RED_ZONE": 0.15,           # Condensed field = more deception
-                "2_MINUTE": -0.10,          # Less time for complex disguises
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{defender} shows Tampa 2 but drops into a perfect trap coverage!",
-                "WIN": "{defender}'s disguise creates hesitation in the pocket.",
-                "SLIGHT_WIN": "The coverage look is slightly misleading.",
-                "NEUTRAL": "{qb} reads the defense correctly.",
-                "SLIGHT_LOSS": "{qb} sees through the disguise.",
-                "LOSS": "{qb} correctly identifies the coverage and audibles to the perfect play.",
-                "DOMINANT_LOSS": "{qb} reads it like a book, finding the coverage hole immediately!"
-            }
-        )
+    def __init__(self, definitions: Dict[str, InteractionDefinition]):
+        self.definitions = definitions
+        self.interactions: Dict[str, CompiledInteraction] = {
+            name: CompiledInteraction.compile(name, defn) for name, defn in definitions.items()
+        }
 
-        # ═══════════════════════════════════════════════════════════════════
-        # LINE OF SCRIMMAGE INTERACTIONS
-        # ═══════════════════════════════════════════════════════════════════
-
-        self.INTERACTION_CATALOG["wr_release_vs_cb_press"] = InteractionDefinition(
-            name="WR Release vs CB Press",
-            interaction_type=InteractionType.LINE_OF_SCRIMMAGE,
-            attacker_attr="release",
-            defender_attr="press",
-            secondary_attrs=["agility", "strength", "speed"],
-            positions_attacker=["WR", "TE"],
-            positions_defender=["CB", "S"],
-            base_importance=1.4,
-            situational_modifiers={
-                "RAIN": -0.15,              # Slippery footing hurts release
-                "SNOW": -0.20,              # Even worse
-                "WIND": 0.05,               # Receiver might use wind for leverage
-                "MAN_COVERAGE": 0.20,       # Press more impactful in man
-                "ZONE": -0.10,              # Less direct matchup importance
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{wr} destroys {cb} with a filthy release - untouched into the route!",
-                "WIN": "{wr} wins off the line cleanly.",
-                "SLIGHT_WIN": "{wr} fights through contact and gets into the route.",
-                "NEUTRAL": "Physical battle at the line - neither gains advantage.",
-                "SLIGHT_LOSS": "{cb}'s jam disrupts the timing.",
-                "LOSS": "{cb} reroutes {wr} significantly.",
-                "DOMINANT_LOSS": "{cb} absolutely smothers {wr} at the line - route is dead on arrival!"
+        self.by_positions: Dict[Tuple[str, str], Tuple[CompiledInteraction, ...]] = {}
+        self.by_play: Dict[Tuple[str, str, str], Tuple[CompiledInteraction, ...]] = {}
+        self.by_phase: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+
+        by_positions: Dict[Tuple[str, str], List[CompiledInteraction]] = {}
+        for compiled in self.interactions.values():
+            defn = compiled.definition
+            for attacker_pos in defn.positions_attacker:
+                for defender_pos in defn.positions_defender:
+                    by_positions.setdefault((attacker_pos, defender_pos), []).append(compiled)
+        self.by_positions = {key: tuple(value) for key, value in by_positions.items()}
+
+        for play_type in PLAY_TYPES:
+            phase_names = {
+                phase: tuple(
+                    name for name, defn in definitions.items()
+                    if defn.interaction_type in types and defn.interaction_type != EXCLUDED_TYPES[play_type]
+                )
+                for phase, types in PHASE_TYPES.items()
             }
-        )
+            for phase, names in phase_names.items():
+                self.by_phase[(play_type, phase)] = names
 
-        self.INTERACTION_CATALOG["te_block_release_vs_lb_coverage"] = InteractionDefinition(
-            name="TE Block-Release vs LB Coverage",
-            interaction_type=InteractionType.LINE_OF_SCRIMMAGE,
-            attacker_attr="blocking_tenacity",  # Fake the block, then release
-            defender_attr="play_recognition",
-            secondary_attrs=["agility", "route_running", "awareness"],
-            positions_attacker=["TE"],
-            positions_defender=["LB"],
-            base_importance=1.2,
-            situational_modifiers={
-                "PLAY_ACTION": 0.25,        # PA sells the block
-                "GOAL_LINE": -0.10,         # Less room to work
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{te} sells the block perfectly and slips out wide open!",
-                "WIN": "{te} releases cleanly into the pattern.",
-                "SLIGHT_WIN": "{lb} hesitates just enough for {te} to get separation.",
-                "NEUTRAL": "{lb} stays with {te} through the release.",
-                "SLIGHT_LOSS": "{lb} reads the play and sticks with {te}.",
-                "LOSS": "{lb} is all over {te} from the snap.",
-                "DOMINANT_LOSS": "{lb} blows up the play, denying any release!"
-            }
-        )
+            play_names = {name for names in phase_names.values() for name in names}
+            for (attacker_pos, defender_pos), interactions in self.by_positions.items():
+                relevant = tuple(c for c in interactions if c.name in play_names)
+                if relevant:
+                    self.by_play[(play_type, attacker_pos, defender_pos)] = relevant
 
-        # ═══════════════════════════════════════════════════════════════════
-        # PASS PROTECTION INTERACTIONS
-        # ═══════════════════════════════════════════════════════════════════
-
-        self.INTERACTION_CATALOG["ol_anchor_vs_dl_first_step"] = InteractionDefinition(
-            name="OL Anchor vs DL First Step",
-            interaction_type=InteractionType.PASS_PROTECTION,
-            attacker_attr="first_step",
-            defender_attr="anchor",
-            secondary_attrs=["strength", "agility", "pass_block", "pass_rush_power"],
-            positions_attacker=["DE", "DT"],
-            positions_defender=["OT", "OG", "C"],
-            base_importance=1.8,            # Critical for pass protection
-            situational_modifiers={
-                "4TH_QUARTER": 0.10,        # DL gets boost from fatigue
-                "LONG_DRIVE": 0.15,         # OL tiring = worse anchor
-                "ROAD": 0.05,               # Crowd noise helps timing
-                "RAIN": -0.10,              # Slippery = worse first step
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{dl} explodes off the line and is in the backfield instantly!",
-                "WIN": "{dl} wins the edge with a quick get-off.",
-                "SLIGHT_WIN": "{dl} gains a half-step advantage.",
-                "NEUTRAL": "Stalemate at the point of attack.",
-                "SLIGHT_LOSS": "{ol} absorbs the rush and holds ground.",
-                "LOSS": "{ol} stonewalls {dl} with perfect technique.",
-                "DOMINANT_LOSS": "{ol} pancakes {dl} into the turf - no pass rush at all!"
-            }
-        )
+    def get(self, name: str) -> Optional[CompiledInteraction]:
+        return self.interactions.get(name)
 
-        self.INTERACTION_CATALOG["ol_discipline_vs_dl_inside_move"] = InteractionDefinition(
-            name="OL Discipline vs DL Inside Counter",
-            interaction_type=InteractionType.PASS_PROTECTION,
-            attacker_attr="pass_rush_finesse",
-            defender_attr="discipline",
-            secondary_attrs=["agility", "awareness", "pass_block"],
-            positions_attacker=["DE", "DT"],
-            positions_defender=["OT", "OG", "C"],
-            base_importance=1.5,
-            situational_modifiers={
-                "3RD_AND_LONG": 0.15,       # Rushers more creative
-                "DROP_BACK_PASS": 0.10,     # More time for counters
-                "QUICK_PASS": -0.20,        # No time for counter moves
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{dl} uses a devastating swim-rip combo to blow by {ol}!",
-                "WIN": "{dl}'s counter move catches {ol} off balance.",
-                "SLIGHT_WIN": "{dl} creates a rushing lane with a flashy move.",
-                "NEUTRAL": "{ol} mirrors {dl}'s move effectively.",
-                "SLIGHT_LOSS": "{ol} recovers nicely from the initial move.",
-                "LOSS": "{ol} reads the counter and stays in front.",
-                "DOMINANT_LOSS": "{ol} bats away the move and drives {dl} into the ground!"
-            }
-        )
+    def for_positions(
+        self,
+        attacker_pos: str,
+        defender_pos: str,
+        play_type: Optional[str] = None
+    ) -> Tuple[CompiledInteraction, ...]:
+        """Interactions for a position pair, optionally limited to one play type."""
+        if play_type is None:
+            return self.by_positions.get((attacker_pos, defender_pos), ())
+        return self.by_play.get((play_type, attacker_pos, defender_pos), ())
+
+    def for_situation(self, play_type: str, phase: str) -> List[str]:
+        if play_type in PLAY_TYPES:
+            return list(self.by_phase.get((play_type, phase), ()))
+
+        # Unknown play types only filter by phase
+        types = PHASE_TYPES.get(phase, ())
+        return [name for name, defn in self.definitions.items() if defn.interaction_type in types]
+
+    def snap_matchups(
+        self,
+        offense: List[Any],
+        defense: List[Any],
+        play_type: str
+    ) -> List[Tuple[CompiledInteraction, Any, Any]]:
+        """
+        Every applicable matchup on one snap, with either side as the aggressor.
 
-        self.INTERACTION_CATALOG["rb_chip_vs_blitz_timing"] = InteractionDefinition(
-            name="RB Chip Block vs LB Blitz Timing",
-            interaction_type=InteractionType.PASS_PROTECTION,
-            attacker_attr="blitz_timing",
-            defender_attr="pass_pro_rating",
-            secondary_attrs=["awareness", "speed", "strength"],
-            positions_attacker=["LB"],
-            positions_defender=["RB", "TE"],
-            base_importance=1.3,
-            situational_modifiers={
-                "MAX_PROTECT": 0.25,        # RB committed to blocking
-                "HOT_ROUTE": -0.15,         # RB releasing, less committed
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{lb} times the blitz perfectly and flies by {rb} untouched!",
-                "WIN": "{lb} gets a free run at the QB.",
-                "SLIGHT_WIN": "{rb}'s chip slows {lb} but doesn't stop them.",
-                "NEUTRAL": "{rb} and {lb} collide - both affected.",
-                "SLIGHT_LOSS": "{rb} gets a solid chip on {lb}.",
-                "LOSS": "{rb} stonewalls {lb} completely.",
-                "DOMINANT_LOSS": "{rb} delivers a devastating chip that sends {lb} to the turf!"
-            }
-        )
+        Offense-initiated matchups come first, in offense then defense order,
+        followed by defense-initiated ones.
+        """
+        matchups = []
+        for attackers, defenders in ((offense, defense), (defense, offense)):
+            for attacker in attackers:
+                attacker_pos = getattr(attacker, "position", None)
+                for defender in defenders:
+                    interactions = self.by_play.get((play_type, attacker_pos, getattr(defender, "position", None)))
+                    if interactions:
+                        matchups.extend((compiled, attacker, defender) for compiled in interactions)
+        return matchups
 
-        # ═══════════════════════════════════════════════════════════════════
-        # ROUTE VS COVERAGE INTERACTIONS
-        # ═══════════════════════════════════════════════════════════════════
-
-        self.INTERACTION_CATALOG["route_running_vs_man_coverage"] = InteractionDefinition(
-            name="Route Running vs Man Coverage",
-            interaction_type=InteractionType.ROUTE_VS_COVERAGE,
-            attacker_attr="route_running",
-            defender_attr="man_coverage",
-            secondary_attrs=["speed", "agility", "awareness"],
-            positions_attacker=["WR", "TE", "RB"],
-            positions_defender=["CB", "S", "LB"],
-            base_importance=1.6,
-            situational_modifiers={
-                "CONCEPT_DEEP": 0.10,       # More time for route to develop
-                "CONCEPT_SHORT": -0.10,     # Less separation opportunity
-                "PRESS": -0.15,             # Already calculated in LOS
-                "OFF_COVERAGE": 0.10,       # More room to work
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{wr} runs a clinic on {cb} - wide open by 5 yards!",
-                "WIN": "{wr} creates clear separation at the break.",
-                "SLIGHT_WIN": "{wr} gains a step at the cut.",
-                "NEUTRAL": "{cb} is stride for stride with {wr}.",
-                "SLIGHT_LOSS": "{cb} anticipates the break and closes.",
-                "LOSS": "{cb} blankets {wr} throughout the route.",
-                "DOMINANT_LOSS": "{cb} jumps the route for an interception opportunity!"
-            }
-        )
 
-        self.INTERACTION_CATALOG["ball_tracking_vs_throw_placement"] = InteractionDefinition(
-            name="DB Ball Tracking vs QB Throw Placement",
-            interaction_type=InteractionType.ROUTE_VS_COVERAGE,
-            attacker_attr="throw_accuracy_mid",  # Will be dynamic based on depth
-            defender_attr="ball_tracking",
-            secondary_attrs=["awareness", "speed", "catching"],
-            positions_attacker=["QB"],
-            positions_defender=["CB", "S"],
-            base_importance=1.4,
-            situational_modifiers={
-                "SUN_IN_EYES": 0.15,        # DB has trouble tracking
-                "NIGHT_GAME": -0.05,        # Lighting more consistent
-                "WIND": 0.20,               # Ball tracking harder in wind
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{qb} throws a perfect back-shoulder fade - DB has no chance!",
-                "WIN": "The ball placement puts {db} in a trailing position.",
-                "SLIGHT_WIN": "Good throw placement, but {db} nearly adjusts.",
-                "NEUTRAL": "Both the throw and coverage are contested.",
-                "SLIGHT_LOSS": "{db} tracks the ball well and is in position.",
-                "LOSS": "{db} reads the throw and makes a play on the ball.",
-                "DOMINANT_LOSS": "{db} high-points the ball for an incredible interception!"
-            }
-        )
+@lru_cache(maxsize=None)
+def get_compiled_catalog() -> CompiledInteractionCatalog:
+    """Build and index the interaction catalog once per process."""
+    catalog = CompiledInteractionCatalog(build_interaction_catalog())
+    logger.info("Compiled attribute interaction catalog with %d interactions", len(catalog.interactions))
+    return catalog
 
-        # ═══════════════════════════════════════════════════════════════════
-        # RUN GAME INTERACTIONS
-        # ═══════════════════════════════════════════════════════════════════
-
-        self.INTERACTION_CATALOG["rb_patience_vs_lb_run_fit"] = InteractionDefinition(
-            name="RB Patience vs LB Run Fit",
-            interaction_type=InteractionType.RUN_GAME,
-            attacker_attr="patience",
-            defender_attr="run_fit",
-            secondary_attrs=["awareness", "speed", "agility", "play_recognition"],
-            positions_attacker=["RB"],
-            positions_defender=["LB"],
-            base_importance=1.5,
-            situational_modifiers={
-                "INSIDE_RUN": 0.10,         # Patience more valuable inside
-                "OUTSIDE_RUN": -0.10,       # Speed more important outside
-                "GOAL_LINE": -0.20,         # No room for patience
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{rb} waits for the hole to develop, then explodes through!",
-                "WIN": "{rb}'s patience allows blockers to seal the lane.",
-                "SLIGHT_WIN": "{rb} makes a subtle cut to find daylight.",
-                "NEUTRAL": "Both {rb} and {lb} in position - contested yards.",
-                "SLIGHT_LOSS": "{lb} fills the gap before {rb} can react.",
-                "LOSS": "{lb} is in the hole immediately.",
-                "DOMINANT_LOSS": "{lb} reads it perfectly and blows up the play in the backfield!"
-            }
-        )
 
-        self.INTERACTION_CATALOG["ol_pull_vs_dl_gap_integrity"] = InteractionDefinition(
-            name="OL Pull Speed vs DL Gap Integrity",
-            interaction_type=InteractionType.RUN_GAME,
-            attacker_attr="pull_speed",
-            defender_attr="gap_integrity",
-            secondary_attrs=["speed", "agility", "run_block", "block_shed"],
-            positions_attacker=["OG", "C"],
-            positions_defender=["DE", "DT", "LB"],
-            base_importance=1.4,
-            situational_modifiers={
-                "POWER_SCHEME": 0.15,       # Pull is central to the play
-                "ZONE_SCHEME": -0.10,       # Less pulling in zone
-                "TRAP": 0.20,               # Misdirection helps the pull
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{ol} gets out and creates a massive lane - convoy blocking!",
-                "WIN": "{ol} kicks out the edge defender perfectly.",
-                "SLIGHT_WIN": "{ol} gets enough to spring the runner.",
-                "NEUTRAL": "{dl} and {ol} meet at the point of attack.",
-                "SLIGHT_LOSS": "{dl} stays in lane and forces a cut.",
-                "LOSS": "{dl} sheds the block and makes the tackle.",
-                "DOMINANT_LOSS": "{dl} blows through the pull and stuffs the play!"
-            }
-        )
+class AttributeInteractionEngine:
+    """
+    Engine for calculating complex cross-attribute effects.
 
-        # ═══════════════════════════════════════════════════════════════════
-        # BALL CARRIER INTERACTIONS (YAC)
-        # ═══════════════════════════════════════════════════════════════════
-
-        self.INTERACTION_CATALOG["juke_vs_tackle"] = InteractionDefinition(
-            name="Ball Carrier Jukes vs Open Field Tackle",
-            interaction_type=InteractionType.BALL_CARRIER,
-            attacker_attr="juke_efficiency",
-            defender_attr="tackle",
-            secondary_attrs=["agility", "speed", "awareness"],
-            positions_attacker=["RB", "WR"],
-            positions_defender=["CB", "S", "LB"],
-            base_importance=1.3,
-            situational_modifiers={
-                "OPEN_FIELD": 0.20,         # More room for moves
-                "SIDELINE": -0.15,          # Less room to operate
-                "FATIGUE_HIGH": 0.15,       # Tackler more likely to miss
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{bc} puts {defender} on skates with a filthy juke!",
-                "WIN": "{bc} makes {defender} miss in space.",
-                "SLIGHT_WIN": "{bc} spins out of the tackle attempt.",
-                "NEUTRAL": "{defender} slows {bc} but doesn't bring them down.",
-                "SLIGHT_LOSS": "{defender} wraps up but {bc} falls forward.",
-                "LOSS": "Solid open field tackle by {defender}.",
-                "DOMINANT_LOSS": "{defender} delivers a huge hit and forces a fumble!"
-            }
-        )
+    This is the brain behind strategic matchups in the simulation.
+    It goes beyond simple A vs B comparisons to model the nuanced
+    rock-paper-scissors nature of football positioning.
+    """
 
-        # ═══════════════════════════════════════════════════════════════════
-        # LEADERSHIP/TEAM INTERACTIONS
-        # ═══════════════════════════════════════════════════════════════════
-
-        self.INTERACTION_CATALOG["field_general_influence"] = InteractionDefinition(
-            name="Field General Leadership Boost",
-            interaction_type=InteractionType.LEADERSHIP,
-            attacker_attr="awareness",      # QB's awareness creates the boost
-            defender_attr="awareness",      # Opposition awareness resists
-            secondary_attrs=["experience"],
-            positions_attacker=["QB"],
-            positions_defender=["LB"],      # Defensive captain counters
-            base_importance=1.0,
-            situational_modifiers={
-                "HOME": 0.10,
-                "LEAD": 0.15,
-                "TRAILING_LATE": -0.20,
-            },
-            narrative_templates={
-                "DOMINANT_WIN": "{qb} has the offense humming - everyone is on the same page!",
-                "WIN": "{qb}'s leadership keeps the offense composed.",
-                "SLIGHT_WIN": "The offense shows good execution.",
-                "NEUTRAL": "Both units are playing disciplined football.",
-                "SLIGHT_LOSS": "The defense's intensity is disrupting rhythm.",
-                "LOSS": "{lb} has the defense playing with fire.",
-                "DOMINANT_LOSS": "The defense is swarming - offense can't get anything going!"
-            }
-        )
+    # Interaction Catalog - All defined matchup types (shared, compiled once per process)
+    INTERACTION_CATALOG: Dict[str, InteractionDefinition] = {}
+
+    def __init__(self, rng: Any = None, numbers_only: bool = False):
+        """
+        Initialize the Attribute Interaction Engine.
+
+        Args:
+            rng: DeterministicRNG instance for reproducible randomness
+            numbers_only: Skip narrative generation by default (e.g. headless sims)
+        """
+        self.rng = rng
+        self.numbers_only = numbers_only
+        self.catalog = get_compiled_catalog()
+        self.INTERACTION_CATALOG = self.catalog.definitions
 
     def calculate_interaction(
         self,
         interaction_name: str,
         attacker: Any,
         defender: Any,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        numbers_only: Optional[bool] = None
     ) -> InteractionResult:
         """
         Calculate the result of an attribute interaction.
@@ -488,16 +661,30 @@ class AttributeInteractionEngine:
             attacker: Player object with attributes (offense/aggressor role)
             defender: Player object with attributes (defense/resistance role)
             context: Game situation modifiers
+            numbers_only: Leave the narrative empty; defaults to the engine setting
 
         Returns:
             InteractionResult with calculated outcome
         """
-        if interaction_name not in self.INTERACTION_CATALOG:
+        compiled = self.catalog.get(interaction_name)
+        if compiled is None:
             logger.warning(f"Unknown interaction: {interaction_name}")
             return self._create_neutral_result(interaction_name)
 
-        definition = self.INTERACTION_CATALOG[interaction_name]
-        context = context or {}
+        if numbers_only is None:
+            numbers_only = self.numbers_only
+        return self._evaluate(compiled, attacker, defender, context or {}, numbers_only)
+
+    def _evaluate(
+        self,
+        compiled: CompiledInteraction,
+        attacker: Any,
+        defender: Any,
+        context: Dict[str, Any],
+        numbers_only: bool
+    ) -> InteractionResult:
+        """Score one matchup against a compiled interaction."""
+        definition = compiled.definition
 
         # Step 1: Get primary attributes
         attacker_primary = getattr(attacker, definition.attacker_attr, 50)
@@ -507,7 +694,7 @@ class AttributeInteractionEngine:
         attacker_secondary_bonus = 0.0
         defender_secondary_bonus = 0.0
 
-        for i, attr in enumerate(definition.secondary_attrs[:2]):
+        for attr in compiled.secondary_attrs:
             attacker_val = getattr(attacker, attr, 50)
             defender_val = getattr(defender, attr, 50)
 
@@ -518,8 +705,8 @@ class AttributeInteractionEngine:
         situational_modifier = 0.0
         modifiers_applied = {}
 
-        for situation, modifier in definition.situational_modifiers.items():
-            if context.get(situation.lower(), False) or context.get(situation, False):
+        for situation, situation_key, modifier in compiled.situational_modifiers:
+            if context.get(situation_key, False) or context.get(situation, False):
                 situational_modifier += modifier
                 modifiers_applied[situation] = modifier
 
@@ -569,8 +756,8 @@ class AttributeInteractionEngine:
         )
 
         # Step 9: Generate narrative
-        narrative = self._generate_narrative(
-            definition,
+        narrative = "" if numbers_only else self._generate_narrative(
+            compiled,
             outcome,
             attacker,
             defender
@@ -631,39 +818,20 @@ class AttributeInteractionEngine:
 
     def _generate_narrative(
         self,
-        definition: InteractionDefinition,
+        compiled: CompiledInteraction,
         outcome: InteractionOutcome,
         attacker: Any,
         defender: Any
     ) -> str:
         """Generate a human-readable narrative for the interaction."""
-        template = definition.narrative_templates.get(outcome.value, "")
-
-        if not template:
-            return f"{outcome.value} in {definition.name}"
-
         # Get player names
         attacker_name = getattr(attacker, 'last_name', None) or \
                        getattr(attacker, 'name', 'Attacker')
         defender_name = getattr(defender, 'last_name', None) or \
                        getattr(defender, 'name', 'Defender')
 
-        # Replace template placeholders
-        narrative = template
-
-        # Position-based replacements
-        for pos in ["qb", "wr", "te", "rb", "ol", "dl", "lb", "cb", "db", "s", "bc"]:
-            if f"{{{pos}}}" in narrative.lower():
-                if pos in ["qb", "wr", "te", "rb", "ol", "bc"]:
-                    narrative = narrative.replace(f"{{{pos}}}", attacker_name)
-                else:
-                    narrative = narrative.replace(f"{{{pos}}}", defender_name)
-
-        # Generic replacements
-        narrative = narrative.replace("{attacker}", attacker_name)
-        narrative = narrative.replace("{defender}", defender_name)
-
-        return narrative
+        # Position placeholders were resolved to attacker/defender slots when compiled
+        return compiled.narratives[outcome.value].format(attacker_name, defender_name)
 
     def _create_neutral_result(self, interaction_name: str) -> InteractionResult:
         """Create a neutral result for unknown interactions."""
@@ -707,54 +875,54 @@ class AttributeInteractionEngine:
         Returns:
             List of interaction names applicable to the situation
         """
-        relevant = []
-
-        phase_map = {
-            "PRE_SNAP": [InteractionType.PRE_SNAP],
-            "SNAP": [InteractionType.LINE_OF_SCRIMMAGE, InteractionType.PASS_PROTECTION],
-            "POST_SNAP": [
-                InteractionType.ROUTE_VS_COVERAGE,
-                InteractionType.RUN_GAME,
-                InteractionType.BALL_CARRIER
-            ]
-        }
-
-        target_types = phase_map.get(phase, [])
-
-        for name, defn in self.INTERACTION_CATALOG.items():
-            if defn.interaction_type in target_types:
-                # Further filter by play type if needed
-                if play_type == "PASS" and defn.interaction_type == InteractionType.RUN_GAME:
-                    continue
-                if play_type == "RUN" and defn.interaction_type == InteractionType.PASS_PROTECTION:
-                    continue
-
-                relevant.append(name)
-
-        return relevant
+        return self.catalog.for_situation(play_type, phase)
 
     def batch_calculate_interactions(
         self,
-        matchups: List[Tuple[str, Any, Any]],
-        context: Optional[Dict[str, Any]] = None
+        matchups: Optional[List[Tuple[str, Any, Any]]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        offense: Optional[List[Any]] = None,
+        defense: Optional[List[Any]] = None,
+        play_type: str = "PASS",
+        numbers_only: Optional[bool] = None
     ) -> List[InteractionResult]:
         """
         Calculate multiple interactions at once.
 
+        Either pass explicit matchups, or pass both lineups (offense/defense)
+        to evaluate every applicable matchup of a full 22-player snap using
+        the compiled position index.
+
         Args:
             matchups: List of (interaction_name, attacker, defender) tuples
             context: Shared context for all calculations
+            offense: Offensive players on the field (used when matchups is None)
+            defense: Defensive players on the field (used when matchups is None)
+            play_type: "PASS" or "RUN", selects the snap's interactions
+            numbers_only: Leave narratives empty; defaults to the engine setting
 
         Returns:
             List of InteractionResult objects
         """
+        context = context or {}
+        if numbers_only is None:
+            numbers_only = self.numbers_only
+
+        if matchups is None:
+            snap = self.catalog.snap_matchups(offense or [], defense or [], play_type)
+            return [
+                self._evaluate(compiled, attacker, defender, context, numbers_only)
+                for compiled, attacker, defender in snap
+            ]
+
         results = []
         for interaction_name, attacker, defender in matchups:
             result = self.calculate_interaction(
                 interaction_name,
                 attacker,
                 defender,
-                context
+                context,
+                numbers_only
             )
             results.append(result)
 
@@ -799,7 +967,8 @@ def apply_interaction_to_play(
                                 InteractionOutcome.SLIGHT_LOSS]:
             aggregate["total_defense_boost"] += result.loser_penalty
 
-        aggregate["narratives"].append(result.narrative)
+        if result.narrative:
+            aggregate["narratives"].append(result.narrative)
         aggregate["all_events"].append(result.to_dict())
 
         if result.outcome in [InteractionOutcome.DOMINANT_WIN, InteractionOutcome.DOMINANT_LOSS]:
@@ -1,26 +1,170 @@
-from typing import Callable, Dict, List, Any
+"""
+Per-game event bus.
+
+Each game session owns an EventBus instance. Subscriptions to bound methods
+are held weakly, so a subscriber that is garbage collected drops out of the bus
+on its own; EventScope unsubscribes a group of handlers explicitly. Events can
+be dispatched immediately, collected in a batch and flushed together, or
+dispatched to async handlers with publish_async. Async handlers reached by a
+sync publish run as tasks on the current loop; the bus holds them until they
+finish and logs any that fail.
+"""
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 from enum import Enum
+import asyncio
+import inspect
+import logging
+import weakref
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Dict[str, Any]], Union[None, Awaitable[None]]]
+
 
 class EventType(str, Enum):
     SACK_EVENT = "SACK_EVENT"
     TOUCHDOWN_EVENT = "TOUCHDOWN_EVENT"
     TURNOVER_EVENT = "TURNOVER_EVENT"
 
+
+class Subscription:
+    """Handle for one subscription; call unsubscribe() to remove it."""
+
+    def __init__(self, bus: "EventBus", event_type: EventType, callback: Handler, weak: bool):
+        self._bus = bus
+        self.event_type = event_type
+        # Bound methods are referenced weakly so the bus never keeps their object alive
+        if weak and inspect.ismethod(callback):
+            self._ref: Callable[[], Optional[Handler]] = weakref.WeakMethod(callback)
+        else:
+            self._ref = lambda: callback
+
+    @property
+    def callback(self) -> Optional[Handler]:
+        return self._ref()
+
+    @property
+    def alive(self) -> bool:
+        return self._ref() is not None
+
+    def unsubscribe(self) -> None:
+        self._bus._remove(self)
+
+
+class EventScope:
+    """Groups subscriptions so they can all be dropped at once (e.g. at the end of a game)."""
+
+    def __init__(self, bus: "EventBus"):
+        self.bus = bus
+        self.subscriptions: List[Subscription] = []
+
+    def subscribe(self, event_type: EventType, callback: Handler, weak: bool = True) -> Subscription:
+        subscription = self.bus.subscribe(event_type, callback, weak=weak)
+        self.subscriptions.append(subscription)
+        return subscription
+
+    def close(self) -> None:
+        for subscription in self.subscriptions:
+            subscription.unsubscribe()
+        self.subscriptions = []
+
+    def __enter__(self) -> "EventScope":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
 class EventBus:
-    _subscribers: Dict[EventType, List[Callable[[Dict[str, Any]], None]]] = {}
-
-    @classmethod
-    def subscribe(cls, event_type: EventType, callback: Callable[[Dict[str, Any]], None]):
-        if event_type not in cls._subscribers:
-            cls._subscribers[event_type] = []
-        cls._subscribers[event_type].append(callback)
-
-    @classmethod
-    def publish(cls, event_type: EventType, payload: Dict[str, Any]):
-        if event_type in cls._subscribers:
-            for callback in cls._subscribers[event_type]:
-                callback(payload)
-
-    @classmethod
-    def clear_subscribers(cls):
-        cls._subscribers = {}
+    def __init__(self) -> None:
+        self._subscribers: Dict[EventType, List[Subscription]] = {}
+        self._batch: Optional[List[Tuple[EventType, Dict[str, Any]]]] = None
+        # Tasks started by sync publish; the loop only holds them weakly, so the bus keeps them until done
+        self._tasks: Set[asyncio.Task] = set()
+
+    def subscribe(self, event_type: EventType, callback: Handler, weak: bool = True) -> Subscription:
+        subscription = Subscription(self, event_type, callback, weak)
+        self._subscribers.setdefault(event_type, []).append(subscription)
+        return subscription
+
+    def scope(self) -> EventScope:
+        return EventScope(self)
+
+    def _remove(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.event_type, [])
+        if subscription in subscribers:
+            subscribers.remove(subscription)
+
+    def _live_handlers(self, event_type: EventType) -> List[Handler]:
+        """Current handlers for an event type, pruning subscribers that were collected."""
+        subscribers = self._subscribers.get(event_type)
+        if not subscribers:
+            return []
+        handlers = [s.callback for s in subscribers]
+        if None in handlers:
+            self._subscribers[event_type] = [s for s, h in zip(subscribers, handlers) if h is not None]
+            handlers = [h for h in handlers if h is not None]
+        return handlers
+
+    def handler_count(self, event_type: Optional[EventType] = None) -> int:
+        """Live handlers for one event type, or for all of them."""
+        event_types = [event_type] if event_type else list(self._subscribers)
+        return sum(len(self._live_handlers(et)) for et in event_types)
+
+    def publish(self, event_type: EventType, payload: Dict[str, Any]) -> None:
+        if self._batch is not None:
+            self._batch.append((event_type, payload))
+            return
+        self._dispatch(event_type, payload)
+
+    def _dispatch(self, event_type: EventType, payload: Dict[str, Any]) -> None:
+        for callback in self._live_handlers(event_type):
+            result = callback(payload)
+            if inspect.isawaitable(result):
+                # Sync publish cannot await; hand coroutines to the running loop if there is one
+                try:
+                    task = asyncio.get_running_loop().create_task(result)
+                except RuntimeError:
+                    result.close()
+                    logger.warning("Async handler skipped by sync publish", extra={"event_type": event_type.value})
+                    continue
+                self._tasks.add(task)
+                task.add_done_callback(lambda done, et=event_type: self._task_done(done, et))
+
+    def _task_done(self, task: asyncio.Task, event_type: EventType) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Async handler failed",
+                exc_info=task.exception(),
+                extra={"event_type": event_type.value}
+            )
+
+    async def publish_async(self, event_type: EventType, payload: Dict[str, Any]) -> None:
+        """Dispatch to every handler, awaiting async ones concurrently."""
+        pending = []
+        for callback in self._live_handlers(event_type):
+            result = callback(payload)
+            if inspect.isawaitable(result):
+                pending.append(result)
+        if pending:
+            await asyncio.gather(*pending)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Queue events published inside the block and dispatch them, in order, on exit."""
+        if self._batch is not None:
+            # Already batching; the outer block flushes
+            yield
+            return
+        self._batch = []
+        try:
+            yield
+        finally:
+            queued, self._batch = self._batch, None
+            for event_type, payload in queued:
+                self._dispatch(event_type, payload)
+
+    def clear_subscribers(self) -> None:
+        self._subscribers = {}
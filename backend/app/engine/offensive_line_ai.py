@@ -1,10 +1,17 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from app.engine.event_bus import EventBus, EventType
 
 class OffensiveLineAI:
-    def __init__(self):
+    def __init__(self, event_bus: Optional[EventBus] = None):
         self.active_debuffs: Dict[str, Dict[str, Any]] = {} # player_id -> {value: int, duration: int}
-        EventBus.subscribe(EventType.SACK_EVENT, self.handle_sack_event)
+        # Weak subscription: dropping this object (or calling close) removes the handler
+        self.event_bus = event_bus or EventBus()
+        self._events = self.event_bus.scope()
+        self._events.subscribe(EventType.SACK_EVENT, self.handle_sack_event)
+
+    def close(self):
+        """Unsubscribe from the game's event bus."""
+        self._events.close()
 
     def handle_sack_event(self, payload: Dict[str, Any]):
         """
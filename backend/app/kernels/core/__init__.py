@@ -1,2 +1,3 @@
-from app.kernels.core.ecs_manager import ECSManager, Entity, Component, System
-from app.kernels.core.hybrid_resolver import HybridResolver
+from app.kernels.core.ecs_manager import ECSManager, Entity, Component, System, ArraySystem, ComponentSpec
+from app.kernels.core.hybrid_resolver import HybridResolver, PhysicsSolver
+from app.kernels.core.spatial_grid import SpatialGrid
@@ -1,5 +1,8 @@
-from typing import Dict, List, Type, Any, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Tuple, Type, Optional
 import uuid
+
+import numpy as np
 from pydantic import BaseModel
 
 class Component(BaseModel):
@@ -19,10 +22,111 @@ class System:
     def update(self, entities: List[Entity], dt: float):
         raise NotImplementedError
 
+
+@dataclass(frozen=True)
+class ComponentSpec:
+    """Storage type of an array-backed component: one row of ``shape`` per entity."""
+    dtype: Any = np.float64
+    shape: Tuple[int, ...] = ()
+
+
+class ArraySystem(System):
+    """
+    A system that runs once per archetype over whole component columns
+    instead of once per entity. ``components`` names the columns it needs
+    and how they are stored; ECSManager.add_system registers them.
+    """
+    components: Dict[str, ComponentSpec] = {}
+
+    def update(self, entities: List[Entity], dt: float):
+        # Object entities carry no array components
+        pass
+
+    def update_arrays(self, columns: Dict[str, np.ndarray], dt: float):
+        raise NotImplementedError
+
+    def run_arrays(self, columns: Dict[str, np.ndarray], dt: float, steps: int):
+        """Advance ``steps`` ticks; systems override this to hoist per-run setup out of the loop."""
+        for _ in range(steps):
+            self.update_arrays(columns, dt)
+
+
+class Archetype:
+    """
+    Every entity with exactly the same set of array components, stored
+    column-wise: one contiguous array per component, one row per entity.
+    """
+
+    def __init__(self, signature: FrozenSet[str], specs: Dict[str, ComponentSpec], capacity: int = 32):
+        self.signature = signature
+        self.count = 0
+        self.entity_ids = np.empty(capacity, dtype=np.int64)
+        self.rows: Dict[int, int] = {}
+        self._storage = {
+            name: np.zeros((capacity, *specs[name].shape), dtype=specs[name].dtype)
+            for name in sorted(signature)
+        }
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Views of the live rows, cached until an entity is added or removed."""
+        if self._columns is None:
+            self._columns = {name: array[:self.count] for name, array in self._storage.items()}
+        return self._columns
+
+    def add(self, entity_id: int, values: Dict[str, Any]) -> None:
+        if self.count == len(self.entity_ids):
+            self._grow()
+        row = self.count
+        for name, array in self._storage.items():
+            array[row] = values[name]
+        self.entity_ids[row] = entity_id
+        self.rows[entity_id] = row
+        self.count += 1
+        self._columns = None
+
+    def remove(self, entity_id: int) -> Dict[str, Any]:
+        """Drop an entity by moving the last row into its slot; returns its values."""
+        row = self.rows.pop(entity_id)
+        last = self.count - 1
+        values = {name: array[row].copy() for name, array in self._storage.items()}
+        if row != last:
+            moved = int(self.entity_ids[last])
+            for array in self._storage.values():
+                array[row] = array[last]
+            self.entity_ids[row] = moved
+            self.rows[moved] = row
+        self.count = last
+        self._columns = None
+        return values
+
+    def _grow(self) -> None:
+        capacity = len(self.entity_ids) * 2
+        self.entity_ids = np.resize(self.entity_ids, capacity)
+        for name, array in self._storage.items():
+            grown = np.zeros((capacity, *array.shape[1:]), dtype=array.dtype)
+            grown[:self.count] = array[:self.count]
+            self._storage[name] = grown
+
+
 class ECSManager:
+    """
+    Entities come in two kinds:
+
+    - object entities (create_entity): pydantic Entities holding pydantic
+      components, walked one by one by plain Systems
+    - array entities (spawn): rows in archetype tables of typed NumPy columns,
+      processed a whole archetype at a time by ArraySystems
+    """
+
     def __init__(self):
         self.entities: Dict[str, Entity] = {}
         self.systems: List[System] = []
+        self.component_specs: Dict[str, ComponentSpec] = {}
+        self.archetypes: Dict[FrozenSet[str], Archetype] = {}
+        self._entity_archetypes: Dict[int, Archetype] = {}
+        self._next_id = 0
 
     def create_entity(self) -> Entity:
         entity_id = str(uuid.uuid4())
@@ -30,10 +134,76 @@ class ECSManager:
         self.entities[entity_id] = entity
         return entity
 
+    def register_component(self, name: str, dtype: Any = np.float64, shape: Tuple[int, ...] = ()) -> None:
+        spec = ComponentSpec(np.dtype(dtype), tuple(shape))
+        existing = self.component_specs.get(name)
+        if existing is not None and existing != spec:
+            raise ValueError(f"Component {name!r} is already registered as {existing}")
+        self.component_specs[name] = spec
+
+    def spawn(self, **components: Any) -> int:
+        """Create an array entity with the given component values; returns its integer ID."""
+        unknown = set(components) - set(self.component_specs)
+        if unknown:
+            raise ValueError(f"Unregistered components: {', '.join(sorted(unknown))}")
+        entity_id = self._next_id
+        self._next_id += 1
+        archetype = self._archetype(frozenset(components))
+        archetype.add(entity_id, components)
+        self._entity_archetypes[entity_id] = archetype
+        return entity_id
+
+    def despawn(self, entity_id: int) -> None:
+        self._entity_archetypes.pop(entity_id).remove(entity_id)
+
+    def get(self, entity_id: int, name: str) -> Any:
+        """Copy of one array entity's component value."""
+        archetype = self._entity_archetypes[entity_id]
+        return archetype.columns[name][archetype.rows[entity_id]].copy()
+
+    def set(self, entity_id: int, name: str, value: Any) -> None:
+        archetype = self._entity_archetypes[entity_id]
+        archetype.columns[name][archetype.rows[entity_id]] = value
+
+    def query(self, *names: str) -> List[Dict[str, np.ndarray]]:
+        """Column views of every non-empty archetype that has all of ``names``."""
+        wanted = set(names)
+        return [
+            archetype.columns for signature, archetype in self.archetypes.items()
+            if archetype.count and wanted <= signature
+        ]
+
     def add_system(self, system: System):
+        if isinstance(system, ArraySystem):
+            for name, spec in system.components.items():
+                self.register_component(name, spec.dtype, spec.shape)
         self.systems.append(system)
 
     def update(self, dt: float):
         # Run systems in strict order: Bio -> Physics -> AI -> Logic
         for system in self.systems:
-            system.update(list(self.entities.values()), dt)
+            if isinstance(system, ArraySystem):
+                for columns in self.query(*system.components):
+                    system.update_arrays(columns, dt)
+            else:
+                system.update(list(self.entities.values()), dt)
+
+    def run(self, dt: float, steps: int):
+        """
+        Advance ``steps`` ticks. A lone ArraySystem gets all of them in one
+        run_arrays call per archetype; otherwise systems interleave per tick.
+        """
+        if len(self.systems) == 1 and isinstance(self.systems[0], ArraySystem):
+            system = self.systems[0]
+            for columns in self.query(*system.components):
+                system.run_arrays(columns, dt, steps)
+            return
+        for _ in range(steps):
+            self.update(dt)
+
+    def _archetype(self, signature: FrozenSet[str]) -> Archetype:
+        archetype = self.archetypes.get(signature)
+        if archetype is None:
+            archetype = Archetype(signature, self.component_specs)
+            self.archetypes[signature] = archetype
+        return archetype
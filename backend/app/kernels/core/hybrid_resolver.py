@@ -1,10 +1,129 @@
-from app.kernels.core.ecs_manager import System, Entity
-from typing import List
+from app.kernels.core.ecs_manager import ArraySystem, ComponentSpec, System, Entity
+from typing import Dict, List, Tuple
+import numpy as np
+
+# Field extents in yards, end zones included
+FIELD_LENGTH = 120.0
+FIELD_WIDTH = 53.3
+FIELD_BOUNDS = np.array([FIELD_LENGTH, FIELD_WIDTH])
+
+VEC2 = ComponentSpec(np.float64, (2,))
+SCALAR = ComponentSpec(np.float64)
+
+
+class PhysicsSolver(ArraySystem):
+    """
+    Moves every on-field body in one vectorized pass per tick.
+
+    Each body steers toward its target at up to max_speed, limited by its
+    acceleration and braking in time to stop on the target, then overlapping
+    bodies are pushed apart (the lighter body gives more ground) and everyone
+    is kept on the field. Units are yards, seconds and pounds.
+    """
+    components = {
+        "position": VEC2,
+        "velocity": VEC2,
+        "target": VEC2,
+        "max_speed": SCALAR,
+        "acceleration": SCALAR,
+        "radius": SCALAR,
+        "mass": SCALAR,
+    }
+
+    def update_arrays(self, columns: Dict[str, np.ndarray], dt: float):
+        self.run_arrays(columns, dt, 1)
+
+    def run_arrays(self, columns: Dict[str, np.ndarray], dt: float, steps: int):
+        """
+        Advance ``steps`` ticks. Per-body and per-pair constants are set up
+        once per run and velocity is carried as displacement per tick, so
+        every tick is a short fixed sequence of in-place ufunc calls on
+        (x, y) rows viewed as complex numbers.
+        """
+        count = len(columns["position"])
+        if not count or steps <= 0:
+            return
+        bounded = columns["position"]
+        position = _complex(bounded)
+        target = _complex(columns["target"])
+        velocity = _complex(columns["velocity"])
+        acceleration = columns["acceleration"]
+
+        step = velocity * dt
+        max_step = columns["max_speed"] * dt
+        brake = 2.0 * acceleration * dt * dt
+        max_change = acceleration * dt * dt
+        steer = np.empty(count, dtype=np.complex128)
+        distance = np.empty(count)
+        scale = np.empty(count)
+        limit = np.empty(count)
+
+        # Every pair (i < j) with the first body's share of the push: the other's share of the mass
+        first, second = np.triu_indices(count, 1)
+        reach = columns["radius"][first] + columns["radius"][second]
+        mass = columns["mass"]
+        pairs = list(zip(first.tolist(), second.tolist(), reach.tolist(),
+                         (mass[second] / (mass[first] + mass[second])).tolist(), strict=True))
+        offsets = np.empty(len(first), dtype=np.complex128)
+        gaps = np.empty(len(first))
+        touching = np.empty(len(first), dtype=bool)
+
+        # A body on its target divides by zero (0/0 with no acceleration); fmin keeps the finite limit
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for _ in range(steps):
+                # Steer: the desired step points at the target, never longer than max_step,
+                # than a body can still brake from (sqrt(2 * a * d) * dt) or than the distance left
+                np.subtract(target, position, out=steer)
+                np.abs(steer, out=distance)
+                np.divide(max_step, distance, out=scale)
+                np.divide(brake, distance, out=limit)
+                np.sqrt(limit, out=limit)
+                np.fmin(scale, limit, out=scale)
+                np.fmin(scale, 1.0, out=scale)
+                np.multiply(steer, scale, out=steer)
+
+                # Accelerate toward it, changing the step by at most acceleration * dt^2
+                np.subtract(steer, step, out=steer)
+                np.abs(steer, out=distance)
+                np.divide(max_change, distance, out=scale)
+                np.fmin(scale, 1.0, out=scale)
+                np.multiply(steer, scale, out=steer)
+                np.add(step, steer, out=step)
+                np.add(position, step, out=position)
+
+                # Separate overlapping pairs (p_i - p_j), then keep everyone on the field
+                np.subtract(position[first], position[second], out=offsets)
+                np.abs(offsets, out=gaps)
+                np.less(gaps, reach, out=touching)
+                hits = touching.nonzero()[0]
+                if len(hits):
+                    self._separate(position, offsets, gaps, hits, pairs)
+                np.maximum(bounded, 0.0, out=bounded)
+                np.minimum(bounded, FIELD_BOUNDS, out=bounded)
+
+        np.divide(step, dt, out=velocity)
+
+    @staticmethod
+    def _separate(position: np.ndarray, offsets: np.ndarray, gaps: np.ndarray,
+                  hits: np.ndarray, pairs: List[Tuple[int, int, float, float]]) -> None:
+        """Push overlapping pairs apart along the line between them, split by mass."""
+        # Only a handful of pairs touch on a tick, so they go one at a time, all from pre-push offsets
+        for pair in hits.tolist():
+            first, second, reach, share = pairs[pair]
+            gap = gaps.item(pair)
+            if gap > 0.0:
+                push = offsets.item(pair) * ((reach - gap) / gap)
+            else:
+                # Coincident bodies have no line between them: the lower index always goes toward -x
+                push = -reach
+            position[first] += push * share
+            position[second] -= push * (1.0 - share)
+
+
+def _complex(rows: np.ndarray) -> np.ndarray:
+    """(n, 2) float rows as a length-n complex view: x is the real part, y the imaginary."""
+    return rows.view(np.complex128)[:, 0]
 
-class PhysicsSolver(System):
-    def update(self, entities: List[Entity], dt: float):
-        # Placeholder for rigid/soft body physics resolution
-        pass
 
 class LogicBridge(System):
     def update(self, entities: List[Entity], dt: float):
@@ -19,6 +138,6 @@ class HybridResolver:
     def resolve_frame(self, entities: List[Entity], dt: float):
         # 1. Sync Logic (AI decisions)
         self.logic_bridge.update(entities, dt)
-        
+
         # 2. Solve Physics (Movement/Collision)
         self.physics_solver.update(entities, dt)
@@ -0,0 +1,153 @@
+from typing import Sequence, Tuple
+import numpy as np
+
+# Cell edge in yards: a 53.3 x 120 field is 11 x 24 cells, a few players per cell
+DEFAULT_CELL_SIZE = 5.0
+# Up to this many query-point pairs (500 on 500), one dense distance matrix beats walking cells
+DENSE_PAIRS = 250_000
+
+
+class SpatialGrid:
+    """
+    Uniform grid over field coordinates, rebuilt once per tick.
+
+    Points are bucketed by cell and stored cell-sorted (CSR layout: one
+    start offset per cell into a single index array), so a query gathers
+    the candidates of the cells around it instead of scanning every point.
+    All queries take a whole frame of query points at once; frames small
+    enough (11 on 11) skip the cells and compare every pair in one dense pass.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self.points = np.empty((0, 2))
+        self._origin = np.zeros(2)
+        self._shape = (1, 1)
+        self._order = np.empty(0, dtype=np.intp)
+        self._starts = np.zeros(2, dtype=np.intp)
+        self._bucketed = False
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def rebuild(self, points: Sequence[Sequence[float]]) -> None:
+        """Take this tick's (x, y) points; query results index into them."""
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self._bucketed = False
+
+    def _bucket(self) -> None:
+        """Sort the points into cells, on the first query that walks the grid."""
+        # The grid spans the points themselves, so nobody falls off its edge
+        self._origin = self.points.min(axis=0)
+        extent = self.points.max(axis=0) - self._origin
+        self._shape = tuple(int(n) for n in extent // self.cell_size + 1)
+
+        cells = self._cell_ids(*self._cells(self.points))
+        self._order = np.argsort(cells, kind="stable")
+        counts = np.bincount(cells, minlength=self._shape[0] * self._shape[1])
+        self._starts = np.concatenate(([0], np.cumsum(counts)))
+        self._bucketed = True
+
+    def nearest(self, queries: Sequence[Sequence[float]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Closest point to each query.
+
+        Returns:
+            (indices, distances); index -1 and distance inf when the grid is
+            empty. Ties go to the lowest point index.
+        """
+        queries = np.asarray(queries, dtype=np.float64).reshape(-1, 2)
+        indices = np.full(len(queries), -1, dtype=np.intp)
+        distances = np.full(len(queries), np.inf)
+        if not len(self.points) or not len(queries):
+            return indices, distances
+        if len(self.points) * len(queries) <= DENSE_PAIRS:
+            distance = self._dense(queries)
+            return distance.argmin(axis=1), distance.min(axis=1)
+        if not self._bucketed:
+            self._bucket()
+
+        qx, qy = self._cells(queries)
+        pending = np.arange(len(queries))
+        ring = 1
+        while len(pending):
+            rows, found = self._candidates(qx[pending], qy[pending], ring)
+            best_rows, best, dist = self._closest(queries[pending], rows, found)
+            indices[pending[best_rows]] = best
+            distances[pending[best_rows]] = dist
+
+            # Anything outside the searched rings is more than ring cells away
+            settled = distances[pending] <= ring * self.cell_size
+            if ring >= max(self._shape):
+                break
+            pending = pending[~settled]
+            ring += 1
+        return indices, distances
+
+    def within(self, queries: Sequence[Sequence[float]], radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Every (query, point) pair at most ``radius`` apart.
+
+        Returns:
+            (query indices, point indices), sorted by query then point
+        """
+        queries = np.asarray(queries, dtype=np.float64).reshape(-1, 2)
+        if not len(self.points) or not len(queries):
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty
+
+        if len(self.points) * len(queries) <= DENSE_PAIRS:
+            return np.nonzero(self._dense(queries) <= radius)
+        if not self._bucketed:
+            self._bucket()
+
+        ring = int(np.ceil(radius / self.cell_size))
+        rows, found = self._candidates(*self._cells(queries), ring)
+        hits = np.hypot(*(self.points[found] - queries[rows]).T) <= radius
+        rows, found = rows[hits], found[hits]
+        order = np.lexsort((found, rows))
+        return rows[order], found[order]
+
+    def _dense(self, queries: np.ndarray) -> np.ndarray:
+        """Every query-to-point distance, as (queries, points)."""
+        # (x, y) rows viewed as complex numbers: one subtract/abs instead of two plus a hypot
+        points = np.ascontiguousarray(self.points).view(np.complex128)[:, 0]
+        return np.abs(np.subtract.outer(np.ascontiguousarray(queries).view(np.complex128)[:, 0], points))
+
+    def _cells(self, xy: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Queries off the grid clamp to its edge cells, which keeps the ring bound valid
+        cells = ((xy - self._origin) // self.cell_size).astype(np.intp)
+        return (np.clip(cells[:, 0], 0, self._shape[0] - 1),
+                np.clip(cells[:, 1], 0, self._shape[1] - 1))
+
+    def _cell_ids(self, cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+        return cx * self._shape[1] + cy
+
+    def _candidates(self, qx: np.ndarray, qy: np.ndarray, ring: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(query row, point index) for every point in the cells within ``ring`` of each query's cell."""
+        offsets = np.arange(-ring, ring + 1)
+        cx = (qx[:, None, None] + offsets[None, :, None]).repeat(len(offsets), axis=2)
+        cy = (qy[:, None, None] + offsets[None, None, :]).repeat(len(offsets), axis=1)
+        rows = np.broadcast_to(np.arange(len(qx))[:, None, None], cx.shape)
+        valid = (cx >= 0) & (cx < self._shape[0]) & (cy >= 0) & (cy < self._shape[1])
+        cells = self._cell_ids(cx[valid], cy[valid])
+
+        starts = self._starts[cells]
+        counts = self._starts[cells + 1] - starts
+        # Expand each cell's [start, start + count) run into one flat index array
+        runs = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        slots = runs + np.arange(counts.sum())
+        return np.repeat(rows[valid], counts), self._order[slots]
+
+    def _closest(self, queries: np.ndarray, rows: np.ndarray, found: np.ndarray):
+        """Per query row with any candidates: (row, nearest point, its distance)."""
+        distance = np.hypot(*(self.points[found] - queries[rows]).T)
+        # Candidates arrive grouped by row, so each row's minimum is one segment reduction
+        starts = np.flatnonzero(np.diff(rows, prepend=-1))
+        best = np.minimum.reduceat(distance, starts)
+        lengths = np.diff(starts, append=len(rows))
+        # Among equally close points, the lowest index wins
+        tied = np.where(distance == np.repeat(best, lengths), found, len(self.points))
+        return rows[starts], np.minimum.reduceat(tied, starts), best
@@ -1,46 +1,85 @@
 from app.kernels.core.ecs_manager import Component
-from app.kernels.core.ecs_manager import Component
-from typing import Dict, Tuple, List
+from app.kernels.core.spatial_grid import DEFAULT_CELL_SIZE, SpatialGrid
+from typing import Dict, Tuple, List, Optional
+from pydantic import PrivateAttr
+import numpy as np
+
+# Zone landmarks, measured from the line of scrimmage (depth) and the sideline (width)
+DEEP_ZONE_DEPTH = 12.0
+FLAT_WIDTH = 13.3
+FIELD_WIDTH = 53.3
+
+# scheme -> [(zone, min depth, max depth, min width, max width)], first match wins
+ZONE_LAYOUTS: Dict[str, List[Tuple[str, float, float, float, float]]] = {
+    "COVER_3": [
+        ("Deep Third", DEEP_ZONE_DEPTH, np.inf, 0.0, FIELD_WIDTH),
+        ("Flat", 0.0, DEEP_ZONE_DEPTH, 0.0, FLAT_WIDTH),
+        ("Flat", 0.0, DEEP_ZONE_DEPTH, FIELD_WIDTH - FLAT_WIDTH, FIELD_WIDTH),
+        ("Hook Curl", 0.0, DEEP_ZONE_DEPTH, FLAT_WIDTH, FIELD_WIDTH - FLAT_WIDTH),
+    ],
+    "COVER_2": [
+        ("Deep Half", DEEP_ZONE_DEPTH, np.inf, 0.0, FIELD_WIDTH),
+        ("Flat", 0.0, DEEP_ZONE_DEPTH, 0.0, FLAT_WIDTH),
+        ("Flat", 0.0, DEEP_ZONE_DEPTH, FIELD_WIDTH - FLAT_WIDTH, FIELD_WIDTH),
+        ("Hook Curl", 0.0, DEEP_ZONE_DEPTH, FLAT_WIDTH, FIELD_WIDTH - FLAT_WIDTH),
+    ],
+}
+
 
 class CoverageNet(Component):
     """
     Simulates the NGS/AWS Coverage Responsibility Models.
     In a real implementation, this would interface with a Neural Network (ONNX/PyTorch).
     Here, we simulate the logic.
+
+    Defender positions live in a SpatialGrid: call index_defenders once per
+    tick, then run any number of frame-wide queries against it. Methods that
+    still take a ``defenders`` list re-index from it first.
     """
-    
-    def identify_targeted_defender(self, pass_trajectory: Dict, defenders: List[Dict]) -> str:
+    cell_size: float = DEFAULT_CELL_SIZE
+    _grid: SpatialGrid = PrivateAttr()
+    _defender_ids: List[str] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context):
+        self._grid = SpatialGrid(self.cell_size)
+
+    def index_defenders(self, defenders: List[Dict]) -> None:
+        """Rebuild the defender grid for this tick."""
+        self._defender_ids = [d['id'] for d in defenders]
+        self._grid.rebuild([(d['x'], d['y']) for d in defenders])
+
+    def identify_targeted_defender(self, pass_trajectory: Dict, defenders: Optional[List[Dict]] = None) -> Optional[str]:
         """
         Model 1: Targeted Defender Identification.
         Finds the defender most responsible for the catch point.
         """
+        if defenders is not None:
+            self.index_defenders(defenders)
         # Simplified: Find closest defender to ball arrival point
-        closest_defender = None
-        min_dist = float('inf')
-        
-        target_x, target_y = pass_trajectory['arrival_x'], pass_trajectory['arrival_y']
-        
-        for defender in defenders:
-            dist = ((defender['x'] - target_x)**2 + (defender['y'] - target_y)**2)**0.5
-            if dist < min_dist:
-                min_dist = dist
-                closest_defender = defender['id']
-                
-        return closest_defender
-
-    def identify_matchups(self, receivers: List[Dict], defenders: List[Dict]) -> Dict[str, str]:
+        [index], _ = self._grid.nearest([(pass_trajectory['arrival_x'], pass_trajectory['arrival_y'])])
+        return self._defender_ids[index] if index >= 0 else None
+
+    def identify_matchups(self, receivers: List[Dict], defenders: Optional[List[Dict]] = None) -> Dict[str, str]:
         """
         Model 2: Matchup Identification.
         Who is covering whom?
         """
-        matchups = {}
-        # Simplified Man-Match logic
-        for rx in receivers:
-            # Find closest defender
-            closest_def = min(defenders, key=lambda d: ((d['x']-rx['x'])**2 + (d['y']-rx['y'])**2)**0.5)
-            matchups[rx['id']] = closest_def['id']
-            
-        return matchups
+        if defenders is not None:
+            self.index_defenders(defenders)
+        # Simplified Man-Match logic: closest defender to each receiver
+        indices, _ = self._grid.nearest([(rx['x'], rx['y']) for rx in receivers])
+        return {
+            rx['id']: self._defender_ids[index]
+            for rx, index in zip(receivers, indices, strict=True) if index >= 0
+        }
+
+    def defenders_within(self, players: List[Dict], radius: float) -> Dict[str, List[str]]:
+        """Indexed defenders within ``radius`` yards of each player (e.g. tight coverage)."""
+        rows, found = self._grid.within([(p['x'], p['y']) for p in players], radius)
+        nearby = {p['id']: [] for p in players}
+        for row, index in zip(rows.tolist(), found.tolist(), strict=True):
+            nearby[players[row]['id']].append(self._defender_ids[index])
+        return nearby
 
     def identify_zone_responsibility(self, defender: Dict, scheme: str) -> str:
         """
@@ -57,5 +96,36 @@ class CoverageNet(Component):
                 return "Flat"
             elif defender['position'] == "S":
                 return "Deep Half"
-                
+
         return "Man"
+
+    def locate_zones(self, players: List[Dict], scheme: str, line_of_scrimmage: float,
+                     direction: int = 1) -> Dict[str, Optional[str]]:
+        """
+        Which of the scheme's zones each player is standing in, in one pass.
+
+        Args:
+            players: Dicts with 'id', 'x' (yards along the field) and 'y' (from the sideline)
+            line_of_scrimmage: x of the line of scrimmage
+            direction: +1 if the offense attacks toward increasing x, -1 otherwise
+
+        Returns:
+            player ID -> zone name, None if in the backfield or out of bounds
+            (or for a scheme without a zone layout)
+        """
+        layout = ZONE_LAYOUTS.get(scheme)
+        if not layout or not players:
+            return {p['id']: None for p in players}
+
+        xy = np.array([(p['x'], p['y']) for p in players], dtype=np.float64)
+        depth = (xy[:, 0] - line_of_scrimmage) * direction
+        bounds = np.array([zone[1:] for zone in layout])
+        inside = (
+            (depth[:, None] >= bounds[:, 0]) & (depth[:, None] < bounds[:, 1])
+            & (xy[:, 1, None] >= bounds[:, 2]) & (xy[:, 1, None] <= bounds[:, 3])
+        )
+        first = inside.argmax(axis=1)
+        return {
+            p['id']: layout[zone][0] if hit else None
+            for p, zone, hit in zip(players, first.tolist(), inside.any(axis=1).tolist(), strict=True)
+        }
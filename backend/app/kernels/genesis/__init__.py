@@ -1,3 +1,4 @@
 from app.kernels.genesis.bio_metrics import AnatomyModel, FatigueRegulator
+from app.kernels.genesis.bio_store import BioStore
 from app.kernels.genesis.neuro_cognition import S2Processor, FocusMonitor
 from app.kernels.genesis.trauma_center import ScarTissueManager
@@ -0,0 +1,250 @@
+"""
+Array-backed biology state for every player in a game.
+
+Fatigue and anatomy live in one contiguous numpy array per attribute, indexed by
+roster slot, so a whole play's (or a whole roster's) fatigue and recovery update
+is a single vectorized call. The arithmetic mirrors FatigueRegulator and
+AnatomyModel exactly; FatigueView and AnatomyView expose the same per-player API
+over a slot for existing callers.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from app.kernels.genesis.bio_metrics import AnatomyModel, FatigueRegulator
+
+LIGAMENTS = ("ACL", "MCL", "Achilles")
+
+# Climate-based fatigue multipliers (see FatigueRegulator.update_fatigue)
+HEAT_THRESHOLD_F = 85.0
+COLD_THRESHOLD_F = 32.0
+HEAT_MULTIPLIER = 1.5   # Cold-climate teams in heat
+COLD_MULTIPLIER = 1.2   # Warm-climate teams in cold
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+class BioStore:
+    """Struct-of-arrays store for fatigue and anatomy, one slot per registered player."""
+
+    def __init__(self, capacity: int = 128):
+        self.slots: Dict[int, int] = {}
+        self.player_ids: List[int] = []
+        self.climates: List[str] = []
+        self._climate_codes: Dict[str, int] = {}
+        self._capacity = 0
+
+        # Fatigue
+        self.hrv = np.empty(0)
+        self.lactic_acid = np.empty(0)
+        self.max_burst_capacity = np.empty(0)
+        self.climate = np.empty(0, dtype=np.int16)
+
+        # Anatomy
+        self.current_health = np.empty(0)
+        self.chronic_wear = np.empty(0)
+        self.ligament_integrity = np.empty((0, len(LIGAMENTS)))
+        self.ligament_stress = np.empty((0, len(LIGAMENTS)))
+        self.ligament_limit = np.empty((0, len(LIGAMENTS)))
+        # False where the player's AnatomyModel has no such ligament
+        self.ligament_present = np.empty((0, len(LIGAMENTS)), dtype=bool)
+
+        self._grow(capacity)
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self.slots
+
+    def _grow(self, capacity: int) -> None:
+        def resize(arr: np.ndarray) -> np.ndarray:
+            grown = np.zeros((capacity,) + arr.shape[1:], dtype=arr.dtype)
+            grown[:len(arr)] = arr
+            return grown
+
+        for name in ("hrv", "lactic_acid", "max_burst_capacity", "climate", "current_health",
+                     "chronic_wear", "ligament_integrity", "ligament_stress", "ligament_limit",
+                     "ligament_present"):
+            setattr(self, name, resize(getattr(self, name)))
+        self._capacity = capacity
+
+    def _climate_code(self, climate: str) -> int:
+        if climate not in self._climate_codes:
+            self._climate_codes[climate] = len(self.climates)
+            self.climates.append(climate)
+        return self._climate_codes[climate]
+
+    def register(self, player_id: int, anatomy: AnatomyModel, fatigue: FatigueRegulator) -> int:
+        """Copy validated component state into a slot; re-registering overwrites the slot."""
+        slot = self.slots.get(player_id)
+        if slot is None:
+            slot = len(self.player_ids)
+            if slot >= self._capacity:
+                self._grow(self._capacity * 2)
+            self.slots[player_id] = slot
+            self.player_ids.append(player_id)
+
+        self.hrv[slot] = fatigue.hrv
+        self.lactic_acid[slot] = fatigue.lactic_acid
+        self.max_burst_capacity[slot] = fatigue.max_burst_capacity
+        self.climate[slot] = self._climate_code(fatigue.home_climate)
+
+        self.current_health[slot] = anatomy.current_health
+        self.chronic_wear[slot] = anatomy.chronic_wear
+        for i, name in enumerate(LIGAMENTS):
+            ligament = anatomy.ligaments.get(name, {})
+            self.ligament_present[slot, i] = name in anatomy.ligaments
+            self.ligament_integrity[slot, i] = ligament.get("integrity", 100.0)
+            self.ligament_stress[slot, i] = ligament.get("stress", 0.0)
+            self.ligament_limit[slot, i] = ligament.get("soft_tissue_limit", 0.0)
+        return slot
+
+    def slots_for(self, player_ids: Optional[Iterable[int]] = None) -> np.ndarray:
+        """Slot indices for the given players (unknown IDs are skipped), or every slot."""
+        if player_ids is None:
+            return np.arange(len(self.player_ids))
+        slots = self.slots
+        return np.fromiter((slots[pid] for pid in player_ids if pid in slots), dtype=np.intp)
+
+    def select(self, player_ids: Iterable[int], values: ArrayLike):
+        """Slots plus matching values; per-player values of unknown IDs are dropped with them."""
+        if np.ndim(values) == 0:
+            return self.slots_for(player_ids), values
+        pairs = [(self.slots[pid], v) for pid, v in zip(player_ids, values) if pid in self.slots]
+        slots = np.array([slot for slot, _ in pairs], dtype=np.intp)
+        return slots, np.array([v for _, v in pairs], dtype=float)
+
+    # ------------------------------------------------------------------
+    # Vectorized updates
+    # ------------------------------------------------------------------
+
+    def apply_exertion(self, slots: np.ndarray, exertion: ArrayLike, temperature: float) -> None:
+        """FatigueRegulator.update_fatigue for many slots at once."""
+        mult = np.ones(len(slots))
+        if temperature > HEAT_THRESHOLD_F and "Cold" in self._climate_codes:
+            mult[self.climate[slots] == self._climate_codes["Cold"]] = HEAT_MULTIPLIER
+        if temperature < COLD_THRESHOLD_F and "Warm" in self._climate_codes:
+            mult[self.climate[slots] == self._climate_codes["Warm"]] = COLD_MULTIPLIER
+
+        exertion = np.broadcast_to(np.asarray(exertion, dtype=float), mult.shape)
+        np.add.at(self.lactic_acid, slots, exertion * 0.5 * mult)
+        np.subtract.at(self.hrv, slots, exertion * 0.2 * mult)
+        self.max_burst_capacity[slots] = np.maximum(0, 100 - self.lactic_acid[slots])
+
+    def add_lactic(self, slots: np.ndarray, delta: ArrayLike) -> None:
+        """Raw fatigue increase with no climate modifier or burst update."""
+        np.add.at(self.lactic_acid, slots, np.broadcast_to(np.asarray(delta, dtype=float), slots.shape))
+
+    def recover(self, slots: np.ndarray, amount: ArrayLike) -> None:
+        """FatigueRegulator.recover for many slots at once."""
+        amount = np.asarray(amount, dtype=float)
+        self.lactic_acid[slots] = np.maximum(0.0, self.lactic_acid[slots] - amount)
+        self.hrv[slots] = np.minimum(100.0, self.hrv[slots] + amount * 0.5)
+        self.max_burst_capacity[slots] = np.maximum(0, 100 - self.lactic_acid[slots])
+
+    def update_fatigue(self, slots: np.ndarray, delta: ArrayLike) -> None:
+        """Positive deltas add fatigue, the rest recover by their magnitude."""
+        delta = np.broadcast_to(np.asarray(delta, dtype=float), slots.shape)
+        tiring = delta > 0
+        if tiring.any():
+            self.add_lactic(slots[tiring], delta[tiring])
+        if not tiring.all():
+            self.recover(slots[~tiring], -delta[~tiring])
+
+    def reset_fatigue(self) -> None:
+        n = len(self.player_ids)
+        self.lactic_acid[:n] = 0.0
+        self.hrv[:n] = 100.0
+        self.max_burst_capacity[:n] = 100.0
+
+    def apply_stress(self, slot: int, torque_vector: float, body_part: str) -> None:
+        """AnatomyModel.apply_stress for one slot; ligaments the player lacks are ignored."""
+        if body_part not in LIGAMENTS:
+            return
+        i = LIGAMENTS.index(body_part)
+        if not self.ligament_present[slot, i]:
+            return
+        self.ligament_stress[slot, i] += torque_vector * 0.1
+        if self.ligament_stress[slot, i] > self.ligament_limit[slot, i]:
+            self.ligament_integrity[slot, i] = 0.0  # Snap
+            self.current_health[slot] -= 50.0
+
+
+class FatigueView:
+    """FatigueRegulator-compatible view of one slot in a BioStore."""
+
+    def __init__(self, store: BioStore, slot: int):
+        self._store = store
+        self._slot = slot
+
+    @property
+    def hrv(self) -> float:
+        return float(self._store.hrv[self._slot])
+
+    @hrv.setter
+    def hrv(self, value: float) -> None:
+        self._store.hrv[self._slot] = value
+
+    @property
+    def lactic_acid(self) -> float:
+        return float(self._store.lactic_acid[self._slot])
+
+    @lactic_acid.setter
+    def lactic_acid(self, value: float) -> None:
+        self._store.lactic_acid[self._slot] = value
+
+    @property
+    def max_burst_capacity(self) -> float:
+        return float(self._store.max_burst_capacity[self._slot])
+
+    @max_burst_capacity.setter
+    def max_burst_capacity(self, value: float) -> None:
+        self._store.max_burst_capacity[self._slot] = value
+
+    @property
+    def home_climate(self) -> str:
+        return self._store.climates[self._store.climate[self._slot]]
+
+    def update_fatigue(self, exertion: float, current_temp_f: float) -> None:
+        self._store.apply_exertion(np.array([self._slot]), exertion, current_temp_f)
+
+    def recover(self, amount: float) -> None:
+        self._store.recover(np.array([self._slot]), amount)
+
+
+class AnatomyView:
+    """AnatomyModel-compatible view of one slot in a BioStore."""
+
+    def __init__(self, store: BioStore, slot: int):
+        self._store = store
+        self._slot = slot
+
+    @property
+    def current_health(self) -> float:
+        return float(self._store.current_health[self._slot])
+
+    @current_health.setter
+    def current_health(self, value: float) -> None:
+        self._store.current_health[self._slot] = value
+
+    @property
+    def chronic_wear(self) -> float:
+        return float(self._store.chronic_wear[self._slot])
+
+    @property
+    def ligaments(self) -> Dict[str, Dict[str, float]]:
+        """Read-only snapshot; use apply_stress to change ligament state."""
+        store, slot = self._store, self._slot
+        return {
+            name: {
+                "integrity": float(store.ligament_integrity[slot, i]),
+                "stress": float(store.ligament_stress[slot, i]),
+                "soft_tissue_limit": float(store.ligament_limit[slot, i]),
+            }
+            for i, name in enumerate(LIGAMENTS)
+            if store.ligament_present[slot, i]
+        }
+
+    def apply_stress(self, torque_vector: float, body_part: str) -> None:
+        self._store.apply_stress(self._slot, torque_vector, body_part)
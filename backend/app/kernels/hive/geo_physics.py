@@ -1,23 +1,131 @@
 from app.kernels.core.ecs_manager import Component
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from pydantic import PrivateAttr
+import numpy as np
+
+# Friction never drops below this, however chewed up the field gets
+MIN_FRICTION = 0.4
+# Friction lost per unit of traffic on a cell
+TRAFFIC_WEAR = 0.01
+# Friction lost per game minute on a fully saturated field; worn cells decay up to twice as fast
+WEATHER_DECAY_PER_MINUTE = 0.002
+
 
 class TurfDegradationMesh(Component):
-    grid: List[List[float]] = []
+    """
+    Friction coefficient per yard of field (length x width), stored as one
+    float32 array so footprints, weather decay and region queries are vectorized.
+    """
+    _friction: np.ndarray = PrivateAttr()
 
-    def __init__(self, width: int = 53, length: int = 120, **data):
+    def __init__(self, width: int = 53, length: int = 120, grid: Optional[List[List[float]]] = None, **data):
         super().__init__(**data)
-        # 10x10 grid approximation for now
-        if not self.grid:
-             self.grid = [[1.0 for _ in range(width)] for _ in range(length)] # Friction Coeff
+        if grid:
+            self._friction = np.array(grid, dtype=np.float32)
+        else:
+            self._friction = np.ones((length, width), dtype=np.float32)  # Friction Coeff
+
+    @property
+    def friction(self) -> np.ndarray:
+        return self._friction
+
+    @property
+    def grid(self) -> List[List[float]]:
+        """Nested-list copy of the field, for callers of the old list-backed mesh."""
+        return self._friction.tolist()
+
+    @property
+    def nbytes(self) -> int:
+        return self._friction.nbytes
+
+    def _in_bounds(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        length, width = self._friction.shape
+        return (xs >= 0) & (xs < length) & (ys >= 0) & (ys < width)
 
     def degrade_zone(self, x: int, y: int, traffic: float):
         # Friction drops with traffic
-        if 0 <= x < len(self.grid) and 0 <= y < len(self.grid[0]):
-            self.grid[x][y] = max(0.4, self.grid[x][y] - (traffic * 0.01))
+        length, width = self._friction.shape
+        if 0 <= x < length and 0 <= y < width:
+            self._friction[x, y] = max(MIN_FRICTION, self._friction[x, y] - (traffic * TRAFFIC_WEAR))
+
+    def apply_footprint(self, xs: Sequence[float], ys: Sequence[float], traffic: Any = 1.0, radius: int = 0):
+        """
+        Degrade every cell a play touched in one call.
+
+        Args:
+            xs, ys: Cell coordinates of each footstep/contact (off-field points are ignored)
+            traffic: Traffic per point, shared or one value per point
+            radius: Also wear cells within this many yards of each point
+        """
+        xs = np.asarray(xs, dtype=np.intp)
+        ys = np.asarray(ys, dtype=np.intp)
+        if xs.shape != ys.shape:
+            raise ValueError(f"xs and ys differ in length ({len(xs)} vs {len(ys)})")
+        wear = np.broadcast_to(np.asarray(traffic, dtype=np.float32) * TRAFFIC_WEAR, xs.shape)
+
+        if radius:
+            offsets = np.arange(-radius, radius + 1)
+            dx, dy = np.meshgrid(offsets, offsets, indexing="ij")
+            xs = (xs[:, None] + dx.ravel()).ravel()
+            ys = (ys[:, None] + dy.ravel()).ravel()
+            wear = np.repeat(wear, dx.size)
+
+        # Sum wear per cell first so repeated steps on one cell stack
+        mask = self._in_bounds(xs, ys)
+        cells = np.ravel_multi_index((xs[mask], ys[mask]), self._friction.shape)
+        total = np.bincount(cells, weights=wear[mask], minlength=self._friction.size)
+        self._friction -= total.reshape(self._friction.shape).astype(np.float32)
+        np.maximum(self._friction, MIN_FRICTION, out=self._friction)
+
+    def apply_weather_decay(self, moisture: float, minutes: float = 1.0):
+        """
+        Wet weather softens the whole field, fastest where it is already worn.
+
+        Args:
+            moisture: Field moisture from 0.0 (dry) to 1.0 (saturated)
+            minutes: Game minutes elapsed
+        """
+        if moisture <= 0 or minutes <= 0:
+            return
+        wear = (1.0 - self._friction) / (1.0 - MIN_FRICTION)
+        self._friction -= np.float32(WEATHER_DECAY_PER_MINUTE * moisture * minutes) * (1.0 + wear)
+        np.maximum(self._friction, MIN_FRICTION, out=self._friction)
 
     def get_friction(self, x: int, y: int) -> float:
         # Return friction at coordinates
-        return self.grid[int(x)][int(y)] if 0 <= x < len(self.grid) else 1.0
+        length, width = self._friction.shape
+        if 0 <= x < length and 0 <= y < width:
+            return float(self._friction[int(x), int(y)])
+        return 1.0
+
+    def get_friction_many(self, xs: Sequence[float], ys: Sequence[float]) -> np.ndarray:
+        """Friction at many points; off-field points read as fresh turf (1.0)."""
+        xs = np.asarray(xs, dtype=np.intp)
+        ys = np.asarray(ys, dtype=np.intp)
+        mask = self._in_bounds(xs, ys)
+        result = np.ones(xs.shape, dtype=np.float32)
+        result[mask] = self._friction[xs[mask], ys[mask]]
+        return result
+
+    def region(self, x_range: Tuple[int, int], y_range: Tuple[int, int]) -> np.ndarray:
+        """View of the cells in [x0, x1) x [y0, y1), clipped to the field."""
+        return self._friction[max(0, x_range[0]):x_range[1], max(0, y_range[0]):y_range[1]]
+
+    def region_stats(self, x_range: Tuple[int, int], y_range: Tuple[int, int],
+                     worn_below: float = 0.8) -> Dict[str, float]:
+        cells = self.region(x_range, y_range)
+        if cells.size == 0:
+            return {"mean": 1.0, "min": 1.0, "worn_fraction": 0.0}
+        return {
+            "mean": float(cells.mean()),
+            "min": float(cells.min()),
+            "worn_fraction": float((cells < worn_below).mean()),
+        }
+
+    def get_state(self) -> Dict[str, float]:
+        """Whole-field summary used by HiveKernel.get_field_conditions."""
+        length, width = self._friction.shape
+        return self.region_stats((0, length), (0, width))
 
 class FluidDynamicsSolver(Component):
     wind_vector: Tuple[float, float] = (0.0, 0.0) # x, y
@@ -27,4 +135,3 @@ class FluidDynamicsSolver(Component):
         # Simplified Magnus force calculation
         # F = S * (w x v)
         return spin * velocity * 0.0004 * self.air_density
-
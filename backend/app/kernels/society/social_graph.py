@@ -1,50 +1,231 @@
 from app.kernels.core.ecs_manager import Component
-from typing import Dict, List, Tuple
-from pydantic import Field
-import networkx as nx
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+from pydantic import PrivateAttr
+import numpy as np
+try:
+    import networkx as nx
+except ImportError:
+    nx = None
+
+# Mutiny cascade: only high-trust bonds share sentiment, and the hit fades per hop
+MUTINY_TRUST_THRESHOLD = 0.7
+MUTINY_DECAY = 0.8
+MUTINY_MIN_HIT = 0.1
+
+DEFAULT_TRUST = 0.5 # Neutral, for players with no edge
+
 
 class TrustGraph(Component):
-    model_config = {"arbitrary_types_allowed": True}
-    # Directive 1: Weighted Undirected Trust Graph
-    # Nodes = PlayerIDs, Edges = Trust (0.0 - 1.0)
-    graph: nx.Graph = Field(default_factory=nx.Graph)
-    
+    """
+    Directive 1: Weighted Undirected Trust Graph
+    Nodes = PlayerIDs, Edges = Trust (0.0 - 1.0)
+
+    Players are mapped to dense int indices with one neighbour dict per index,
+    so traversal never touches networkx (only needed for to_networkx export).
+    """
     # Directive 10: Personality DNA
     personalities: Dict[str, str] = {} # ID -> "Leader", "Volatile", "Stoic"
 
+    _index: Dict[Hashable, int] = PrivateAttr(default_factory=dict)
+    _ids: List[Hashable] = PrivateAttr(default_factory=list)
+    _adjacency: List[Dict[int, float]] = PrivateAttr(default_factory=list)
+
+    def _node(self, player_id: Hashable) -> int:
+        idx = self._index.get(player_id)
+        if idx is None:
+            idx = len(self._ids)
+            self._index[player_id] = idx
+            self._ids.append(player_id)
+            self._adjacency.append({})
+        return idx
+
+    @property
+    def node_ids(self) -> List[Hashable]:
+        return list(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
     def add_trust_edge(self, p1: str, p2: str, trust: float):
-        self.graph.add_edge(p1, p2, weight=trust)
+        i, j = self._node(p1), self._node(p2)
+        self._adjacency[i][j] = trust
+        self._adjacency[j][i] = trust
 
     def get_trust(self, p1: str, p2: str) -> float:
-        if self.graph.has_edge(p1, p2):
-            return self.graph[p1][p2]['weight']
-        return 0.5 # Default neutral
+        i, j = self._index.get(p1), self._index.get(p2)
+        if i is None or j is None:
+            return DEFAULT_TRUST
+        return self._adjacency[i].get(j, DEFAULT_TRUST)
+
+    def neighbors(self, player_id: str) -> Dict[Hashable, float]:
+        idx = self._index.get(player_id)
+        if idx is None:
+            return {}
+        return {self._ids[j]: trust for j, trust in self._adjacency[idx].items()}
+
+    def edges(self) -> Iterable[Tuple[Hashable, Hashable, float]]:
+        for i, neighbours in enumerate(self._adjacency):
+            for j, trust in neighbours.items():
+                if i < j:
+                    yield self._ids[i], self._ids[j], trust
 
     def trigger_mutiny_cascade(self, source_id: str, morale_hit: float) -> int:
         """
         Directive 2: Mutiny Cascade (BFS).
         Returns number of players affected.
         """
-        affected_count = 0
+        return len(self.mutiny_cascade(source_id, morale_hit))
+
+    def mutiny_cascade(self, source_id: str, morale_hit: float) -> Dict[Hashable, float]:
+        """The cascade itself: every affected player with the hit they took."""
+        affected: Dict[Hashable, float] = {}
+        source = self._index.get(source_id)
+        if source is None:
+            # Unknown players still take the hit themselves
+            return {source_id: morale_hit}
+
         visited = set()
-        queue = [(source_id, morale_hit)]
-        
+        queue = deque([(source, morale_hit)])
+
         while queue:
-            current_id, current_hit = queue.pop(0)
-            if current_id in visited: continue
-            visited.add(current_id)
-            affected_count += 1
-            
+            current, current_hit = queue.popleft()
+            if current in visited: continue
+            visited.add(current)
+            affected[self._ids[current]] = current_hit
+
             # Propagate to neighbors if trust is HIGH (shared sentiment)
-            if self.graph.has_node(current_id):
-                for neighbor in self.graph.neighbors(current_id):
-                    trust = self.graph[current_id][neighbor]['weight']
-                    if trust > 0.7: # High trust spreads mutiny
-                        decayed_hit = current_hit * 0.8
-                        if decayed_hit > 0.1:
-                            queue.append((neighbor, decayed_hit))
-                            
-        return affected_count
+            decayed_hit = current_hit * MUTINY_DECAY
+            if decayed_hit > MUTINY_MIN_HIT:
+                for neighbor, trust in self._adjacency[current].items():
+                    if trust > MUTINY_TRUST_THRESHOLD and neighbor not in visited:
+                        queue.append((neighbor, decayed_hit))
+
+        return affected
+
+    def to_csr(self, min_trust: float = 0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (indptr, indices, weights) arrays over edges with trust > min_trust.
+        Row i lists the neighbours of node i, in node-index order.
+        """
+        indptr = np.zeros(len(self._ids) + 1, dtype=np.int64)
+        indices: List[int] = []
+        weights: List[float] = []
+        for i, neighbours in enumerate(self._adjacency):
+            for j in sorted(neighbours):
+                if neighbours[j] > min_trust:
+                    indices.append(j)
+                    weights.append(neighbours[j])
+            indptr[i + 1] = len(indices)
+        return indptr, np.array(indices, dtype=np.int64), np.array(weights, dtype=float)
+
+    def to_networkx(self) -> Any:
+        """Export for visualization or ad-hoc analysis (requires networkx)."""
+        if nx is None:
+            raise ImportError("networkx is required to export a TrustGraph")
+        graph = nx.Graph()
+        graph.add_nodes_from(self._ids)
+        graph.add_weighted_edges_from(self.edges())
+        return graph
+
+
+class LeagueTrustNetwork:
+    """
+    Every team's TrustGraph packed into one block-diagonal CSR graph, so a
+    league-wide influence pass is a single level-synchronous BFS in numpy.
+    """
+
+    def __init__(self, graphs: Dict[Any, TrustGraph], min_trust: float = MUTINY_TRUST_THRESHOLD):
+        self.teams = list(graphs)
+        self.min_trust = min_trust
+        self._offsets: Dict[Any, int] = {}
+        self._ids: List[Tuple[Any, Hashable]] = []
+
+        indptrs, indices = [np.zeros(1, dtype=np.int64)], []
+        offset = 0
+        for team in self.teams:
+            graph = graphs[team]
+            indptr, idx, _ = graph.to_csr(min_trust)
+            indptrs.append(indptr[1:] + indptrs[-1][-1])
+            indices.append(idx + offset)
+            self._offsets[team] = offset
+            self._ids.extend((team, pid) for pid in graph.node_ids)
+            offset += len(graph)
+
+        self._graphs = graphs
+        self.indptr = np.concatenate(indptrs)
+        self.indices = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64)
+
+    def propagate_influence(
+        self,
+        sources: Dict[Any, List[Tuple[Hashable, float]]],
+        decay: float = MUTINY_DECAY,
+        min_hit: float = MUTINY_MIN_HIT
+    ) -> Dict[Any, Dict[Hashable, float]]:
+        """
+        Spread influence from every team's sources at once.
+
+        Args:
+            sources: team -> [(player_id, hit)] seeds
+            decay: Fraction of the hit passed on per hop
+            min_hit: Hits at or below this stop spreading
+
+        Returns:
+            team -> {player_id: hit}; a player reached by several paths keeps
+            the hit from the shortest (then strongest) one. With one source per
+            team this matches TrustGraph.mutiny_cascade.
+        """
+        n = len(self._ids)
+        hits = np.zeros(n)
+        visited = np.zeros(n, dtype=bool)
+        result: Dict[Any, Dict[Hashable, float]] = {team: {} for team in self.teams}
+
+        frontier_nodes, frontier_hits = [], []
+        for team, seeds in sources.items():
+            graph = self._graphs.get(team)
+            for player_id, hit in seeds:
+                idx = graph._index.get(player_id) if graph is not None else None
+                if idx is None:
+                    # Players outside the graph only take their own hit
+                    result.setdefault(team, {})[player_id] = hit
+                    continue
+                frontier_nodes.append(self._offsets[team] + idx)
+                frontier_hits.append(hit)
+
+        frontier, frontier_hit = self._dedupe(np.array(frontier_nodes, dtype=np.int64), np.array(frontier_hits))
+        while frontier.size:
+            visited[frontier] = True
+            hits[frontier] = frontier_hit
+
+            spreading = frontier_hit * decay > min_hit
+            starts = self.indptr[frontier[spreading]]
+            counts = self.indptr[frontier[spreading] + 1] - starts
+            if counts.sum() == 0:
+                break
+
+            # Flatten the CSR rows of every spreading node
+            row_offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+            neighbours = self.indices[row_offsets + np.arange(counts.sum())]
+            neighbour_hits = np.repeat(frontier_hit[spreading] * decay, counts)
+
+            fresh = ~visited[neighbours]
+            frontier, frontier_hit = self._dedupe(neighbours[fresh], neighbour_hits[fresh])
+
+        for node in np.flatnonzero(visited):
+            team, player_id = self._ids[node]
+            result[team][player_id] = float(hits[node])
+        return result
+
+    @staticmethod
+    def _dedupe(nodes: np.ndarray, node_hits: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Unique nodes, keeping the largest hit for each."""
+        if nodes.size == 0:
+            return nodes, node_hits
+        unique, inverse = np.unique(nodes, return_inverse=True)
+        best = np.full(unique.size, -np.inf)
+        np.maximum.at(best, inverse, node_hits)
+        return unique, best
+
 
 class ChemistryLogic(Component):
     # Directive 7: QB Trust Gates Play Resolution
@@ -5,6 +5,7 @@ from app.api.endpoints import system, simulation, data, websocket, teams, player
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import IntegrityError, OperationalError
 from pydantic import ValidationError
+from contextlib import asynccontextmanager
 import logging
 import logging.handlers
 import os
@@ -52,11 +53,21 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    simulation.session_manager.start_eviction()
+    yield
+    # Cancel live games and close their database sessions before exit or reload
+    await simulation.session_manager.shutdown()
+
+
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
     version=settings.API_VERSION,
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 # Rate Limiting
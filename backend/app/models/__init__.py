@@ -6,8 +6,10 @@ from app.models.coach import Coach
 from app.models.gm import GM
 from app.models.settings import SystemSettings
 from app.models.game import Game
+from app.models.play_event import PlayEvent
 from app.models.stats import PlayerGameStats
 from app.models.season import Season, SeasonStatus
+from app.models.standings import TeamSeasonStanding
 from app.models.playoff import PlayoffMatchup, PlayoffRound, PlayoffConference
 from app.models.draft import DraftPick
 from app.models.history import SeasonHistory, PlayerSeasonStats, TeamSeasonStats
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, JSON, Index
+from sqlalchemy.orm import relationship
+from app.models.base import Base
+
+
+class PlayEvent(Base):
+    """
+    Append-only play-by-play log.
+
+    Each play is written exactly once, in batches per drive or quarter, so the
+    cost of persisting a play does not grow with the length of the game.
+    """
+    __tablename__ = "play_events"
+    __table_args__ = (
+        Index("ix_play_events_game_sequence", "game_id", "sequence", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    game_id = Column(Integer, ForeignKey("game.id"), nullable=False, index=True)
+    sequence = Column(Integer, nullable=False)  # 1-based play number within the game
+    quarter = Column(Integer, default=1)
+    possession = Column(String)  # "home" or "away"
+
+    # Serialized PlayResult
+    data = Column(JSON, nullable=False)
+
+    game = relationship("Game", backref="play_events")
+
+    def __repr__(self):
+        return f"<PlayEvent(game_id={self.game_id}, sequence={self.sequence})>"
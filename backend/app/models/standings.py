@@ -0,0 +1,57 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Float, Boolean, JSON, Index
+from sqlalchemy.orm import relationship
+from app.models.base import Base
+
+
+class TeamSeasonStanding(Base):
+    """
+    Materialized standings row for one team in one season.
+
+    Rows are created when a season is initialized. Record counters are
+    updated incrementally as game results are saved; ranks and strength of
+    schedule are re-derived from the season's rows.
+    StandingsCalculator.rebuild_standings recreates the table from games.
+    """
+    __tablename__ = "team_standings"
+    __table_args__ = (
+        Index("ix_team_standings_season_team", "season_id", "team_id", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    season_id = Column(Integer, ForeignKey("season.id"), nullable=False, index=True)
+    team_id = Column(Integer, ForeignKey("team.id"), nullable=False)
+
+    team = relationship("Team")
+
+    # Record
+    wins = Column(Integer, default=0)
+    losses = Column(Integer, default=0)
+    ties = Column(Integer, default=0)
+    points_for = Column(Integer, default=0)
+    points_against = Column(Integer, default=0)
+
+    division_wins = Column(Integer, default=0)
+    division_losses = Column(Integer, default=0)
+    division_ties = Column(Integer, default=0)
+    conference_wins = Column(Integer, default=0)
+    conference_losses = Column(Integer, default=0)
+    conference_ties = Column(Integer, default=0)
+
+    # Tiebreaker inputs
+    head_to_head = Column(JSON, default=dict)  # {opponent_id: wins against them}
+    opponents = Column(JSON, default=list)  # Scheduled opponent IDs (played or not)
+
+    # Derived (recomputed on every update)
+    win_percentage = Column(Float, default=0.0)
+    point_differential = Column(Integer, default=0)
+    strength_of_schedule = Column(Float, default=0.0)
+    division_rank = Column(Integer)
+    conference_rank = Column(Integer)
+    seed = Column(Integer)
+    clinched_playoff = Column(Boolean, default=False)
+    clinched_division = Column(Boolean, default=False)
+    clinched_seed = Column(Integer)
+    tiebreaker_reason = Column(String)
+
+    def __repr__(self):
+        return f"<TeamSeasonStanding(season_id={self.season_id}, team_id={self.team_id}, {self.wins}-{self.losses}-{self.ties})>"
@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
 class PlayerGameStats(Base):
+    __table_args__ = (
+        # One box score row per player per game; target of the bulk stats upsert
+        Index("uq_playergamestats_player_game", "player_id", "game_id", unique=True),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
 
 
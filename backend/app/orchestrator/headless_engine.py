@@ -0,0 +1,284 @@
+"""
+Headless Game Engine
+--------------------
+Runs complete four-quarter games from an in-memory roster snapshot with no
+database I/O, for Monte-Carlo style batch runs.
+
+The engine drives the same SimulationOrchestrator play loop used by live games
+(play calling, PlayResolver, Genesis fatigue) but skips every persistence step
+and returns compact results instead of full play-by-play history.
+"""
+
+from collections import namedtuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.models.player import Player
+from app.orchestrator.match_context import MatchContext
+from app.orchestrator.play_commands import PuntCommand
+from app.orchestrator.simulation_orchestrator import SimulationOrchestrator
+
+logger = logging.getLogger(__name__)
+
+TraitSnapshot = namedtuple("TraitSnapshot", ["name"])
+
+QUARTER_LENGTH = "15:00"
+NUM_QUARTERS = 4
+
+
+class PlayerSnapshot:
+    """
+    Detached, in-memory copy of a Player row.
+
+    Exposes the same attribute names as the ORM model, so the depth chart,
+    play resolver and interaction engine can use it unchanged.
+    """
+
+    def __init__(self, **attributes: Any):
+        self.position = None
+        self.depth_chart_rank = 999
+        self.overall_rating = 50
+        self.injury_status = "ACTIVE"
+        self.traits: List[TraitSnapshot] = []
+        self.__dict__.update(attributes)
+
+    @classmethod
+    def from_player(cls, player: Player) -> "PlayerSnapshot":
+        """Copy every column (and loaded traits) off an ORM Player."""
+        attributes = {
+            column.key: getattr(player, column.key)
+            for column in Player.__table__.columns
+        }
+        if "traits" not in inspect(player).unloaded:
+            attributes["traits"] = [TraitSnapshot(t.name) for t in player.traits]
+        return cls(**attributes)
+
+    def __repr__(self) -> str:
+        return f"<PlayerSnapshot(id={getattr(self, 'id', None)}, position={self.position})>"
+
+
+@dataclass
+class RosterSnapshot:
+    """Both rosters for a matchup, frozen in memory."""
+    home_team_id: int
+    away_team_id: int
+    home_players: List[PlayerSnapshot]
+    away_players: List[PlayerSnapshot]
+
+    @classmethod
+    def from_players(
+        cls,
+        home_team_id: int,
+        home_players: Iterable[Player],
+        away_team_id: int,
+        away_players: Iterable[Player]
+    ) -> "RosterSnapshot":
+        return cls(
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+            home_players=[PlayerSnapshot.from_player(p) for p in home_players],
+            away_players=[PlayerSnapshot.from_player(p) for p in away_players],
+        )
+
+    @classmethod
+    async def load(cls, db: AsyncSession, home_team_id: int, away_team_id: int) -> "RosterSnapshot":
+        """Load both rosters once; every game run afterwards is database-free."""
+        rosters = {}
+        for team_id in (home_team_id, away_team_id):
+            stmt = (
+                select(Player)
+                .where(Player.team_id == team_id)
+                .options(selectinload(Player.traits))
+                .order_by(Player.id)
+            )
+            result = await db.execute(stmt)
+            rosters[team_id] = result.scalars().all()
+
+        return cls.from_players(home_team_id, rosters[home_team_id], away_team_id, rosters[away_team_id])
+
+
+@dataclass
+class DriveSummary:
+    """One possession: where it started, what it gained and how it ended."""
+    team: str  # "home" or "away"
+    quarter: int
+    start_yard_line: int
+    plays: int = 0
+    yards: int = 0
+    result: str = "END_OF_GAME"  # TOUCHDOWN, TURNOVER, PUNT, DOWNS, END_OF_HALF, END_OF_GAME
+
+
+@dataclass
+class HeadlessGameResult:
+    """Compact result of one headless game."""
+    seed: Any
+    home_score: int
+    away_score: int
+    total_plays: int
+    drives: List[DriveSummary] = field(default_factory=list)
+    team_stats: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    box_score: Dict[int, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def winner(self) -> str:
+        if self.home_score == self.away_score:
+            return "tie"
+        return "home" if self.home_score > self.away_score else "away"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seed": self.seed,
+            "home_score": self.home_score,
+            "away_score": self.away_score,
+            "winner": self.winner,
+            "total_plays": self.total_plays,
+            "drives": [vars(d) for d in self.drives],
+            "team_stats": self.team_stats,
+            "box_score": self.box_score,
+        }
+
+
+class HeadlessGameEngine:
+    """
+    Plays full games from a RosterSnapshot without any database access.
+
+    A single orchestrator is reused across games and reseeded per game, so a
+    batch of N games costs N game loops and nothing else.
+    """
+
+    def __init__(self, snapshot: RosterSnapshot, config: Optional[dict] = None, max_plays: int = 400):
+        self.snapshot = snapshot
+        self.config = config or {}
+        self.max_plays = max_plays
+        # Nobody reads play narratives in a batch, so interactions skip building them
+        self.orchestrator = SimulationOrchestrator(
+            timing_sample_rate=settings.KERNEL_TIMING_BATCH_SAMPLE_RATE, numbers_only=True
+        )
+        self.orchestrator.play_delay_seconds = 0.0
+
+    def play_game(self, seed: Any) -> HeadlessGameResult:
+        """Play one four-quarter game seeded with ``seed``."""
+        weather_config = self.config.get("weather", {"temperature": 70, "condition": "Sunny"})
+        match_context = MatchContext(
+            self.snapshot.home_team_id,
+            self.snapshot.away_team_id,
+            weather_config=weather_config
+        )
+        match_context.load_rosters_from_players(self.snapshot.home_players, self.snapshot.away_players)
+
+        orchestrator = self.orchestrator
+        orchestrator.start_headless_session(match_context, {**self.config, "seed": seed})
+
+        team_stats = {
+            side: {"plays": 0, "yards": 0, "pass_plays": 0, "run_plays": 0, "turnovers": 0, "touchdowns": 0}
+            for side in ("home", "away")
+        }
+        drives: List[DriveSummary] = []
+        drive = DriveSummary(team=orchestrator.possession, quarter=1, start_yard_line=self._own_yard_line())
+
+        for _ in range(self.max_plays):
+            offense = orchestrator.possession
+            points_before = self._score(offense)
+
+            result = orchestrator._run_play()
+
+            stats = team_stats[offense]
+            stats["plays"] += 1
+            stats["yards"] += result.yards_gained
+            if result.passer_id:
+                stats["pass_plays"] += 1
+            elif result.rusher_id:
+                stats["run_plays"] += 1
+            if result.is_turnover:
+                stats["turnovers"] += 1
+
+            drive.plays += 1
+            drive.yards += result.yards_gained
+
+            # The orchestrator only scores touchdowns, credited to the team that had the ball
+            touchdown = self._score(offense) > points_before
+            if touchdown:
+                stats["touchdowns"] += 1
+
+            quarter_over = orchestrator._is_quarter_over()
+            game_over = quarter_over and orchestrator.current_quarter >= NUM_QUARTERS
+            halftime = quarter_over and orchestrator.current_quarter == NUM_QUARTERS // 2
+
+            if orchestrator.possession != offense:
+                if touchdown:
+                    drive.result = "TOUCHDOWN"
+                elif isinstance(orchestrator.last_command, PuntCommand):
+                    drive.result = "PUNT"
+                elif result.is_turnover:
+                    drive.result = "TURNOVER"
+                else:
+                    drive.result = "DOWNS"
+            elif halftime:
+                drive.result = "END_OF_HALF"
+            elif game_over:
+                drive.result = "END_OF_GAME"
+
+            if game_over:
+                break
+
+            if quarter_over:
+                self._advance_quarter(halftime)
+
+            if orchestrator.possession != offense or halftime:
+                drives.append(drive)
+                drive = DriveSummary(
+                    team=orchestrator.possession,
+                    quarter=orchestrator.current_quarter,
+                    start_yard_line=self._own_yard_line()
+                )
+
+        drives.append(drive)
+        orchestrator.timer.end_game()
+
+        box_score = orchestrator.aggregate_player_stats()
+        return HeadlessGameResult(
+            seed=seed,
+            home_score=orchestrator.home_score,
+            away_score=orchestrator.away_score,
+            total_plays=len(orchestrator.history),
+            drives=drives,
+            team_stats=team_stats,
+            box_score={pid: box_score[pid] for pid in sorted(box_score)},
+        )
+
+    def simulate_games(self, num_games: int, seed: Any = "headless") -> List[HeadlessGameResult]:
+        """Play ``num_games`` games with per-game seeds derived from ``seed``."""
+        results = [self.play_game(f"{seed}:{i}") for i in range(num_games)]
+        logger.info("Headless batch complete", extra={"games": num_games})
+        return results
+
+    def _score(self, side: str) -> int:
+        orchestrator = self.orchestrator
+        return orchestrator.home_score if side == "home" else orchestrator.away_score
+
+    def _own_yard_line(self) -> int:
+        """Current ball position measured from the offense's own goal line."""
+        orchestrator = self.orchestrator
+        if orchestrator.possession == "home":
+            return orchestrator.yard_line
+        return 100 - orchestrator.yard_line
+
+    def _advance_quarter(self, halftime: bool) -> None:
+        """Roll the clock into the next quarter; at halftime the away team receives."""
+        orchestrator = self.orchestrator
+        orchestrator.current_quarter += 1
+        orchestrator.time_left = QUARTER_LENGTH
+
+        if halftime:
+            orchestrator.possession = "away"
+            orchestrator.yard_line = 75  # Away team's own 25
+            orchestrator.down = 1
+            orchestrator.distance = 10
+            if orchestrator.match_context and orchestrator.match_context.genesis:
+                orchestrator.match_context.genesis.reset_all_fatigue()
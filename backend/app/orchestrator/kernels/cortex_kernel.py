@@ -1,6 +1,17 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from app.kernels.cortex.strategy import StrategyEngine
+from app.orchestrator.play_policy import Distribution, PolicyTable, SituationBuckets, draw
+
+# Dimensions (and thresholds) of preloaded policy tables for call_play
+SITUATION_BUCKETS = SituationBuckets(
+    down=(1, 2, 3),
+    distance=(1, 3, 10),
+    field_position=(40, 59, 64, 80),
+    quarter=(3, 4),
+    time_remaining=(9, 119, 299),
+    score_differential=(-9, -8, -1, 0, 7),
+)
 
 @dataclass
 class GameSituation:
@@ -16,11 +27,24 @@ class CortexKernel:
     """
     Facade for the Cortex (AI/Strategy) Engine.
     Manages decision making and play calling based on game situation and coach philosophy.
+
+    call_play is a handful of comparisons, cheaper than any table lookup, so
+    coaches are not compiled into policy tables (see play_policy); a
+    preloaded table (a hand-tuned or stored scheme) still takes priority.
     """
-    def __init__(self, seed: Any = None):
+    def __init__(self, seed: Any = None, policies: Optional[Dict[Tuple[int, int], PolicyTable]] = None):
+        """
+        Args:
+            seed: Seed for play-call draws
+            policies: Preloaded tables by (aggressiveness, pass_tendency)
+        """
         from app.core.random_utils import DeterministicRNG
         self.strategy = StrategyEngine()
         self.rng = DeterministicRNG(seed if seed is not None else 0)
+        self.policies = dict(policies or {})
+        for policy in self.policies.values():
+            if policy.buckets.names != SITUATION_BUCKETS.names:
+                raise ValueError(f"Policy table dimensions {policy.buckets.names} do not match {SITUATION_BUCKETS.names}")
 
     def call_play(self, situation: GameSituation, coach_philosophy: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -33,6 +57,12 @@ class CortexKernel:
         aggressiveness = coach.get("aggressiveness", 50) # 0-100
         pass_tendency = coach.get("pass_tendency", 50) # 0-100
 
+        # 0. A preloaded table for this coach, where it covers the situation
+        if self.policies:
+            distribution = self._table_distribution(situation, aggressiveness, pass_tendency)
+            if distribution is not None:
+                return draw(self.rng, distribution)
+
         # 1. Special Teams Logic (4th Down)
         if situation.down == 4:
             return self._decide_4th_down(situation, aggressiveness)
@@ -79,6 +109,16 @@ class CortexKernel:
         else:
             return "RUN"
 
+    def _table_distribution(self, situation: GameSituation, aggressiveness: int,
+                            pass_tendency: int) -> Optional[Distribution]:
+        policy = self.policies.get((aggressiveness, pass_tendency))
+        if policy is None:
+            return None
+        return policy.lookup(
+            situation.down, situation.distance, situation.field_position,
+            situation.quarter, situation.time_remaining, situation.score_differential
+        )
+
     def _decide_4th_down(self, situation: GameSituation, aggressiveness: int) -> str:
         """Decide what to do on 4th down."""
         # Field Goal Range (approx 35 yard line of opponent -> field_position 65+)
@@ -1,20 +1,31 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Union
 from app.kernels.genesis.bio_metrics import AnatomyModel, FatigueRegulator
+from app.kernels.genesis.bio_store import AnatomyView, BioStore, FatigueView
 
 class GenesisKernel:
     """
     Facade for the Genesis (Biological/Injury) Engine.
     Manages player health, fatigue, and injury risks.
+
+    State lives in an array-backed BioStore so whole-roster updates are
+    vectorized; player_states keeps the per-player object API as views.
     """
     def __init__(self) -> None:
         # In a real system, this would load from a DB or state manager
+        self.store = BioStore()
         self.player_states: Dict[int, Dict[str, Any]] = {}
 
     def register_player(self, player_id: int, profile_data: Dict[str, Any]) -> None:
         """Initialize biological components for a player."""
+        # Components validate the profile and supply defaults; the store keeps the values
+        slot = self.store.register(
+            player_id,
+            AnatomyModel(**profile_data.get("anatomy", {})),
+            FatigueRegulator(**profile_data.get("fatigue", {}))
+        )
         self.player_states[player_id] = {
-            "anatomy": AnatomyModel(**profile_data.get("anatomy", {})),
-            "fatigue": FatigueRegulator(**profile_data.get("fatigue", {}))
+            "anatomy": AnatomyView(self.store, slot),
+            "fatigue": FatigueView(self.store, slot)
         }
 
     def calculate_fatigue(self, player_id: int, exertion: float, temperature: float) -> float:
@@ -29,16 +40,25 @@ class GenesisKernel:
         state.update_fatigue(exertion, temperature)
         return state.lactic_acid
 
+    def calculate_fatigue_batch(
+        self,
+        player_ids: Iterable[int],
+        exertion: Union[float, List[float]],
+        temperature: float
+    ) -> None:
+        """Apply exertion to many players in one vectorized update."""
+        slots, exertion = self.store.select(player_ids, exertion)
+        self.store.apply_exertion(slots, exertion, temperature)
+
     def get_current_fatigue(self, player_id: int) -> float:
         """
         Return current fatigue level for a player without updating it.
         Returns: Fatigue percentage (0.0 - 100.0)
         """
-        if player_id not in self.player_states:
+        slot = self.store.slots.get(player_id)
+        if slot is None:
             return 0.0
-
-        state = self.player_states[player_id]["fatigue"]
-        return state.lactic_acid
+        return float(self.store.lactic_acid[slot])
 
     def check_injury_risk(self, player_id: int, impact_force: float, body_part: str) -> Dict[str, Any]:
         """
@@ -64,24 +84,17 @@ class GenesisKernel:
         Directly update fatigue by a delta amount.
         Positive delta increases fatigue, negative decreases it.
         """
-        if player_id not in self.player_states:
-            return
+        self.update_fatigue_batch([player_id], delta)
 
-        state = self.player_states[player_id]["fatigue"]
-        if delta > 0:
-            # Treat as generic exertion without temp modifier
-            state.lactic_acid += delta
-        else:
-            state.recover(-delta)
+    def update_fatigue_batch(self, player_ids: Iterable[int], delta: Union[float, List[float]]) -> None:
+        """update_fatigue for many players at once; delta may be shared or per player."""
+        slots, delta = self.store.select(player_ids, delta)
+        self.store.update_fatigue(slots, delta)
 
     def reset_all_fatigue(self) -> None:
         """Reset fatigue for all players (e.g. halftime)."""
-        for pid, state in self.player_states.items():
-            state["fatigue"].lactic_acid = 0.0
-            state["fatigue"].hrv = 100.0
-            state["fatigue"].max_burst_capacity = 100.0
+        self.store.reset_fatigue()
 
     def recover_all_fatigue(self, amount: float) -> None:
         """Recover fatigue for all players (e.g. timeout)."""
-        for pid, state in self.player_states.items():
-            state["fatigue"].recover(amount)
+        self.store.recover(self.store.slots_for(), amount)
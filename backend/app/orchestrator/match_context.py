@@ -1,12 +1,15 @@
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 from app.models.player import Player
 from app.models.team import Team
 from app.services.depth_chart_service import DepthChartService
 from app.orchestrator.kernels.genesis_kernel import GenesisKernel
 # from app.engine.kernels.cortex import CortexSystem # To be implemented/imported
 
+LineupKey = Tuple[int, str, str]  # (team_id, formation, side)
+
 class MatchContext:
     """
     Holds the state of a single match simulation, including:
@@ -16,7 +19,7 @@ class MatchContext:
     - Game Context (Score, Time, etc.)
     """
 
-    def __init__(self, home_team_id: int, away_team_id: int, db: AsyncSession, weather_config: Dict = None):
+    def __init__(self, home_team_id: int, away_team_id: int, db: Optional[AsyncSession] = None, weather_config: Dict = None):
         self.home_team_id = home_team_id
         self.away_team_id = away_team_id
         self.db = db
@@ -30,6 +33,14 @@ class MatchContext:
         # Fatigue: player_id -> fatigue_level (0.0 to 1.0, where 1.0 is exhausted)
         self.fatigue_state: Dict[int, float] = {}
 
+        # Lineup index: one resolved lineup per team/formation/side, rebuilt only after roster events
+        self._lineup_cache: Dict[LineupKey, List[Player]] = {}
+        self.lineup_cache_hits = 0
+        self.lineup_cache_misses = 0
+
+        # Players subbed out for fatigue, skipped when lineups are built
+        self.benched: Set[int] = set()
+
         # Systems
         self.genesis: Optional[GenesisKernel] = None
         # self.cortex: Optional[CortexSystem] = None
@@ -37,23 +48,45 @@ class MatchContext:
     async def load_rosters(self):
         """Loads full rosters for both teams from the database."""
         # Load Home Team
-        stmt_home = select(Player).where(Player.team_id == self.home_team_id)
+        stmt_home = (
+            select(Player)
+            .where(Player.team_id == self.home_team_id)
+            .options(selectinload(Player.traits))
+            .order_by(Player.id)
+        )
         result_home = await self.db.execute(stmt_home)
         home_players = result_home.scalars().all()
-        self.home_roster = {p.id: p for p in home_players}
 
         # Load Away Team
-        stmt_away = select(Player).where(Player.team_id == self.away_team_id)
+        stmt_away = (
+            select(Player)
+            .where(Player.team_id == self.away_team_id)
+            .options(selectinload(Player.traits))
+            .order_by(Player.id)
+        )
         result_away = await self.db.execute(stmt_away)
         away_players = result_away.scalars().all()
+
+        self.load_rosters_from_players(home_players, away_players)
+
+    def load_rosters_from_players(self, home_players: List[Any], away_players: List[Any]):
+        """
+        Populates rosters from in-memory player objects without touching the database.
+
+        Any object exposing the Player attributes works (ORM rows or snapshots).
+        """
+        self.home_roster = {p.id: p for p in home_players}
         self.away_roster = {p.id: p for p in away_players}
 
         # Initialize fatigue for all players
+        self.fatigue_state = {}
         for pid in self.home_roster:
             self.fatigue_state[pid] = 0.0
         for pid in self.away_roster:
             self.fatigue_state[pid] = 0.0
 
+        self.benched = set()
+        self.invalidate_lineups()
         self.initialize_systems()
 
     def initialize_systems(self):
@@ -78,16 +111,30 @@ class MatchContext:
         """
         Returns the 11 players on the field for a given team and formation.
 
+        Lineups are resolved once per formation and cached until a roster event
+        (injury, fatigue substitution, depth chart edit) invalidates the team.
+
         Args:
             team_id: The ID of the team.
             formation: The formation name (e.g., "I_FORM", "SHOTGUN", "4_3", "NICKEL").
             side: "OFFENSE" or "DEFENSE".
         """
-        # Get the correct roster list
-        if team_id == self.home_team_id:
-            roster_list = list(self.home_roster.values())
+        key = (team_id, formation, side)
+        lineup = self._lineup_cache.get(key)
+        if lineup is None:
+            self.lineup_cache_misses += 1
+            lineup = self._build_lineup(team_id, formation, side)
+            self._lineup_cache[key] = lineup
         else:
-            roster_list = list(self.away_roster.values())
+            self.lineup_cache_hits += 1
+
+        # Copy so callers cannot mutate the cached lineup
+        return list(lineup)
+
+    def _build_lineup(self, team_id: int, formation: str, side: str) -> List[Player]:
+        # Get the correct roster list
+        roster = self.home_roster if team_id == self.home_team_id else self.away_roster
+        roster_list = [p for pid, p in roster.items() if pid not in self.benched]
 
         if side == "OFFENSE":
             starters = DepthChartService.get_starting_offense(roster_list, formation)
@@ -101,7 +148,6 @@ class MatchContext:
         # If we are short players (e.g. missing depth chart), fill with best available from roster
         # This is a fallback mechanism
         if len(players) < 11:
-            needed = 11 - len(players)
             # Simple fallback: grab random players not already fielded
             current_ids = {p.id for p in players}
 
@@ -113,17 +159,67 @@ class MatchContext:
 
         return players
 
+    def invalidate_lineups(self, team_id: Optional[int] = None):
+        """Drops cached lineups for one team, or for both teams when team_id is None."""
+        if team_id is None:
+            self._lineup_cache.clear()
+            return
+        for key in [k for k in self._lineup_cache if k[0] == team_id]:
+            del self._lineup_cache[key]
+
+    def lineup_cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters for profiling lineup resolution."""
+        return {
+            "hits": self.lineup_cache_hits,
+            "misses": self.lineup_cache_misses,
+            "entries": len(self._lineup_cache),
+        }
+
+    def team_of(self, player_id: int) -> Optional[int]:
+        if player_id in self.home_roster:
+            return self.home_team_id
+        if player_id in self.away_roster:
+            return self.away_team_id
+        return None
+
+    def set_injury_status(self, player_id: int, status: str):
+        """Applies an in-game injury status (e.g. OUT) and re-resolves that team's lineups."""
+        team_id = self.team_of(player_id)
+        if team_id is None:
+            return
+        roster = self.home_roster if team_id == self.home_team_id else self.away_roster
+        roster[player_id].injury_status = status
+        self.invalidate_lineups(team_id)
+
+    def sub_out_for_fatigue(self, player_id: int):
+        """Benches a tired player until return_from_fatigue is called."""
+        if player_id in self.benched or self.team_of(player_id) is None:
+            return
+        self.benched.add(player_id)
+        self.invalidate_lineups(self.team_of(player_id))
+
+    def return_from_fatigue(self, player_id: int):
+        if player_id not in self.benched:
+            return
+        self.benched.discard(player_id)
+        self.invalidate_lineups(self.team_of(player_id))
+
+    def depth_chart_changed(self, team_id: int):
+        """Call after editing depth_chart_rank on roster players mid-game."""
+        self.invalidate_lineups(team_id)
+
     def update_fatigue(self, player_ids: List[int], fatigue_delta: float):
         """Updates fatigue for a list of players."""
+        if self.genesis:
+            # Genesis uses 0-100 scale, MatchContext used 0.0-1.0
+            # We assume fatigue_delta passed here is 0.0-1.0 (e.g. 0.05)
+            # So we multiply by 100
+            self.genesis.update_fatigue_batch(player_ids, fatigue_delta * 100.0)
+            return
+
         for pid in player_ids:
-            if self.genesis:
-                # Genesis uses 0-100 scale, MatchContext used 0.0-1.0
-                # We assume fatigue_delta passed here is 0.0-1.0 (e.g. 0.05)
-                # So we multiply by 100
-                self.genesis.update_fatigue(pid, fatigue_delta * 100.0)
-            else:
-                if pid in self.fatigue_state:
-                    self.fatigue_state[pid] = min(1.0, max(0.0, self.fatigue_state[pid] + fatigue_delta))
+            if pid in self.fatigue_state:
+                self.fatigue_state[pid] = min(1.0, max(0.0, self.fatigue_state[pid] + fatigue_delta))
 
     def get_player_fatigue(self, player_id: int) -> float:
         if self.genesis:
@@ -1,9 +1,23 @@
 from dataclasses import dataclass
-from typing import List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
+from app.core.config import settings
 from app.orchestrator.play_commands import (
     PlayCommand, PassPlayCommand, RunPlayCommand,
     PuntCommand, FieldGoalCommand
 )
+from app.orchestrator.play_policy import PolicyTable, SituationBuckets, draw, to_distribution
+
+RUN_DIRECTIONS = ("left", "middle", "right")
+
+# Bucket edges sit on the thresholds the logic below branches on, so a compiled table is exact
+SITUATION_BUCKETS = SituationBuckets(
+    down=(1, 2, 3),
+    distance=(2, 4, 6, 10),
+    distance_to_goal=(2, 38, 60),
+    time_left_seconds=(299, 599),
+    score_diff=(-9, -4, -1, 8),
+)
 
 @dataclass
 class PlayCallingContext:
@@ -19,8 +33,12 @@ class PlayCallingContext:
 class PlayCaller:
     """
     Handles situation-aware play selection based on game state and coach personality.
+
+    Plays come from a policy table compiled from play_distribution() for
+    this coach (see play_policy); states the table lacks use the live logic.
     """
-    def __init__(self, rng: Any, aggression: float = 0.5, run_pass_ratio: float = 0.45) -> None:
+    def __init__(self, rng: Any, aggression: float = 0.5, run_pass_ratio: float = 0.45,
+                 policy: Optional[PolicyTable] = None) -> None:
         """
         Initialize PlayCaller.
 
@@ -30,29 +48,63 @@ class PlayCaller:
                                Affects 4th down decisions, deep passes, etc.
             run_pass_ratio (float): 0.0 (all pass) to 1.0 (all run).
                                    Base tendency before situational adjustments.
+            policy: Preloaded table for this coach or scheme. Defaults to one
+                    compiled from the live logic (unless PLAY_POLICY_TABLES is off).
         """
+        if policy is not None and policy.buckets.names != SITUATION_BUCKETS.names:
+            raise ValueError(f"Policy table dimensions {policy.buckets.names} do not match {SITUATION_BUCKETS.names}")
         self.rng = rng
         self.aggression = aggression
         self.run_pass_ratio = run_pass_ratio
+        self.policy = policy
 
     def select_play(self, context: PlayCallingContext) -> PlayCommand:
         """
         Select the appropriate play command based on the current context.
         """
-        # 1. Check for Special Teams situations (4th down)
-        if context.down == 4:
-            return self._handle_fourth_down(context)
+        distribution = None
+        policy = self._policy()
+        if policy is not None:
+            distribution = policy.lookup(
+                context.down, context.distance, context.distance_to_goal,
+                context.time_left_seconds, context.score_diff
+            )
+        if distribution is None:
+            distribution = to_distribution(self.play_distribution(context))
 
-        # 2. Determine Run vs Pass
-        is_pass = self._decide_run_vs_pass(context)
+        return self._create_command(draw(self.rng, distribution), context)
 
-        if is_pass:
-            return self._create_pass_play(context)
-        else:
-            return self._create_run_play(context)
-
-    def _handle_fourth_down(self, context: PlayCallingContext) -> PlayCommand:
-        """Handle 4th down logic: Punt, FG, or Go for it."""
+    def play_distribution(self, context: PlayCallingContext) -> Dict[str, float]:
+        """
+        The live play-calling logic: probability of each play type
+        ("PASS_SHORT", "RUN_LEFT", "PUNT", "FG", ...) in this situation.
+        """
+        # 1. Check for Special Teams situations (4th down)
+        if context.down == 4:
+            kick = self._fourth_down_kick(context)
+            if kick is not None:
+                return {kick: 1.0}
+
+        # 2. Determine Run vs Pass, then depth or direction
+        pass_prob = self._pass_probability(context)
+        depth_weights = self._pass_depth_weights(context)
+        total = sum(depth_weights.values())
+
+        plays = {f"PASS_{depth.upper()}": pass_prob * weight / total for depth, weight in depth_weights.items()}
+        # Could adjust run direction based on team strengths later
+        for direction in RUN_DIRECTIONS:
+            plays[f"RUN_{direction.upper()}"] = (1.0 - pass_prob) / len(RUN_DIRECTIONS)
+        return plays
+
+    def _policy(self) -> Optional[PolicyTable]:
+        if self.policy is not None:
+            return self.policy
+        if not settings.PLAY_POLICY_TABLES:
+            return None
+        return compiled_policy(self.aggression, self.run_pass_ratio)
+
+    def _fourth_down_kick(self, context: PlayCallingContext) -> Optional[str]:
+        """Handle 4th down logic: "PUNT", "FG", or None to go for it."""
 
         # Field Goal Range (approx 35 yard line, so 35+17 = 52 yard FG)
         # distance_to_goal <= 35 means we are at opponent 35 or closer.
@@ -84,26 +136,13 @@ class PlayCaller:
 
         if should_go_for_it:
             # Treat as normal down
-            if self._decide_run_vs_pass(context):
-                return self._create_pass_play(context)
-            else:
-                return self._create_run_play(context)
+            return None
 
-        if in_fg_range:
-            return FieldGoalCommand(
-                kicking_team=context.offense_players,
-                defense=context.defense_players,
-                distance=context.distance_to_goal + 17 # +17 for snap and hold
-            )
-        else:
-            return PuntCommand(
-                punting_team=context.offense_players,
-                receiving_team=context.defense_players
-            )
+        return "FG" if in_fg_range else "PUNT"
 
-    def _decide_run_vs_pass(self, context: PlayCallingContext) -> bool:
+    def _pass_probability(self, context: PlayCallingContext) -> float:
         """
-        Returns True for Pass, False for Run.
+        Probability of calling a pass.
         Adjusts base ratio based on situation.
         """
         # Start with base probability of passing
@@ -129,13 +168,10 @@ class PlayCaller:
             pass_prob -= 0.1
 
         # Clamp probability
-        pass_prob = max(0.05, min(0.95, pass_prob))
-
-        return self.rng.random() < pass_prob
+        return max(0.05, min(0.95, pass_prob))
 
-    def _create_pass_play(self, context: PlayCallingContext) -> PassPlayCommand:
-        """Determine pass depth and create command."""
-        # Determine depth based on distance needed
+    def _pass_depth_weights(self, context: PlayCallingContext) -> Dict[str, int]:
+        """Relative weight of each pass depth, based on distance needed."""
         depth_weights = {"short": 1, "mid": 1, "deep": 1}
 
         if context.distance > 10:
@@ -148,25 +184,43 @@ class PlayCaller:
         if self.aggression > 0.7:
             depth_weights["deep"] += 1
 
-        # Select depth
-        choices = list(depth_weights.keys())
-        weights = list(depth_weights.values())
-        selected_depth = self.rng.choices(choices, weights=weights, k=1)[0]
+        return depth_weights
+
+    def _create_command(self, play: str, context: PlayCallingContext) -> PlayCommand:
+        """Build the command for a play type drawn from the distribution."""
+        if play == "FG":
+            return FieldGoalCommand(
+                kicking_team=context.offense_players,
+                defense=context.defense_players,
+                distance=context.distance_to_goal + 17 # +17 for snap and hold
+            )
+        if play == "PUNT":
+            return PuntCommand(
+                punting_team=context.offense_players,
+                receiving_team=context.defense_players
+            )
 
-        return PassPlayCommand(
+        kind, _, detail = play.partition("_")
+        if kind == "PASS":
+            return PassPlayCommand(
+                offense_players=context.offense_players,
+                defense_players=context.defense_players,
+                depth=detail.lower()
+            )
+        return RunPlayCommand(
             offense_players=context.offense_players,
             defense_players=context.defense_players,
-            depth=selected_depth
+            run_direction=detail.lower()
         )
 
-    def _create_run_play(self, context: PlayCallingContext) -> RunPlayCommand:
-        """Determine run direction and create command."""
-        directions = ["left", "middle", "right"]
-        # Could adjust based on team strengths later
-        selected_dir = self.rng.choice(directions)
 
-        return RunPlayCommand(
-            offense_players=context.offense_players,
-            defense_players=context.defense_players,
-            run_direction=selected_dir
+@lru_cache(maxsize=32)
+def compiled_policy(aggression: float, run_pass_ratio: float) -> PolicyTable:
+    """The live logic of one coach, compiled over every situation bucket (once per process)."""
+    caller = PlayCaller(rng=None, aggression=aggression, run_pass_ratio=run_pass_ratio)
+    return PolicyTable.compile(
+        SITUATION_BUCKETS,
+        lambda situation: caller.play_distribution(
+            PlayCallingContext(possession="home", offense_players=[], defense_players=[], **situation)
         )
+    )
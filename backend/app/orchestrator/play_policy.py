@@ -0,0 +1,145 @@
+"""
+Precompiled play-calling policy tables.
+
+Every input a play caller looks at (down, distance, field position, clock,
+score) falls into a handful of ranges that lead to the same decision, so a
+caller's logic can be compiled once per coach into a table from situation
+bucket to weighted play distribution. Calling a play is then a bucket
+lookup plus one weighted draw; the live logic stays as the fallback for any
+state a table does not cover.
+"""
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, product
+from math import prod
+from operator import getitem, mul
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# A weighted play distribution ready for drawing: (plays, cumulative weights)
+Distribution = Tuple[Tuple[str, ...], Tuple[float, ...]]
+SituationKey = Tuple[int, ...]
+
+
+class SituationBuckets:
+    """
+    Discrete situation space: per dimension, the ascending inclusive upper
+    bounds of every bucket but the last (which is open-ended).
+
+    SituationBuckets(distance=(2, 6)) buckets distance as <=2, 3-6, 7+.
+    """
+
+    def __init__(self, **bounds: Sequence[int]):
+        self.names = tuple(bounds)
+        self.bounds = tuple(tuple(b) for b in bounds.values())
+        # Row-major strides: a bucket combination is one flat index, last dimension fastest
+        sizes = [len(b) + 1 for b in self.bounds]
+        self.strides = tuple(prod(sizes[i + 1:]) for i in range(len(sizes)))
+        # Per dimension, value -> bucket * stride for every value looked up so far
+        self._offsets = tuple({} for _ in self.bounds)
+
+    def __len__(self) -> int:
+        size = 1
+        for bounds in self.bounds:
+            size *= len(bounds) + 1
+        return size
+
+    def key(self, *values: int) -> SituationKey:
+        """Bucket of each value, in dimension order."""
+        return tuple(map(bisect_left, self.bounds, values))
+
+    def index(self, *values: int) -> int:
+        """
+        Flat index of a situation's bucket combination (its position in
+        representatives()).
+
+        Each value's bucket is bisected once and remembered, so a repeat
+        lookup is one dict hit per dimension and no tuple is built.
+        """
+        try:
+            return sum(map(getitem, self._offsets, values))
+        except KeyError:
+            for offsets, bounds, stride, value in zip(self._offsets, self.bounds, self.strides, values, strict=True):
+                offsets[value] = bisect_left(bounds, value) * stride
+            return sum(map(getitem, self._offsets, values))
+
+    def flat_index(self, key: SituationKey) -> int:
+        """Flat index of a bucket combination."""
+        return sum(map(mul, key, self.strides))
+
+    def representatives(self) -> Iterator[Tuple[SituationKey, Dict[str, int]]]:
+        """One concrete value per bucket combination, keyed by dimension name."""
+        samples = [tuple(bounds) + (bounds[-1] + 1,) for bounds in self.bounds]
+        for combination in product(*(range(len(s)) for s in samples)):
+            yield combination, {
+                name: sample[index]
+                for name, sample, index in zip(self.names, samples, combination)
+            }
+
+
+def to_distribution(weights: Dict[str, float]) -> Distribution:
+    """Drop zero-weight plays and precompute cumulative weights."""
+    plays = tuple(play for play, weight in weights.items() if weight > 0)
+    return plays, tuple(accumulate(weights[play] for play in plays))
+
+
+def draw(rng: Any, distribution: Distribution) -> str:
+    """Pick one play with a single rng.random() draw."""
+    plays, cumulative = distribution
+    if len(plays) == 1:
+        return plays[0]
+    return plays[bisect_right(cumulative, rng.random() * cumulative[-1])]
+
+
+class PolicyTable:
+    """
+    Situation bucket -> weighted play distribution, for one coach or scheme.
+
+    Entries are fixed at construction: lookups go through a flat list with
+    one slot per bucket combination.
+    """
+
+    def __init__(self, buckets: SituationBuckets, entries: Optional[Dict[SituationKey, Distribution]] = None):
+        self.buckets = buckets
+        self.entries: Dict[SituationKey, Distribution] = entries or {}
+        self._flat: List[Optional[Distribution]] = [None] * len(buckets)
+        for key, distribution in self.entries.items():
+            self._flat[buckets.flat_index(key)] = distribution
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def compile(cls, buckets: SituationBuckets,
+                distribution: Callable[[Dict[str, int]], Dict[str, float]]) -> "PolicyTable":
+        """
+        Evaluate ``distribution`` (the live logic, as play -> weight) once at
+        a representative of every bucket combination.
+        """
+        return cls(buckets, {
+            key: to_distribution(distribution(situation))
+            for key, situation in buckets.representatives()
+        })
+
+    def lookup(self, *values: int) -> Optional[Distribution]:
+        """Distribution for a situation, or None if the table does not cover it."""
+        return self._flat[self.buckets.index(*values)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form, so compiled or hand-tuned tables can be stored per coach."""
+        return {
+            "dimensions": dict(zip(self.buckets.names, (list(b) for b in self.buckets.bounds))),
+            "entries": [
+                {"key": list(key), "plays": list(plays), "weights": [
+                    round(weight - previous, 6)
+                    for weight, previous in zip(cumulative, (0.0,) + cumulative[:-1])
+                ]}
+                for key, (plays, cumulative) in self.entries.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PolicyTable":
+        buckets = SituationBuckets(**data["dimensions"])
+        return cls(buckets, {
+            tuple(entry["key"]): to_distribution(dict(zip(entry["plays"], entry["weights"])))
+            for entry in data["entries"]
+        })
@@ -7,6 +7,7 @@ from app.engine.event_bus import EventBus, EventType
 from app.engine.offensive_line_ai import OffensiveLineAI
 from app.engine.weather_effects import WeatherEffects
 from app.engine.attribute_interaction import AttributeInteractionEngine, apply_interaction_to_play
+from app.core.kernel_timing import KernelTimer, FATIGUE, INTERACTIONS, WEATHER
 from app.models.weather import GameWeather
 from typing import Optional, Any, List, Tuple
 import logging
@@ -17,12 +18,22 @@ class PlayResolver:
     """
     Resolves a PlayCommand by orchestrating the various simulation kernels.
     """
-    def __init__(self, rng: Any, kernels: Optional[KernelInterface] = None) -> None:
+    def __init__(self, rng: Any, kernels: Optional[KernelInterface] = None, numbers_only: bool = False) -> None:
         self.rng = rng
         self.kernels = kernels or KernelInterface()
         self.current_match_context = None
-        self.offensive_line_ai = OffensiveLineAI()
-        self.interaction_engine = AttributeInteractionEngine(rng=rng)
+        self.event_bus = EventBus()
+        self.offensive_line_ai = OffensiveLineAI(self.event_bus)
+        # numbers_only skips interaction narratives (batch runs never read them)
+        self.interaction_engine = AttributeInteractionEngine(rng=rng, numbers_only=numbers_only)
+        # Disabled until an orchestrator shares its timer
+        self.timer = KernelTimer(sample_rate=0)
+
+    def start_game(self) -> None:
+        """Give the next game its own event bus and line AI, dropping the last game's handlers."""
+        self.offensive_line_ai.close()
+        self.event_bus = EventBus()
+        self.offensive_line_ai = OffensiveLineAI(self.event_bus)
 
     def register_players(self, match_context: Any) -> None:
         """Register all players from the match context with the kernels."""
@@ -219,6 +230,7 @@ class PlayResolver:
                    command.defense[0]
 
         # 2. Genesis Kernel: Calculate Fatigue & Injury Risk
+        started = self.timer.clock()
         temp = self._get_weather_temp()
         # Use get_current_fatigue (read-only) for penalty calculation
         # Fatigue update happens in Orchestrator
@@ -227,6 +239,7 @@ class PlayResolver:
         # Injury Check
         injury_check = self.kernels.genesis.check_injury_risk(qb.id, impact_force=600.0, body_part="ACL")
         injuries = [injury_check] if injury_check["is_injured"] else []
+        self.timer.record(FATIGUE, started)
 
         # 3. Line Battle & Sack Check
         block_results, sackers, beaten_ols = self._resolve_line_battle(command.offense, command.defense)
@@ -283,7 +296,7 @@ class PlayResolver:
                             intimidation_factor = 1.5
                             break
 
-                EventBus.publish(EventType.SACK_EVENT, {
+                self.event_bus.publish(EventType.SACK_EVENT, {
                     "beaten_linemen_ids": [beaten_ol.id],
                     "sacker_id": sacker.id,
                     "intimidation_factor": intimidation_factor
@@ -303,7 +316,9 @@ class PlayResolver:
 
         # ** ATTRIBUTE INTERACTIONS ** (Set 3/Set 4 Integration)
         # Calculate cross-attribute effects
+        started = self.timer.clock()
         interaction_results = self._apply_pass_play_interactions(qb, target, defender, command)
+        self.timer.record(INTERACTIONS, started)
 
         # Safety check: ensure results are valid
         if interaction_results is None or not isinstance(interaction_results, dict):
@@ -339,7 +354,9 @@ class PlayResolver:
         )
 
         # C. Weather Impact
+        started = self.timer.clock()
         weather_effects = self._get_weather_effects()
+        self.timer.record(WEATHER, started)
         weather_penalty = 0.0
 
         if weather_effects:
@@ -490,10 +507,12 @@ class PlayResolver:
                    command.defense[0]
 
         # 2. Genesis Kernel: Fatigue
+        started = self.timer.clock()
         temp = self._get_weather_temp()
         # print(f"DEBUG: Resolving Run Play. RB ID: {rb.id}, Temp: {temp}")
         # Use get_current_fatigue (read-only)
         current_fatigue = self.kernels.genesis.get_current_fatigue(rb.id)
+        self.timer.record(FATIGUE, started)
         # print(f"DEBUG: Calculated Fatigue: {current_fatigue}")
 
         # 3. Attribute Logic via ProbabilityEngine
@@ -569,7 +588,9 @@ class PlayResolver:
         if hasattr(rb, "ball_security") and rb.ball_security < 70: fumble_chance += 0.01
 
         # Weather Fumble Modifier
+        started = self.timer.clock()
         weather_effects = self._get_weather_effects()
+        self.timer.record(WEATHER, started)
         if weather_effects:
             fumble_mod = weather_effects.get_fumble_probability_modifier()
             fumble_chance *= fumble_mod
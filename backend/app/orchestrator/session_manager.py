@@ -0,0 +1,286 @@
+"""
+Live game sessions for the simulation API.
+
+Every live game gets its own SimulationOrchestrator, its own AsyncSession and
+its own asyncio task, keyed by a session id, so any number of games can run
+side by side on one worker without sharing game state. The manager caps how
+many sessions it holds and evicts sessions that have gone idle, both when
+room is needed and from a periodic background sweep; the app's lifespan
+starts that sweep and shuts every session down on exit.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+import time
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.orchestrator.simulation_orchestrator import SimulationOrchestrator
+from app.schemas.play import PlayResult
+
+logger = logging.getLogger(__name__)
+
+PlayCallback = Callable[["LiveGameSession", PlayResult], Awaitable[None]]
+UpdateCallback = Callable[["LiveGameSession", Dict[str, Any]], Awaitable[None]]
+
+
+class SessionLimitError(RuntimeError):
+    """Raised when a new session would exceed the manager's limit."""
+
+
+@dataclass
+class LiveGameSession:
+    session_id: str
+    orchestrator: SimulationOrchestrator
+    num_plays: int
+    config: Dict[str, Any] = field(default_factory=dict)
+    game_id: Optional[int] = None
+    status: str = "starting"  # starting, running, completed, stopped, failed
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    last_active: float = field(default_factory=time.time)
+    db_session: Optional[AsyncSession] = field(default=None, repr=False)
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def is_running(self) -> bool:
+        return self.status in ("starting", "running")
+
+    def touch(self) -> None:
+        self.last_active = time.time()
+
+    def idle_seconds(self, now: Optional[float] = None) -> float:
+        return (now or time.time()) - self.last_active
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "game_id": self.game_id,
+            "status": self.status,
+            "error": self.error,
+            "num_plays": self.num_plays,
+            "plays_run": len(self.orchestrator.history),
+            "created_at": self.created_at,
+            "last_active": self.last_active,
+            "game_state": self.orchestrator.get_game_state(),
+        }
+
+
+class LiveSessionManager:
+    """
+    Hosts concurrent live games.
+
+    A session stays listed after its game ends so clients can still read its
+    status and plays; it is evicted once nobody has touched it (and it has not
+    run a play) for idle_timeout seconds. Running sessions that stall that long
+    are stopped and evicted too.
+    """
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        orchestrator_factory: Callable[[], SimulationOrchestrator] = SimulationOrchestrator,
+    ) -> None:
+        self.max_sessions = max_sessions or settings.LIVE_SESSION_LIMIT
+        self.idle_timeout = idle_timeout or settings.LIVE_SESSION_IDLE_TIMEOUT
+        self.session_factory = session_factory
+        self.orchestrator_factory = orchestrator_factory
+        self.sessions: Dict[str, LiveGameSession] = {}
+        self.latest_session_id: Optional[str] = None
+        self._eviction_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    @property
+    def running_count(self) -> int:
+        return sum(1 for s in self.sessions.values() if s.is_running)
+
+    async def start(
+        self,
+        num_plays: int = 100,
+        config: Optional[Dict[str, Any]] = None,
+        on_play_complete: Optional[PlayCallback] = None,
+        on_game_update: Optional[UpdateCallback] = None,
+        play_delay_seconds: Optional[float] = None,
+    ) -> LiveGameSession:
+        """
+        Create a game and start simulating it in the background.
+
+        The game row is created before this returns, so session.game_id is set.
+
+        Raises:
+            SessionLimitError: max_sessions are already held and none can be freed
+        """
+        await self._make_room()
+
+        config = config or {}
+        session = LiveGameSession(
+            session_id=uuid.uuid4().hex,
+            orchestrator=self.orchestrator_factory(),
+            num_plays=num_plays,
+            config=config,
+        )
+        orchestrator = session.orchestrator
+        if play_delay_seconds is not None:
+            orchestrator.play_delay_seconds = play_delay_seconds
+        self._bind_callbacks(session, on_play_complete, on_game_update)
+
+        # Reserve the slot before awaiting so concurrent starts respect the limit
+        self.sessions[session.session_id] = session
+        session.db_session = self.session_factory()
+        try:
+            await orchestrator.start_new_game_session(
+                home_team_id=config.get("home_team_id", 1),
+                away_team_id=config.get("away_team_id", 2),
+                config=config,
+                db_session=session.db_session,
+            )
+        except Exception:
+            self.sessions.pop(session.session_id, None)
+            await session.db_session.close()
+            raise
+
+        session.game_id = orchestrator.current_game_id
+        session.status = "running"
+        session.task = asyncio.create_task(self._run(session), name=f"live-game-{session.session_id}")
+        self.latest_session_id = session.session_id
+
+        logger.info(
+            "Live session started",
+            extra={"session_id": session.session_id, "game_id": session.game_id, "num_plays": num_plays},
+        )
+        return session
+
+    def _bind_callbacks(
+        self,
+        session: LiveGameSession,
+        on_play_complete: Optional[PlayCallback],
+        on_game_update: Optional[UpdateCallback],
+    ) -> None:
+        async def play_complete(result: PlayResult) -> None:
+            session.touch()
+            if on_play_complete:
+                await on_play_complete(session, result)
+
+        async def game_update(state: Dict[str, Any]) -> None:
+            if on_game_update:
+                await on_game_update(session, state)
+
+        session.orchestrator.on_play_complete = play_complete
+        session.orchestrator.on_game_update = game_update
+
+    async def _run(self, session: LiveGameSession) -> None:
+        orchestrator = session.orchestrator
+        try:
+            # The game was created in start(); the loop resets the scoreboard and plays it
+            await orchestrator.run_continuous_simulation(session.num_plays, session.config)
+            if session.status == "running":
+                session.status = "completed"
+        except asyncio.CancelledError:
+            orchestrator.stop_simulation()
+            session.status = "stopped"
+            raise
+        except Exception as e:
+            session.status = "failed"
+            session.error = str(e)
+            logger.exception("Live session failed", extra={"session_id": session.session_id})
+        finally:
+            session.touch()
+            if session.db_session is not None:
+                await session.db_session.close()
+                session.db_session = None
+            logger.info(
+                "Live session finished",
+                extra={"session_id": session.session_id, "game_id": session.game_id, "status": session.status},
+            )
+
+    def get(self, session_id: str) -> LiveGameSession:
+        """Look up a session by session id or by its game id; touching it keeps it alive."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = next((s for s in self.sessions.values() if str(s.game_id) == str(session_id)), None)
+        if session is None:
+            raise KeyError(session_id)
+        session.touch()
+        return session
+
+    def latest(self) -> Optional[LiveGameSession]:
+        """Most recently started session still held, for the single-game endpoints."""
+        if self.latest_session_id in self.sessions:
+            return self.get(self.latest_session_id)
+        return None
+
+    def stop(self, session_id: str) -> LiveGameSession:
+        """Ask a session to stop after its current play; the game is still finalized."""
+        session = self.get(session_id)
+        if session.is_running:
+            session.orchestrator.stop_simulation()
+            session.status = "stopped"
+        return session
+
+    async def remove(self, session_id: str) -> None:
+        """Cancel a session's task (if still running) and forget it."""
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return
+        if session.task and not session.task.done():
+            session.task.cancel()
+            await asyncio.gather(session.task, return_exceptions=True)
+        if self.latest_session_id == session_id:
+            self.latest_session_id = None
+
+    def list(self) -> List[Dict[str, Any]]:
+        return [s.to_dict() for s in sorted(self.sessions.values(), key=lambda s: s.created_at)]
+
+    async def evict_idle(self, now: Optional[float] = None) -> List[str]:
+        """Drop every session idle for longer than idle_timeout; returns their ids."""
+        now = now or time.time()
+        idle = [sid for sid, s in self.sessions.items() if s.idle_seconds(now) > self.idle_timeout]
+        for session_id in idle:
+            await self.remove(session_id)
+        if idle:
+            logger.info("Evicted idle live sessions", extra={"count": len(idle)})
+        return idle
+
+    async def _make_room(self) -> None:
+        if len(self.sessions) < self.max_sessions:
+            return
+        await self.evict_idle()
+        # Finished games are only kept for reading back; free the oldest first
+        finished = sorted((s for s in self.sessions.values() if not s.is_running), key=lambda s: s.last_active)
+        for session in finished[:len(self.sessions) - self.max_sessions + 1]:
+            await self.remove(session.session_id)
+        if len(self.sessions) >= self.max_sessions:
+            raise SessionLimitError(f"Live session limit reached ({self.max_sessions})")
+
+    def start_eviction(self, interval: Optional[float] = None) -> None:
+        """Evict idle sessions every ``interval`` seconds in the background, until shutdown()."""
+        if self._eviction_task is None or self._eviction_task.done():
+            self._eviction_task = asyncio.create_task(
+                self._evict_periodically(interval or settings.LIVE_SESSION_EVICT_INTERVAL),
+                name="live-session-eviction",
+            )
+
+    async def _evict_periodically(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception:
+                logger.exception("Idle live session sweep failed")
+
+    async def shutdown(self) -> None:
+        """Stop the idle sweep and cancel every session, e.g. on application shutdown."""
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            await asyncio.gather(self._eviction_task, return_exceptions=True)
+            self._eviction_task = None
+        for session_id in list(self.sessions):
+            await self.remove(session_id)
@@ -1,21 +1,25 @@
 from app.orchestrator.play_resolver import PlayResolver
-from app.orchestrator.play_commands import PassPlayCommand, RunPlayCommand
+from app.orchestrator.play_commands import PassPlayCommand, PlayCommand, RunPlayCommand
 from app.orchestrator.play_caller import PlayCaller, PlayCallingContext
 from app.schemas.play import PlayResult
 from app.core.database import SessionLocal
 from app.models.game import Game
-from app.models.stats import PlayerGameStats
+from app.models.play_event import PlayEvent
 from app.models.player import Player
 from app.orchestrator.match_context import MatchContext
 from app.orchestrator.kernels.cortex_kernel import GameSituation
 from app.core.random_utils import DeterministicRNG
+from app.core.config import settings
+from app.core.kernel_timing import KernelTimer, FATIGUE, PERSISTENCE, PLAY_CALLING, RESOLUTION
+from app.services.stats_writer import BulkStatsWriter
 
-from typing import List, Optional, Callable, Awaitable, Any
+from typing import Dict, List, Optional, Callable, Awaitable, Any, Tuple
 import asyncio
 import datetime
 import logging
+import time
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +27,23 @@ class SimulationOrchestrator:
     """
     Orchestrates the setup and execution of a simulation.
     """
-    def __init__(self) -> None:
+    def __init__(self, timing_sample_rate: Optional[float] = None, numbers_only: bool = False) -> None:
         # Initialize with a default seed for startup/testing
         self.rng = DeterministicRNG("initial_boot_seed")
 
-        self.play_resolver = PlayResolver(self.rng)
+        self.play_resolver = PlayResolver(self.rng, numbers_only=numbers_only)
         self.play_caller = PlayCaller(self.rng, aggression=0.5) # Default balanced coach
+
+        # Per-phase timing; batch runs pass a low sample rate to keep overhead down
+        if timing_sample_rate is None:
+            timing_sample_rate = settings.KERNEL_TIMING_SAMPLE_RATE
+        self.set_timer(KernelTimer(timing_sample_rate))
         self.history: List[PlayResult] = []
+        # The play _run_play last called, so callers can tell e.g. a punt from a failed 4th down
+        self.last_command: Optional[PlayCommand] = None
+
+        # Plays not yet appended to the play_events log: (sequence, quarter, possession, result)
+        self._pending_play_events: List[Tuple[int, int, str, PlayResult]] = []
 
         # Game State
         self.is_running = False
@@ -46,6 +60,9 @@ class SimulationOrchestrator:
         self.db_session: Optional[AsyncSession] = None
         self.current_game_id = None
 
+        # Optional shared writer; when set, player stats are queued for a batch flush
+        self.stats_writer: Optional[BulkStatsWriter] = None
+
         # Match Context (Data Hydration)
         self.match_context: Optional[MatchContext] = None
 
@@ -61,6 +78,8 @@ class SimulationOrchestrator:
         """Initialize a new game session in the database."""
         self.game_config = config or {}
         self.db_session = db_session
+        self.play_resolver.start_game()
+        self.timer.reset()
 
         if self.db_session:
             new_game = Game(
@@ -77,11 +96,9 @@ class SimulationOrchestrator:
             await self.db_session.refresh(new_game)
             self.current_game_id = new_game.id
 
-            # Initialize Deterministic RNG with Game ID
-            self.rng = DeterministicRNG(new_game.id)
-            # Update components with new RNG
-            self.play_resolver.rng = self.rng
-            self.play_caller.rng = self.rng
+            # Initialize Deterministic RNG with an explicit seed (parallel week
+            # workers) or fall back to the Game ID
+            self.set_rng(DeterministicRNG(self.game_config.get("seed", new_game.id)))
 
             # Hydrate Match Context
             logger.info("Hydrating match context", extra={"game_id": new_game.id})
@@ -131,15 +148,53 @@ class SimulationOrchestrator:
              # So we assume db_session is provided.
              pass
 
+    def set_rng(self, rng: DeterministicRNG) -> None:
+        """
+        Use a new RNG for this orchestrator and every component that draws from it.
+
+        Each component gets its own child stream, so a change to how often one
+        of them draws does not shift the others' numbers.
+        """
+        self.rng = rng
+        self.play_resolver.rng = rng.stream("play_resolver")
+        self.play_resolver.interaction_engine.rng = rng.stream("interactions")
+        self.play_caller.rng = rng.stream("play_caller")
+
+    def set_timer(self, timer: KernelTimer) -> None:
+        """Use a new phase timer for this orchestrator and its play resolver."""
+        self.timer = timer
+        self.play_resolver.timer = timer
+
+    def start_headless_session(self, match_context: MatchContext, config: Optional[dict] = None) -> None:
+        """
+        Prepare a game from an already-hydrated MatchContext without a database.
+
+        Plays run through _run_play(); nothing is persisted.
+        """
+        self.game_config = config or {}
+        self.db_session = None
+        self.current_game_id = None
+        self.match_context = match_context
+
+        self.set_rng(DeterministicRNG(self.game_config.get("seed", "headless")))
+        self.play_resolver.start_game()
+        self.timer.reset()
+        self.play_resolver.register_players(match_context)
+        self.reset_game_state()
+
     async def _save_progress(self) -> None:
-        """Save current game state and history to database."""
+        """
+        Save current game state and append buffered plays to the play log.
+
+        Only plays not yet written are inserted, so the cost of a save depends on
+        the size of the batch rather than on how far into the game we are.
+        """
         if not self.db_session or not self.current_game_id:
             return
 
+        started = time.perf_counter()
         try:
-            stmt = select(Game).where(Game.id == self.current_game_id)
-            result = await self.db_session.execute(stmt)
-            game = result.scalar_one_or_none()
+            game = await self.db_session.get(Game, self.current_game_id)
 
             if game:
                 game.home_score = self.home_score
@@ -147,16 +202,31 @@ class SimulationOrchestrator:
                 game.current_quarter = self.current_quarter
                 game.time_left = self.time_left
 
-                # Update game data with plays and config
+                # Game data keeps only the compact state; plays live in play_events
                 current_data = dict(game.game_data) if game.game_data else {}
-                current_data["plays"] = [p.model_dump() for p in self.history]
                 current_data["state"] = self.get_game_state()
+                current_data["play_count"] = len(self.history)
                 game.game_data = current_data
 
+                if self._pending_play_events:
+                    await self.db_session.execute(insert(PlayEvent), [
+                        {
+                            "game_id": self.current_game_id,
+                            "sequence": sequence,
+                            "quarter": quarter,
+                            "possession": possession,
+                            "data": result.model_dump(),
+                        }
+                        for sequence, quarter, possession, result in self._pending_play_events
+                    ])
+
                 await self.db_session.commit()
+                self._pending_play_events = []
         except Exception as e:
             logger.exception("Error saving game progress", extra={"game_id": self.current_game_id})
             await self.db_session.rollback()
+        finally:
+            self.timer.record_always(PERSISTENCE, started)
 
     async def save_game_result(self) -> None:
         """Finalize the game in the database."""
@@ -174,10 +244,16 @@ class SimulationOrchestrator:
                 await self._save_player_stats()
                 await self._save_progress() # Ensure final state is saved
 
-                logger.info("Finalized game result", extra={"game_id": self.current_game_id})
+                lineup_cache = self.match_context.lineup_cache_stats() if self.match_context else {}
+                logger.info(
+                    "Finalized game result",
+                    extra={"game_id": self.current_game_id, "lineup_cache": lineup_cache},
+                )
         except Exception as e:
             logger.exception("Error finalizing game", extra={"game_id": self.current_game_id})
         finally:
+            self.timer.end_game()
+
             # Cleanup Match Context
             self.match_context = None
 
@@ -204,14 +280,38 @@ class SimulationOrchestrator:
         # 1. Map player IDs to Team IDs
         player_team_map = {}
         if self.match_context:
-            for pid, p in self.match_context.home_roster.items():
+            for pid in self.match_context.home_roster:
                 player_team_map[pid] = game.home_team_id
-            for pid, p in self.match_context.away_roster.items():
+            for pid in self.match_context.away_roster:
                 player_team_map[pid] = game.away_team_id
 
-        # 2. Aggregate Stats
-        # Structure: player_id -> {stat_name: value}
-        stats_agg = {}
+        # 2. Aggregate Stats (single pass over history)
+        stats_agg = self.aggregate_player_stats()
+
+        # 3. Queue on the shared week writer, or upsert this game on its own
+        if self.stats_writer is not None:
+            self.stats_writer.add_game(game.id, game.season_id, stats_agg, player_team_map)
+            return
+
+        started = time.perf_counter()
+        writer = BulkStatsWriter(self.db_session)
+        writer.add_game(game.id, game.season_id, stats_agg, player_team_map)
+        report = await writer.flush()
+        await self.db_session.commit()
+        self.timer.record_always(PERSISTENCE, started)
+        logger.info(
+            "Player stats saved",
+            extra={"game_id": game.id, "player_count": report.rows_written, "elapsed_ms": report.elapsed_ms}
+        )
+
+    def aggregate_player_stats(self) -> Dict[int, Dict[str, int]]:
+        """
+        Aggregate per-player box score stats from the play history.
+
+        Returns:
+            Mapping of player_id -> {stat_name: value}
+        """
+        stats_agg: Dict[int, Dict[str, int]] = {}
 
         def get_stats(pid):
             if pid not in stats_agg:
@@ -254,47 +354,7 @@ class SimulationOrchestrator:
                     if play.is_touchdown:
                         s["rec_tds"] += 1
 
-        # 3. Save to DB
-        count = 0
-        for pid, stats in stats_agg.items():
-            team_id = player_team_map.get(pid)
-            if not team_id:
-                # Fallback: query player if not in match context (shouldn't happen often)
-                stmt = select(Player).where(Player.id == pid)
-                result = await self.db_session.execute(stmt)
-                player = result.scalar_one_or_none()
-                if player:
-                    team_id = player.team_id
-
-            if not team_id:
-                continue
-
-            # Check if exists first
-            stmt = select(PlayerGameStats).where(
-                PlayerGameStats.player_id == pid,
-                PlayerGameStats.game_id == game.id
-            )
-            result = await self.db_session.execute(stmt)
-            pgs = result.scalar_one_or_none()
-
-            if not pgs:
-                pgs = PlayerGameStats(
-                    player_id=pid,
-                    game_id=game.id,
-                    team_id=team_id,
-                    season_id=game.season_id,
-                    **stats
-                )
-                self.db_session.add(pgs)
-            else:
-                # Update existing
-                for k, v in stats.items():
-                    setattr(pgs, k, getattr(pgs, k) + v)
-
-            count += 1
-
-        await self.db_session.commit()
-        logger.info("Player stats saved", extra={"game_id": game.id, "player_count": count})
+        return stats_agg
 
     def run_simulation(self) -> PlayResult:
         """
@@ -393,7 +453,30 @@ class SimulationOrchestrator:
         logger.info("Simulation complete")
 
     async def _execute_single_play(self) -> PlayResult:
-        """Execute a single play and update game state."""
+        """
+        Execute a single play and update game state.
+
+        The play is buffered for the append-only play log, which is flushed
+        once per drive (change of possession) and at the end of each quarter.
+        """
+        quarter, possession = self.current_quarter, self.possession
+        result = self._run_play()
+
+        if self.db_session and self.current_game_id:
+            self._pending_play_events.append((len(self.history), quarter, possession, result))
+            if self.possession != possession or self._is_quarter_over():
+                await self._save_progress()
+        return result
+
+    def _run_play(self) -> PlayResult:
+        """
+        Select, resolve and apply a single play without any database I/O.
+
+        Shared by the live orchestrator and the headless engine.
+        """
+        timer = self.timer
+        timer.start_play()
+        started = timer.clock()
 
         # Get Real Players from MatchContext if available
         offense_players = []
@@ -464,18 +547,26 @@ class SimulationOrchestrator:
         else:
             # Legacy PlayCaller
             command = self.play_caller.select_play(context)
+        timer.record(PLAY_CALLING, started)
+
+        self.last_command = command
 
         # Resolve play
+        started = timer.clock()
         result = self.play_resolver.resolve_play(command)
+        timer.record(RESOLUTION, started)
         self.history.append(result)
 
         # Update game state based on result
-        await self._update_game_state(result)
+        self._apply_play_result(result)
 
         # Update Fatigue in MatchContext
         if self.match_context:
+            started = timer.clock()
             self._update_fatigue(offense_players, defense_players, result)
+            timer.record(FATIGUE, started)
 
+        timer.end_play()
         return result
 
     def _convert_decision_to_command(self, decision: str, context: PlayCallingContext) -> Any:
@@ -536,7 +627,12 @@ class SimulationOrchestrator:
         self.match_context.update_fatigue(defense_ids, 0.02) # Medium exertion
 
     async def _update_game_state(self, result: PlayResult) -> None:
-        """Update game state based on play result."""
+        """Update game state based on play result and persist it."""
+        self._apply_play_result(result)
+        await self._save_progress()
+
+    def _apply_play_result(self, result: PlayResult) -> None:
+        """Apply a play result to the in-memory game state."""
         # Update yard line
         if self.possession == "home":
             self.yard_line += result.yards_gained
@@ -596,9 +692,6 @@ class SimulationOrchestrator:
         except (ValueError, AttributeError):
             pass
 
-        # Persist state
-        await self._save_progress()
-
     def _is_quarter_over(self) -> bool:
         """Check if the current quarter is over."""
         try:
@@ -618,6 +711,8 @@ class SimulationOrchestrator:
         self.distance = 10
         self.yard_line = 25
         self.history = []
+        self.last_command = None
+        self._pending_play_events = []
         # self.player_stats = {} # Reset stats
 
     def get_game_state(self) -> dict:
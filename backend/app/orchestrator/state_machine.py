@@ -2,12 +2,26 @@
 Game State Machine
 -----------------
 Manages game flow and state transitions with validation
+
+By default transitions are checked against a precomputed table and recorded
+as small TransitionRecords in a bounded ring buffer, and the game is saved in
+the background at checkpoints. With snapshots=True (or STATE_MACHINE_SNAPSHOTS)
+every transition also keeps a full context snapshot and is logged, for debugging.
 """
 
+from collections import deque
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Callable, Deque, FrozenSet, NamedTuple, Optional, Dict, Any, Union
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
 import datetime
+import logging
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
 
 
 class GameState(str, Enum):
@@ -54,6 +68,24 @@ class StateTransition(BaseModel):
     context_snapshot: Dict[str, Any]
 
 
+class TransitionRecord(NamedTuple):
+    """Ring-buffer record of a state transition (no context snapshot)"""
+    sequence: int
+    from_state: GameState
+    to_state: GameState
+    monotonic_time: float
+
+
+# Entering one of these states checkpoints the game to the database
+CHECKPOINT_STATES = frozenset({
+    GameState.QUARTER_BREAK,
+    GameState.HALFTIME,
+    GameState.TWO_MINUTE_WARNING,
+    GameState.FINAL,
+    GameState.OVERTIME,
+})
+
+
 class GameStateMachine:
     """
     Controls game flow and validates state transitions
@@ -85,12 +117,47 @@ class GameStateMachine:
         GameState.OVERTIME: [GameState.PLAY_CALLING, GameState.FINAL]
     }
     
-    def __init__(self, game_id: int, initial_state: GameState = GameState.PRE_GAME):
+    # VALID_TRANSITIONS as frozensets, so validating a transition is one lookup
+    TRANSITION_TABLE: Dict[GameState, FrozenSet[GameState]] = {
+        state: frozenset(next_states) for state, next_states in VALID_TRANSITIONS.items()
+    }
+
+    def __init__(
+        self,
+        game_id: int,
+        initial_state: GameState = GameState.PRE_GAME,
+        snapshots: Optional[bool] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        history_size: Optional[int] = None,
+        checkpoint_interval: Optional[int] = None,
+    ):
+        """
+        Args:
+            game_id: Game row to persist to
+            initial_state: Starting state
+            snapshots: Keep a full StateTransition (with context snapshot) per transition
+                       and log it; defaults to STATE_MACHINE_SNAPSHOTS
+            session_factory: Opens AsyncSessions for background checkpoints; None disables them
+            history_size: Ring buffer length when not snapshotting
+            checkpoint_interval: Also checkpoint every N transitions (0: checkpoint states only)
+        """
         self.game_id = game_id
         self.current_state = initial_state
         self.context: Optional[GameContext] = None
-        self.history: list[StateTransition] = []
-        
+        self.snapshots = settings.STATE_MACHINE_SNAPSHOTS if snapshots is None else snapshots
+        self.history: Union[list[StateTransition], Deque[TransitionRecord]] = (
+            [] if self.snapshots else
+            deque(maxlen=history_size if history_size is not None else settings.STATE_MACHINE_HISTORY_SIZE)
+        )
+        self.transition_count = 0
+
+        self.session_factory = session_factory
+        self.checkpoint_interval = (
+            settings.STATE_MACHINE_CHECKPOINT_INTERVAL if checkpoint_interval is None else checkpoint_interval
+        )
+        self._pending_checkpoint: Optional[Dict[str, Any]] = None
+        self._checkpoint_task: Optional[asyncio.Task] = None
+
     def transition(self, new_state: GameState, context: Optional[GameContext] = None) -> bool:
         """
         Attempt to transition to a new state
@@ -110,29 +177,41 @@ class GameStateMachine:
             )
         
         # Record the transition
-        transition = StateTransition(
-            from_state=self.current_state,
-            to_state=new_state,
-            timestamp=datetime.datetime.utcnow(),
-            context_snapshot=self.context.dict() if self.context else {}
-        )
-        self.history.append(transition)
-        
-        # Update state
         old_state = self.current_state
+        self.transition_count += 1
+        if self.snapshots:
+            self.history.append(StateTransition(
+                from_state=old_state,
+                to_state=new_state,
+                timestamp=datetime.datetime.utcnow(),
+                context_snapshot=self.context.model_dump() if self.context else {}
+            ))
+        else:
+            self.history.append(TransitionRecord(self.transition_count, old_state, new_state, time.monotonic()))
+
+        # Update state
         self.current_state = new_state
         
         # Update context if provided
         if context:
             self.context = context
-            
-        print(f"[GameStateMachine] Transitioned: {old_state} → {new_state}")
+
+        if self.snapshots:
+            logger.debug(
+                "State transition",
+                extra={"game_id": self.game_id, "from_state": old_state.value, "to_state": new_state.value},
+            )
+
+        if new_state in CHECKPOINT_STATES or (
+            self.checkpoint_interval and self.transition_count % self.checkpoint_interval == 0
+        ):
+            self._schedule_checkpoint()
         return True
     
     def _is_valid_transition(self, new_state: GameState) -> bool:
         """Check if transition is valid"""
-        valid_next_states = self.VALID_TRANSITIONS.get(self.current_state, [])
-        return new_state in valid_next_states
+        valid_next_states = self.TRANSITION_TABLE.get(self.current_state)
+        return valid_next_states is not None and new_state in valid_next_states
     
     def update_context(self, **kwargs) -> None:
         """Update game context with new values"""
@@ -175,7 +254,7 @@ class GameStateMachine:
             "game_id": self.game_id,
             "current_state": self.current_state.value,
             "context": self.context.dict() if self.context else None,
-            "transition_count": len(self.history)
+            "transition_count": self.transition_count
         }
     
     def persist_to_db(self, db_session) -> None:
@@ -186,26 +265,80 @@ class GameStateMachine:
         
         game = db_session.query(Game).filter(Game.id == self.game_id).first()
         if not game:
-            print(f"[GameStateMachine] Warning: Game {self.game_id} not found in DB")
+            logger.warning("Game not found in DB", extra={"game_id": self.game_id})
             return
             
         if self.context:
-            # Update columns
-            game.home_score = self.context.home_score
-            game.away_score = self.context.away_score
-            
-            # Update game_data JSON
-            current_data = game.game_data or {}
-            current_data.update({
-                "quarter": self.context.quarter,
-                "time_remaining": self.context.time_remaining,
-                "down": self.context.down,
-                "distance": self.context.distance,
-                "yard_line": self.context.yard_line,
-                "possession_team_id": self.context.possession_team_id,
-                "is_home_possession": self.context.is_home_possession,
-                "current_state": self.current_state.value
-            })
-            game.game_data = current_data
-            
+            self._apply_checkpoint(game, self._checkpoint_data())
             db_session.commit()
+
+    async def persist_async(self) -> None:
+        """
+        Checkpoint the current state now, after any checkpoint already being written.
+        """
+        if self.session_factory is None or self.context is None:
+            return
+        self._pending_checkpoint = self._checkpoint_data()
+        if self._checkpoint_task is not None and not self._checkpoint_task.done():
+            # The running writer picks up the pending checkpoint before it exits
+            await self._checkpoint_task
+        if self._pending_checkpoint is not None:
+            await self._write_checkpoints()
+
+    def _schedule_checkpoint(self) -> None:
+        """Save the current state in the background without blocking the caller."""
+        if self.session_factory is None or self.context is None:
+            return
+        # Only the latest checkpoint matters; one already queued is replaced
+        self._pending_checkpoint = self._checkpoint_data()
+        if self._checkpoint_task is not None and not self._checkpoint_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync caller): the checkpoint waits for persist_async()
+            return
+        self._checkpoint_task = loop.create_task(
+            self._write_checkpoints(), name=f"state-checkpoint-{self.game_id}"
+        )
+
+    async def _write_checkpoints(self) -> None:
+        from app.models.game import Game
+
+        while self._pending_checkpoint is not None:
+            data, self._pending_checkpoint = self._pending_checkpoint, None
+            try:
+                async with self.session_factory() as db:
+                    game = await db.get(Game, self.game_id)
+                    if not game:
+                        logger.warning("Game not found in DB", extra={"game_id": self.game_id})
+                        continue
+                    self._apply_checkpoint(game, data)
+                    await db.commit()
+            except Exception:
+                logger.exception("Error checkpointing game state", extra={"game_id": self.game_id})
+
+    def _checkpoint_data(self) -> Dict[str, Any]:
+        return {
+            "home_score": self.context.home_score,
+            "away_score": self.context.away_score,
+            "quarter": self.context.quarter,
+            "time_remaining": self.context.time_remaining,
+            "down": self.context.down,
+            "distance": self.context.distance,
+            "yard_line": self.context.yard_line,
+            "possession_team_id": self.context.possession_team_id,
+            "is_home_possession": self.context.is_home_possession,
+            "current_state": self.current_state.value
+        }
+
+    @staticmethod
+    def _apply_checkpoint(game, data: Dict[str, Any]) -> None:
+        # Update columns
+        game.home_score = data["home_score"]
+        game.away_score = data["away_score"]
+
+        # Update game_data JSON (a new dict, so the change is detected)
+        current_data = dict(game.game_data) if game.game_data else {}
+        current_data.update({key: value for key, value in data.items() if key not in ("home_score", "away_score")})
+        game.game_data = current_data
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional, List
+from typing import Dict, Optional, List
 from app.models.playoff import PlayoffRound, PlayoffConference
 from app.schemas.team import Team
 
@@ -31,3 +31,31 @@ class PlayoffMatchup(PlayoffMatchupBase):
 class PlayoffBracket(BaseModel):
     season_id: int
     matchups: List[PlayoffMatchup]
+
+class HypotheticalResult(BaseModel):
+    """Assumed final score for a remaining regular season game."""
+    game_id: int
+    home_score: int
+    away_score: int
+
+class WhatIfScenario(BaseModel):
+    outcomes: List[HypotheticalResult] = []
+
+class WhatIfSeedingRequest(BaseModel):
+    scenarios: List[WhatIfScenario]
+
+class ProjectedSeed(BaseModel):
+    seed: int
+    team_id: int
+    team_name: str
+    team_abbreviation: str
+    division: str
+    wins: int
+    losses: int
+    ties: int
+    win_percentage: float
+    division_winner: bool
+
+class WhatIfSeeding(BaseModel):
+    """Projected seeds per conference ("AFC", "NFC") for one scenario."""
+    seeds: Dict[str, List[ProjectedSeed]]
@@ -0,0 +1,66 @@
+"""
+Rebuild or verify the materialized team_standings table.
+
+    python app/scripts/rebuild_standings.py 3            # rebuild season 3
+    python app/scripts/rebuild_standings.py 3 --verify   # compare only
+    python app/scripts/rebuild_standings.py --all
+
+New seasons get their rows when they are initialized; run with --all once
+after upgrading to add them for seasons created before the table existed.
+"""
+import argparse
+import sys
+from pathlib import Path
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Add backend directory to path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from app.core.database import SessionLocal
+from app.models.season import Season
+from app.services.standings_calculator import StandingsCalculator
+
+
+def rebuild_standings(season_ids, verify_only=False) -> int:
+    db: Session = SessionLocal()
+    failures = 0
+    try:
+        calculator = StandingsCalculator(db)
+        for season_id in season_ids:
+            if verify_only:
+                mismatches = calculator.verify_standings(season_id)
+                if mismatches:
+                    failures += 1
+                    print(f"Season {season_id}: {len(mismatches)} mismatches")
+                    for line in mismatches:
+                        print(f"  {line}")
+                else:
+                    print(f"Season {season_id}: standings OK")
+            else:
+                standings = calculator.rebuild_standings(season_id)
+                print(f"Season {season_id}: rebuilt {len(standings)} team rows")
+    finally:
+        db.close()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild or verify materialized standings")
+    parser.add_argument("season_ids", nargs="*", type=int, help="Season IDs to process")
+    parser.add_argument("--all", action="store_true", help="Process every season")
+    parser.add_argument("--verify", action="store_true", help="Compare against a full recalculation without writing")
+    args = parser.parse_args()
+
+    season_ids = args.season_ids
+    if args.all:
+        with SessionLocal() as db:
+            season_ids = db.execute(select(Season.id).order_by(Season.id)).scalars().all()
+    if not season_ids:
+        parser.error("give one or more season IDs, or --all")
+
+    sys.exit(1 if rebuild_standings(season_ids, verify_only=args.verify) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -306,33 +306,30 @@ class DraftAssistant:
                 return None, False
 
             cache_key = f"historical_comp_{player_data['position']}_{player_data['overall_rating']}"
-            cached_data = mcp_cache.get(cache_key, "historical_comparisons")
-
-            if cached_data:
-                logger.debug(f"Cache hit for historical comparison: {cache_key}")
-                return HistoricalComparison(**cached_data), True
-
-            # Call MCP tool for historical data
-            result = await client.call_tool(
-                "get_player_career_stats",
-                arguments={
-                    "player_name": f"{player_data['first_name']} {player_data['last_name']}",
-                    "position": player_data['position']
-                }
-            )
 
-            if result and isinstance(result, dict):
-                comparison = HistoricalComparison(
+            async def fetch_comparison() -> Optional[Dict]:
+                # Call MCP tool for historical data
+                result = await client.call_tool(
+                    "get_player_career_stats",
+                    arguments={
+                        "player_name": f"{player_data['first_name']} {player_data['last_name']}",
+                        "position": player_data['position']
+                    }
+                )
+                if not result or not isinstance(result, dict):
+                    return None
+                logger.info(f"Retrieved historical comparison via MCP for {player_data['position']}")
+                return HistoricalComparison(
                     comparable_player_name=result.get('name', 'Similar Player'),
                     seasons_active=result.get('years_active', 'N/A'),
                     career_highlights=result.get('highlights', 'Solid career stats'),
                     similarity_score=0.85  # Placeholder - would be calculated by MCP
-                )
+                ).model_dump()
 
-                # Cache the result
-                mcp_cache.set(cache_key, comparison.model_dump(), "historical_comparisons")
-                logger.info(f"Retrieved historical comparison via MCP for {player_data['position']}")
-                return comparison, True
+            # Cached, or fetched once however many suggestions ask at the same time
+            comparison = await mcp_cache.get_or_fetch(cache_key, "historical_comparisons", fetch_comparison)
+            if comparison:
+                return HistoricalComparison(**comparison), True
 
         except Exception as e:
             logger.warning(f"MCP historical comparison failed: {str(e)}")
@@ -381,14 +378,14 @@ class DraftAssistant:
                 client = registry.get_client("nfl_stats")
                 if client:
                     cache_key = f"league_avg_{position}_2024"
-                    stats = mcp_cache.get(cache_key, "league_averages")
-                    if not stats:
-                        stats = await client.call_tool(
+                    stats = await mcp_cache.get_or_fetch(
+                        cache_key,
+                        "league_averages",
+                        lambda: client.call_tool(
                             "get_league_averages",
                             arguments={"position": position, "season": 2024}
                         )
-                        if stats:
-                            mcp_cache.set(cache_key, stats, "league_averages")
+                    )
 
                     if stats:
                         historical_context = f"League average for {position} in 2024 suggests high value for this archetype."
@@ -0,0 +1,140 @@
+"""
+In-memory draft engine.
+
+Loads the undrafted picks, the rookie pool and every team's positional counts
+once, runs the whole draft against a heap-ordered big board, and writes all
+selections in a single commit. Selection rules are the same as
+OffseasonService.simulate_next_pick, which remains the interactive path.
+"""
+from typing import Dict, List, Tuple
+import heapq
+import logging
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.draft import DraftPick
+from app.models.player import Player
+from app.schemas.offseason import DraftPickSummary
+
+logger = logging.getLogger(__name__)
+
+# Target roster counts per position used to judge positional need
+TARGET_COUNTS = {
+    "QB": 3, "RB": 4, "WR": 6, "TE": 3, "OT": 4, "OG": 4, "C": 2,
+    "DE": 4, "DT": 4, "LB": 6, "CB": 6, "S": 4, "K": 1, "P": 1
+}
+DEFAULT_TARGET = 5
+
+# Number of top prospects checked for a positional need before taking the best available
+NEED_WINDOW = 11
+
+BoardEntry = Tuple[int, int, Player]  # (-overall_rating, player_id, player)
+
+
+def prospect_key(player: Player) -> Tuple[int, int]:
+    """Big board order: highest overall first, ties broken by player ID."""
+    return (-(player.overall_rating or 0), player.id)
+
+
+def pick_summary(pick: DraftPick, player: Player) -> DraftPickSummary:
+    return DraftPickSummary(
+        round=pick.round,
+        pick_number=pick.pick_number,
+        team_id=pick.team_id,
+        player_name=f"{player.first_name} {player.last_name}",
+        player_position=player.position,
+        player_overall=player.overall_rating
+    )
+
+
+class DraftEngine:
+    """Runs every remaining pick of a season's draft in one transaction."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def run(self, season_id: int) -> List[DraftPickSummary]:
+        start = time.perf_counter()
+
+        picks = self._load_open_picks(season_id)
+        board = self._load_board()
+        position_counts = self._load_position_counts()
+        load_ms = (time.perf_counter() - start) * 1000
+
+        summary = []
+        for pick in picks:
+            if not board:
+                break
+
+            counts = position_counts.setdefault(pick.team_id, {})
+            player = self._select(board, counts)
+
+            pick.player_id = player.id
+            player.team_id = pick.team_id
+            player.contract_years = 4
+            player.is_rookie = False
+            counts[player.position] = counts.get(player.position, 0) + 1
+
+            summary.append(pick_summary(pick, player))
+
+        self.db.commit()
+
+        logger.info(
+            "Draft simulated",
+            extra={
+                "season_id": season_id,
+                "picks": len(summary),
+                "load_ms": round(load_ms, 3),
+                "total_ms": round((time.perf_counter() - start) * 1000, 3),
+            },
+        )
+        return summary
+
+    def _load_open_picks(self, season_id: int) -> List[DraftPick]:
+        stmt = select(DraftPick).where(
+            DraftPick.season_id == season_id,
+            DraftPick.player_id == None
+        ).order_by(DraftPick.pick_number)
+        return list(self.db.execute(stmt).scalars().all())
+
+    def _load_board(self) -> List[BoardEntry]:
+        stmt = select(Player).where(
+            Player.is_rookie == True,
+            Player.team_id == None
+        )
+        board = [(*prospect_key(p), p) for p in self.db.execute(stmt).scalars().all()]
+        heapq.heapify(board)
+        return board
+
+    def _load_position_counts(self) -> Dict[int, Dict[str, int]]:
+        """Roster size by position for every team, in one grouped query."""
+        stmt = (
+            select(Player.team_id, Player.position, func.count())
+            .where(Player.team_id != None)
+            .group_by(Player.team_id, Player.position)
+        )
+        counts: Dict[int, Dict[str, int]] = {}
+        for team_id, position, count in self.db.execute(stmt).all():
+            counts.setdefault(team_id, {})[position] = count
+        return counts
+
+    @staticmethod
+    def _select(board: List[BoardEntry], counts: Dict[str, int]) -> Player:
+        """
+        Take the first of the top NEED_WINDOW prospects at a position of need,
+        otherwise the best player available. Unchosen prospects go back on the board.
+        """
+        window = [heapq.heappop(board) for _ in range(min(NEED_WINDOW, len(board)))]
+
+        chosen = 0
+        for i, (_, _, prospect) in enumerate(window):
+            if counts.get(prospect.position, 0) < TARGET_COUNTS.get(prospect.position, DEFAULT_TARGET):
+                chosen = i
+                break
+
+        for i, entry in enumerate(window):
+            if i != chosen:
+                heapq.heappush(board, entry)
+        return window[chosen][2]
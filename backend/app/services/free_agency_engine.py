@@ -0,0 +1,169 @@
+"""
+Free agency matching market.
+
+Loads every free agent, team cap space and roster count up front, then runs a
+single auction in memory: free agents come off a heap in rating order and each
+signs with the team making the strongest bid (cap space per open roster slot)
+that can afford him. All signings are committed together.
+"""
+from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, List, Tuple
+import heapq
+import logging
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.random_utils import DeterministicRNG
+from app.models.player import Player
+from app.models.team import Team
+
+logger = logging.getLogger(__name__)
+
+ROSTER_LIMIT = 53
+
+# Minimum contracts fit under any cap, so rosters can always be filled
+LEAGUE_MINIMUM_SALARY = 1_000_000
+
+TeamBid = Tuple[float, float, int]  # (-cap per open slot, -tiebreak, team_id)
+
+
+@dataclass
+class FreeAgencyReport:
+    """Outcome of one free agency run, with timings per phase."""
+    signings: int = 0
+    free_agents: int = 0
+    teams_filled: int = 0
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"message": "Free Agency simulated.", **asdict(self)}
+
+
+@dataclass
+class _TeamState:
+    team: Team
+    open_slots: int
+    cap_space: float
+    tiebreak: float
+
+    def bid(self) -> TeamBid:
+        return (-(self.cap_space / self.open_slots), -self.tiebreak, self.team.id)
+
+
+class FreeAgencyEngine:
+    """
+    Matches free agents to teams in one pass.
+
+    Results depend only on the data and the RNG seed, which breaks ties
+    between teams bidding the same cap space per slot.
+    """
+
+    def __init__(self, db: Session, rng: DeterministicRNG):
+        self.db = db
+        self.rng = rng
+
+    def run(self, season_id: int) -> FreeAgencyReport:
+        report = FreeAgencyReport()
+
+        start = time.perf_counter()
+        teams = list(self.db.execute(select(Team).order_by(Team.id)).scalars().all())
+        roster_counts = self._load_roster_counts()
+        free_agents = self._load_free_agents()
+        report.free_agents = len(free_agents)
+        report.timings_ms["load"] = self._elapsed_ms(start)
+
+        start = time.perf_counter()
+        signings = self._match(teams, roster_counts, free_agents)
+        report.signings = len(signings)
+        report.timings_ms["match"] = self._elapsed_ms(start)
+
+        start = time.perf_counter()
+        for player, state in signings:
+            player.team_id = state.team.id
+            player.contract_years = 1
+        for state in {id(s): s for _, s in signings}.values():
+            state.team.salary_cap_space = state.cap_space
+        self.db.commit()
+        report.timings_ms["commit"] = self._elapsed_ms(start)
+
+        filled = {state.team.id for _, state in signings if state.open_slots == 0}
+        report.teams_filled = len(filled)
+
+        logger.info("Free agency simulated", extra={"season_id": season_id, **asdict(report)})
+        return report
+
+    def _load_roster_counts(self) -> Dict[int, int]:
+        stmt = (
+            select(Player.team_id, func.count())
+            .where(Player.team_id != None)
+            .group_by(Player.team_id)
+        )
+        return dict(self.db.execute(stmt).all())
+
+    def _load_free_agents(self) -> List[Player]:
+        stmt = select(Player).where(
+            Player.team_id == None,
+            Player.is_retired.isnot(True)
+        )
+        return list(self.db.execute(stmt).scalars().all())
+
+    def _match(
+        self,
+        teams: List[Team],
+        roster_counts: Dict[int, int],
+        free_agents: List[Player]
+    ) -> List[Tuple[Player, _TeamState]]:
+        """
+        Assign free agents best-first to the highest bidder that can afford them.
+
+        O(n log n) in free agents: one heap pop per player plus a bounded number
+        of team-heap operations.
+        """
+        bidders: List[Tuple[TeamBid, _TeamState]] = []
+        for team in teams:
+            # Draw for every team, bidding or not, so one team's roster does not shift the others' tiebreaks
+            tiebreak = self.rng.random()
+            open_slots = ROSTER_LIMIT - roster_counts.get(team.id, 0)
+            if open_slots > 0:
+                state = _TeamState(team, open_slots, float(team.salary_cap_space or 0.0), tiebreak)
+                bidders.append((state.bid(), state))
+        heapq.heapify(bidders)
+
+        market = [(-(p.overall_rating or 0), p.id, p) for p in free_agents]
+        heapq.heapify(market)
+
+        signings = []
+        while market and bidders:
+            _, _, player = heapq.heappop(market)
+            salary = player.contract_salary or LEAGUE_MINIMUM_SALARY
+
+            # Highest bidders first; set aside teams that cannot afford this player
+            passed = []
+            winner = None
+            while bidders:
+                entry = heapq.heappop(bidders)
+                state = entry[1]
+                if salary <= LEAGUE_MINIMUM_SALARY or salary <= state.cap_space:
+                    winner = state
+                    break
+                passed.append(entry)
+
+            for entry in passed:
+                heapq.heappush(bidders, entry)
+            if winner is None:
+                continue
+
+            winner.open_slots -= 1
+            # Minimum contracts sign even over the cap, which bottoms out at zero
+            winner.cap_space = max(winner.cap_space - salary, 0.0)
+            signings.append((player, winner))
+            if winner.open_slots > 0:
+                heapq.heappush(bidders, (winner.bid(), winner))
+
+        return signings
+
+    @staticmethod
+    def _elapsed_ms(start: float) -> float:
+        return round((time.perf_counter() - start) * 1000, 3)
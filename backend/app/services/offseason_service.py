@@ -7,6 +7,8 @@ from app.models.draft import DraftPick
 from app.models.playoff import PlayoffMatchup, PlayoffRound
 from app.services.standings_calculator import StandingsCalculator
 from app.services.rookie_generator import RookieGenerator
+from app.services.free_agency_engine import FreeAgencyEngine
+from app.services.draft_engine import DraftEngine, NEED_WINDOW, DEFAULT_TARGET, TARGET_COUNTS, pick_summary
 import random
 from typing import List, Optional
 from app.schemas.offseason import TeamNeed, Prospect, DraftPickSummary, PlayerProgressionResult
@@ -19,7 +21,8 @@ class OffseasonService:
     def __init__(self, db: Session, seed: int = None):
         self.db = db
         self.standings_calculator = StandingsCalculator(db)
-        self.rng = DeterministicRNG(seed if seed is not None else random.randint(0, 1000000))
+        self.seed = seed if seed is not None else random.randint(0, 1000000)
+        self.rng = DeterministicRNG(self.seed)
         self.rookie_generator = RookieGenerator(db, seed=self.rng.randint(0, 1000000))
 
     async def start_offseason(self, season_id: int) -> dict:
@@ -228,10 +231,6 @@ class OffseasonService:
     def get_team_needs(self, team_id: int) -> List[TeamNeed]:
         """Get structured team needs analysis."""
         needs_dict = self._get_team_needs(team_id)
-        TARGET_COUNTS = {
-            "QB": 3, "RB": 4, "WR": 6, "TE": 3, "OT": 4, "OG": 4, "C": 2,
-            "DE": 4, "DT": 4, "LB": 6, "CB": 6, "S": 4, "K": 1, "P": 1
-        }
 
         result = []
         for pos, target in TARGET_COUNTS.items():
@@ -306,7 +305,12 @@ class OffseasonService:
         return pick
 
     def simulate_next_pick(self, season_id: int) -> Optional[DraftPickSummary]:
-        """Simulate the next single pick in the draft."""
+        """
+        Simulate the next single pick in the draft.
+
+        Queries and commits per pick, for interactive drafting; simulate_draft
+        runs the same selection rules in memory.
+        """
         pick = self.get_current_pick(season_id)
         if not pick:
             return None
@@ -316,7 +320,7 @@ class OffseasonService:
         stmt = select(Player).where(
             Player.is_rookie == True,
             Player.team_id == None
-        ).order_by(Player.overall_rating.desc()).limit(20)
+        ).order_by(Player.overall_rating.desc(), Player.id).limit(20)
         rookies = list(self.db.execute(stmt).scalars().all())
 
         if not rookies:
@@ -325,20 +329,15 @@ class OffseasonService:
         rookie_pool = list(rookies)
         team_needs = self._get_team_needs(pick.team_id)
 
-        TARGET_COUNTS = {
-            "QB": 3, "RB": 4, "WR": 6, "TE": 3, "OT": 4, "OG": 4, "C": 2,
-            "DE": 4, "DT": 4, "LB": 6, "CB": 6, "S": 4, "K": 1, "P": 1
-        }
-
         selected_player = None
 
         # 1. Look for high-value need
         for i, prospect in enumerate(rookie_pool):
-            if i > 10:
+            if i >= NEED_WINDOW:
                 break
 
             current_count = team_needs.get(prospect.position, 0)
-            target = TARGET_COUNTS.get(prospect.position, 5)
+            target = TARGET_COUNTS.get(prospect.position, DEFAULT_TARGET)
 
             if current_count < target:
                 selected_player = prospect
@@ -360,17 +359,19 @@ class OffseasonService:
 
         self.db.commit()
 
-        return DraftPickSummary(
-            round=pick.round,
-            pick_number=pick.pick_number,
-            team_id=pick.team_id,
-            player_name=f"{player.first_name} {player.last_name}",
-            player_position=player.position,
-            player_overall=player.overall_rating
-        )
+        return pick_summary(pick, player)
+
+    def simulate_draft(self, season_id: int, pick_by_pick: bool = False) -> List[DraftPickSummary]:
+        """
+        Simulate the remainder of the draft.
+
+        By default the whole draft runs in memory with a single commit
+        (DraftEngine). pick_by_pick=True repeats simulate_next_pick instead,
+        which selects the same players but queries and commits every pick.
+        """
+        if not pick_by_pick:
+            return DraftEngine(self.db).run(season_id)
 
-    def simulate_draft(self, season_id: int) -> List[DraftPickSummary]:
-        """Simulate the remainder of the draft."""
         summary = []
         while True:
             result = self.simulate_next_pick(season_id)
@@ -381,33 +382,14 @@ class OffseasonService:
         return summary
 
     def simulate_free_agency(self, season_id: int) -> dict:
-        """Fill rosters with free agents."""
-        stmt = select(Team)
-        teams = list(self.db.execute(stmt).scalars().all())
-
-        # Get available FAs
-        stmt_fa = select(Player).where(Player.team_id == None).order_by(Player.overall_rating.desc())
-        free_agents = list(self.db.execute(stmt_fa).scalars().all())
-        fa_pool = list(free_agents)
-
-        for team in teams:
-            # Check roster size
-            stmt_count = select(func.count()).select_from(Player).where(Player.team_id == team.id)
-            roster_count = self.db.execute(stmt_count).scalar() or 0
-            needed = 53 - roster_count
-
-            if needed > 0:
-                # Sign top available players
-                # Real logic would check positions
-                for _ in range(needed):
-                    if not fa_pool:
-                        break
-                    player = fa_pool.pop(0)
-                    player.team_id = team.id
-                    player.contract_years = 1
-
-        self.db.commit()
-        return {"message": "Free Agency simulated."}
+        """
+        Fill rosters with free agents.
+
+        Runs the FreeAgencyEngine market; results are fixed by the service
+        seed and season, independent of any other RNG use.
+        """
+        rng = DeterministicRNG(f"free_agency:{season_id}:{self.seed}")
+        return FreeAgencyEngine(self.db, rng).run(season_id).to_dict()
 
     def process_retirements(self, season_id: int) -> List[str]:
         """Process player retirements based on age and rating."""
@@ -0,0 +1,41 @@
+"""
+Read side of the append-only play log.
+
+Plays are stored one row per play in ``play_events``; the JSON play-by-play
+view is only assembled here, when someone actually asks for it.
+"""
+from typing import Any, Dict, List
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from app.models.game import Game
+from app.models.play_event import PlayEvent
+
+
+class PlayLogService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_plays(self, game: Game) -> List[Dict[str, Any]]:
+        """
+        Build the play-by-play list for a game.
+
+        Falls back to the legacy ``game_data["plays"]`` blob for games that were
+        simulated before the play log existed.
+        """
+        stmt = (
+            select(PlayEvent.data)
+            .where(PlayEvent.game_id == game.id)
+            .order_by(PlayEvent.sequence)
+        )
+        plays = list(self.db.execute(stmt).scalars().all())
+        if plays:
+            return plays
+        return (game.game_data or {}).get("plays", [])
+
+    def get_game_data(self, game: Game) -> Dict[str, Any]:
+        """Return ``game.game_data`` with the play list materialized from the log."""
+        data = dict(game.game_data or {})
+        plays = self.get_plays(game)
+        if plays:
+            data["plays"] = plays
+        return data
@@ -3,11 +3,14 @@ from sqlalchemy import select
 from app.models.season import Season, SeasonStatus
 from app.models.team import Team
 from app.models.playoff import PlayoffMatchup, PlayoffRound, PlayoffConference
-from app.services.standings_calculator import StandingsCalculator
-from typing import List, Dict
+from app.services.standings_calculator import GameOutcome, StandingsCalculator, TeamStanding
+from app.schemas.playoff import ProjectedSeed, WhatIfSeeding
+from typing import Any, List, Dict
 from app.models.game import Game
 import datetime
 
+CONFERENCES = ("AFC", "NFC")
+
 class PlayoffService:
     """
     Service for managing the NFL playoff lifecycle.
@@ -54,13 +57,12 @@ class PlayoffService:
             # Let's raise error as per plan.
             raise ValueError("Playoffs already generated for this season")
 
-        # 1. Calculate Seeds
-        afc_seeds = self._calculate_conference_seeds(season_id, "AFC")
-        nfc_seeds = self._calculate_conference_seeds(season_id, "NFC")
+        # 1. Calculate Seeds (one standings snapshot for both conferences)
+        seeds = self._calculate_seeds(season_id)
 
         # 2. Create Wild Card Matchups (Week 19)
-        self._create_wild_card_round(season_id, "AFC", afc_seeds)
-        self._create_wild_card_round(season_id, "NFC", nfc_seeds)
+        self._create_wild_card_round(season_id, "AFC", seeds["AFC"])
+        self._create_wild_card_round(season_id, "NFC", seeds["NFC"])
 
         # 3. Update Season Status
         season.status = SeasonStatus.POST_SEASON
@@ -69,9 +71,35 @@ class PlayoffService:
 
         return self.get_bracket(season_id)
 
-    def _calculate_conference_seeds(self, season_id: int, conference: str) -> List[Team]:
+    def _calculate_seeds(self, season_id: int) -> Dict[str, List[Team]]:
+        """
+        Calculate playoff seeds for both conferences.
+
+        Standings are read once and every seeded team is loaded in a single
+        query.
+
+        Args:
+            season_id: The season ID.
+
+        Returns:
+            Dict[str, List[Team]]: Conference -> ordered list of 7 teams, where index 0 is Seed 1.
         """
-        Calculate playoff seeds for a conference based on NFL rules.
+        standings = self.standings_calculator.get_standings(season_id)
+        seeded = {conference: self._seed_conference(standings, conference) for conference in CONFERENCES}
+
+        team_ids = [stat.team_id for stats in seeded.values() for stat in stats]
+        teams = self.db.execute(select(Team).where(Team.id.in_(team_ids))).scalars().all()
+        teams_by_id = {team.id: team for team in teams}
+
+        return {
+            conference: [teams_by_id.get(stat.team_id) for stat in stats]
+            for conference, stats in seeded.items()
+        }
+
+    @staticmethod
+    def _seed_conference(standings: List[TeamStanding], conference: str) -> List[TeamStanding]:
+        """
+        Order a conference's playoff teams based on NFL rules.
 
         Seeding Rules:
         1. The 4 division winners are seeded 1-4 based on record.
@@ -79,14 +107,12 @@ class PlayoffService:
         3. Tiebreakers used: Win Percentage, Total Wins, Point Differential.
 
         Args:
-            season_id: The season ID.
+            standings: League standings.
             conference: "AFC" or "NFC".
 
         Returns:
-            List[Team]: Ordered list of 7 teams, where index 0 is Seed 1.
+            List[TeamStanding]: Division winners followed by up to 3 wild cards.
         """
-        # Get all standings for conference
-        standings = self.standings_calculator.calculate_standings(season_id)
         conf_teams = [s for s in standings if s.conference == conference]
 
         # Group by Division to find winners
@@ -114,16 +140,76 @@ class PlayoffService:
         wild_card_candidates.sort(key=lambda x: (x.win_percentage, x.wins, x.point_differential), reverse=True)
         top_wild_cards = wild_card_candidates[:3]
 
-        # Combine
-        ordered_stats = div_winners + top_wild_cards
+        return div_winners + top_wild_cards
+
+    def what_if_seeding(self, season_id: int, scenarios: List[List[Dict[str, Any]]]) -> List[WhatIfSeeding]:
+        """
+        Dry-run playoff seeding for hypothetical results of remaining games.
+
+        Current standings are snapshotted once and every scenario is projected
+        from that snapshot in memory; nothing is written to the database.
+
+        Args:
+            season_id: Season ID.
+            scenarios: Each scenario is a list of {"game_id", "home_score", "away_score"}
+                for unplayed regular season games. Games left out stay unplayed.
+
+        Returns:
+            List[WhatIfSeeding]: Projected seeds per conference, one entry per scenario.
 
-        # Fetch Team objects
-        ordered_teams = []
-        for stat in ordered_stats:
-            team = self.db.execute(select(Team).where(Team.id == stat.team_id)).scalar_one_or_none()
-            ordered_teams.append(team)
+        Raises:
+            ValueError: If season not found, or an outcome names a game that is not
+                a remaining regular season game of this season.
+        """
+        season = self.db.execute(select(Season).where(Season.id == season_id)).scalar_one_or_none()
+        if not season:
+            raise ValueError("Season not found")
 
-        return ordered_teams
+        stmt = select(Game).where(
+            Game.season_id == season_id,
+            Game.is_played == False,
+            Game.is_playoff.isnot(True)
+        )
+        remaining = {game.id: game for game in self.db.execute(stmt).scalars().all()}
+        snapshot = self.standings_calculator.standings_snapshot(season_id)
+
+        projections = []
+        for outcomes in scenarios:
+            games = []
+            seen = set()
+            for outcome in outcomes:
+                game = remaining.get(outcome["game_id"])
+                if not game or outcome["game_id"] in seen:
+                    raise ValueError(f"Game {outcome['game_id']} is not a remaining regular season game")
+                seen.add(game.id)
+                games.append(GameOutcome(game.home_team_id, game.away_team_id, outcome["home_score"], outcome["away_score"]))
+
+            standings = self.standings_calculator.project_standings(snapshot, games)
+            projections.append(WhatIfSeeding(seeds={
+                conference: self._projected_seeds(standings, conference)
+                for conference in CONFERENCES
+            }))
+
+        return projections
+
+    def _projected_seeds(self, standings: List[TeamStanding], conference: str) -> List[ProjectedSeed]:
+        """Seed a conference from projected standings."""
+        num_divisions = len({s.division for s in standings if s.conference == conference})
+        return [
+            ProjectedSeed(
+                seed=seed,
+                team_id=stat.team_id,
+                team_name=stat.team_name,
+                team_abbreviation=stat.team_abbreviation,
+                division=stat.division,
+                wins=stat.wins,
+                losses=stat.losses,
+                ties=stat.ties,
+                win_percentage=stat.win_percentage,
+                division_winner=seed <= num_divisions
+            )
+            for seed, stat in enumerate(self._seed_conference(standings, conference), 1)
+        ]
 
     def _create_wild_card_round(self, season_id: int, conference: str, seeds: List[Team]):
         """
@@ -1,9 +1,44 @@
 from typing import List, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, select
+from sqlalchemy import and_, delete, func, or_, select
 from app.models.team import Team
 from app.models.game import Game
+from app.models.standings import TeamSeasonStanding
 from pydantic import BaseModel, ConfigDict
+from collections import namedtuple
+import copy
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Counters stored on TeamSeasonStanding and updated incrementally
+RECORD_FIELDS = (
+    'wins', 'losses', 'ties', 'points_for', 'points_against',
+    'division_wins', 'division_losses', 'division_ties',
+    'conference_wins', 'conference_losses', 'conference_ties',
+)
+
+# A played (or hypothetical) result; anything with these attributes works, including Game
+GameOutcome = namedtuple("GameOutcome", ["home_team_id", "away_team_id", "home_score", "away_score"])
+
+# Keys of the per-team working stats dict (see _new_team_stats)
+WORKING_FIELDS = (
+    'team_id', 'team_name', 'team_abbreviation', 'conference', 'division',
+) + RECORD_FIELDS
+
+# Derived columns recomputed on every update, with their TeamStanding defaults
+DERIVED_DEFAULTS = {
+    'win_percentage': 0.0,
+    'point_differential': 0,
+    'strength_of_schedule': 0.0,
+    'division_rank': None,
+    'conference_rank': None,
+    'seed': None,
+    'clinched_playoff': False,
+    'clinched_division': False,
+    'clinched_seed': None,
+    'tiebreaker_reason': None,
+}
 
 
 class TeamStanding(BaseModel):
@@ -50,7 +85,11 @@ class StandingsCalculator:
 
     def calculate_standings(self, season_id: int) -> List[TeamStanding]:
         """
-        Calculate standings for all teams in a season.
+        Calculate standings for all teams in a season from scratch.
+
+        Scans every game in the season. Reads should normally go through
+        get_standings, which serves the materialized table; this path is the
+        source of truth used by rebuild_standings and verify_standings.
 
         Args:
             season_id: ID of the season
@@ -58,34 +97,140 @@ class StandingsCalculator:
         Returns:
             List of TeamStanding objects sorted by rank
         """
+        standings_with_ranks = self._calculate_from_games(season_id)
+        return [TeamStanding(**data) for data in standings_with_ranks]
+
+    def get_standings(
+        self,
+        season_id: int,
+        conference: Optional[str] = None,
+        division: Optional[str] = None
+    ) -> List[TeamStanding]:
+        """
+        Read standings from the materialized team_standings table.
+
+        A single indexed, read-only query, independent of how many games have
+        been played. Rows are built when the season is initialized (or by
+        app/scripts/rebuild_standings.py for older seasons); a season without
+        rows is calculated from its games instead, still without writing.
+        """
+        rows = self._query_standing_rows(season_id, conference, division)
+        if rows:
+            return [self._standing_from_row(row, team) for row, team in rows]
+        if (conference or division) and self._has_standing_rows(season_id):
+            return []
+
+        logger.warning("Standings not materialized, calculating from games", extra={"season_id": season_id})
+        return [
+            standing for standing in self.calculate_standings(season_id)
+            if (not conference or standing.conference == conference)
+            and (not division or standing.division == division)
+        ]
+
+    def rebuild_standings(self, season_id: int) -> List[TeamStanding]:
+        """Recreate the season's team_standings rows from its games."""
+        standings_with_ranks = self._calculate_from_games(season_id)
+
+        self.db.execute(delete(TeamSeasonStanding).where(TeamSeasonStanding.season_id == season_id))
+        self.db.add_all(
+            TeamSeasonStanding(season_id=season_id, team_id=data['team_id'], **self._row_values(data))
+            for data in standings_with_ranks
+        )
+        self.db.commit()
+
+        logger.info("Standings rebuilt", extra={"season_id": season_id, "teams": len(standings_with_ranks)})
+        return [TeamStanding(**data) for data in standings_with_ranks]
+
+    def apply_game_results(self, season_id: int, games: List[Game]) -> None:
+        """
+        Fold newly completed games into the materialized standings.
+
+        Call once per game, when it is first marked played. Record counters
+        are updated in place; ranks, seeds and strength of schedule are then
+        re-derived from the season's standings rows, without scanning games.
+        """
+        rows = self._query_standing_rows(season_id)
+        if not rows:
+            # Nothing materialized yet: a rebuild already includes these games
+            self.rebuild_standings(season_id)
+            return
+
+        team_stats = {team.id: self._stats_from_row(row, team) for row, team in rows}
+        for game in games:
+            if game.is_played:
+                self._add_unscheduled_opponents(season_id, team_stats, game)
+                self._apply_game(team_stats, game)
+
+        rows_by_team = {row.team_id: row for row, _ in rows}
+        for data in self._rank_team_stats(team_stats):
+            for key, value in self._row_values(data).items():
+                setattr(rows_by_team[data['team_id']], key, value)
+        self.db.commit()
+
+    def standings_snapshot(self, season_id: int) -> Dict[int, Dict]:
+        """
+        Read-only working stats for every team, keyed by team ID.
+
+        Served from team_standings when the season is materialized, otherwise
+        computed from the games. Nothing is written either way.
+        """
+        rows = self._query_standing_rows(season_id)
+        if rows:
+            return {team.id: self._stats_from_row(row, team) for row, team in rows}
+
+        snapshot = {}
+        for data in self._calculate_from_games(season_id):
+            stats = {key: data[key] for key in WORKING_FIELDS}
+            stats['opponents'] = list(data['opponents'])
+            stats['head_to_head'] = dict(data['head_to_head'])
+            snapshot[data['team_id']] = stats
+        return snapshot
+
+    def project_standings(self, snapshot: Dict[int, Dict], games: List[GameOutcome]) -> List[TeamStanding]:
+        """
+        Standings after adding hypothetical results to a snapshot.
+
+        The snapshot is left untouched, so it can be reused across scenarios.
+        """
+        team_stats = copy.deepcopy(snapshot)
+        for game in games:
+            self._apply_game(team_stats, game)
+        return [TeamStanding(**data) for data in self._rank_team_stats(team_stats)]
+
+    def verify_standings(self, season_id: int) -> List[str]:
+        """
+        Compare the materialized standings with a full recalculation.
+
+        Returns:
+            Human-readable mismatches (empty when the table is correct)
+        """
+        expected = {s.team_id: s.model_dump() for s in self.calculate_standings(season_id)}
+        actual = {
+            team.id: self._standing_from_row(row, team).model_dump()
+            for row, team in self._query_standing_rows(season_id)
+        }
+
+        mismatches = []
+        for team_id in sorted(set(expected) | set(actual)):
+            if team_id not in actual:
+                mismatches.append(f"team {team_id}: missing from team_standings")
+                continue
+            if team_id not in expected:
+                mismatches.append(f"team {team_id}: unexpected row in team_standings")
+                continue
+            for key, value in expected[team_id].items():
+                if actual[team_id][key] != value:
+                    mismatches.append(f"team {team_id}: {key} is {actual[team_id][key]!r}, expected {value!r}")
+        return mismatches
+
+    def _calculate_from_games(self, season_id: int) -> List[Dict]:
+        """Aggregate every game in the season and rank the result."""
         # Fetch all teams and games for the season
-        teams = self.db.execute(select(Team)).scalars().all()
+        teams = self.db.execute(select(Team).order_by(Team.id)).scalars().all()
         games = self.db.execute(select(Game).where(Game.season_id == season_id)).scalars().all()
 
         # Initialize team stats
-        team_stats = {
-            team.id: {
-                'team_id': team.id,
-                'team_name': f"{team.city} {team.name}",
-                'team_abbreviation': team.abbreviation,
-                'conference': team.conference,
-                'division': team.division,
-                'wins': 0,
-                'losses': 0,
-                'ties': 0,
-                'points_for': 0,
-                'points_against': 0,
-                'opponents': [],
-                'division_wins': 0,
-                'division_losses': 0,
-                'division_ties': 0,
-                'conference_wins': 0,
-                'conference_losses': 0,
-                'conference_ties': 0,
-                'head_to_head': {} # Map of opponent_id -> wins against them
-            }
-            for team in teams
-        }
+        team_stats = {team.id: self._new_team_stats(team) for team in teams}
 
         # Process games
         for game in games:
@@ -101,60 +246,121 @@ class StandingsCalculator:
             if not game.is_played:
                 continue
 
-            # Update stats for played games
-            if home_id in team_stats and away_id in team_stats:
-                home_team = team_stats[home_id]
-                away_team = team_stats[away_id]
-
-                home_team['points_for'] += game.home_score
-                home_team['points_against'] += game.away_score
-                away_team['points_for'] += game.away_score
-                away_team['points_against'] += game.home_score
-
-                # Determine winner
-                winner_id = None
-                if game.home_score > game.away_score:
-                    home_team['wins'] += 1
-                    away_team['losses'] += 1
-                    winner_id = home_id
-                elif game.home_score < game.away_score:
-                    home_team['losses'] += 1
-                    away_team['wins'] += 1
-                    winner_id = away_id
+            self._apply_game(team_stats, game)
+
+        return self._rank_team_stats(team_stats)
+
+    @staticmethod
+    def _new_team_stats(team: Team) -> Dict:
+        return {
+            'team_id': team.id,
+            'team_name': f"{team.city} {team.name}",
+            'team_abbreviation': team.abbreviation,
+            'conference': team.conference,
+            'division': team.division,
+            'wins': 0,
+            'losses': 0,
+            'ties': 0,
+            'points_for': 0,
+            'points_against': 0,
+            'opponents': [],
+            'division_wins': 0,
+            'division_losses': 0,
+            'division_ties': 0,
+            'conference_wins': 0,
+            'conference_losses': 0,
+            'conference_ties': 0,
+            'head_to_head': {} # Map of opponent_id -> wins against them
+        }
+
+    def _add_unscheduled_opponents(self, season_id: int, team_stats: Dict[int, Dict], game: Game) -> None:
+        """
+        Record the opponent of a game scheduled after the rows were built
+        (a playoff game, say), as _calculate_from_games would.
+
+        The row only lists opponent IDs, so a game counts as already
+        scheduled while the opponent appears there as often as the two teams
+        meet in the season.
+        """
+        home_id, away_id = game.home_team_id, game.away_team_id
+        meetings = self.db.execute(
+            select(func.count()).select_from(Game).where(
+                Game.season_id == season_id,
+                or_(
+                    and_(Game.home_team_id == home_id, Game.away_team_id == away_id),
+                    and_(Game.home_team_id == away_id, Game.away_team_id == home_id),
+                )
+            )
+        ).scalar_one()
+
+        for team_id, opponent_id in ((home_id, away_id), (away_id, home_id)):
+            if team_id in team_stats:
+                opponents = team_stats[team_id]['opponents']
+                if opponents.count(opponent_id) < meetings:
+                    opponents.append(opponent_id)
+
+    @staticmethod
+    def _apply_game(team_stats: Dict[int, Dict], game: "Game | GameOutcome") -> None:
+        """Add one played game to both teams' record counters."""
+        home_id = game.home_team_id
+        away_id = game.away_team_id
+
+        # Update stats for played games
+        if home_id in team_stats and away_id in team_stats:
+            home_team = team_stats[home_id]
+            away_team = team_stats[away_id]
+
+            home_team['points_for'] += game.home_score
+            home_team['points_against'] += game.away_score
+            away_team['points_for'] += game.away_score
+            away_team['points_against'] += game.home_score
+
+            # Determine winner
+            winner_id = None
+            if game.home_score > game.away_score:
+                home_team['wins'] += 1
+                away_team['losses'] += 1
+                winner_id = home_id
+            elif game.home_score < game.away_score:
+                home_team['losses'] += 1
+                away_team['wins'] += 1
+                winner_id = away_id
+            else:
+                home_team['ties'] += 1
+                away_team['ties'] += 1
+
+            # Update Head-to-Head
+            if winner_id == home_id:
+                home_team['head_to_head'][away_id] = home_team['head_to_head'].get(away_id, 0) + 1
+            elif winner_id == away_id:
+                away_team['head_to_head'][home_id] = away_team['head_to_head'].get(home_id, 0) + 1
+
+            # Update Division Record
+            if home_team['conference'] == away_team['conference'] and home_team['division'] == away_team['division']:
+                if winner_id == home_id:
+                    home_team['division_wins'] += 1
+                    away_team['division_losses'] += 1
+                elif winner_id == away_id:
+                    home_team['division_losses'] += 1
+                    away_team['division_wins'] += 1
                 else:
-                    home_team['ties'] += 1
-                    away_team['ties'] += 1
+                    home_team['division_ties'] += 1
+                    away_team['division_ties'] += 1
 
-                # Update Head-to-Head
+            # Update Conference Record
+            if home_team['conference'] == away_team['conference']:
                 if winner_id == home_id:
-                    home_team['head_to_head'][away_id] = home_team['head_to_head'].get(away_id, 0) + 1
+                    home_team['conference_wins'] += 1
+                    away_team['conference_losses'] += 1
                 elif winner_id == away_id:
-                    away_team['head_to_head'][home_id] = away_team['head_to_head'].get(home_id, 0) + 1
-
-                # Update Division Record
-                if home_team['conference'] == away_team['conference'] and home_team['division'] == away_team['division']:
-                    if winner_id == home_id:
-                        home_team['division_wins'] += 1
-                        away_team['division_losses'] += 1
-                    elif winner_id == away_id:
-                        home_team['division_losses'] += 1
-                        away_team['division_wins'] += 1
-                    else:
-                        home_team['division_ties'] += 1
-                        away_team['division_ties'] += 1
-
-                # Update Conference Record
-                if home_team['conference'] == away_team['conference']:
-                    if winner_id == home_id:
-                        home_team['conference_wins'] += 1
-                        away_team['conference_losses'] += 1
-                    elif winner_id == away_id:
-                        home_team['conference_losses'] += 1
-                        away_team['conference_wins'] += 1
-                    else:
-                        home_team['conference_ties'] += 1
-                        away_team['conference_ties'] += 1
+                    home_team['conference_losses'] += 1
+                    away_team['conference_wins'] += 1
+                else:
+                    home_team['conference_ties'] += 1
+                    away_team['conference_ties'] += 1
 
+    def _rank_team_stats(self, team_stats: Dict[int, Dict]) -> List[Dict]:
+        """Derive percentages, SOS, ranks and clinch flags from record counters."""
         # Calculate derived stats (Win %, Diff, SOS)
         for stats in team_stats.values():
             total_games = stats['wins'] + stats['losses'] + stats['ties']
@@ -210,12 +416,73 @@ class StandingsCalculator:
                      # Simplified: if rank 1 late in season, assume close to clinching seed
                      pass
 
-        # Convert to TeamStanding objects
-        standings = [
-            TeamStanding(**data) for data in standings_with_ranks
-        ]
-
-        return standings
+        return standings_with_ranks
+
+    def _query_standing_rows(
+        self,
+        season_id: int,
+        conference: Optional[str] = None,
+        division: Optional[str] = None
+    ) -> List[Tuple[TeamSeasonStanding, Team]]:
+        stmt = (
+            select(TeamSeasonStanding, Team)
+            .join(Team, Team.id == TeamSeasonStanding.team_id)
+            .where(TeamSeasonStanding.season_id == season_id)
+            .order_by(TeamSeasonStanding.team_id)
+        )
+        if conference:
+            stmt = stmt.where(Team.conference == conference)
+        if division:
+            stmt = stmt.where(Team.division == division)
+        return self.db.execute(stmt).all()
+
+    def _has_standing_rows(self, season_id: int) -> bool:
+        stmt = select(TeamSeasonStanding.id).where(TeamSeasonStanding.season_id == season_id).limit(1)
+        return self.db.execute(stmt).first() is not None
+
+    def _stats_from_row(self, row: TeamSeasonStanding, team: Team) -> Dict:
+        """Rebuild the working stats dict for a team from its standings row."""
+        stats = self._new_team_stats(team)
+        for key in RECORD_FIELDS:
+            stats[key] = getattr(row, key) or 0
+        stats['opponents'] = list(row.opponents or [])
+        # JSON object keys come back as strings
+        stats['head_to_head'] = {int(k): v for k, v in (row.head_to_head or {}).items()}
+        return stats
+
+    @staticmethod
+    def _row_values(data: Dict) -> Dict:
+        """Column values for a TeamSeasonStanding row from a ranked stats dict."""
+        values = {key: data[key] for key in RECORD_FIELDS}
+        values.update({key: data.get(key, DERIVED_DEFAULTS[key]) for key in DERIVED_DEFAULTS})
+        values['opponents'] = list(data['opponents'])
+        values['head_to_head'] = {str(k): v for k, v in data['head_to_head'].items()}
+        return values
+
+    @staticmethod
+    def _standing_from_row(row: TeamSeasonStanding, team: Team) -> TeamStanding:
+        return TeamStanding(
+            team_id=team.id,
+            team_name=f"{team.city} {team.name}",
+            team_abbreviation=team.abbreviation,
+            conference=team.conference,
+            division=team.division,
+            wins=row.wins,
+            losses=row.losses,
+            ties=row.ties,
+            win_percentage=row.win_percentage,
+            points_for=row.points_for,
+            points_against=row.points_against,
+            point_differential=row.point_differential,
+            division_rank=row.division_rank,
+            conference_rank=row.conference_rank,
+            seed=row.seed,
+            strength_of_schedule=row.strength_of_schedule,
+            clinched_playoff=row.clinched_playoff,
+            clinched_division=row.clinched_division,
+            clinched_seed=row.clinched_seed,
+            tiebreaker_reason=row.tiebreaker_reason,
+        )
 
     def _assign_ranks(self, standings_data: List[Dict]) -> List[Dict]:
         """Assign conference and division ranks with tiebreaker info."""
@@ -331,16 +598,8 @@ class StandingsCalculator:
 
     def get_division_standings(self, season_id: int, conference: str, division: str) -> List[TeamStanding]:
         """Get standings for a specific division."""
-        all_standings = self.calculate_standings(season_id)
-        return [
-            s for s in all_standings
-            if s.conference == conference and s.division == division
-        ]
+        return self.get_standings(season_id, conference=conference, division=division)
 
     def get_conference_standings(self, season_id: int, conference: str) -> List[TeamStanding]:
         """Get standings for a specific conference."""
-        all_standings = self.calculate_standings(season_id)
-        return [
-            s for s in all_standings
-            if s.conference == conference
-        ]
+        return self.get_standings(season_id, conference=conference)
@@ -0,0 +1,149 @@
+"""
+Bulk writer for per-game player box scores.
+
+Aggregated stats for one game (or every game in a week) are buffered in memory
+and persisted with a single set-based ``INSERT ... ON CONFLICT DO UPDATE``,
+instead of one SELECT plus one INSERT/UPDATE per player.
+"""
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional
+import logging
+import time
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.player import Player
+from app.models.stats import PlayerGameStats
+
+logger = logging.getLogger(__name__)
+
+# Keep well under SQLite's bound-parameter limit (32766 on modern builds)
+MAX_PARAMS_PER_STATEMENT = 30000
+
+UPSERT_DIALECTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+@dataclass
+class StatsWriteReport:
+    """What a flush wrote and how long it took."""
+    rows_written: int = 0
+    games: int = 0
+    statements: int = 0
+    elapsed_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class BulkStatsWriter:
+    """
+    Buffers PlayerGameStats rows and upserts them in one statement.
+
+    Re-writing a (player, game) pair adds to the stored totals, matching the
+    behaviour of the old row-by-row path.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._rows: List[Dict[str, Any]] = []
+        self._game_ids = set()
+        self._missing_team: List[Dict[str, Any]] = []
+
+    @property
+    def pending_rows(self) -> int:
+        return len(self._rows) + len(self._missing_team)
+
+    def add_game(
+        self,
+        game_id: int,
+        season_id: Optional[int],
+        stats_by_player: Dict[int, Dict[str, int]],
+        player_team_map: Dict[int, int]
+    ) -> int:
+        """
+        Queue one game's aggregated stats.
+
+        Players missing from ``player_team_map`` are resolved with a single
+        query at flush time.
+
+        Returns:
+            Number of rows queued
+        """
+        for pid, stats in stats_by_player.items():
+            row = {
+                "player_id": pid,
+                "game_id": game_id,
+                "team_id": player_team_map.get(pid),
+                "season_id": season_id,
+                **stats
+            }
+            if row["team_id"]:
+                self._rows.append(row)
+            else:
+                self._missing_team.append(row)
+
+        self._game_ids.add(game_id)
+        return len(stats_by_player)
+
+    async def flush(self) -> StatsWriteReport:
+        """
+        Upsert every queued row. The caller owns the transaction and commits.
+        """
+        start = time.perf_counter()
+        report = StatsWriteReport(games=len(self._game_ids))
+
+        rows = self._rows + await self._resolve_missing_teams()
+        self._rows, self._missing_team, self._game_ids = [], [], set()
+
+        if rows:
+            report.statements = await self._upsert(rows)
+            report.rows_written = len(rows)
+
+        report.elapsed_ms = round((time.perf_counter() - start) * 1000, 3)
+        logger.info("Player stats written", extra=report.to_dict())
+        return report
+
+    async def _resolve_missing_teams(self) -> List[Dict[str, Any]]:
+        """Look up team IDs for players that were not in the match context."""
+        if not self._missing_team:
+            return []
+
+        player_ids = {row["player_id"] for row in self._missing_team}
+        result = await self.db.execute(
+            select(Player.id, Player.team_id).where(Player.id.in_(player_ids))
+        )
+        team_by_player = dict(result.all())
+
+        resolved = []
+        for row in self._missing_team:
+            team_id = team_by_player.get(row["player_id"])
+            if team_id:
+                resolved.append({**row, "team_id": team_id})
+        return resolved
+
+    async def _upsert(self, rows: List[Dict[str, Any]]) -> int:
+        dialect = self.db.bind.dialect.name
+        insert = UPSERT_DIALECTS.get(dialect)
+        if insert is None:
+            raise ValueError(f"Bulk stats upsert is not supported on dialect '{dialect}'")
+
+        table = PlayerGameStats.__table__
+        stat_columns = [key for key in rows[0] if key not in ("player_id", "game_id", "team_id", "season_id")]
+
+        # Column defaults are bound per row too, so size chunks by table width
+        rows_per_statement = max(1, MAX_PARAMS_PER_STATEMENT // len(table.columns))
+        statements = 0
+        for offset in range(0, len(rows), rows_per_statement):
+            stmt = insert(table).values(rows[offset:offset + rows_per_statement])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.player_id, table.c.game_id],
+                set_={col: table.c[col] + stmt.excluded[col] for col in stat_columns}
+            )
+            await self.db.execute(stmt)
+            statements += 1
+        return statements
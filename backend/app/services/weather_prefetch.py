@@ -0,0 +1,167 @@
+"""
+Week-level weather prefetch.
+
+Resolves the weather for every game in a slate before kickoff: stadiums are
+looked up in one query, identical (stadium, kickoff) pairs are requested once,
+cached answers are reused, and the rest go to the weather MCP server in a
+single get_week_weather call. Servers without the batch tool get a bounded
+concurrent burst of get_game_weather calls instead.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import json
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.mcp_cache import mcp_cache
+from app.models.game import Game
+from app.models.team import Team
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KICKOFF = "2024-09-01T13:00:00"
+MAX_CONCURRENT_REQUESTS = 8
+
+WeatherKey = Tuple[str, str]  # (stadium_location, kickoff)
+
+
+def tool_payload(result: Any) -> Any:
+    """Plain data from an MCP tool result (structured or JSON text content); dicts pass through."""
+    if result is None or isinstance(result, (dict, list)):
+        return result
+    if getattr(result, "isError", False):
+        return None
+    structured = getattr(result, "structuredContent", None)
+    if structured is not None:
+        # FastMCP wraps non-object return values as {"result": ...}
+        return structured.get("result", structured) if isinstance(structured, dict) else structured
+    for content in getattr(result, "content", None) or []:
+        text = getattr(content, "text", None)
+        if text:
+            try:
+                return json.loads(text)
+            except json.JSONDecodeError:
+                return None
+    return None
+
+
+def parse_weather(weather_data: Dict) -> Dict:
+    """Parse weather strings ("41 F", "15 mph NW") into the engine's numeric config."""
+    try:
+        temp_str = weather_data.get("temperature", "70 F")
+        temp = int(temp_str.split()[0]) if temp_str and temp_str[0].isdigit() or temp_str[0] == '-' else 70
+
+        wind_str = weather_data.get("wind", "0 mph")
+        wind = int(wind_str.split()[0]) if wind_str and wind_str[0].isdigit() else 0
+
+        return {
+            "temperature": temp,
+            "wind_speed": wind,
+            "condition": weather_data.get("condition", "Clear")
+        }
+    except Exception:
+        return {"temperature": 70, "wind_speed": 0, "condition": "Clear"}
+
+
+class WeatherPrefetcher:
+    def __init__(self, db: AsyncSession, client: Any = None, max_concurrency: int = MAX_CONCURRENT_REQUESTS):
+        self.db = db
+        self._client = client
+        self.max_concurrency = max_concurrency
+        self.stats = {"games": 0, "requests": 0, "cached": 0, "batched": False}
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            from app.core.mcp_registry import registry
+            self._client = registry.get_client("weather")
+        return self._client
+
+    async def locations_for(self, games: Iterable[Game]) -> Dict[int, str]:
+        """Stadium location (home team "City, Name") per home team, in one query."""
+        team_ids = {game.home_team_id for game in games if game.home_team_id is not None}
+        if not team_ids:
+            return {}
+        teams = (await self.db.execute(select(Team).where(Team.id.in_(team_ids)))).scalars().all()
+        return {team.id: f"{team.city}, {team.name}" if team.city else team.name for team in teams}
+
+    async def prefetch(self, games: List[Game]) -> Dict[int, Dict]:
+        """
+        Parsed weather config per game ID; games whose weather could not be
+        resolved are left out (the engine then uses its default weather).
+        """
+        self.stats = {"games": len(games), "requests": 0, "cached": 0, "batched": False}
+        client = self.client
+        if not games or client is None:
+            return {}
+
+        locations = await self.locations_for(games)
+        keys: Dict[int, WeatherKey] = {}
+        for game in games:
+            kickoff = game.date.isoformat() if game.date else DEFAULT_KICKOFF
+            keys[game.id] = (locations.get(game.home_team_id, "Unknown"), kickoff)
+
+        resolved: Dict[WeatherKey, Dict] = {}
+        missing: List[WeatherKey] = []
+        for key in dict.fromkeys(keys.values()):
+            cached = await mcp_cache.get(self._cache_key(key), "weather")
+            if cached is not None:
+                resolved[key] = cached
+            else:
+                missing.append(key)
+        self.stats["cached"] = len(resolved)
+
+        if missing:
+            try:
+                resolved.update(await self._fetch_batch(client, missing))
+            except Exception as e:
+                logger.warning("Weather batch request failed; falling back to per-game requests", exc_info=e)
+                resolved.update(await self._fetch_each(client, missing))
+
+        return {game_id: parse_weather(resolved[key]) for game_id, key in keys.items() if key in resolved}
+
+    async def _fetch_batch(self, client: Any, keys: List[WeatherKey]) -> Dict[WeatherKey, Dict]:
+        self.stats["requests"] += 1
+        result = await client.call_tool("get_week_weather", arguments={
+            "games": [{"stadium_location": location, "date_time": kickoff} for location, kickoff in keys]
+        })
+        payload = tool_payload(result)
+        if not isinstance(payload, list) or len(payload) != len(keys):
+            raise ValueError("get_week_weather is unavailable or returned a malformed slate")
+
+        self.stats["batched"] = True
+        resolved = {}
+        for key, weather in zip(keys, payload):
+            if isinstance(weather, dict):
+                resolved[key] = weather
+                await mcp_cache.set(self._cache_key(key), weather, "weather")
+        return resolved
+
+    async def _fetch_each(self, client: Any, keys: List[WeatherKey]) -> Dict[WeatherKey, Dict]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_one(key: WeatherKey) -> Optional[Dict]:
+            async def call() -> Optional[Dict]:
+                async with semaphore:
+                    self.stats["requests"] += 1
+                    result = await client.call_tool("get_game_weather", arguments={
+                        "stadium_location": key[0],
+                        "date_time": key[1]
+                    })
+                payload = tool_payload(result)
+                return payload if isinstance(payload, dict) else None
+
+            try:
+                return await mcp_cache.get_or_fetch(self._cache_key(key), "weather", call)
+            except Exception as e:
+                logger.warning("Could not fetch weather from MCP", extra={"location": key[0]}, exc_info=e)
+                return None
+
+        weather = await asyncio.gather(*(fetch_one(key) for key in keys))
+        return {key: w for key, w in zip(keys, weather) if w is not None}
+
+    @staticmethod
+    def _cache_key(key: WeatherKey) -> str:
+        return f"weather:{key[0]}:{key[1]}"
@@ -1,20 +1,59 @@
 """
 Batch simulation service for simulating entire weeks of games.
 """
-from typing import List, Dict, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlalchemy import select
+from app.core.config import settings
+from app.core.random_utils import DeterministicRNG
 from app.models.game import Game
 from app.models.season import Season
 from app.orchestrator.simulation_orchestrator import SimulationOrchestrator
 from app.schemas.play import PlayResult
 import asyncio
 import logging
+import multiprocessing
+import os
 
 from app.services.player_development_service import PlayerDevelopmentService
+from app.services.standings_calculator import StandingsCalculator
+from app.services.stats_writer import BulkStatsWriter
+from app.services.weather_prefetch import WeatherPrefetcher
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class GameJob:
+    """Self-contained, picklable description of one game for a week worker."""
+    game_id: int
+    home_team_id: int
+    away_team_id: int
+    seed: str
+    database_url: str
+    play_count: int = 100
+    weather: Dict[str, Any] = field(default_factory=dict)
+
+
+async def _play_game_job(job: GameJob) -> Dict:
+    """Run a single game on its own engine and session."""
+    connect_args = {"timeout": 30} if "sqlite" in job.database_url else {}
+    engine = create_async_engine(job.database_url, poolclass=NullPool, connect_args=connect_args)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as db:
+            return await WeekSimulator(db).play_game_job(job)
+    finally:
+        await engine.dispose()
+
+
+def _run_game_job(job: GameJob) -> Dict:
+    """Process pool entry point: each worker runs the game on a private event loop."""
+    return asyncio.run(_play_game_job(job))
+
 class WeekSimulator:
     """
     Simulates all games in a week using the SimulationOrchestrator.
@@ -26,48 +65,28 @@ class WeekSimulator:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.player_development_service = PlayerDevelopmentService(db)
+        self.weather_prefetcher = WeatherPrefetcher(db)
+        self.week_weather: Dict[int, Dict] = {}
 
-    async def _fetch_weather(self, game: Game) -> Optional[Dict]:
-        """Fetch weather for a game using MCP."""
-        try:
-            from app.core.mcp_registry import registry
-            client = registry.get_client("weather")
-            if client:
-                # Get stadium location
-                location = "Unknown"
-                if game.home_team and game.home_team.city:
-                     location = f"{game.home_team.city}, {game.home_team.name}"
-                elif game.home_team:
-                     location = game.home_team.name
-
-                # Call MCP tool
-                weather_data = await client.call_tool("get_game_weather", arguments={
-                    "stadium_location": location,
-                    "date_time": game.date.isoformat() if game.date else "2024-09-01T13:00:00"
-                })
-
-                if isinstance(weather_data, dict):
-                    return weather_data
-        except Exception as e:
-            logger.warning("Could not fetch weather from MCP", exc_info=e)
-        return None
-
-    def _parse_weather(self, weather_data: Dict) -> Dict:
-        """Parse weather strings into numeric values."""
-        try:
-            temp_str = weather_data.get("temperature", "70 F")
-            temp = int(temp_str.split()[0]) if temp_str and temp_str[0].isdigit() or temp_str[0] == '-' else 70
-
-            wind_str = weather_data.get("wind", "0 mph")
-            wind = int(wind_str.split()[0]) if wind_str and wind_str[0].isdigit() else 0
-
-            return {
-                "temperature": temp,
-                "wind_speed": wind,
-                "condition": weather_data.get("condition", "Clear")
-            }
-        except Exception:
-            return {"temperature": 70, "wind_speed": 0, "condition": "Clear"}
+    async def prefetch_week_weather(self, games: List[Game]) -> Dict[int, Dict]:
+        """
+        Resolve weather for every game in the slate before any kickoff.
+
+        Results are kept in self.week_weather (game ID -> weather config) for the
+        games to read; games without weather fall back to the engine default.
+        """
+        self.week_weather.update(await self.weather_prefetcher.prefetch(games))
+        logger.info("Prefetched week weather", extra=self.weather_prefetcher.stats)
+        return self.week_weather
+
+    def _apply_weather(self, game: Game) -> Dict:
+        """Prefetched weather config for a game, recorded on the Game row."""
+        weather_config = self.week_weather.get(game.id, {})
+        if weather_config:
+            game.weather_condition = weather_config["condition"]
+            game.weather_temperature = weather_config["temperature"]
+            game.wind_speed = weather_config["wind_speed"]
+        return weather_config
 
     async def simulate_week(
         self,
@@ -100,7 +119,12 @@ class WeekSimulator:
         if not games:
             return {"error": "No unplayed games found for this week"}
 
+        # Every stadium's weather in one request, before the first kickoff
+        await self.prefetch_week_weather(games)
+
         results = {}
+        # Box scores for the whole week are upserted together after the last game
+        stats_writer = BulkStatsWriter(self.db)
 
         for game in games:
             logger.info(
@@ -113,20 +137,13 @@ class WeekSimulator:
             )
 
             # Create orchestrator for this game
-            orchestrator = SimulationOrchestrator()
+            orchestrator = SimulationOrchestrator(timing_sample_rate=self._timing_sample_rate(use_fast_sim))
+            orchestrator.stats_writer = stats_writer
 
             if use_fast_sim:
                 orchestrator.play_delay_seconds = 0.0  # No delays in fast sim
 
-            # Fetch weather
-            weather_data = await self._fetch_weather(game)
-            weather_config = {}
-            if weather_data:
-                parsed = self._parse_weather(weather_data)
-                game.weather_condition = parsed["condition"]
-                game.weather_temperature = parsed["temperature"]
-                game.wind_speed = parsed["wind_speed"]
-                weather_config = parsed
+            weather_config = self._apply_weather(game)
 
             # Start game session (this will create/update db entry)
             await orchestrator.start_new_game_session(
@@ -168,6 +185,10 @@ class WeekSimulator:
                 },
             )
 
+        stats_report = await stats_writer.flush()
+        await self.db.commit()
+        await self._update_standings(season_id, games)
+
         # Process weekly development (Training, Injuries, Morale)
         logger.info("Processing weekly player development", extra={"season_id": season_id, "week": week})
         await self.player_development_service.process_weekly_development(season_id, week)
@@ -175,9 +196,150 @@ class WeekSimulator:
         return {
             "week": week,
             "games_simulated": len(results),
+            "stats_write": stats_report.to_dict(),
+            "results": results
+        }
+
+    async def simulate_week_parallel(
+        self,
+        season_id: int,
+        week: int,
+        play_count: int = 100,
+        max_workers: Optional[int] = None,
+        seed: Optional[str] = None,
+        database_url: Optional[str] = None
+    ) -> Dict:
+        """
+        Simulate all games in a week across a pool of worker processes.
+
+        Every game runs with its own database session and its own RNG stream
+        below ``seed`` (keyed by game ID), so box scores are identical for any
+        number of workers. Results are merged back in game ID order.
+
+        Args:
+            season_id: ID of the season
+            week: Week number to simulate
+            play_count: Number of plays per game (default: 100)
+            max_workers: Worker processes (default: CPU count). 1 runs in-process.
+            seed: Root seed for the week (default: derived from season and week)
+            database_url: Async database URL for worker sessions (default: settings)
+
+        Returns:
+            Dictionary mapping game IDs to game results
+        """
+        stmt = select(Game).filter(
+            Game.season_id == season_id,
+            Game.week == week,
+            Game.is_played == False
+        ).order_by(Game.id)
+        result = await self.db.execute(stmt)
+        games = result.scalars().all()
+
+        if not games:
+            return {"error": "No unplayed games found for this week"}
+
+        # Game seeds are streams below the week, so no game depends on scheduling order
+        week_rng = DeterministicRNG(seed) if seed is not None else \
+            DeterministicRNG(f"season_{season_id}").stream("week", week)
+        root_seed = week_rng.seed
+        database_url = database_url or settings.async_database_url
+        max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(games)))
+
+        week_weather = await self.prefetch_week_weather(games)
+
+        jobs = []
+        for game in games:
+            jobs.append(GameJob(
+                game_id=game.id,
+                home_team_id=game.home_team_id,
+                away_team_id=game.away_team_id,
+                seed=week_rng.stream("game", game.id).seed,
+                database_url=database_url,
+                play_count=play_count,
+                weather=week_weather.get(game.id, {})
+            ))
+
+        logger.info(
+            "Simulating week in parallel",
+            extra={"season_id": season_id, "week": week, "games": len(jobs), "workers": max_workers},
+        )
+
+        if max_workers == 1:
+            game_results = [await _play_game_job(job) for job in jobs]
+        else:
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                game_results = await asyncio.gather(
+                    *(loop.run_in_executor(pool, _run_game_job, job) for job in jobs)
+                )
+
+        # Merge results back in deterministic (game ID) order
+        results = {}
+        games_by_id = {game.id: game for game in games}
+        for job, game_result in sorted(zip(jobs, game_results), key=lambda pair: pair[0].game_id):
+            game = games_by_id[job.game_id]
+            if job.weather:
+                game.weather_condition = job.weather["condition"]
+                game.weather_temperature = job.weather["temperature"]
+                game.wind_speed = job.weather["wind_speed"]
+            game.is_played = True
+            game.home_score = game_result["home_score"]
+            game.away_score = game_result["away_score"]
+            game.game_data = {
+                "final_score": f"{game_result['home_score']}-{game_result['away_score']}",
+                "plays": game_result["total_plays"],
+                "quarters": game_result["quarters"],
+                "seed": job.seed
+            }
+            results[job.game_id] = game_result
+        await self.db.commit()
+        await self._update_standings(season_id, games)
+
+        logger.info("Processing weekly player development", extra={"season_id": season_id, "week": week})
+        await self.player_development_service.process_weekly_development(season_id, week)
+
+        return {
+            "week": week,
+            "games_simulated": len(results),
+            "workers": max_workers,
+            "seed": root_seed,
             "results": results
         }
 
+    async def play_game_job(self, job: GameJob) -> Dict:
+        """
+        Play one game described by a GameJob on this simulator's session.
+
+        Used by parallel week workers; the scheduled Game row is left untouched
+        so the parent process can merge results in a deterministic order.
+        """
+        orchestrator = SimulationOrchestrator(timing_sample_rate=self._timing_sample_rate(True))
+        orchestrator.play_delay_seconds = 0.0
+
+        await orchestrator.start_new_game_session(
+            home_team_id=job.home_team_id,
+            away_team_id=job.away_team_id,
+            config={"fast_sim": True, "weather": job.weather, "seed": job.seed},
+            db_session=self.db
+        )
+
+        await self._run_simulation(orchestrator, job.play_count)
+
+        box_score = orchestrator.aggregate_player_stats()
+        return {
+            "home_team_id": job.home_team_id,
+            "away_team_id": job.away_team_id,
+            "home_score": orchestrator.home_score,
+            "away_score": orchestrator.away_score,
+            "total_plays": len(orchestrator.history),
+            "quarters": orchestrator.current_quarter,
+            "winner": "home" if orchestrator.home_score > orchestrator.away_score else "away",
+            "box_score": {pid: box_score[pid] for pid in sorted(box_score)}
+        }
+
     async def simulate_game(self, game_id: int, play_count: int = 100, use_fast_sim: bool = True) -> Dict:
         """
         Simulate a single game.
@@ -200,19 +362,12 @@ class WeekSimulator:
             },
         )
 
-        orchestrator = SimulationOrchestrator()
+        orchestrator = SimulationOrchestrator(timing_sample_rate=self._timing_sample_rate(use_fast_sim))
         if use_fast_sim:
             orchestrator.play_delay_seconds = 0.0
 
-        # Fetch weather
-        weather_data = await self._fetch_weather(game)
-        weather_config = {}
-        if weather_data:
-            parsed = self._parse_weather(weather_data)
-            game.weather_condition = parsed["condition"]
-            game.weather_temperature = parsed["temperature"]
-            game.wind_speed = parsed["wind_speed"]
-            weather_config = parsed
+        await self.prefetch_week_weather([game])
+        weather_config = self._apply_weather(game)
 
         await orchestrator.start_new_game_session(
             home_team_id=game.home_team_id,
@@ -232,6 +387,7 @@ class WeekSimulator:
             "quarters": orchestrator.current_quarter
         }
         await self.db.commit()
+        await self._update_standings(game.season_id, [game])
 
         return {
             "id": game.id,
@@ -242,6 +398,21 @@ class WeekSimulator:
             "winner": "home" if orchestrator.home_score > orchestrator.away_score else "away"
         }
 
+    @staticmethod
+    def _timing_sample_rate(use_fast_sim: bool) -> float:
+        """Fast-sim batches time a sample of plays; paced games time every play."""
+        if use_fast_sim:
+            return settings.KERNEL_TIMING_BATCH_SAMPLE_RATE
+        return settings.KERNEL_TIMING_SAMPLE_RATE
+
+    async def _update_standings(self, season_id: Optional[int], games: List[Game]) -> None:
+        """Fold newly completed games into the materialized standings table."""
+        if season_id is None:
+            return
+        await self.db.run_sync(
+            lambda session: StandingsCalculator(session).apply_game_results(season_id, games)
+        )
+
     async def _run_simulation(self, orchestrator: SimulationOrchestrator, num_plays: int) -> None:
         """
         Run the simulation loop for a single game asynchronously.
@@ -269,7 +440,7 @@ class WeekSimulator:
                 break
 
         orchestrator.is_running = False
-        orchestrator.save_game_result()
+        await orchestrator.save_game_result()
 
     async def simulate_full_season(
         self,
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from mcp.server.fastmcp import FastMCP
 
 mcp = FastMCP("weather")
@@ -46,6 +46,16 @@ def get_game_weather(stadium_location: str, date_time: str) -> Dict[str, str]:
         "precipitation": "None"
     }
 
+@mcp.tool()
+def get_week_weather(games: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Get weather for many games in one request (e.g. a whole week's slate).
+
+    Args:
+        games: List of {"stadium_location": ..., "date_time": ...}, one per game
+    """
+    return [get_game_weather(g.get("stadium_location", ""), g.get("date_time", "")) for g in games]
+
 @mcp.tool()
 def get_historical_conditions(location: str, date_range: str) -> str:
     """
@@ -0,0 +1,92 @@
+"""
+Benchmark a full game of turf updates: the list-of-lists mesh vs the array mesh.
+
+Run with: python scripts/benchmark_turf.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add backend directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.kernels.hive.geo_physics import TurfDegradationMesh
+
+PLAYS = 160            # Roughly one game, both teams
+FOOTSTEPS_PER_PLAY = 22 * 12
+QUARTERS = 4
+
+
+class ListTurfMesh:
+    """The original nested-list implementation, kept here as the baseline."""
+
+    def __init__(self, width=53, length=120):
+        self.grid = [[1.0 for _ in range(width)] for _ in range(length)]
+
+    def degrade_zone(self, x, y, traffic):
+        if 0 <= x < len(self.grid) and 0 <= y < len(self.grid[0]):
+            self.grid[x][y] = max(0.4, self.grid[x][y] - (traffic * 0.01))
+
+    def weather_decay(self, amount):
+        for row in self.grid:
+            for y, value in enumerate(row):
+                row[y] = max(0.4, value - amount * (1.0 + (1.0 - value) / 0.6))
+
+    def region_mean(self, x0, x1, y0, y1):
+        cells = [self.grid[x][y] for x in range(x0, x1) for y in range(y0, y1)]
+        return sum(cells) / len(cells)
+
+
+def list_bytes(grid):
+    return sys.getsizeof(grid) + sum(sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row) for row in grid)
+
+
+def make_plays(seed=1):
+    rng = np.random.default_rng(seed)
+    plays = []
+    for _ in range(PLAYS):
+        xs = rng.integers(0, 120, size=FOOTSTEPS_PER_PLAY)
+        ys = rng.integers(0, 53, size=FOOTSTEPS_PER_PLAY)
+        plays.append((xs, ys, rng.uniform(0.5, 3.0, size=FOOTSTEPS_PER_PLAY)))
+    return plays
+
+
+def run_list(plays):
+    mesh = ListTurfMesh()
+    start = time.perf_counter()
+    for i, (xs, ys, traffic) in enumerate(plays):
+        for x, y, t in zip(xs.tolist(), ys.tolist(), traffic.tolist(), strict=True):
+            mesh.degrade_zone(x, y, t)
+        mesh.region_mean(int(xs[0]) - 5 if xs[0] >= 5 else 0, min(120, int(xs[0]) + 5), 0, 53)
+        if (i + 1) % (PLAYS // QUARTERS) == 0:
+            mesh.weather_decay(0.002 * 15)
+    return time.perf_counter() - start, list_bytes(mesh.grid)
+
+
+def run_array(plays):
+    mesh = TurfDegradationMesh()
+    start = time.perf_counter()
+    for i, (xs, ys, traffic) in enumerate(plays):
+        mesh.apply_footprint(xs, ys, traffic)
+        mesh.region_stats((int(xs[0]) - 5, int(xs[0]) + 5), (0, 53))
+        if (i + 1) % (PLAYS // QUARTERS) == 0:
+            mesh.apply_weather_decay(moisture=1.0, minutes=15)
+    return time.perf_counter() - start, mesh.nbytes
+
+
+def benchmark_turf():
+    plays = make_plays()
+    print(f"Game: {PLAYS} plays x {FOOTSTEPS_PER_PLAY} footsteps, weather decay each quarter")
+
+    list_time, list_mem = run_list(plays)
+    array_time, array_mem = run_array(plays)
+
+    print(f"List mesh:  {list_time * 1000:8.1f} ms  {list_mem / 1024:8.1f} KiB")
+    print(f"Array mesh: {array_time * 1000:8.1f} ms  {array_mem / 1024:8.1f} KiB")
+    print(f"Speedup: {list_time / array_time:.1f}x, memory: {list_mem / array_mem:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    benchmark_turf()
@@ -0,0 +1,97 @@
+"""
+Benchmark week weather: one MCP call per game in series (the old per-game path)
+vs the batched week prefetch, against the local weather MCP server.
+
+Run with: python scripts/benchmark_weather_prefetch.py
+"""
+import asyncio
+import datetime
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# Add backend directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.mcp_cache import mcp_cache
+from app.core.mcp_client import MCPHostClient
+from app.models.base import Base
+from app.models.game import Game
+from app.models.team import Team
+from app.services.weather_prefetch import WeatherPrefetcher, parse_weather, tool_payload
+
+TEAMS = 32
+ROUNDS = 5
+
+
+async def seed(db):
+    teams = [Team(name=f"Team {i}", city=f"City {i}", abbreviation=f"T{i}", conference="AFC", division="East")
+             for i in range(TEAMS)]
+    db.add_all(teams)
+    await db.flush()
+    kickoff = datetime.datetime(2024, 12, 22, 13, 0)
+    games = [Game(season=2024, week=16, home_team_id=teams[i].id, away_team_id=teams[i + 1].id, date=kickoff)
+             for i in range(0, TEAMS, 2)]
+    db.add_all(games)
+    await db.commit()
+    return teams, games
+
+
+async def per_game(client, teams_by_id, games):
+    """The old path: one get_game_weather call per game, in series."""
+    weather = {}
+    for game in games:
+        team = teams_by_id[game.home_team_id]
+        result = await client.call_tool("get_game_weather", arguments={
+            "stadium_location": f"{team.city}, {team.name}",
+            "date_time": game.date.isoformat()
+        })
+        weather[game.id] = parse_weather(tool_payload(result))
+    return weather
+
+
+async def benchmark():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    client = MCPHostClient("weather", {
+        "transport": "stdio",
+        "command": sys.executable,
+        "args": ["mcp_servers/weather_server/server.py"],
+        "env": {"PYTHONPATH": "."}
+    })
+    await client.connect()
+
+    try:
+        async with session_factory() as db:
+            teams, games = await seed(db)
+            teams_by_id = {team.id: team for team in teams}
+            prefetcher = WeatherPrefetcher(db, client=client)
+
+            serial, batched = [], []
+            for _ in range(ROUNDS):
+                start = time.perf_counter()
+                expected = await per_game(client, teams_by_id, games)
+                serial.append(time.perf_counter() - start)
+
+                mcp_cache.clear()  # Time a cold prefetch, not cache hits
+                start = time.perf_counter()
+                weather = await prefetcher.prefetch(games)
+                batched.append(time.perf_counter() - start)
+                assert weather == expected
+
+        print(f"Week of {len(games)} games, best of {ROUNDS}")
+        print(f"Per-game calls:  {min(serial) * 1000:8.2f} ms ({len(games)} requests)")
+        print(f"Batched prefetch:{min(batched) * 1000:8.2f} ms ({prefetcher.stats['requests']} request)")
+        print(f"Speedup:         {min(serial) / min(batched):8.1f}x")
+    finally:
+        await client.disconnect()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark())
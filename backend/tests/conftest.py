@@ -2,12 +2,15 @@ import pytest
 import os
 import asyncio
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 from app.models.base import Base
 from app.main import app
 from app.core.database import get_db, get_async_db
+from app.models.player import Player
+from app.models.team import Team
+from app.orchestrator.headless_engine import PlayerSnapshot, RosterSnapshot
 
 # Use a file-based SQLite database for testing to allow sharing between sync and async
 TEST_DB_FILE = "test.db"
@@ -42,6 +45,12 @@ def set_sqlite_pragma_async(dbapi_connection, connection_record):
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.close()
 
+# One full game-day roster: every position the play resolver looks up
+ROSTER_POSITIONS = [
+    "QB", "RB", "WR", "WR", "WR", "TE", "OT", "OT", "OG", "OG", "C",
+    "DE", "DE", "DT", "DT", "LB", "LB", "LB", "CB", "CB", "S", "S", "K", "P"
+]
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 AsyncTestingSessionLocal = sessionmaker(
     class_=AsyncSession, autocommit=False, autoflush=False, bind=async_engine
@@ -107,6 +116,49 @@ async def async_db_session():
     async with AsyncTestingSessionLocal() as session:
         yield session
 
+@pytest.fixture(scope="function")
+def session_factory(async_db_session):
+    """Async sessions configured like the application's AsyncSessionLocal, which does not expire on commit."""
+    return async_sessionmaker(async_db_session.bind, class_=AsyncSession, expire_on_commit=False)
+
+@pytest.fixture(scope="function")
+async def db(session_factory):
+    async with session_factory() as session:
+        yield session
+
+@pytest.fixture(scope="function")
+def seed_teams():
+    """
+    Factory that adds teams with a full roster each and returns their ids.
+    The caller commits, so seeding can share a transaction with other rows.
+    """
+    async def seed(db, count=2, name="Team", abbreviation="T", conference="AFC", division="East"):
+        team_ids = []
+        for i in range(count):
+            team = Team(name=f"{name} {i}", city=f"City {i}", abbreviation=f"{abbreviation}{i}",
+                        conference=conference, division=division)
+            db.add(team)
+            await db.flush()
+            team_ids.append(team.id)
+            for j, pos in enumerate(ROSTER_POSITIONS):
+                db.add(Player(first_name=name, last_name=f"{pos}{j}", position=pos, team_id=team.id,
+                              overall_rating=70, age=25))
+        return team_ids
+    return seed
+
+@pytest.fixture(scope="function")
+def roster_snapshot():
+    """Factory for an in-memory home (1) vs away (2) snapshot; ratings are drawn from `rng` when given."""
+    def build(rng=None):
+        def roster(team_id):
+            return [
+                PlayerSnapshot(id=team_id * 100 + i, position=pos, last_name=f"{pos}{i}",
+                               overall_rating=rng.randint(60, 90) if rng else 70)
+                for i, pos in enumerate(ROSTER_POSITIONS)
+            ]
+        return RosterSnapshot(home_team_id=1, away_team_id=2, home_players=roster(1), away_players=roster(2))
+    return build
+
 @pytest.fixture(scope="function")
 def client(db_session):
     """
@@ -1,5 +1,5 @@
 import pytest
-from backend.mcp_servers.weather_server.server import get_game_weather, get_historical_conditions
+from backend.mcp_servers.weather_server.server import get_game_weather, get_historical_conditions, get_week_weather
 
 def test_get_game_weather_lambeau_winter():
     weather = get_game_weather("Lambeau Field", "2024-12-25T13:00:00")
@@ -20,3 +20,10 @@ def test_get_historical_conditions():
     summary = get_historical_conditions("Green Bay", "2023-09-01 to 2023-12-31")
     assert "Green Bay" in summary
     assert "Average temp" in summary
+
+def test_get_week_weather_matches_single_game_calls():
+    games = [
+        {"stadium_location": "Lambeau Field", "date_time": "2024-12-25T13:00:00"},
+        {"stadium_location": "Hard Rock Stadium", "date_time": "2024-12-25T13:00:00"},
+    ]
+    assert get_week_weather(games) == [get_game_weather(**g) for g in games]
@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
 from app.models.season import Season
+from app.models.standings import TeamSeasonStanding
 from app.models.team import Team
 
 @pytest.mark.asyncio
@@ -30,6 +32,12 @@ async def test_initialize_season(async_client: AsyncClient, async_db_session):
     assert data["is_active"] is True
     assert data["current_week"] == 1
 
+    # Standings are materialized with the schedule, so reads never write
+    rows = await async_db_session.execute(
+        select(func.count()).select_from(TeamSeasonStanding).where(TeamSeasonStanding.season_id == data["id"])
+    )
+    assert rows.scalar() == 4
+
 @pytest.mark.asyncio
 async def test_get_current_season(async_client: AsyncClient, async_db_session):
     season = Season(year=2031, is_active=True)
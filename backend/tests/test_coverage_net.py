@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from app.kernels.core import spatial_grid
+from app.kernels.core.spatial_grid import SpatialGrid
+from app.kernels.cortex.coverage_net import CoverageNet
+
+
+def _brute_nearest(points, queries):
+    gaps = np.hypot(*(queries[:, None, :] - points[None, :, :]).transpose(2, 0, 1))
+    return gaps.argmin(axis=1), gaps.min(axis=1)
+
+
+@pytest.fixture(params=["dense", "cells"])
+def search(request, monkeypatch):
+    """Run each grid test against both the dense path and the cell walk."""
+    if request.param == "cells":
+        monkeypatch.setattr(spatial_grid, "DENSE_PAIRS", 0)
+    return request.param
+
+
+@pytest.mark.usefixtures("search")
+class TestSpatialGrid:
+    @pytest.mark.parametrize("cell_size", [1.0, 5.0, 30.0])
+    def test_nearest_matches_brute_force(self, cell_size):
+        rng = np.random.default_rng(7)
+        points = rng.uniform((0, 0), (120, 53.3), size=(60, 2))
+        # Include queries well off the field
+        queries = rng.uniform((-40, -20), (160, 70), size=(200, 2))
+        grid = SpatialGrid(cell_size)
+        grid.rebuild(points)
+
+        indices, distances = grid.nearest(queries)
+
+        expected_indices, expected_distances = _brute_nearest(points, queries)
+        assert indices.tolist() == expected_indices.tolist()
+        assert distances == pytest.approx(expected_distances)
+
+    def test_ties_go_to_the_lowest_index(self):
+        grid = SpatialGrid()
+        grid.rebuild([(30.0, 10.0), (10.0, 10.0), (30.0, 10.0)])
+        indices, _ = grid.nearest([(20.0, 10.0), (31.0, 10.0)])
+        assert indices.tolist() == [0, 0]
+
+    def test_within_radius(self):
+        rng = np.random.default_rng(3)
+        points = rng.uniform((0, 0), (120, 53.3), size=(40, 2))
+        queries = rng.uniform((0, 0), (120, 53.3), size=(30, 2))
+        grid = SpatialGrid(4.0)
+        grid.rebuild(points)
+
+        rows, found = grid.within(queries, 7.5)
+
+        gaps = np.hypot(*(queries[:, None, :] - points[None, :, :]).transpose(2, 0, 1))
+        expected_rows, expected_found = np.nonzero(gaps <= 7.5)
+        assert rows.tolist() == expected_rows.tolist()
+        assert found.tolist() == expected_found.tolist()
+
+    def test_empty_grid(self):
+        grid = SpatialGrid()
+        grid.rebuild([])
+        indices, distances = grid.nearest([(1.0, 1.0)])
+        assert indices.tolist() == [-1] and distances.tolist() == [np.inf]
+        assert len(grid.within([(1.0, 1.0)], 5.0)[0]) == 0
+
+    def test_cell_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            SpatialGrid(0)
+
+
+class TestCoverageNet:
+    DEFENDERS = [
+        {'id': 'cb1', 'x': 40, 'y': 5},
+        {'id': 'lb1', 'x': 36, 'y': 26},
+        {'id': 's1', 'x': 52, 'y': 30},
+        {'id': 'cb2', 'x': 40, 'y': 48},
+    ]
+
+    def test_matchups_against_the_indexed_frame(self):
+        cov = CoverageNet()
+        cov.index_defenders(self.DEFENDERS)
+        receivers = [
+            {'id': 'wr1', 'x': 38, 'y': 6},
+            {'id': 'te1', 'x': 35, 'y': 22},
+            {'id': 'wr2', 'x': 41, 'y': 46},
+        ]
+
+        assert cov.identify_matchups(receivers) == {'wr1': 'cb1', 'te1': 'lb1', 'wr2': 'cb2'}
+        assert cov.identify_targeted_defender({'arrival_x': 50, 'arrival_y': 33}) == 's1'
+
+    def test_passing_defenders_reindexes(self):
+        cov = CoverageNet()
+        cov.index_defenders(self.DEFENDERS)
+        moved = [{'id': 'lb1', 'x': 60, 'y': 10}]
+        assert cov.identify_targeted_defender({'arrival_x': 41, 'arrival_y': 5}, moved) == 'lb1'
+        assert cov.identify_targeted_defender({'arrival_x': 41, 'arrival_y': 5}, []) is None
+
+    def test_defenders_within(self):
+        cov = CoverageNet()
+        cov.index_defenders(self.DEFENDERS)
+        nearby = cov.defenders_within([{'id': 'wr1', 'x': 38, 'y': 6}, {'id': 'rb1', 'x': 20, 'y': 26}], 3.0)
+        assert nearby == {'wr1': ['cb1'], 'rb1': []}
+
+    def test_locate_zones(self):
+        cov = CoverageNet()
+        players = [
+            {'id': 'fs', 'x': 55, 'y': 26},   # 15 deep
+            {'id': 'cb', 'x': 45, 'y': 4},    # 5 deep, outside
+            {'id': 'lb', 'x': 46, 'y': 26},   # 6 deep, middle
+            {'id': 'dl', 'x': 39, 'y': 26},   # Behind the line
+        ]
+        assert cov.locate_zones(players, "COVER_2", line_of_scrimmage=40) == {
+            'fs': 'Deep Half', 'cb': 'Flat', 'lb': 'Hook Curl', 'dl': None,
+        }
+        # Same spots with the offense attacking the other way
+        flipped = [dict(p, x=80 - p['x']) for p in players]
+        assert cov.locate_zones(flipped, "COVER_3", line_of_scrimmage=40, direction=-1)['fs'] == 'Deep Third'
+        assert cov.locate_zones(players, "BLITZ", line_of_scrimmage=40)['fs'] is None
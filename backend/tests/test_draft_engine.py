@@ -0,0 +1,100 @@
+import random
+
+from sqlalchemy import select
+
+from app.models.draft import DraftPick
+from app.models.player import Player
+from app.models.season import Season
+from app.models.team import Team
+from app.services.draft_engine import DraftEngine, TARGET_COUNTS
+from app.services.offseason_service import OffseasonService
+
+POSITIONS = list(TARGET_COUNTS)
+
+
+def _seed_draft(db, num_teams=4, rounds=6, num_rookies=60):
+    rng = random.Random(7)
+    season = Season(year=2079)
+    db.add(season)
+
+    teams = []
+    for i in range(num_teams):
+        team = Team(name=f"Draft {i}", city="City", abbreviation=f"DR{i}", conference="AFC", division="East")
+        db.add(team)
+        teams.append(team)
+    db.flush()
+
+    # Rosters already full at some positions, so needs differ between teams
+    for i, team in enumerate(teams):
+        for pos in POSITIONS[i::num_teams]:
+            for _ in range(TARGET_COUNTS[pos]):
+                db.add(Player(first_name="Vet", last_name=pos, position=pos, team_id=team.id, age=28))
+
+    # Coarse ratings so ties are common
+    rookies = [
+        Player(first_name="Rookie", last_name=str(i), position=rng.choice(POSITIONS),
+               overall_rating=rng.choice(range(60, 80, 4)), is_rookie=True, age=21)
+        for i in range(num_rookies)
+    ]
+    db.add_all(rookies)
+    db.flush()
+
+    for round_num in range(1, rounds + 1):
+        for i, team in enumerate(teams):
+            db.add(DraftPick(season_id=season.id, team_id=team.id, original_team_id=team.id,
+                             round=round_num, pick_number=(round_num - 1) * num_teams + i + 1))
+    db.commit()
+    return season, teams, rookies
+
+
+def _draft_results(db, season_id):
+    stmt = select(DraftPick.pick_number, DraftPick.player_id).where(
+        DraftPick.season_id == season_id
+    ).order_by(DraftPick.pick_number)
+    return db.execute(stmt).all()
+
+
+def _undo_draft(db, season_id, rookies):
+    for pick in db.execute(select(DraftPick).where(DraftPick.season_id == season_id)).scalars():
+        pick.player_id = None
+    for rookie in rookies:
+        rookie.team_id = None
+        rookie.is_rookie = True
+        rookie.contract_years = 0
+    db.commit()
+
+
+def test_in_memory_draft_matches_pick_by_pick(db_session):
+    season, teams, rookies = _seed_draft(db_session)
+    service = OffseasonService(db_session, seed=11)
+
+    sequential = service.simulate_draft(season.id, pick_by_pick=True)
+    sequential_results = _draft_results(db_session, season.id)
+
+    _undo_draft(db_session, season.id, rookies)
+
+    in_memory = service.simulate_draft(season.id)
+    in_memory_results = _draft_results(db_session, season.id)
+
+    assert len(in_memory) == 24
+    assert in_memory == sequential
+    assert in_memory_results == sequential_results
+    assert all(player_id is not None for _, player_id in in_memory_results)
+
+
+def test_draft_engine_commits_once(db_session):
+    season, teams, rookies = _seed_draft(db_session, rounds=2)
+
+    commits = []
+    original_commit = db_session.commit
+    db_session.commit = lambda: (commits.append(1), original_commit())
+    try:
+        summary = DraftEngine(db_session).run(season.id)
+    finally:
+        db_session.commit = original_commit
+
+    assert len(summary) == 8
+    assert len(commits) == 1
+    drafted = [r for r in rookies if r.team_id is not None]
+    assert len(drafted) == 8
+    assert all(not r.is_rookie and r.contract_years == 4 for r in drafted)
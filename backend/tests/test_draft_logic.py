@@ -87,7 +87,7 @@ def test_draft_logic_needs(service, mock_db):
     mock_db.query.side_effect = query_side_effect
     
     # Run simulation
-    service.simulate_draft(season_id=1)
+    service.simulate_draft(season_id=1, pick_by_pick=True)
     
     # Assertions
     # Should have picked the QB (85) over the RB (90) because of need
@@ -137,7 +137,7 @@ def test_draft_logic_bpa(service, mock_db):
 
     mock_db.query.side_effect = query_side_effect
     
-    service.simulate_draft(season_id=1)
+    service.simulate_draft(season_id=1, pick_by_pick=True)
     
     # Should pick the QB (BPA) because Kicker was too far down
     assert pick.player_id == 201
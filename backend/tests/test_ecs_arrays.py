@@ -0,0 +1,188 @@
+import numpy as np
+import pytest
+
+from app.kernels.core.ecs_manager import ArraySystem, ComponentSpec, ECSManager, System
+from app.kernels.core.hybrid_resolver import FIELD_LENGTH, PhysicsSolver
+from app.kernels.core.sim_engine import SimEngine
+
+
+def _physics_world():
+    ecs = ECSManager()
+    ecs.add_system(PhysicsSolver())
+    return ecs
+
+
+def _body(ecs, position, target=None, mass=250.0, **overrides):
+    values = {
+        "position": position,
+        "velocity": (0.0, 0.0),
+        "target": target if target is not None else position,
+        "max_speed": 9.0,
+        "acceleration": 7.0,
+        "radius": 0.6,
+        "mass": mass,
+    }
+    values.update(overrides)
+    return ecs.spawn(**values)
+
+
+class TestArchetypes:
+    def test_entities_with_the_same_components_share_columns(self):
+        ecs = ECSManager()
+        ecs.register_component("position", shape=(2,))
+        ecs.register_component("health", dtype=np.int32)
+
+        a = ecs.spawn(position=(1.0, 2.0))
+        b = ecs.spawn(position=(3.0, 4.0), health=90)
+        c = ecs.spawn(position=(5.0, 6.0), health=70)
+
+        assert len(ecs.archetypes) == 2
+        # Every archetype with a position, each as one contiguous column
+        positions = np.concatenate([cols["position"] for cols in ecs.query("position")])
+        assert positions.shape == (3, 2)
+        [healthy] = ecs.query("position", "health")
+        assert healthy["health"].dtype == np.int32
+        assert healthy["health"].tolist() == [90, 70]
+        assert ecs.get(a, "position").tolist() == [1.0, 2.0]
+        assert ecs.get(c, "health") == 70
+        assert b != c
+
+    def test_despawn_moves_the_last_row_into_the_gap(self):
+        ecs = ECSManager()
+        ecs.register_component("speed")
+        ids = [ecs.spawn(speed=float(i)) for i in range(4)]
+
+        ecs.despawn(ids[1])
+
+        [cols] = ecs.query("speed")
+        assert cols["speed"].tolist() == [0.0, 3.0, 2.0]
+        assert ecs.get(ids[3], "speed") == 3.0
+        ecs.set(ids[3], "speed", 9.5)
+        assert ecs.get(ids[3], "speed") == 9.5
+
+    def test_archetype_grows_past_its_initial_capacity(self):
+        ecs = ECSManager()
+        ecs.register_component("speed")
+        ids = [ecs.spawn(speed=float(i)) for i in range(100)]
+
+        [cols] = ecs.query("speed")
+        assert cols["speed"].shape == (100,)
+        assert ecs.get(ids[77], "speed") == 77.0
+
+    def test_components_must_be_registered_consistently(self):
+        ecs = ECSManager()
+        ecs.register_component("position", shape=(2,))
+        with pytest.raises(ValueError):
+            ecs.register_component("position", shape=(3,))
+        with pytest.raises(ValueError):
+            ecs.spawn(position=(0.0, 0.0), morale=1.0)
+
+    def test_array_and_object_systems_run_in_order(self):
+        calls = []
+
+        class Counter(System):
+            def update(self, entities, dt):
+                calls.append(("objects", len(entities)))
+
+        class Doubler(ArraySystem):
+            components = {"speed": ComponentSpec()}
+
+            def update_arrays(self, columns, dt):
+                calls.append(("arrays", len(columns["speed"])))
+                columns["speed"] *= 2
+
+        ecs = ECSManager()
+        ecs.add_system(Counter())
+        ecs.add_system(Doubler())
+        ecs.create_entity()
+        ecs.spawn(speed=1.5)
+        ecs.spawn(speed=2.0)
+
+        ecs.update(0.1)
+
+        assert calls == [("objects", 1), ("arrays", 2)]
+        assert ecs.query("speed")[0]["speed"].tolist() == [3.0, 4.0]
+
+
+class TestPhysicsSolver:
+    def test_body_accelerates_then_arrives_on_its_target(self):
+        ecs = _physics_world()
+        runner = _body(ecs, (20.0, 20.0), target=(40.0, 20.0))
+        sim = SimEngine(ecs)
+
+        sim.update(sim.time_step)
+        # One tick of acceleration: 7 yd/s^2 * 0.1 s
+        assert ecs.get(runner, "velocity") == pytest.approx([0.7, 0.0])
+
+        assert sim.run_loop(6.0) == 60
+        assert ecs.get(runner, "position") == pytest.approx([40.0, 20.0], abs=0.05)
+
+    def test_speed_is_capped(self):
+        ecs = _physics_world()
+        runner = _body(ecs, (10.0, 20.0), target=(110.0, 20.0), acceleration=100.0)
+        SimEngine(ecs).run_loop(1.0)
+        assert np.hypot(*ecs.get(runner, "velocity")) == pytest.approx(9.0)
+
+    def test_overlapping_bodies_are_pushed_apart_by_mass(self):
+        ecs = _physics_world()
+        lineman = _body(ecs, (50.0, 20.0), mass=300.0)
+        corner = _body(ecs, (50.6, 20.0), mass=100.0)
+
+        SimEngine(ecs).update(0.1)
+
+        lineman_x, corner_x = ecs.get(lineman, "position")[0], ecs.get(corner, "position")[0]
+        # 0.6 yards of overlap: the 100 lb body gives three quarters of it
+        assert corner_x - lineman_x == pytest.approx(1.2)
+        assert corner_x - 50.6 == pytest.approx(0.45)
+
+    def test_coincident_bodies_are_pushed_apart(self):
+        ecs = _physics_world()
+        first = _body(ecs, (10.0, 10.0))
+        second = _body(ecs, (10.0, 10.0))
+
+        SimEngine(ecs).run_loop(1.0)
+
+        a, b = ecs.get(first, "position"), ecs.get(second, "position")
+        assert np.isfinite(a).all() and np.isfinite(b).all()
+        # No line between them at the start: the lower index goes toward -x
+        assert a[0] < 10.0 < b[0]
+        assert np.hypot(*(b - a)) > 1.0
+
+    def test_batched_run_matches_tick_by_tick(self):
+        worlds = [_physics_world(), _physics_world()]
+        rng = np.random.default_rng(7)
+        for _ in range(8):
+            start, target = rng.uniform(10, 40, 2), rng.uniform(10, 40, 2)
+            for ecs in worlds:
+                _body(ecs, tuple(start), target=tuple(target))
+
+        SimEngine(worlds[0]).run_loop(3.0)
+        for _ in range(30):
+            worlds[1].update(0.1)
+
+        [batched], [ticked] = (ecs.query("position", "velocity") for ecs in worlds)
+        np.testing.assert_allclose(batched["position"], ticked["position"], atol=1e-9)
+        np.testing.assert_allclose(batched["velocity"], ticked["velocity"], atol=1e-9)
+
+    def test_bodies_stay_on_the_field(self):
+        ecs = _physics_world()
+        runner = _body(ecs, (118.0, 1.0), target=(140.0, -10.0))
+        SimEngine(ecs).run_loop(3.0)
+        x, y = ecs.get(runner, "position")
+        assert x == FIELD_LENGTH and y == 0.0
+
+    def test_full_field_tick(self):
+        ecs = _physics_world()
+        rng = np.random.default_rng(4)
+        for i in range(22):
+            start = (35.0 + i // 11, 6.0 + (i % 11) * 4.0)
+            _body(ecs, start, target=(rng.uniform(20, 80), rng.uniform(0, 53)))
+
+        SimEngine(ecs).run_loop(6.0)
+
+        [cols] = ecs.query("position")
+        points = cols["position"]
+        gaps = np.hypot(*(points[:, None, :] - points[None, :, :]).transpose(2, 0, 1))
+        np.fill_diagonal(gaps, np.inf)
+        assert np.isfinite(points).all()
+        assert gaps.min() > 1.2 - 0.1  # Nobody ends up inside anyone else
@@ -0,0 +1,132 @@
+import asyncio
+import gc
+
+from app.engine.event_bus import EventBus, EventType
+from app.engine.offensive_line_ai import OffensiveLineAI
+from app.orchestrator.headless_engine import PlayerSnapshot
+from app.orchestrator.match_context import MatchContext
+from app.orchestrator.play_resolver import PlayResolver
+from app.orchestrator.simulation_orchestrator import SimulationOrchestrator
+
+SACK = {"beaten_linemen_ids": [7], "intimidation_factor": 1.0}
+
+
+def _roster(base_id):
+    positions = ["QB", "RB", "WR", "TE", "OT", "OG", "C", "DE", "DT", "LB", "CB", "S"]
+    return [PlayerSnapshot(id=base_id + i, position=pos, last_name=pos) for i, pos in enumerate(positions)]
+
+
+def test_handler_count_constant_across_1000_games():
+    orchestrator = SimulationOrchestrator()
+    counts = set()
+    line_ais = set()
+
+    for game in range(1000):
+        context = MatchContext(1, 2)
+        context.load_rosters_from_players(_roster(100), _roster(200))
+        orchestrator.start_headless_session(context, {"seed": game})
+
+        resolver = orchestrator.play_resolver
+        resolver.event_bus.publish(EventType.SACK_EVENT, SACK)
+        counts.add(resolver.event_bus.handler_count())
+        line_ais.add(id(resolver.offensive_line_ai))
+
+    assert counts == {1}
+    assert len(line_ais) > 1  # Each game got its own line AI
+    assert orchestrator.play_resolver.offensive_line_ai.active_debuffs[7]["duration"] == 3
+
+
+def test_shared_bus_drops_collected_subscribers():
+    bus = EventBus()
+    for _ in range(1000):
+        OffensiveLineAI(bus)
+    gc.collect()
+
+    assert bus.handler_count() == 0
+
+    keeper = OffensiveLineAI(bus)
+    bus.publish(EventType.SACK_EVENT, SACK)
+    assert bus.handler_count(EventType.SACK_EVENT) == 1
+    assert 7 in keeper.active_debuffs
+
+
+def test_resolvers_no_longer_share_events():
+    first, second = PlayResolver(rng=None), PlayResolver(rng=None)
+
+    first.event_bus.publish(EventType.SACK_EVENT, SACK)
+
+    assert 7 in first.offensive_line_ai.active_debuffs
+    assert second.offensive_line_ai.active_debuffs == {}
+
+
+def test_scope_unsubscribes_explicitly():
+    bus = EventBus()
+    received = []
+
+    with bus.scope() as scope:
+        scope.subscribe(EventType.TOUCHDOWN_EVENT, received.append)
+        scope.subscribe(EventType.TURNOVER_EVENT, received.append)
+        bus.publish(EventType.TOUCHDOWN_EVENT, {"n": 1})
+        assert bus.handler_count() == 2
+
+    bus.publish(EventType.TOUCHDOWN_EVENT, {"n": 2})
+    assert received == [{"n": 1}]
+    assert bus.handler_count() == 0
+
+
+def test_batch_defers_dispatch_until_exit():
+    bus = EventBus()
+    received = []
+    bus.subscribe(EventType.TOUCHDOWN_EVENT, received.append)
+
+    with bus.batch():
+        bus.publish(EventType.TOUCHDOWN_EVENT, {"n": 1})
+        with bus.batch():
+            bus.publish(EventType.TOUCHDOWN_EVENT, {"n": 2})
+        assert received == []
+
+    assert received == [{"n": 1}, {"n": 2}]
+
+
+def test_publish_async_awaits_coroutine_handlers():
+    bus = EventBus()
+    received = []
+
+    async def handler(payload):
+        await asyncio.sleep(0)
+        received.append(payload["n"])
+
+    bus.subscribe(EventType.TURNOVER_EVENT, handler)
+    bus.subscribe(EventType.TURNOVER_EVENT, lambda payload: received.append(-payload["n"]))
+
+    asyncio.run(bus.publish_async(EventType.TURNOVER_EVENT, {"n": 3}))
+
+    assert sorted(received) == [-3, 3]
+
+
+def test_sync_publish_keeps_async_handler_tasks_and_logs_failures(caplog):
+    bus = EventBus()
+    received = []
+
+    async def handler(payload):
+        await asyncio.sleep(0)
+        received.append(payload["n"])
+
+    async def broken(payload):
+        raise ValueError("handler blew up")
+
+    bus.subscribe(EventType.SACK_EVENT, handler)
+    bus.subscribe(EventType.SACK_EVENT, broken)
+
+    async def publish_and_settle():
+        bus.publish(EventType.SACK_EVENT, {"n": 5})
+        assert len(bus._tasks) == 2  # Held by the bus until they finish
+        while bus._tasks:
+            await asyncio.sleep(0)
+
+    asyncio.run(publish_and_settle())
+
+    assert received == [5]
+    failures = [r for r in caplog.records if r.getMessage() == "Async handler failed"]
+    assert len(failures) == 1
+    assert failures[0].event_type == "SACK_EVENT"
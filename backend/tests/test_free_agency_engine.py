@@ -0,0 +1,90 @@
+from sqlalchemy import select
+
+from app.core.random_utils import DeterministicRNG
+from app.models.player import Player
+from app.models.team import Team
+from app.services.free_agency_engine import FreeAgencyEngine, LEAGUE_MINIMUM_SALARY, ROSTER_LIMIT
+from app.services.offseason_service import OffseasonService
+
+
+def _player(pid, rating, salary, position="WR"):
+    return Player(id=pid, first_name="FA", last_name=str(pid), position=position,
+                  overall_rating=rating, contract_salary=salary)
+
+
+def _match(teams, roster_counts, free_agents, seed="fa"):
+    engine = FreeAgencyEngine(db=None, rng=DeterministicRNG(seed))
+    return [(p.id, state.team.id) for p, state in engine._match(teams, roster_counts, free_agents)]
+
+
+def test_best_players_go_to_highest_cap_per_slot():
+    rich = Team(id=1, name="Rich", salary_cap_space=10_000_000)
+    broke = Team(id=2, name="Broke", salary_cap_space=0)
+    free_agents = [
+        _player(10, 70, 1_000_000),
+        _player(11, 90, 5_000_000),
+        _player(12, 80, 1_000_000),
+        _player(13, 95, 20_000_000),  # Nobody can afford him
+    ]
+
+    engine = FreeAgencyEngine(db=None, rng=DeterministicRNG("fa"))
+    signings = engine._match([rich, broke], {1: ROSTER_LIMIT - 2, 2: ROSTER_LIMIT - 1}, free_agents)
+
+    assert [(p.id, state.team.id) for p, state in signings] == [(11, 1), (12, 1), (10, 2)]
+    # Broke signs a minimum contract over the cap without going negative
+    assert {state.team.id: state.cap_space for _, state in signings} == {1: 4_000_000, 2: 0.0}
+
+
+def test_each_minimum_signing_keeps_cap_space_non_negative():
+    free_agents = [_player(20 + i, 80 - i, None) for i in range(4)]
+    for signed in range(1, len(free_agents) + 1):
+        team = Team(id=1, name="Tight", salary_cap_space=1_500_000)
+        engine = FreeAgencyEngine(db=None, rng=DeterministicRNG("min"))
+        signings = engine._match([team], {1: ROSTER_LIMIT - 5}, free_agents[:signed])
+
+        assert [p.id for p, _ in signings] == [p.id for p in free_agents[:signed]]
+        cap_space = signings[-1][1].cap_space
+        assert cap_space == max(1_500_000 - signed * LEAGUE_MINIMUM_SALARY, 0.0)
+        assert cap_space >= 0
+
+
+def test_full_rosters_do_not_bid():
+    team = Team(id=1, name="Full", salary_cap_space=50_000_000)
+    assert _match([team], {1: ROSTER_LIMIT}, [_player(10, 99, 1_000_000)]) == []
+
+
+def test_ties_are_deterministic_per_seed():
+    teams = [Team(id=i, name=f"T{i}", salary_cap_space=5_000_000) for i in range(1, 9)]
+    free_agents = [_player(100 + i, 70, 1_000_000) for i in range(40)]
+    counts = {t.id: ROSTER_LIMIT - 5 for t in teams}
+
+    first = _match(teams, counts, free_agents, seed="a")
+    assert first == _match(teams, counts, free_agents, seed="a")
+    assert len(first) == 40
+    assert any(_match(teams, counts, free_agents, seed=s) != first for s in ("b", "c", "d"))
+
+
+def test_simulate_free_agency_commits_and_reports_timings(db_session):
+    team = Team(name="Market", city="City", abbreviation="MKT", conference="NFC", division="South",
+                salary_cap_space=100_000_000)
+    db_session.add(team)
+    db_session.flush()
+    for i in range(ROSTER_LIMIT - 2):
+        db_session.add(Player(first_name="Vet", last_name=str(i), position="LB", team_id=team.id))
+    retired = Player(first_name="Old", last_name="Timer", position="QB", overall_rating=99, is_retired=True)
+    db_session.add(retired)
+    for i in range(3):
+        db_session.add(Player(first_name="Free", last_name=str(i), position="CB", overall_rating=75 + i))
+    db_session.commit()
+
+    report = OffseasonService(db_session, seed=3).simulate_free_agency(season_id=1)
+
+    assert report["message"] == "Free Agency simulated."
+    assert set(report["timings_ms"]) == {"load", "match", "commit"}
+    # Two open slots for three free agents on minimum contracts
+    assert report["signings"] == 2
+    assert retired.team_id is None
+    assert team.salary_cap_space == 100_000_000 - 2 * LEAGUE_MINIMUM_SALARY
+
+    roster = db_session.execute(select(Player).where(Player.team_id == team.id)).scalars().all()
+    assert len(roster) == ROSTER_LIMIT
@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from app.kernels.genesis.bio_metrics import AnatomyModel, FatigueRegulator
+from app.orchestrator.kernels.genesis_kernel import GenesisKernel
+
+CLIMATES = ["Neutral", "Cold", "Warm", "Dome"]
+
+
+def _kernel_and_reference(num_players=106):
+    kernel = GenesisKernel()
+    reference = {}
+    for pid in range(1, num_players + 1):
+        climate = CLIMATES[pid % len(CLIMATES)]
+        kernel.register_player(pid, {"fatigue": {"home_climate": climate}, "anatomy": {}})
+        reference[pid] = (AnatomyModel(), FatigueRegulator(home_climate=climate))
+    return kernel, reference
+
+
+def test_vectorized_updates_match_component_models():
+    kernel, reference = _kernel_and_reference()
+    rng = random.Random(5)
+    ids = list(reference)
+
+    for _ in range(200):
+        on_field = rng.sample(ids, 22)
+        temperature = rng.choice([20.0, 70.0, 95.0])
+        exertion = [rng.uniform(0, 3) for _ in on_field]
+        kernel.calculate_fatigue_batch(on_field, exertion, temperature)
+        for pid, amount in zip(on_field, exertion):
+            reference[pid][1].update_fatigue(amount, temperature)
+
+        delta = rng.choice([2.0, -1.5])
+        kernel.update_fatigue_batch(on_field, delta)
+        for pid in on_field:
+            fatigue = reference[pid][1]
+            if delta > 0:
+                fatigue.lactic_acid += delta
+            else:
+                fatigue.recover(-delta)
+
+        kernel.recover_all_fatigue(0.5)
+        for _, fatigue in reference.values():
+            fatigue.recover(0.5)
+
+    for pid, (_, fatigue) in reference.items():
+        view = kernel.player_states[pid]["fatigue"]
+        assert kernel.get_current_fatigue(pid) == pytest.approx(fatigue.lactic_acid)
+        assert view.hrv == pytest.approx(fatigue.hrv)
+        assert view.max_burst_capacity == pytest.approx(fatigue.max_burst_capacity)
+        assert view.home_climate == fatigue.home_climate
+
+
+def test_views_expose_component_api():
+    kernel, _ = _kernel_and_reference(num_players=3)
+    fatigue = kernel.player_states[1]["fatigue"]
+
+    fatigue.update_fatigue(10.0, 90.0)  # Cold climate in heat
+    assert fatigue.lactic_acid == 7.5
+    fatigue.lactic_acid = 1.0
+    assert kernel.get_current_fatigue(1) == 1.0
+
+    anatomy = kernel.player_states[2]["anatomy"]
+    assert kernel.check_injury_risk(2, impact_force=600.0, body_part="ACL") == {"is_injured": False}
+    assert kernel.check_injury_risk(2, impact_force=600.0, body_part="ACL")["is_injured"] is True
+    assert anatomy.ligaments["ACL"]["integrity"] == 0.0
+    assert anatomy.current_health == 50.0
+
+
+def test_batch_skips_unknown_players_and_keeps_deltas_aligned():
+    kernel, _ = _kernel_and_reference(num_players=3)
+
+    kernel.update_fatigue_batch([1, 999, 3], [4.0, 100.0, 6.0])
+
+    assert kernel.get_current_fatigue(1) == 4.0
+    assert kernel.get_current_fatigue(2) == 0.0
+    assert kernel.get_current_fatigue(3) == 6.0
+    assert kernel.get_current_fatigue(999) == 0.0
+
+
+def test_store_grows_past_initial_capacity():
+    kernel = GenesisKernel()
+    for pid in range(300):
+        kernel.register_player(pid, {})
+    kernel.update_fatigue_batch(range(300), 1.0)
+
+    assert len(kernel.store) == 300
+    assert kernel.get_current_fatigue(299) == 1.0
+
+
+def test_missing_ligaments_ignore_stress_like_the_component_model():
+    kernel = GenesisKernel()
+    partial = {"ACL": {"integrity": 100.0, "stress": 0.0, "soft_tissue_limit": 85.0}}
+    kernel.register_player(1, {"anatomy": {"ligaments": partial}})
+    reference = AnatomyModel(ligaments={name: dict(values) for name, values in partial.items()})
+
+    anatomy = kernel.player_states[1]["anatomy"]
+    for model in (anatomy, reference):
+        model.apply_stress(600.0, "Achilles")
+        model.apply_stress(600.0, "MCL")
+
+    assert anatomy.ligaments == reference.ligaments
+    assert anatomy.current_health == reference.current_health == 100.0
@@ -0,0 +1,64 @@
+from app.models.player import Player
+from app.orchestrator.headless_engine import HeadlessGameEngine, PlayerSnapshot
+from app.orchestrator.play_commands import PuntCommand, RunPlayCommand
+from app.schemas.play import PlayResult
+
+
+def test_headless_game_plays_four_quarters_without_db(roster_snapshot):
+    engine = HeadlessGameEngine(roster_snapshot())
+    result = engine.play_game(seed="unit")
+
+    assert engine.orchestrator.db_session is None
+    assert engine.orchestrator.current_game_id is None
+    assert engine.orchestrator.current_quarter == 4
+    assert engine.orchestrator._is_quarter_over()
+
+    assert result.total_plays == sum(d.plays for d in result.drives)
+    assert result.team_stats["home"]["plays"] + result.team_stats["away"]["plays"] == result.total_plays
+    assert result.home_score == 7 * result.team_stats["home"]["touchdowns"]
+    assert result.away_score == 7 * result.team_stats["away"]["touchdowns"]
+    valid_results = {"TOUCHDOWN", "TURNOVER", "PUNT", "DOWNS", "END_OF_HALF", "END_OF_GAME"}
+    assert all(d.result in valid_results for d in result.drives)
+
+
+def test_drive_results_follow_the_called_play(roster_snapshot):
+    engine = HeadlessGameEngine(roster_snapshot(), max_plays=8)
+    orchestrator = engine.orchestrator
+    # Home goes for it on 4th and loses yards again; away punts on 4th
+    calls = iter([RunPlayCommand([], [], run_direction="middle")] * 7 + [PuntCommand([], [])])
+    orchestrator.play_caller.select_play = lambda context: next(calls)
+    orchestrator.play_resolver.resolve_play = lambda command: PlayResult(
+        yards_gained=-5 if isinstance(command, PuntCommand) else -2, description="scripted"
+    )
+
+    result = engine.play_game(seed="drives")
+
+    assert [d.result for d in result.drives[:2]] == ["DOWNS", "PUNT"]
+    assert result.team_stats["home"]["touchdowns"] == result.team_stats["away"]["touchdowns"] == 0
+
+
+def test_headless_games_are_reproducible_per_seed(roster_snapshot):
+    first = HeadlessGameEngine(roster_snapshot()).simulate_games(3, seed="repeat")
+    second = HeadlessGameEngine(roster_snapshot()).simulate_games(3, seed="repeat")
+
+    assert [r.to_dict() for r in first] == [r.to_dict() for r in second]
+
+
+def test_batch_runs_skip_narratives_without_changing_outcomes(roster_snapshot):
+    numbers_only = HeadlessGameEngine(roster_snapshot())
+    narrated = HeadlessGameEngine(roster_snapshot())
+    narrated.orchestrator.play_resolver.interaction_engine.numbers_only = False
+
+    assert numbers_only.orchestrator.play_resolver.interaction_engine.numbers_only is True
+    assert ([r.to_dict() for r in numbers_only.simulate_games(3, seed="narrative")]
+            == [r.to_dict() for r in narrated.simulate_games(3, seed="narrative")])
+
+
+def test_player_snapshot_copies_orm_columns():
+    player = Player(id=7, first_name="Joe", last_name="Snap", position="QB", speed=88, overall_rating=81)
+    snapshot = PlayerSnapshot.from_player(player)
+
+    assert snapshot.id == 7
+    assert snapshot.position == "QB"
+    assert snapshot.speed == 88
+    assert snapshot.overall_rating == 81
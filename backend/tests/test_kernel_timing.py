@@ -0,0 +1,94 @@
+import random
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core import kernel_timing
+from app.core.kernel_timing import KernelTimer, PERSISTENCE, PLAY, PLAY_CALLING, RESOLUTION
+from app.orchestrator.headless_engine import HeadlessGameEngine
+
+
+def _observations(metric, phase):
+    return REGISTRY.get_sample_value(f"{metric}_count", {"phase": phase}) or 0.0
+
+
+def _play(timer, phase_seconds):
+    timer.start_play()
+    started = timer.clock()
+    timer.record(PLAY_CALLING, started - phase_seconds)
+    timer.end_play()
+
+
+def test_sampling_times_every_nth_play():
+    timer = KernelTimer(sample_rate=0.25)
+    assert timer.interval == 4
+
+    sampled = []
+    for _ in range(12):
+        timer.start_play()
+        sampled.append(timer.sampling)
+        timer.end_play()
+
+    assert sampled == [False, False, False, True] * 3
+    assert timer.sampled_plays == 3
+
+
+def test_game_summary_scales_sampled_plays(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(kernel_timing.time, "perf_counter", lambda: now[0])
+    timer = KernelTimer(sample_rate=0.5)
+
+    for _ in range(10):
+        _play(timer, phase_seconds=0.002)
+    timer.record_always(PERSISTENCE, now[0] - 0.05)
+
+    summary = timer.game_summary()
+    # 5 sampled plays at 2 ms stand in for all 10
+    assert summary[PLAY_CALLING] == pytest.approx(0.002 * 10)
+    assert summary[PERSISTENCE] == pytest.approx(0.05)
+
+
+def test_end_game_observes_histograms_and_resets():
+    before_play = _observations("sim_play_phase_seconds", PLAY_CALLING)
+    before_game = _observations("sim_game_phase_seconds", PLAY_CALLING)
+    timer = KernelTimer(sample_rate=1.0)
+
+    for _ in range(3):
+        _play(timer, phase_seconds=0.001)
+    timer.end_game()
+
+    assert _observations("sim_play_phase_seconds", PLAY_CALLING) == before_play + 3
+    assert _observations("sim_game_phase_seconds", PLAY_CALLING) == before_game + 1
+    assert timer.plays == 0 and timer.game_summary() == {}
+
+
+def test_disabled_timer_records_nothing():
+    timer = KernelTimer(sample_rate=0)
+    assert not timer.enabled
+
+    _play(timer, phase_seconds=0.001)
+    timer.record_always(PERSISTENCE, 0.0)
+
+    assert timer.clock() == 0.0
+    assert timer.game_summary() == {}
+
+
+def test_headless_game_reports_every_phase(roster_snapshot):
+    engine = HeadlessGameEngine(roster_snapshot(random.Random(7)))
+    engine.orchestrator.set_timer(KernelTimer(sample_rate=1.0))
+    before = {phase: _observations("sim_game_phase_seconds", phase) for phase in (PLAY, PLAY_CALLING, RESOLUTION)}
+
+    engine.play_game("timed")
+
+    for phase, count in before.items():
+        assert _observations("sim_game_phase_seconds", phase) == count + 1
+    assert _observations("sim_play_phase_seconds", "fatigue") > 0
+
+
+def test_sampling_does_not_change_results(roster_snapshot):
+    timed = HeadlessGameEngine(roster_snapshot(random.Random(7)))
+    untimed = HeadlessGameEngine(roster_snapshot(random.Random(7)))
+    timed.orchestrator.set_timer(KernelTimer(sample_rate=0.5))
+    untimed.orchestrator.set_timer(KernelTimer(sample_rate=0))
+
+    assert timed.play_game("same").to_dict() == untimed.play_game("same").to_dict()
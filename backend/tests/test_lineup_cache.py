@@ -0,0 +1,78 @@
+from app.models.player import Player
+from app.orchestrator.match_context import MatchContext
+
+OFFENSE = ["QB", "RB", "WR", "WR", "WR", "TE", "OT", "OG", "C", "OG", "OT"]
+DEFENSE = ["DE", "DE", "DT", "DT", "LB", "LB", "LB", "CB", "CB", "S", "S"]
+
+
+def _roster(first_id, team_id, positions):
+    # Two deep at every spot so a backup can step in
+    players = []
+    for depth in (1, 2):
+        for i, pos in enumerate(positions):
+            pid = first_id + depth * 100 + i
+            players.append(Player(id=pid, team_id=team_id, position=pos, depth_chart_rank=depth,
+                                  overall_rating=90 - depth * 10, injury_status="ACTIVE"))
+    return players
+
+
+def _context():
+    ctx = MatchContext(home_team_id=1, away_team_id=2)
+    ctx.load_rosters_from_players(_roster(1000, 1, OFFENSE), _roster(2000, 2, DEFENSE))
+    return ctx
+
+
+def test_repeated_lookups_hit_the_cache():
+    ctx = _context()
+
+    first = ctx.get_fielded_players(1, "standard", "OFFENSE")
+    for _ in range(50):
+        assert ctx.get_fielded_players(1, "standard", "OFFENSE") == first
+    ctx.get_fielded_players(2, "4-3", "DEFENSE")
+
+    assert len(first) == 11
+    assert ctx.lineup_cache_stats() == {"hits": 50, "misses": 2, "entries": 2}
+
+
+def test_cached_lineup_cannot_be_mutated_by_callers():
+    ctx = _context()
+    ctx.get_fielded_players(1, "standard", "OFFENSE").clear()
+    assert len(ctx.get_fielded_players(1, "standard", "OFFENSE")) == 11
+
+
+def test_injury_invalidates_only_that_team():
+    ctx = _context()
+    qb = next(p for p in ctx.get_fielded_players(1, "standard", "OFFENSE") if p.position == "QB")
+    ctx.get_fielded_players(2, "4-3", "DEFENSE")
+
+    ctx.set_injury_status(qb.id, "OUT")
+
+    assert ctx.lineup_cache_stats()["entries"] == 1
+    offense = ctx.get_fielded_players(1, "standard", "OFFENSE")
+    assert qb not in offense
+    assert any(p.position == "QB" for p in offense)
+
+
+def test_fatigue_sub_and_depth_chart_edit_rebuild_lineups():
+    ctx = _context()
+    defense = ctx.get_fielded_players(2, "4-3", "DEFENSE")
+    tired = next(p for p in defense if p.position == "CB")
+
+    ctx.sub_out_for_fatigue(tired.id)
+    assert tired not in ctx.get_fielded_players(2, "4-3", "DEFENSE")
+
+    ctx.return_from_fatigue(tired.id)
+    assert tired in ctx.get_fielded_players(2, "4-3", "DEFENSE")
+
+    backup = next(p for p in ctx.away_roster.values() if p.position == "CB" and p not in defense)
+    backup.depth_chart_rank, tired.depth_chart_rank = 1, 2
+    assert tired in ctx.get_fielded_players(2, "4-3", "DEFENSE")  # Stale until told
+    ctx.depth_chart_changed(2)
+    lineup = ctx.get_fielded_players(2, "4-3", "DEFENSE")
+    assert backup in lineup and tired not in lineup
+
+
+def test_lineup_matches_uncached_resolution():
+    ctx = _context()
+    cached = ctx.get_fielded_players(1, "shotgun_3wr", "OFFENSE")
+    assert cached == ctx._build_lineup(1, "shotgun_3wr", "OFFENSE")
@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.models.game import Game
+from app.orchestrator.session_manager import LiveSessionManager, SessionLimitError
+
+
+@pytest.fixture
+async def teams(db, seed_teams):
+    home_id, away_id = await seed_teams(db, name="Live", abbreviation="LV")
+    await db.commit()
+    return {"home_team_id": home_id, "away_team_id": away_id}
+
+
+async def _wait(manager):
+    await asyncio.gather(*(s.task for s in manager.sessions.values() if s.task))
+
+
+@pytest.mark.asyncio
+async def test_fifty_concurrent_sessions_do_not_interfere(session_factory, teams):
+    manager = LiveSessionManager(max_sessions=64, session_factory=session_factory)
+
+    plays_seen = {}
+    all_live = asyncio.Event()
+
+    async def on_play(session, result):
+        plays_seen.setdefault(session.session_id, []).append(result)
+        # Hold every game after its first play until all 50 are live at once
+        if len(plays_seen) == 50:
+            all_live.set()
+        await asyncio.wait_for(all_live.wait(), timeout=60)
+
+    sessions = await asyncio.gather(*(
+        manager.start(
+            num_plays=8 + i % 5,
+            config={**teams, "seed": f"live-{i}"},
+            on_play_complete=on_play,
+            play_delay_seconds=0,
+        )
+        for i in range(50)
+    ))
+    await asyncio.wait_for(all_live.wait(), timeout=60)
+    assert manager.running_count == 50
+    await _wait(manager)
+
+    assert len({s.game_id for s in sessions}) == 50
+    assert len({id(s.orchestrator) for s in sessions}) == 50
+    for session in sessions:
+        assert session.status == "completed"
+        assert session.db_session is None
+        # Each session only saw its own plays
+        assert plays_seen[session.session_id] == session.orchestrator.history
+        assert 0 < len(session.orchestrator.history) <= session.num_plays
+
+    async with session_factory() as db:
+        games = (await db.execute(select(Game).where(Game.id.in_([s.game_id for s in sessions])))).scalars().all()
+    assert len(games) == 50
+    assert all(g.is_played for g in games)
+
+
+@pytest.mark.asyncio
+async def test_limit_stop_and_idle_eviction(session_factory, teams):
+    manager = LiveSessionManager(max_sessions=2, idle_timeout=60, session_factory=session_factory)
+
+    first = await manager.start(num_plays=1000, config=teams, play_delay_seconds=0.01)
+    second = await manager.start(num_plays=1000, config=teams, play_delay_seconds=0.01)
+    with pytest.raises(SessionLimitError):
+        await manager.start(num_plays=5, config=teams)
+
+    # Lookup works by session id or game id
+    assert manager.get(str(first.game_id)) is first
+    assert manager.latest() is second
+
+    manager.stop(first.session_id)
+    await first.task
+    assert first.status == "stopped"
+    assert not first.orchestrator.is_running
+
+    # A finished session makes room for a new one
+    third = await manager.start(num_plays=5, config=teams, play_delay_seconds=0)
+    assert first.session_id not in manager.sessions
+    await third.task
+
+    # Sessions idle past the timeout are evicted, cancelling any that are still running
+    evicted = await manager.evict_idle(now=second.last_active + 3600)
+    assert set(evicted) == {second.session_id, third.session_id}
+    assert second.task.cancelled() or second.task.done()
+    assert second.status == "stopped"
+    assert len(manager) == 0
+    assert manager.list() == []
+
+
+def test_session_endpoints_without_live_games(client):
+    response = client.get("/api/simulation/sessions")
+    assert response.status_code == 200
+    assert response.json()["sessions"] == []
+
+    status = client.get("/api/simulation/status").json()
+    assert status["isRunning"] is False
+    assert status["homeScore"] == 0
+
+    assert client.get("/api/simulation/sessions/missing").status_code == 404
+    assert client.post("/api/simulation/stop").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_background_sweep_evicts_idle_sessions(session_factory, teams):
+    manager = LiveSessionManager(idle_timeout=0.05, session_factory=session_factory)
+    session = await manager.start(num_plays=2, config=teams, play_delay_seconds=0)
+    await session.task
+
+    manager.start_eviction(interval=0.02)
+    for _ in range(50):
+        if not manager.sessions:
+            break
+        await asyncio.sleep(0.02)
+    assert len(manager) == 0
+
+    sweep = manager._eviction_task
+    await manager.shutdown()
+    assert sweep.cancelled() and manager._eviction_task is None
+
+
+def test_app_lifespan_shuts_live_sessions_down(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.api.endpoints import simulation
+    from app.main import app
+
+    manager = LiveSessionManager()
+    monkeypatch.setattr(simulation, "session_manager", manager)
+
+    with TestClient(app):
+        assert manager._eviction_task is not None and not manager._eviction_task.done()
+        sweep = manager._eviction_task
+    assert sweep.done() and manager._eviction_task is None
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from app.core import mcp_cache as cache_module
+from app.core.mcp_cache import LRUTTLCache, MCPCache
+
+
+class DictBackend:
+    def __init__(self, fail: bool = False):
+        self.data = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("backend down")
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl):
+        if self.fail:
+            raise ConnectionError("backend down")
+        self.data[key] = value
+
+    async def clear(self):
+        self.data.clear()
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUTTLCache(max_entries=3)
+    for key in "abc":
+        cache.set(key, key.upper(), ttl=60)
+    assert cache.get("a") == "A"  # a is now the most recent
+    cache.set("d", "D", ttl=60)
+
+    assert cache.get("b") is None
+    assert [cache.get(k) for k in "acd"] == ["A", "C", "D"]
+    assert cache.evictions == 1
+    assert len(cache) == 3
+
+
+def test_entries_expire_after_their_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUTTLCache()
+    cache.set("short", 1, ttl=10)
+    cache.set("long", 2, ttl=100)
+
+    now[0] += 50
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_make_one_call():
+    cache = MCPCache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"temperature": "41 F"}
+
+    results = await asyncio.gather(*(cache.get_or_fetch("weather:GB", "weather", fetch) for _ in range(32)))
+
+    assert calls == 1
+    assert all(r == {"temperature": "41 F"} for r in results)
+    metrics = cache.metrics()
+    assert metrics["coalesced"] == 31
+    assert metrics["inflight"] == 0
+
+    # Later requests are plain hits
+    assert await cache.get_or_fetch("weather:GB", "weather", fetch) == {"temperature": "41 F"}
+    assert calls == 1
+    assert cache.metrics()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_reaches_every_waiter_and_is_not_cached():
+    cache = MCPCache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("mcp unavailable")
+
+    results = await asyncio.gather(
+        *(cache.get_or_fetch("stats:QB", "league_averages", fetch) for _ in range(5)),
+        return_exceptions=True,
+    )
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def recovered():
+        return {"yards": 250}
+
+    assert await cache.get_or_fetch("stats:QB", "league_averages", recovered) == {"yards": 250}
+
+
+@pytest.mark.asyncio
+async def test_backend_tier_is_shared_and_optional():
+    backend = DictBackend()
+    writer, reader = MCPCache(backend=backend), MCPCache(backend=backend)
+
+    await writer.set("news:1", ["headline"], "player_news")
+    assert "news:1" in backend.data
+    # A second process finds it in the backend and keeps a local copy
+    assert await reader.get("news:1", "player_news") == ["headline"]
+    assert "news:1" in reader.memory_cache
+
+    # A failing backend degrades to the memory tier
+    broken = MCPCache(backend=DictBackend(fail=True))
+    await broken.set("news:2", ["other"], "player_news")
+    assert await broken.get("news:2", "player_news") == ["other"]
+    assert await broken.get("news:3", "player_news") is None
+    assert broken.metrics()["backend_errors"] == 2
+
+    await writer.clear_all()
+    assert backend.data == {}
+    assert len(writer.memory_cache) == 0
+
+
+def test_memory_only_without_redis_url(monkeypatch):
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    assert MCPCache.from_env().backend is None
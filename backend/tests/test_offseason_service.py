@@ -25,23 +25,25 @@ from sqlalchemy import select
 
 class MockTeam:
     """Mock Team object for testing."""
-    def __init__(self, id, name, city="City", abbreviation="ABC"):
+    def __init__(self, id, name, city="City", abbreviation="ABC", salary_cap_space=0.0):
         self.id = id
         self.name = name
         self.city = city
         self.abbreviation = abbreviation
+        self.salary_cap_space = salary_cap_space
 
 
 class MockPlayer:
     """Mock Player object for testing."""
     def __init__(self, id, first_name, last_name, position, team_id=None,
-                 contract_years=0, overall_rating=70, is_rookie=False):
+                 contract_years=0, overall_rating=70, is_rookie=False, contract_salary=1000000):
         self.id = id
         self.first_name = first_name
         self.last_name = last_name
         self.position = position.value if isinstance(position, Position) else position
         self.team_id = team_id
         self.contract_years = contract_years
+        self.contract_salary = contract_salary
         self.overall_rating = overall_rating
         self.is_rookie = is_rookie
         self.age = 22
@@ -318,7 +320,7 @@ def test_simulate_draft_fills_all_picks(service, mock_db):
     mock_db.execute.side_effect = execute_side_effect
     mock_db.commit.return_value = None
 
-    service.simulate_draft(season_id)
+    service.simulate_draft(season_id, pick_by_pick=True)
 
     # Verify all picks have been assigned
     for pick in picks:
@@ -366,7 +368,7 @@ def test_simulate_draft_respects_team_needs(service, mock_db):
     mock_db.execute.side_effect = execute_side_effect
     mock_db.commit.return_value = None
 
-    service.simulate_draft(season_id)
+    service.simulate_draft(season_id, pick_by_pick=True)
 
     # Should pick QB (position of need) even though WR has higher rating
     assert picks[0].player_id == 10  # QB prospect
@@ -396,7 +398,7 @@ def test_simulate_free_agency_fills_rosters_to_53(service, mock_db):
             mock_result.scalars.return_value.all.return_value = teams
         elif "from player" in stmt_str:
             if "count(*)" in stmt_str:
-                 mock_result.scalar.return_value = 0 # Empty roster
+                 mock_result.all.return_value = [] # Empty rosters (counts grouped by team)
             else:
                  mock_result.scalars.return_value.all.return_value = free_agents
 
@@ -434,7 +436,7 @@ def test_simulate_free_agency_signs_best_available_players(service, mock_db):
             mock_result.scalars.return_value.all.return_value = teams
         elif "from player" in stmt_str:
             if "count(*)" in stmt_str:
-                 mock_result.scalar.return_value = 51 # Need 2 more
+                 mock_result.all.return_value = [(1, 51)] # Need 2 more
             else:
                  mock_result.scalars.return_value.all.return_value = free_agents
 
@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.models.game import Game
+from app.models.play_event import PlayEvent
+from app.orchestrator.simulation_orchestrator import SimulationOrchestrator
+from app.services.play_log_service import PlayLogService
+
+
+async def _logged_plays(db, game_id):
+    return (await db.execute(
+        select(func.count(PlayEvent.id)).where(PlayEvent.game_id == game_id)
+    )).scalar()
+
+
+@pytest.mark.asyncio
+async def test_plays_are_appended_once_to_play_log(db, seed_teams):
+    home_id, away_id = await seed_teams(db, name="Log", abbreviation="L", conference="NFC", division="West")
+    await db.commit()
+
+    orchestrator = SimulationOrchestrator()
+    await orchestrator.start_new_game_session(home_id, away_id, config={"seed": "log"}, db_session=db)
+    game_id = orchestrator.current_game_id
+    orchestrator.reset_game_state()
+
+    flushes = 0
+    for _ in range(30):
+        possession = orchestrator.possession
+        await orchestrator._execute_single_play()
+        pending = orchestrator._pending_play_events
+        logged = await _logged_plays(db, game_id)
+        if orchestrator.possession != possession or orchestrator._is_quarter_over():
+            # End of a drive: the buffer was written out
+            assert pending == []
+            assert logged == len(orchestrator.history)
+            flushes += 1
+        else:
+            # Only the current drive is buffered; everything before it is logged
+            assert {possession for _, _, possession, _ in pending} == {orchestrator.possession}
+            assert logged + len(pending) == len(orchestrator.history)
+    assert flushes > 0
+
+    history_len = len(orchestrator.history)
+    await orchestrator.save_game_result()
+
+    sequences = (await db.execute(
+        select(PlayEvent.sequence).where(PlayEvent.game_id == game_id).order_by(PlayEvent.sequence)
+    )).scalars().all()
+    assert sequences == list(range(1, history_len + 1))
+
+    game = await db.get(Game, game_id)
+    assert "plays" not in game.game_data
+    assert game.game_data["play_count"] == history_len
+
+    plays = await db.run_sync(lambda s: PlayLogService(s).get_plays(s.get(Game, game_id)))
+    assert len(plays) == history_len
+    assert all("description" in p for p in plays)
+
+
+@pytest.mark.asyncio
+async def test_play_log_falls_back_to_legacy_game_data(db):
+    game = Game(season=2020, week=1, game_data={"plays": [{"description": "legacy"}]})
+    db.add(game)
+    await db.commit()
+    game_id = game.id
+
+    assert await _logged_plays(db, game_id) == 0
+
+    plays = await db.run_sync(lambda s: PlayLogService(s).get_plays(s.get(Game, game_id)))
+    assert plays == [{"description": "legacy"}]
@@ -0,0 +1,130 @@
+import itertools
+import math
+
+import pytest
+
+from app.core.config import settings
+from app.core.random_utils import DeterministicRNG
+from app.orchestrator import play_caller as play_caller_module
+from app.orchestrator.kernels import cortex_kernel
+from app.orchestrator.kernels.cortex_kernel import CortexKernel, GameSituation
+from app.orchestrator.play_caller import PlayCaller, PlayCallingContext
+from app.orchestrator.play_commands import FieldGoalCommand, PassPlayCommand, PuntCommand, RunPlayCommand
+from app.orchestrator.play_policy import PolicyTable, SituationBuckets, draw, to_distribution
+
+
+def _same(table_entry, distribution):
+    (plays, cumulative), (expected_plays, expected) = table_entry, distribution
+    return plays == expected_plays and all(map(math.isclose, cumulative, expected))
+
+
+def _context(down, distance, distance_to_goal, time_left_seconds, score_diff):
+    return PlayCallingContext(
+        down=down, distance=distance, distance_to_goal=distance_to_goal,
+        time_left_seconds=time_left_seconds, score_diff=score_diff,
+        possession="home", offense_players=[], defense_players=[]
+    )
+
+
+class TestPolicyTable:
+    def test_buckets(self):
+        buckets = SituationBuckets(distance=(2, 6), score=(-1, 0))
+        assert len(buckets) == 9
+        assert [buckets.key(d, 0)[0] for d in (1, 2, 3, 6, 7, 40)] == [0, 0, 1, 1, 2, 2]
+        assert [values for _, values in buckets.representatives()][:4] == [
+            {"distance": 2, "score": -1}, {"distance": 2, "score": 0},
+            {"distance": 2, "score": 1}, {"distance": 6, "score": -1},
+        ]
+        # Flat indexes follow representatives(), for values inside or beyond the edges
+        assert [buckets.index(*values.values()) for _, values in buckets.representatives()] == list(range(9))
+        assert buckets.index(40, -5) == buckets.index(40, -5) == buckets.flat_index(buckets.key(40, -5)) == 6
+
+    def test_draw_is_one_random_call(self):
+        distribution = to_distribution({"RUN": 0.5, "PASS_SHORT": 0.0, "PASS_DEEP": 0.5})
+        assert distribution[0] == ("RUN", "PASS_DEEP")
+
+        rng, replay = DeterministicRNG("draw"), DeterministicRNG("draw")
+        picks = [draw(rng, distribution) for _ in range(200)]
+        assert picks == ["RUN" if replay.random() * 1.0 < 0.5 else "PASS_DEEP" for _ in range(200)]
+        assert 60 < picks.count("RUN") < 140
+
+    def test_round_trips_through_a_dict(self):
+        table = PolicyTable.compile(SituationBuckets(down=(1, 2, 3)), lambda s: {"RUN": s["down"], "PASS_SHORT": 1})
+        restored = PolicyTable.from_dict(table.to_dict())
+        assert restored.buckets.names == ("down",)
+        assert restored.lookup(3) == table.lookup(3) == (("RUN", "PASS_SHORT"), (3, 4))
+
+
+class TestPlayCallerPolicy:
+    @pytest.mark.parametrize("aggression,run_pass_ratio", [(0.1, 0.45), (0.5, 0.45), (0.9, 0.3)])
+    def test_compiled_table_matches_the_live_logic(self, aggression, run_pass_ratio):
+        caller = PlayCaller(DeterministicRNG(1), aggression=aggression, run_pass_ratio=run_pass_ratio)
+        table = play_caller_module.compiled_policy(aggression, run_pass_ratio)
+
+        # Both sides of every threshold the live logic branches on
+        for situation in itertools.product(
+            (1, 2, 3, 4), (1, 2, 3, 4, 5, 6, 7, 10, 11, 20), (0, 2, 3, 38, 39, 60, 61, 99),
+            (5, 299, 300, 599, 600, 1800), (-21, -9, -8, -4, -3, -1, 0, 1, 8, 9, 21)
+        ):
+            live = to_distribution(caller.play_distribution(_context(*situation)))
+            assert _same(table.lookup(*situation), live), situation
+
+    def test_select_play_draws_from_the_table(self):
+        caller = PlayCaller(DeterministicRNG(2))
+        commands = [caller.select_play(_context(1, 10, 75, 900, 0)) for _ in range(50)]
+        assert {type(c) for c in commands} == {PassPlayCommand, RunPlayCommand}
+
+        kick = caller.select_play(_context(4, 5, 25, 900, 0))
+        assert isinstance(kick, FieldGoalCommand) and kick.distance == 42
+
+    def test_uncovered_states_fall_back_to_the_live_logic(self):
+        # A hand-tuned table that only covers 4th downs: always punt
+        buckets = play_caller_module.SITUATION_BUCKETS
+        table = PolicyTable(buckets, {
+            key: to_distribution({"PUNT": 1.0})
+            for key, values in buckets.representatives() if values["down"] == 4
+        })
+        caller = PlayCaller(DeterministicRNG(3), policy=table)
+
+        assert isinstance(caller.select_play(_context(4, 5, 25, 900, 0)), PuntCommand)
+        assert isinstance(caller.select_play(_context(1, 10, 75, 900, 0)), (PassPlayCommand, RunPlayCommand))
+
+    def test_policy_dimensions_must_match(self):
+        with pytest.raises(ValueError):
+            PlayCaller(DeterministicRNG(4), policy=PolicyTable(SituationBuckets(down=(1, 2, 3))))
+
+    def test_tables_can_be_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "PLAY_POLICY_TABLES", False)
+        monkeypatch.setattr(play_caller_module, "compiled_policy", None)
+        caller = PlayCaller(DeterministicRNG(5))
+        assert isinstance(caller.select_play(_context(4, 10, 60, 900, 0)), PuntCommand)
+
+
+class TestCortexPolicy:
+    def test_preloaded_policy_wins(self):
+        buckets = cortex_kernel.SITUATION_BUCKETS
+        table = PolicyTable(buckets, {key: to_distribution({"PASS_DEEP": 1.0}) for key, _ in buckets.representatives()})
+        cortex = CortexKernel(policies={(50, 50): table})
+
+        sit = GameSituation(down=1, distance=2, field_position=50, time_remaining=900, score_differential=0, quarter=1)
+        assert cortex.call_play(sit) == "PASS_DEEP"
+        assert cortex.call_play(sit, {"aggressiveness": 40}) == "RUN"
+
+    def test_uncovered_states_use_the_branch_logic(self):
+        # Only 4th downs covered: always go for it deep
+        buckets = cortex_kernel.SITUATION_BUCKETS
+        table = PolicyTable(buckets, {
+            key: to_distribution({"PASS_DEEP": 1.0})
+            for key, values in buckets.representatives() if values["down"] == 4
+        })
+        cortex = CortexKernel(policies={(50, 50): table})
+
+        fourth = GameSituation(down=4, distance=8, field_position=30, time_remaining=900, score_differential=0, quarter=1)
+        short = GameSituation(down=2, distance=2, field_position=50, time_remaining=900, score_differential=0, quarter=1)
+        assert cortex.call_play(fourth) == "PASS_DEEP"
+        assert CortexKernel().call_play(fourth) == "PUNT"
+        assert cortex.call_play(short) == "RUN"
+
+    def test_policy_dimensions_must_match(self):
+        with pytest.raises(ValueError):
+            CortexKernel(policies={(50, 50): PolicyTable(SituationBuckets(down=(1, 2, 3)))})
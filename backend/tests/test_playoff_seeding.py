@@ -0,0 +1,101 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.models.game import Game
+from app.models.season import Season
+from app.models.standings import TeamSeasonStanding
+from app.models.team import Team
+from app.services.playoff_service import PlayoffService
+from app.services.standings_calculator import StandingsCalculator
+
+
+def _seed_season(db):
+    season = Season(year=2078)
+    db.add(season)
+
+    teams = {}
+    for key, conference, division in [("A", "AFC", "WhatIf North"), ("B", "AFC", "WhatIf North"),
+                                      ("C", "AFC", "WhatIf South"), ("D", "NFC", "WhatIf East")]:
+        team = Team(name=f"WhatIf {key}", city="City", abbreviation=f"WI{key}", conference=conference, division=division)
+        db.add(team)
+        teams[key] = team
+    db.flush()
+
+    games = {
+        "B_C": Game(season_id=season.id, season=2078, week=1, home_team_id=teams["B"].id,
+                    away_team_id=teams["C"].id, home_score=10, away_score=3, is_played=True),
+        "A_B": Game(season_id=season.id, season=2078, week=2, home_team_id=teams["A"].id, away_team_id=teams["B"].id),
+        "A_D": Game(season_id=season.id, season=2078, week=3, home_team_id=teams["A"].id, away_team_id=teams["D"].id),
+    }
+    db.add_all(games.values())
+    db.commit()
+    return season, teams, games
+
+
+def _seed_of(seeding, conference, team_id):
+    return next(s for s in seeding.seeds[conference] if s.team_id == team_id)
+
+
+def test_what_if_projects_scenarios_without_writing(db_session):
+    season, teams, games = _seed_season(db_session)
+    service = PlayoffService(db_session)
+
+    current, flipped = service.what_if_seeding(season.id, [
+        [],
+        [
+            {"game_id": games["A_B"].id, "home_score": 30, "away_score": 0},
+            {"game_id": games["A_D"].id, "home_score": 20, "away_score": 0},
+        ],
+    ])
+
+    assert current.seeds["AFC"][0].team_id == teams["B"].id
+    assert flipped.seeds["AFC"][0].team_id == teams["A"].id
+    assert _seed_of(flipped, "AFC", teams["A"].id).wins == 2
+    b_seed = _seed_of(flipped, "AFC", teams["B"].id)
+    assert (b_seed.wins, b_seed.losses, b_seed.division_winner) == (1, 1, False)
+
+    # Dry run: no results saved and no standings materialized
+    db_session.expire_all()
+    assert db_session.get(Game, games["A_B"].id).is_played is False
+    count = db_session.execute(
+        select(func.count()).select_from(TeamSeasonStanding).where(TeamSeasonStanding.season_id == season.id)
+    ).scalar()
+    assert count == 0
+
+
+def test_what_if_rejects_played_or_unknown_games(db_session):
+    season, teams, games = _seed_season(db_session)
+    service = PlayoffService(db_session)
+
+    with pytest.raises(ValueError):
+        service.what_if_seeding(season.id, [[{"game_id": games["B_C"].id, "home_score": 0, "away_score": 7}]])
+    with pytest.raises(ValueError):
+        service.what_if_seeding(season.id, [[{"game_id": -1, "home_score": 0, "away_score": 7}]])
+
+
+def test_seeds_both_conferences_from_one_snapshot(db_session):
+    season, teams, games = _seed_season(db_session)
+    # Standings are materialized when a season is initialized
+    StandingsCalculator(db_session).rebuild_standings(season.id)
+    service = PlayoffService(db_session)
+
+    seeds = service._calculate_seeds(season.id)
+
+    assert set(seeds) == {"AFC", "NFC"}
+    assert seeds["AFC"][0].id == teams["B"].id
+    assert all(isinstance(team, Team) for conference in seeds.values() for team in conference)
+
+
+def test_seeds_a_season_without_standings_rows(db_session):
+    # Seasons created before team_standings existed have games but no rows
+    season, teams, games = _seed_season(db_session)
+    service = PlayoffService(db_session)
+
+    seeds = service._calculate_seeds(season.id)
+
+    assert seeds["AFC"][0].id == teams["B"].id
+    assert [team.id for team in seeds["NFC"]] == [teams["D"].id]
+    count = db_session.execute(
+        select(func.count()).select_from(TeamSeasonStanding).where(TeamSeasonStanding.season_id == season.id)
+    ).scalar()
+    assert count == 0
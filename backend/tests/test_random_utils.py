@@ -52,3 +52,62 @@ def test_gauss():
     rng = DeterministicRNG("GAUSS")
     val = rng.gauss(0, 1)
     assert isinstance(val, float)
+
+def test_stream_ignores_parent_draws():
+    """A child stream depends on the parent's seed and its keys, not the parent's state."""
+    parent = DeterministicRNG("LEAGUE")
+    before = parent.stream("game", 7)
+    [parent.random() for _ in range(50)]
+    after = parent.stream("game", 7)
+
+    assert [before.random() for _ in range(5)] == [after.random() for _ in range(5)]
+    assert parent.stream("game", 7).random() != parent.stream("game", 8).random()
+    assert parent.stream("game", 7).random() != parent.random()
+
+def test_stream_seed_round_trips():
+    """A stream's seed alone recreates it (which is how worker processes receive it)."""
+    game = DeterministicRNG("LEAGUE").stream("season", 2025).stream("week", 3).stream("game", 41)
+    assert game.seed == "LEAGUE/season:2025/week:3/game:41"
+
+    copy = DeterministicRNG(game.seed)
+    assert [game.randint(1, 100) for _ in range(5)] == [copy.randint(1, 100) for _ in range(5)]
+
+def test_stream_needs_a_key():
+    with pytest.raises(ValueError):
+        DeterministicRNG("LEAGUE").stream()
+
+def test_streams_are_independent_of_scheduling():
+    """Games drawn in any order, on any thread, produce the same numbers."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    week = DeterministicRNG("LEAGUE").stream("week", 1)
+    game_ids = list(range(16))
+
+    def play(game_id):
+        rng = week.stream("game", game_id)
+        return game_id, [rng.random() for _ in range(100)]
+
+    in_order = dict(play(game_id) for game_id in game_ids)
+    shuffled = list(reversed(game_ids))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        threaded = dict(pool.map(play, shuffled))
+
+    assert threaded == in_order
+
+def test_batch_draws():
+    """Batch draws are reproducible, in range, and leave the scalar sequence alone."""
+    rng1 = DeterministicRNG("BATCH")
+    rng2 = DeterministicRNG("BATCH")
+
+    uniforms = rng1.randoms(1000)
+    assert uniforms.shape == (1000,)
+    assert ((uniforms >= 0.0) & (uniforms < 1.0)).all()
+    assert (rng2.randoms(1000) == uniforms).all()
+
+    ints = rng1.randints(1, 6, 1000)
+    assert ints.min() >= 1 and ints.max() <= 6
+    assert abs(rng1.gausses(10.0, 2.0, 5000).mean() - 10.0) < 0.2
+    assert (rng1.uniforms(-1.0, 1.0, 100) >= -1.0).all()
+
+    # rng1 drew four batches, rng2 one; their scalar streams still agree
+    assert rng1.random() == rng2.random() == DeterministicRNG("BATCH").random()
@@ -0,0 +1,133 @@
+from sqlalchemy import select
+
+from app.models.game import Game
+from app.models.season import Season
+from app.models.standings import TeamSeasonStanding
+from app.models.team import Team
+from app.services.standings_calculator import StandingsCalculator
+
+
+def _seed_season(db):
+    season = Season(year=2077)
+    db.add(season)
+
+    teams = []
+    for i, (conference, division) in enumerate([("AFC", "East"), ("AFC", "East"), ("AFC", "West"), ("NFC", "East")]):
+        team = Team(name=f"Stand {i}", city="City", abbreviation=f"ST{i}", conference=conference, division=division)
+        db.add(team)
+        teams.append(team)
+    db.flush()
+
+    pairings = [(0, 1), (2, 3), (1, 2), (3, 0), (0, 2), (1, 3)]
+    games = [
+        Game(season_id=season.id, season=2077, week=week // 2 + 1,
+             home_team_id=teams[h].id, away_team_id=teams[a].id)
+        for week, (h, a) in enumerate(pairings)
+    ]
+    db.add_all(games)
+    db.commit()
+    return season, teams, games
+
+
+def _play(game, home_score, away_score):
+    game.home_score = home_score
+    game.away_score = away_score
+    game.is_played = True
+
+
+def test_reads_never_write(db_session):
+    season, teams, games = _seed_season(db_session)
+    _play(games[0], 21, 14)
+    db_session.commit()
+    calculator = StandingsCalculator(db_session)
+
+    # Nothing materialized yet: the read calculates from games rather than building the table
+    standings = calculator.get_standings(season.id)
+    assert standings == calculator.calculate_standings(season.id)
+    assert {s.team_id: s.wins for s in standings}[teams[0].id] == 1
+    division = calculator.get_standings(season.id, conference="AFC", division="East")
+    assert {s.team_id for s in division} >= {teams[0].id, teams[1].id}
+    assert all(s.conference == "AFC" and s.division == "East" for s in division)
+    # ...and verify reports the missing rows instead of comparing the calculation with itself
+    assert f"team {teams[0].id}: missing from team_standings" in calculator.verify_standings(season.id)
+    assert db_session.execute(
+        select(TeamSeasonStanding).where(TeamSeasonStanding.season_id == season.id)
+    ).first() is None
+
+
+def test_rebuilt_table_serves_reads(db_session):
+    season, teams, games = _seed_season(db_session)
+    _play(games[0], 21, 14)
+    _play(games[1], 10, 10)
+    db_session.commit()
+
+    calculator = StandingsCalculator(db_session)
+    calculator.rebuild_standings(season.id)
+    standings = {s.team_id: s for s in calculator.get_standings(season.id)}
+
+    assert (standings[teams[0].id].wins, standings[teams[1].id].losses) == (1, 1)
+    assert standings[teams[2].id].ties == 1
+    assert calculator.verify_standings(season.id) == []
+
+    division = calculator.get_standings(season.id, conference="AFC", division="East")
+    assert {s.team_id for s in division} >= {teams[0].id, teams[1].id}
+    assert all(s.conference == "AFC" and s.division == "East" for s in division)
+
+
+def test_incremental_updates_match_full_recalculation(db_session):
+    season, teams, games = _seed_season(db_session)
+    calculator = StandingsCalculator(db_session)
+    calculator.rebuild_standings(season.id)
+
+    scores = [(24, 17), (3, 27), (14, 14), (31, 30), (7, 20), (35, 0)]
+    for game, (home, away) in zip(games, scores):
+        _play(game, home, away)
+        db_session.commit()
+        calculator.apply_game_results(season.id, [game])
+        assert calculator.verify_standings(season.id) == []
+
+    row = db_session.execute(
+        select(TeamSeasonStanding).where(
+            TeamSeasonStanding.season_id == season.id,
+            TeamSeasonStanding.team_id == teams[0].id
+        )
+    ).scalar_one()
+    assert (row.wins, row.losses, row.ties) == (1, 2, 0)
+
+
+def test_rebuild_replaces_drifted_rows(db_session):
+    season, teams, games = _seed_season(db_session)
+    _play(games[0], 21, 14)
+    db_session.commit()
+
+    calculator = StandingsCalculator(db_session)
+    calculator.rebuild_standings(season.id)
+    # Applying an already-counted game double counts it; verify catches it
+    calculator.apply_game_results(season.id, [games[0]])
+    assert calculator.verify_standings(season.id)
+
+    calculator.rebuild_standings(season.id)
+    assert calculator.verify_standings(season.id) == []
+
+
+def test_games_added_after_the_rows_are_built_join_the_schedule(db_session):
+    season, teams, games = _seed_season(db_session)
+    calculator = StandingsCalculator(db_session)
+    calculator.rebuild_standings(season.id)
+
+    # A playoff game, created once the season's rows already exist
+    playoff = Game(season_id=season.id, season=2077, week=19, is_playoff=True,
+                   home_team_id=teams[0].id, away_team_id=teams[3].id)
+    db_session.add(playoff)
+    _play(playoff, 27, 24)
+    db_session.commit()
+    calculator.apply_game_results(season.id, [playoff])
+
+    assert calculator.verify_standings(season.id) == []
+    row = db_session.execute(
+        select(TeamSeasonStanding).where(
+            TeamSeasonStanding.season_id == season.id,
+            TeamSeasonStanding.team_id == teams[0].id
+        )
+    ).scalar_one()
+    assert row.opponents.count(teams[3].id) == 2
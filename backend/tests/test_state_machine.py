@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.game import Game
+from app.orchestrator.state_machine import (
+    GameContext, GameState, GameStateMachine, StateTransition, TransitionRecord
+)
+
+# One snap: call, line up, snap, play, whistle
+SNAP = [GameState.PLAY_CALLING, GameState.PRE_SNAP, GameState.SNAP, GameState.PLAY_IN_PROGRESS, GameState.POST_PLAY]
+
+
+@pytest.fixture
+def session_factory(async_db_session):
+    return async_sessionmaker(async_db_session.bind, class_=AsyncSession, expire_on_commit=False)
+
+
+def _machine(**kwargs):
+    machine = GameStateMachine(1, initial_state=GameState.POST_PLAY, **kwargs)
+    machine.set_context(GameContext(possession_team_id=7))
+    return machine
+
+
+def test_transitions_are_validated_from_the_table():
+    machine = _machine(snapshots=False)
+    assert machine.transition(GameState.PLAY_CALLING)
+    with pytest.raises(ValueError):
+        machine.transition(GameState.FINAL)
+    assert machine.current_state == GameState.PLAY_CALLING
+    assert set(machine.TRANSITION_TABLE) == set(GameStateMachine.VALID_TRANSITIONS)
+
+
+def test_fast_mode_keeps_a_ring_buffer(capsys):
+    machine = _machine(snapshots=False, history_size=8)
+    for _ in range(4):
+        for state in SNAP:
+            machine.transition(state)
+
+    assert machine.transition_count == 20
+    assert machine.get_state_info()["transition_count"] == 20
+    assert len(machine.history) == 8
+    last = machine.history[-1]
+    assert isinstance(last, TransitionRecord)
+    assert (last.sequence, last.from_state, last.to_state) == (20, GameState.PLAY_IN_PROGRESS, GameState.POST_PLAY)
+    assert [r.sequence for r in machine.history] == list(range(13, 21))
+    assert capsys.readouterr().out == ""
+
+
+def test_snapshot_mode_records_full_context():
+    machine = _machine(snapshots=True)
+    machine.update_context(home_score=7)
+    machine.transition(GameState.PLAY_CALLING)
+    machine.update_context(home_score=14)
+    machine.transition(GameState.PRE_SNAP)
+
+    assert all(isinstance(t, StateTransition) for t in machine.history)
+    assert [t.context_snapshot["home_score"] for t in machine.history] == [7, 14]
+
+
+async def test_checkpoints_persist_in_the_background(session_factory):
+    async with session_factory() as db:
+        game = Game(season=2024, week=1, game_data={"weather": "Sunny"})
+        db.add(game)
+        await db.commit()
+        game_id = game.id
+
+    machine = GameStateMachine(game_id, initial_state=GameState.POST_PLAY, snapshots=False,
+                               session_factory=session_factory, checkpoint_interval=0)
+    machine.set_context(GameContext(possession_team_id=7, quarter=1, time_remaining=0, home_score=3))
+
+    # Ordinary snaps are not checkpoints; the quarter break is
+    for state in SNAP:
+        machine.transition(state)
+    assert machine._checkpoint_task is None
+    machine.transition(GameState.QUARTER_BREAK)
+    # Further checkpoints while one is in flight coalesce into the latest state
+    machine.update_context(quarter=2, home_score=10)
+    machine.transition(GameState.HALFTIME)
+    task = machine._checkpoint_task
+    assert task is not None and not task.done()
+
+    await task
+    async with session_factory() as db:
+        game = await db.get(Game, game_id)
+        assert game.home_score == 10
+        assert game.game_data["current_state"] == "HALFTIME"
+        assert game.game_data["quarter"] == 2
+        assert game.game_data["weather"] == "Sunny"
+
+    machine.update_context(away_score=6)
+    await machine.persist_async()
+    async with session_factory() as db:
+        assert (await db.get(Game, game_id)).away_score == 6
+
+
+def test_checkpoints_without_a_loop_wait_for_persist_async():
+    written = []
+
+    class Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def get(self, model, game_id):
+            return Game(id=game_id, game_data=None)
+
+        async def commit(self):
+            written.append(True)
+
+    machine = _machine(snapshots=False, session_factory=Session, checkpoint_interval=0)
+    machine.transition(GameState.FINAL)
+    assert machine._checkpoint_task is None and not written
+
+    asyncio.run(machine.persist_async())
+    assert written == [True]
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import select
+
+from app.models.game import Game
+from app.models.player import Player
+from app.models.stats import PlayerGameStats
+from app.models.team import Team
+from app.services.stats_writer import BulkStatsWriter
+
+
+async def _seed_game(db):
+    teams = []
+    for i in range(2):
+        team = Team(name=f"Bulk {i}", city="City", abbreviation=f"B{i}", conference="AFC", division="North")
+        db.add(team)
+        await db.flush()
+        teams.append(team)
+
+    players = [
+        Player(first_name="Bulk", last_name=f"P{i}", position="WR", team_id=teams[i % 2].id, age=25)
+        for i in range(4)
+    ]
+    db.add_all(players)
+    game = Game(season=2031, week=1, home_team_id=teams[0].id, away_team_id=teams[1].id)
+    db.add(game)
+    await db.commit()
+    return game, players
+
+
+def _line(yards):
+    return {"targets": 1, "receptions": 1, "rec_yards": yards, "rec_tds": 0}
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_inserts_then_accumulates(db):
+    game, players = await _seed_game(db)
+    team_map = {p.id: p.team_id for p in players}
+    stats = {p.id: _line(10 + i) for i, p in enumerate(players)}
+
+    writer = BulkStatsWriter(db)
+    writer.add_game(game.id, None, stats, team_map)
+    report = await writer.flush()
+    await db.commit()
+
+    assert report.rows_written == 4
+    assert report.games == 1
+    assert report.statements == 1
+    assert report.elapsed_ms >= 0
+
+    # Second write for the same game adds onto the existing rows
+    writer.add_game(game.id, None, stats, team_map)
+    await writer.flush()
+    await db.commit()
+
+    rows = (await db.execute(
+        select(PlayerGameStats).where(PlayerGameStats.game_id == game.id).order_by(PlayerGameStats.player_id)
+    )).scalars().all()
+    assert len(rows) == 4
+    assert [r.rec_yards for r in rows] == [20, 22, 24, 26]
+    assert [r.targets for r in rows] == [2, 2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_missing_team_ids_are_resolved_in_one_lookup(db):
+    game, players = await _seed_game(db)
+
+    writer = BulkStatsWriter(db)
+    writer.add_game(game.id, None, {p.id: _line(5) for p in players}, player_team_map={})
+    assert writer.pending_rows == 4
+
+    report = await writer.flush()
+    await db.commit()
+
+    assert report.rows_written == 4
+    rows = (await db.execute(
+        select(PlayerGameStats).where(PlayerGameStats.game_id == game.id)
+    )).scalars().all()
+    assert {r.player_id: r.team_id for r in rows} == {p.id: p.team_id for p in players}
@@ -0,0 +1,93 @@
+import random
+import time
+from collections import deque
+
+import pytest
+
+from app.kernels.society.social_graph import LeagueTrustNetwork, TrustGraph
+
+
+def _locker_room(team, rng, size=53, edges=300):
+    graph = TrustGraph()
+    for _ in range(edges):
+        a, b = rng.sample(range(size), 2)
+        graph.add_trust_edge(f"{team}-{a}", f"{team}-{b}", round(rng.random(), 2))
+    return graph
+
+
+def _reference_cascade(graph, source_id, morale_hit):
+    """The original list-based BFS, run against the graph's public API."""
+    visited, count = set(), 0
+    queue = deque([(source_id, morale_hit)])
+    while queue:
+        current, hit = queue.popleft()
+        if current in visited:
+            continue
+        visited.add(current)
+        count += 1
+        for neighbor, trust in graph.neighbors(current).items():
+            if trust > 0.7 and hit * 0.8 > 0.1:
+                queue.append((neighbor, hit * 0.8))
+    return count
+
+
+def test_graph_api_and_cascade():
+    graph = TrustGraph()
+    graph.add_trust_edge("p1", "p2", 0.9)
+    graph.add_trust_edge("p2", "p3", 0.8)
+    graph.add_trust_edge("p3", "p4", 0.2)
+
+    assert graph.get_trust("p2", "p1") == 0.9
+    assert graph.get_trust("p1", "p4") == 0.5
+    assert graph.get_trust("p1", "nobody") == 0.5
+    assert graph.mutiny_cascade("p1", 10.0) == {"p1": 10.0, "p2": 8.0, "p3": pytest.approx(6.4)}
+    assert graph.trigger_mutiny_cascade("nobody", 10.0) == 1
+    assert graph.trigger_mutiny_cascade("p1", 0.1) == 1  # Too weak to spread
+
+
+def test_cascade_matches_reference_bfs():
+    rng = random.Random(4)
+    for team in range(5):
+        graph = _locker_room(team, rng)
+        for source in rng.sample(graph.node_ids, 5):
+            hit = rng.uniform(0.5, 20)
+            assert graph.trigger_mutiny_cascade(source, hit) == _reference_cascade(graph, source, hit)
+
+
+def test_league_propagation_matches_per_team_cascades():
+    rng = random.Random(9)
+    graphs = {team: _locker_room(team, rng) for team in range(32)}
+    sources = {team: [(rng.choice(graph.node_ids), rng.uniform(1, 15))] for team, graph in graphs.items()}
+
+    start = time.perf_counter()
+    league = LeagueTrustNetwork(graphs).propagate_influence(sources)
+    elapsed = time.perf_counter() - start
+
+    for team, graph in graphs.items():
+        (source, hit), = sources[team]
+        expected = graph.mutiny_cascade(source, hit)
+        assert league[team].keys() == expected.keys()
+        for player_id, value in expected.items():
+            assert league[team][player_id] == pytest.approx(value)
+    assert elapsed < 1.0
+
+
+def test_league_propagation_keeps_strongest_of_several_sources():
+    graph = TrustGraph()
+    graph.add_trust_edge("a", "b", 0.9)
+    graph.add_trust_edge("b", "c", 0.9)
+
+    result = LeagueTrustNetwork({"T": graph}).propagate_influence({"T": [("a", 1.0), ("c", 5.0), ("ghost", 2.0)]})
+
+    assert result["T"] == {"a": 1.0, "b": 4.0, "c": 5.0, "ghost": 2.0}
+
+
+def test_networkx_export():
+    nx = pytest.importorskip("networkx")
+    graph = TrustGraph()
+    graph.add_trust_edge("p1", "p2", 0.9)
+
+    exported = graph.to_networkx()
+
+    assert isinstance(exported, nx.Graph)
+    assert exported["p1"]["p2"]["weight"] == 0.9
@@ -0,0 +1,78 @@
+import sys
+
+import numpy as np
+import pytest
+
+from app.kernels.hive.geo_physics import MIN_FRICTION, TurfDegradationMesh
+from app.orchestrator.kernels.hive_kernel import HiveKernel
+
+
+def test_footprint_matches_cell_by_cell_degradation():
+    rng = np.random.default_rng(3)
+    xs = rng.integers(-5, 125, size=500)
+    ys = rng.integers(-5, 58, size=500)
+    traffic = rng.uniform(0, 20, size=500)
+
+    vectorized = TurfDegradationMesh()
+    vectorized.apply_footprint(xs, ys, traffic)
+
+    looped = TurfDegradationMesh()
+    for x, y, t in zip(xs, ys, traffic, strict=True):
+        looped.degrade_zone(int(x), int(y), float(t))
+
+    np.testing.assert_allclose(vectorized.friction, looped.friction, atol=1e-5)
+    assert vectorized.friction.min() >= MIN_FRICTION
+
+
+def test_footprint_radius_wears_neighbours():
+    turf = TurfDegradationMesh()
+    turf.apply_footprint([0], [10], traffic=10.0, radius=1)
+
+    assert turf.get_friction(0, 10) == pytest.approx(0.9)
+    assert turf.get_friction(1, 11) == pytest.approx(0.9)
+    assert turf.get_friction(2, 10) == 1.0
+    assert turf.get_friction(-1, 10) == 1.0  # Off the field
+
+
+def test_footprint_rejects_mismatched_coordinates():
+    turf = TurfDegradationMesh()
+    with pytest.raises(ValueError):
+        turf.apply_footprint([1, 2, 3], [4])
+    with pytest.raises(ValueError):
+        turf.apply_footprint([1, 2], [4, 5], traffic=[1.0, 2.0, 3.0])
+
+
+def test_weather_decay_hits_worn_cells_harder():
+    turf = TurfDegradationMesh()
+    turf.degrade_zone(50, 20, 30.0)
+
+    turf.apply_weather_decay(moisture=1.0, minutes=15)
+
+    worn_loss = 0.7 - turf.get_friction(50, 20)
+    fresh_loss = 1.0 - turf.get_friction(10, 10)
+    assert worn_loss > fresh_loss > 0
+
+    turf.apply_weather_decay(moisture=1.0, minutes=10_000)
+    assert turf.friction.min() == pytest.approx(MIN_FRICTION)
+
+
+def test_region_queries_and_field_state():
+    turf = TurfDegradationMesh()
+    turf.apply_footprint([10, 11], [0, 0], traffic=50.0)
+
+    stats = turf.region_stats((10, 12), (0, 2))
+    assert stats["min"] == pytest.approx(0.5)
+    assert stats["mean"] == pytest.approx(0.75)
+    assert stats["worn_fraction"] == 0.5
+    assert list(turf.get_friction_many([10, 500], [0, 0])) == pytest.approx([0.5, 1.0])
+
+    assert HiveKernel().get_field_conditions() == {"mean": 1.0, "min": 1.0, "worn_fraction": 0.0}
+
+
+def test_array_is_much_smaller_than_nested_lists():
+    turf = TurfDegradationMesh()
+    turf.apply_weather_decay(moisture=0.5)
+    grid = turf.grid
+
+    list_bytes = sys.getsizeof(grid) + sum(sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row) for row in grid)
+    assert turf.nbytes * 5 < list_bytes
@@ -0,0 +1,126 @@
+import asyncio
+import datetime
+import os
+import sys
+
+import pytest
+
+from app.core.mcp_cache import mcp_cache
+from app.core.mcp_client import MCPHostClient
+from app.models.game import Game
+from app.models.team import Team
+from app.services.weather_prefetch import WeatherPrefetcher, tool_payload
+
+SERVER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mcp_servers", "weather_server", "server.py"
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    mcp_cache.clear()
+    yield
+    mcp_cache.clear()
+
+
+def _weather_client():
+    return MCPHostClient("weather_test", {"transport": "stdio", "command": sys.executable, "args": [SERVER_PATH]})
+
+
+class SingleGameOnly:
+    """Wraps a client as an older server without the batch tool, tracking concurrency."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+        self.active = self.peak = 0
+
+    async def call_tool(self, name, arguments):
+        self.calls.append(name)
+        if name == "get_week_weather":
+            raise RuntimeError("Unknown tool: get_week_weather")
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            return await self.client.call_tool(name, arguments)
+        finally:
+            self.active -= 1
+
+
+async def _seed_games(db):
+    cities = ["Green Bay", "Miami", "Denver"]
+    teams = []
+    for i, city in enumerate(cities):
+        team = Team(name=f"Wx {i}", city=city, abbreviation=f"WX{i}", conference="NFC", division="North")
+        db.add(team)
+        teams.append(team)
+    await db.flush()
+
+    kickoff = datetime.datetime(2024, 12, 22, 13, 0)
+    games = []
+    # Every team hosts twice at the same kickoff, so each stadium repeats once
+    for home in teams + teams:
+        away = teams[(teams.index(home) + 1) % len(teams)]
+        games.append(Game(season=2024, week=16, home_team_id=home.id, away_team_id=away.id, date=kickoff))
+    db.add_all(games)
+    await db.commit()
+    return teams, games
+
+
+def test_tool_payload_unwraps_results():
+    assert tool_payload({"condition": "Clear"}) == {"condition": "Clear"}
+    assert tool_payload(None) is None
+
+
+@pytest.mark.asyncio
+async def test_prefetch_resolves_the_week_in_one_request(db):
+    teams, games = await _seed_games(db)
+    weather_client = _weather_client()
+    await weather_client.connect()
+    try:
+        prefetcher = WeatherPrefetcher(db, client=weather_client)
+        weather = await prefetcher.prefetch(games)
+    finally:
+        await weather_client.disconnect()
+
+    assert prefetcher.stats["requests"] == 1
+    assert prefetcher.stats["batched"] is True
+    assert set(weather) == {g.id for g in games}
+    green_bay = [g.id for g in games if g.home_team_id == teams[0].id]
+    miami = [g.id for g in games if g.home_team_id == teams[1].id]
+    assert all(weather[gid] == {"temperature": 15, "wind_speed": 15, "condition": "Snow"} for gid in green_bay)
+    assert all(weather[gid]["condition"] == "Sunny" for gid in miami)
+
+    # A second prefetch of the same slate is served from the cache
+    again = await prefetcher.prefetch(games)
+    assert again == weather
+    assert prefetcher.stats["requests"] == 0
+    assert prefetcher.stats["cached"] == 3
+
+
+@pytest.mark.asyncio
+async def test_prefetch_falls_back_to_bounded_burst(db):
+    teams, games = await _seed_games(db)
+    weather_client = _weather_client()
+    await weather_client.connect()
+    try:
+        client = SingleGameOnly(weather_client)
+        prefetcher = WeatherPrefetcher(db, client=client, max_concurrency=2)
+        weather = await prefetcher.prefetch(games)
+    finally:
+        await weather_client.disconnect()
+
+    # One failed batch attempt, then one call per distinct stadium
+    assert client.calls.count("get_week_weather") == 1
+    assert client.calls.count("get_game_weather") == 3
+    assert client.peak <= 2
+    assert set(weather) == {g.id for g in games}
+
+
+@pytest.mark.asyncio
+async def test_prefetch_without_weather_server(db):
+    _, games = await _seed_games(db)
+    prefetcher = WeatherPrefetcher(db)
+    prefetcher._client = None
+    assert await prefetcher.prefetch(games) == {}
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from app.api.endpoints.websocket import DISCONNECT, DROP_OLDEST, ConnectionManager
+
+
+class FakeSocket:
+    def __init__(self, delay: float = 0.0, stall: bool = False):
+        self.delay = delay
+        self.stall = stall
+        self.sent = []
+        self.close_codes = []
+
+    async def accept(self):
+        pass
+
+    async def close(self, code=1000):
+        self.close_codes.append(code)
+
+    async def send_text(self, text):
+        if self.stall:
+            await asyncio.Event().wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(text)
+
+
+async def _drain(manager):
+    for _ in range(100):
+        if all(c.queue.empty() for c in manager.clients.values() if not c.websocket.stall):
+            break
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+async def _shutdown(manager):
+    for ws in list(manager.clients):
+        manager.disconnect(ws)
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_thousand_clients_get_one_serialized_message():
+    manager = ConnectionManager(queue_size=32)
+    sockets = [FakeSocket() for _ in range(1000)]
+    for ws in sockets:
+        await manager.connect(ws)
+
+    start = time.perf_counter()
+    for play in range(20):
+        assert await manager.broadcast({"type": "PLAY_RESULT", "payload": {"play": play}}) == 1000
+    elapsed = time.perf_counter() - start
+    await _drain(manager)
+
+    assert all(len(ws.sent) == 20 for ws in sockets)
+    # Every client received the very same serialized string
+    assert len({id(ws.sent[-1]) for ws in sockets}) == 1
+    assert json.loads(sockets[0].sent[-1])["payload"] == {"play": 19}
+    # Broadcasting only queues; it never waits on a socket
+    assert elapsed < 1.0
+    await _shutdown(manager)
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_stall_others():
+    manager = ConnectionManager(queue_size=4, policy=DROP_OLDEST)
+    stuck = FakeSocket(stall=True)
+    fast = [FakeSocket() for _ in range(10)]
+    for ws in [stuck] + fast:
+        await manager.connect(ws)
+
+    for play in range(10):
+        await manager.broadcast({"type": "PLAY_RESULT", "payload": {"play": play}})
+        await asyncio.sleep(0)
+    await _drain(manager)
+
+    assert all(len(ws.sent) == 10 for ws in fast)
+    stuck_client = manager.clients[stuck]
+    # The stuck client keeps only its newest messages
+    assert stuck_client.queue.qsize() == 4
+    assert stuck_client.dropped > 0
+    assert json.loads(stuck_client.queue._queue[-1])["payload"] == {"play": 9}
+    await _shutdown(manager)
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_drops_slow_client():
+    manager = ConnectionManager(queue_size=2, policy=DISCONNECT)
+    stuck, fast = FakeSocket(stall=True), FakeSocket()
+    await manager.connect(stuck)
+    await manager.connect(fast)
+
+    for play in range(5):
+        await manager.broadcast({"type": "PLAY_RESULT", "payload": {"play": play}})
+        await asyncio.sleep(0)
+    await _drain(manager)
+
+    assert stuck not in manager.clients
+    assert stuck.close_codes == [1013]
+    assert fast in manager.clients
+    assert len(fast.sent) == 5
+    assert fast.close_codes == []
+    assert not manager._closing
+
+    # Dropping a client that already left does not close it again
+    manager.drop(stuck)
+    await asyncio.sleep(0)
+    assert stuck.close_codes == [1013]
+    await _shutdown(manager)
+
+
+@pytest.mark.asyncio
+async def test_send_error_drops_and_closes_client():
+    class BrokenSocket(FakeSocket):
+        async def send_text(self, text):
+            raise RuntimeError("connection reset")
+
+    manager = ConnectionManager()
+    broken = BrokenSocket()
+    await manager.connect(broken)
+
+    await manager.broadcast({"type": "PLAY_RESULT", "payload": {}})
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert broken not in manager.clients
+    assert broken.close_codes == [1011]
+
+
+@pytest.mark.asyncio
+async def test_game_channels():
+    manager = ConnectionManager()
+    everything, game_one, game_two = FakeSocket(), FakeSocket(), FakeSocket()
+    await manager.connect(everything)
+    await manager.connect(game_one, game_id=1)
+    await manager.connect(game_two)
+    manager.subscribe(game_two, "2")
+
+    assert await manager.broadcast({"type": "GAME_UPDATE", "payload": {"game": 1}}, game_id=1) == 2
+    assert await manager.broadcast({"type": "GAME_UPDATE", "payload": {"game": 2}}, game_id=2) == 2
+    assert await manager.broadcast({"type": "ENGINE_UPDATE", "payload": {}}) == 1
+    await _drain(manager)
+
+    assert len(everything.sent) == 3
+    assert [json.loads(t)["payload"] for t in game_one.sent] == [{"game": 1}]
+    assert [json.loads(t)["payload"] for t in game_two.sent] == [{"game": 2}]
+
+    # Leaving the last game puts the client back on every game
+    manager.unsubscribe(game_two, 2)
+    manager.disconnect(game_one)
+    assert manager.channels == {}
+    assert await manager.broadcast({"type": "GAME_UPDATE", "payload": {"game": 1}}, game_id=1) == 2
+    await _shutdown(manager)
+
+
+def test_websocket_endpoint_subscribe_and_ping(client):
+    from app.api.endpoints.websocket import manager
+
+    with client.websocket_connect("/ws/simulation/live?game_id=7") as ws:
+        ws.send_text(json.dumps({"type": "PING"}))
+        assert json.loads(ws.receive_text()) == {"type": "PONG"}
+        assert set(manager.channels) == {"7"}
+
+        ws.send_text(json.dumps({"type": "UNSUBSCRIBE", "game_id": 7}))
+        ws.send_text(json.dumps({"type": "PING"}))
+        assert json.loads(ws.receive_text()) == {"type": "PONG"}
+        assert manager.channels == {}
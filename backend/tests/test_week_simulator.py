@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import update
+
+from app.models.game import Game
+from app.models.season import Season
+from app.services.week_simulator import WeekSimulator
+
+async def _seed_week(db, seed_teams, num_teams=4):
+    season = Season(year=2031)
+    db.add(season)
+    await db.flush()
+
+    team_ids = await seed_teams(db, count=num_teams, abbreviation="W")
+    for i in range(0, num_teams, 2):
+        db.add(Game(season_id=season.id, season=2031, week=1,
+                    home_team_id=team_ids[i], away_team_id=team_ids[i + 1]))
+
+    season_id = season.id
+    await db.commit()
+    return season_id
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_parallel_week_is_deterministic_across_worker_counts(async_db_session, seed_teams):
+    season_id = await _seed_week(async_db_session, seed_teams)
+    database_url = async_db_session.bind.url.render_as_string(hide_password=False)
+
+    runs = []
+    for workers in (1, 2):
+        await async_db_session.execute(
+            update(Game).where(Game.season_id == season_id).values(is_played=False)
+        )
+        await async_db_session.commit()
+
+        simulator = WeekSimulator(async_db_session)
+        result = await simulator.simulate_week_parallel(
+            season_id, 1, play_count=40, max_workers=workers, seed="fixed", database_url=database_url
+        )
+        assert result["games_simulated"] == 2
+        assert result["workers"] == workers
+        runs.append(result["results"])
+
+    assert runs[0] == runs[1]
+    for game_result in runs[0].values():
+        assert game_result["box_score"]
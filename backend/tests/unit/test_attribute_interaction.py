@@ -21,7 +21,8 @@ from app.engine.attribute_interaction import (
     InteractionOutcome,
     InteractionResult,
     InteractionDefinition,
-    apply_interaction_to_play
+    apply_interaction_to_play,
+    get_compiled_catalog
 )
 
 
@@ -608,6 +609,75 @@ class TestBatchProcessing:
         assert "HOME" in results[0].modifiers_applied
 
 
+    def test_batch_full_snap_uses_position_index(self, engine):
+        """A 22-player snap should expand into every indexed matchup."""
+        offense = [MockPlayer(id=i, position=pos) for i, pos in enumerate(
+            ["QB", "RB", "WR", "WR", "WR", "TE", "OT", "OG", "C", "OG", "OT"])]
+        defense = [MockPlayer(id=100 + i, position=pos) for i, pos in enumerate(
+            ["DE", "DT", "DT", "DE", "LB", "LB", "LB", "CB", "CB", "S", "S"])]
+
+        pass_results = engine.batch_calculate_interactions(offense=offense, defense=defense, play_type="PASS")
+        run_results = engine.batch_calculate_interactions(offense=offense, defense=defense, play_type="RUN")
+
+        assert len(pass_results) == len(engine.catalog.snap_matchups(offense, defense, "PASS"))
+        pass_types = {r.interaction_type for r in pass_results}
+        run_types = {r.interaction_type for r in run_results}
+        assert InteractionType.PASS_PROTECTION in pass_types
+        assert InteractionType.RUN_GAME not in pass_types
+        assert InteractionType.RUN_GAME in run_types
+        assert InteractionType.PASS_PROTECTION not in run_types
+
+    def test_numbers_only_skips_narrative(self, elite_qb, rookie_dl):
+        """Numbers-only mode should give the same numbers with no narrative."""
+        full = AttributeInteractionEngine(rng=MockRNG(0.9))
+        numbers = AttributeInteractionEngine(rng=MockRNG(0.9), numbers_only=True)
+
+        a = full.calculate_interaction("hard_count_vs_discipline", elite_qb, rookie_dl, {"HOME": True})
+        b = numbers.calculate_interaction("hard_count_vs_discipline", elite_qb, rookie_dl, {"HOME": True})
+
+        assert "Mahomes" in a.narrative
+        assert b.narrative == ""
+        assert (a.outcome, a.differential, a.winner_boost, a.modifiers_applied) == \
+               (b.outcome, b.differential, b.winner_boost, b.modifiers_applied)
+        assert apply_interaction_to_play(numbers, {}, [("hard_count_vs_discipline", elite_qb, rookie_dl)])["narratives"] == []
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMPILED CATALOG TESTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestCompiledCatalog:
+    """Tests for the process-wide compiled catalog."""
+
+    def test_catalog_built_once(self):
+        """Engines should share one compiled catalog."""
+        first = AttributeInteractionEngine()
+        second = AttributeInteractionEngine(rng=MockRNG())
+
+        assert first.catalog is second.catalog is get_compiled_catalog()
+        assert first.INTERACTION_CATALOG is second.INTERACTION_CATALOG
+
+    def test_position_and_play_type_index(self):
+        """Lookups by position pair should respect play type."""
+        catalog = get_compiled_catalog()
+
+        names = {c.name for c in catalog.for_positions("QB", "DE")}
+        assert "hard_count_vs_discipline" in names
+
+        pass_rush = {c.name for c in catalog.for_positions("DE", "OT", "PASS")}
+        assert "ol_anchor_vs_dl_first_step" in pass_rush
+        assert catalog.for_positions("DE", "OT", "RUN") == ()
+        assert catalog.for_positions("K", "P") == ()
+
+    def test_compiled_narrative_matches_template(self, engine, good_wr, elite_cb):
+        """Compiled templates should fill both player names."""
+        compiled = engine.catalog.get("wr_release_vs_cb_press")
+        narrative = engine._generate_narrative(compiled, InteractionOutcome.SLIGHT_LOSS, good_wr, elite_cb)
+
+        template = compiled.definition.narrative_templates["SLIGHT_LOSS"]
+        assert narrative == template.replace("{wr}", "Receiver").replace("{cb}", "Gardner")
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # UTILITY METHOD TESTS
 # ═══════════════════════════════════════════════════════════════════════════════